@@ -0,0 +1,100 @@
+"""
+Assembly benchmark for OPLang programming language.
+Generates Jasmin code for a program with several classes and assembles it,
+once by running jasmin.jar for every .j file (as the test harness used to)
+and once with the in-process ClassWriter.
+
+Usage: python benchmarks/bench_assemble.py [--classes N] [--methods N] [--repeat N]
+"""
+
+import argparse
+import glob
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, ROOT)
+
+from src.utils.nodes import *
+from src.codegen.codegen import CodeGenerator
+from src.codegen.class_writer import ClassWriter
+
+JASMIN_JAR = os.path.join(ROOT, "src", "runtime", "jasmin.jar")
+
+
+def make_program(classes: int, methods: int):
+    """classes classes with methods int methods each, plus a Main class."""
+    decls = []
+    for c in range(classes):
+        members = []
+        for m in range(methods):
+            body = BlockStatement(
+                [VariableDecl(False, PrimitiveType("int"), [Variable("x", IntLiteral(m))])],
+                [
+                    AssignmentStatement(IdLHS("x"), BinaryOp(Identifier("x"), "*", Identifier("p"))),
+                    ReturnStatement(BinaryOp(Identifier("x"), "+", IntLiteral(c * 1000 + m))),
+                ],
+            )
+            members.append(MethodDecl(False, PrimitiveType("int"), f"m{m}", [Parameter(PrimitiveType("int"), "p")], body))
+        decls.append(ClassDecl(f"Bench{c}", None, members))
+    main_body = BlockStatement([], [
+        MethodInvocationStatement(PostfixExpression(Identifier("io"), [MethodCall("writeStr", [StringLiteral("done")])]))
+    ])
+    decls.append(ClassDecl("BenchMain", None, [MethodDecl(True, PrimitiveType("void"), "main", [], main_body)]))
+    return Program(decls)
+
+
+def generate(ast, workdir: str):
+    """Generate the .j files of ast and move them into workdir."""
+    CodeGenerator().visit(ast)
+    runtime_dir = os.path.join(ROOT, "src", "runtime")
+    paths = []
+    for decl in ast.class_decls:
+        path = os.path.join(workdir, decl.name + ".j")
+        shutil.move(os.path.join(runtime_dir, decl.name + ".j"), path)
+        paths.append(path)
+    return paths
+
+
+def time_jasmin(paths) -> float:
+    start = time.perf_counter()
+    for path in paths:
+        subprocess.run(
+            ["java", "-jar", JASMIN_JAR, "-d", os.path.dirname(path), path],
+            capture_output=True, check=True,
+        )
+    return time.perf_counter() - start
+
+
+def time_class_writer(paths) -> float:
+    start = time.perf_counter()
+    for path in paths:
+        ClassWriter.assemble_file(path)
+    return time.perf_counter() - start
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="OPLang assembly benchmark")
+    arg_parser.add_argument("--classes", type=int, default=4)
+    arg_parser.add_argument("--methods", type=int, default=20)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        paths = generate(make_program(args.classes, args.methods), workdir)
+        old = min(time_jasmin(paths) for _ in range(args.repeat))
+        new = min(time_class_writer(paths) for _ in range(args.repeat))
+        classes = len(glob.glob(os.path.join(workdir, "*.class")))
+
+    print(f"{'files':>6}{'jasmin.jar (s)':>16}{'ClassWriter (s)':>17}{'speedup':>10}")
+    print(f"{len(paths):>6}{old:>16.3f}{new:>17.4f}{old / new:>9.0f}x")
+    assert classes == len(paths)
+
+
+if __name__ == "__main__":
+    main()
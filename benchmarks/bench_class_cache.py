@@ -0,0 +1,88 @@
+"""
+Class cache benchmark for OPLang programming language.
+Compiles the same programs twice through a ClassCache: the cold pass runs
+code generation and assembly and fills the cache, the warm pass only reads
+the class files back.
+
+Usage: python benchmarks/bench_class_cache.py [--programs N] [--classes N] [--statements N]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, ROOT)
+
+from src.utils.nodes import *
+from src.codegen.codegen import CodeGenerator
+from src.codegen.class_cache import ClassCache, CompiledProgram
+
+
+def make_program(classes: int, statements: int, value: int):
+    """Main with `statements` writes, plus classes-1 classes with one method each."""
+    decls = [
+        ClassDecl(f"C{i}", None, [
+            MethodDecl(False, PrimitiveType("int"), "get", [Parameter(PrimitiveType("int"), "p")],
+                       BlockStatement([], [ReturnStatement(BinaryOp(Identifier("p"), "+", IntLiteral(i)))]))
+        ])
+        for i in range(classes - 1)
+    ]
+    writes = [
+        MethodInvocationStatement(PostfixExpression(Identifier("io"), [
+            MethodCall("writeInt", [BinaryOp(IntLiteral(value), "*", IntLiteral(k))])
+        ]))
+        for k in range(statements)
+    ]
+    main = MethodDecl(True, PrimitiveType("void"), "main", [], BlockStatement([], writes))
+    decls.append(ClassDecl("Main", None, [main]))
+    return Program(decls)
+
+
+def compile_all(cache: ClassCache, asts, output_dir: str) -> float:
+    start = time.perf_counter()
+    for ast in asts:
+        key = cache.key(ast)
+        program = cache.get(key)
+        if program is None:
+            sink = {}
+            codegen = CodeGenerator(class_files=True, sink=sink)
+            codegen.visit(ast)
+            program = CompiledProgram(
+                codegen.main_class, {name: sink[name + ".class"] for name in codegen.class_names}
+            )
+            cache.put(key, program)
+        program.write(output_dir)
+    return time.perf_counter() - start
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="OPLang class cache benchmark")
+    arg_parser.add_argument("--programs", type=int, default=200)
+    arg_parser.add_argument("--classes", type=int, default=4)
+    arg_parser.add_argument("--statements", type=int, default=200)
+    args = arg_parser.parse_args()
+
+    asts = [make_program(args.classes, args.statements, n) for n in range(args.programs)]
+    root = tempfile.mkdtemp(prefix="oplang-bench-")
+    try:
+        cache = ClassCache(os.path.join(root, "cache"))
+        output_dir = os.path.join(root, "out")
+        os.makedirs(output_dir)
+        cold = compile_all(cache, asts, output_dir)
+        warm = compile_all(cache, asts, output_dir)
+    finally:
+        shutil.rmtree(root)
+
+    stats = cache.stats()
+    print(f"{'programs':>9}{'cold (s)':>10}{'warm (s)':>10}{'speedup':>9}{'hits':>6}{'misses':>8}{'saved (KiB)':>13}")
+    print(f"{args.programs:>9}{cold:>10.3f}{warm:>10.3f}{cold / warm:>8.1f}x"
+          f"{stats['hits']:>6}{stats['misses']:>8}{stats['bytes_saved'] / 1024:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Code buffer benchmark for OPLang programming language.
+Generates code for a method holding one large array literal, once with the
+Code instruction buffer and once with plain string concatenation (the
+previous behaviour), checks both produce the same Jasmin file and reports
+the time per element.
+
+String concatenation is only linear while CPython can resize the string in
+place; --profile runs code generation under cProfile, which keeps extra
+references around and makes it quadratic.
+
+Usage: python benchmarks/bench_codegen_buffer.py [--elements N] [--profile]
+"""
+
+import argparse
+import cProfile
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, ROOT)
+
+from src.utils.nodes import *
+from src.codegen import codegen
+from src.codegen.codegen import CodeGenerator
+
+
+def string_code(*parts):
+    """Stand-in for Code that builds plain strings, so `+=` copies again."""
+    return "".join(parts)
+
+
+def make_program(elements: int):
+    """main() declares int[elements] a := {0, 1, 2, ...}."""
+    literal = ArrayLiteral([IntLiteral(i) for i in range(elements)])
+    body = BlockStatement(
+        [VariableDecl(False, ArrayType(PrimitiveType("int"), elements), [Variable("a", literal)])],
+        [],
+    )
+    main = MethodDecl(True, PrimitiveType("void"), "main", [], body)
+    return Program([ClassDecl("Bench", None, [main])])
+
+
+def time_codegen(code_cls, ast, profile: bool = False):
+    # Code generation writes Bench.j next to the runtime; read it back and clean up
+    saved = codegen.Code
+    codegen.Code = code_cls
+    try:
+        generator = CodeGenerator()
+        start = time.perf_counter()
+        if profile:
+            cProfile.Profile().runcall(generator.visit, ast)
+        else:
+            generator.visit(ast)
+        elapsed = time.perf_counter() - start
+    finally:
+        codegen.Code = saved
+    path = generator.emit.filepath
+    with open(path) as f:
+        output = f.read()
+    os.remove(path)
+    return elapsed, output
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="OPLang code buffer benchmark")
+    arg_parser.add_argument("--elements", type=int, default=100000)
+    arg_parser.add_argument("--profile", action="store_true", help="generate code under cProfile")
+    args = arg_parser.parse_args()
+
+    print(f"{'elements':>9}{'string (s)':>12}{'us/elem':>9}{'Code (s)':>10}{'us/elem':>9}{'speedup':>9}")
+    for elements in (args.elements // 4, args.elements // 2, args.elements):
+        ast = make_program(elements)
+        old, old_output = time_codegen(string_code, ast, args.profile)
+        new, new_output = time_codegen(codegen.Code, ast, args.profile)
+        assert old_output == new_output, "Code buffer changed the generated output"
+        print(
+            f"{elements:>9}{old:>12.3f}{old / elements * 1e6:>9.2f}"
+            f"{new:>10.3f}{new / elements * 1e6:>9.2f}{old / new:>8.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
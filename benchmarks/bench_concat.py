@@ -0,0 +1,109 @@
+"""
+String concatenation benchmark for OPLang programming language.
+Compiles a loop that builds a line from a ^ chain of strings, ints and
+booleans, once with a StringBuilder and a toString for every ^ (an
+intermediate String per operator) and once with the whole chain fused
+into one StringBuilder, and compares the bytecode and run time.
+
+Usage: python benchmarks/bench_concat.py [--iterations N] [--operands N]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, ROOT)
+
+from src.utils.nodes import *
+from src.codegen.codegen import CodeGenerator
+from src.codegen.utils import Code
+from src.codegen.jvm_runner import JVMRunner
+
+RUNTIME_DIR = os.path.join(ROOT, "src", "runtime")
+
+
+class PairwiseCodeGenerator(CodeGenerator):
+    """Code generator that builds and converts a new String for every ^."""
+
+    def generate_concat(self, node, o):
+        frame = o.frame
+        code = Code(self.emit.emit_new_string_builder(frame))
+        for operand in (node.left, node.right):
+            operand_code, operand_type = self.visit(operand, o)
+            code += operand_code
+            code += self.emit.emit_append(operand_type, frame)
+        return code + self.emit.emit_builder_to_string(frame)
+
+
+def make_program(iterations: int, operands: int):
+    """Build a line from a chain of `operands` ^ operands for i in 1..iterations, print the last."""
+    line = StringLiteral("#")
+    for k in range(operands - 1):
+        if k % 3 == 0:
+            operand = StringLiteral(",")
+        elif k % 3 == 1:
+            operand = BinaryOp(Identifier("i"), "*", IntLiteral(k))
+        else:
+            operand = ParenthesizedExpression(BinaryOp(BinaryOp(Identifier("i"), "%", IntLiteral(k)), "==", IntLiteral(0)))
+        line = BinaryOp(line, "^", operand)
+    body = BlockStatement(
+        [
+            VariableDecl(False, PrimitiveType("int"), [Variable("i")]),
+            VariableDecl(False, PrimitiveType("string"), [Variable("line", StringLiteral(""))]),
+        ],
+        [
+            ForStatement("i", IntLiteral(1), "to", IntLiteral(iterations), AssignmentStatement(IdLHS("line"), line)),
+            MethodInvocationStatement(PostfixExpression(Identifier("io"), [
+                MethodCall("writeStr", [Identifier("line")])
+            ])),
+        ],
+    )
+    main = MethodDecl(True, PrimitiveType("void"), "main", [], body)
+    return Program([ClassDecl("Main", None, [main])])
+
+
+def instruction_counts(source: str):
+    lines = [line.strip() for line in source.splitlines()]
+    code = [line for line in lines if line and not line.startswith(".") and not line.endswith(":")]
+    builders = [line for line in code if line == "new java/lang/StringBuilder"]
+    return len(code), len(builders)
+
+
+def measure(runner, generator, ast):
+    workspace = tempfile.mkdtemp(prefix="oplang-bench-")
+    try:
+        codegen = generator(class_files=True, output_dir=workspace)
+        codegen.visit(ast)
+        with open(os.path.join(workspace, "Main.j")) as f:
+            instructions, builders = instruction_counts(f.read())
+        shutil.copy(os.path.join(RUNTIME_DIR, "io.class"), workspace)
+        runner.run(workspace, "Main")  # warm up the JIT
+        start = time.perf_counter()
+        result = runner.run(workspace, "Main")
+        elapsed = time.perf_counter() - start
+    finally:
+        shutil.rmtree(workspace)
+    return instructions, builders, elapsed, result.stdout.strip()
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="OPLang string concatenation benchmark")
+    arg_parser.add_argument("--iterations", type=int, default=2_000_000)
+    arg_parser.add_argument("--operands", type=int, default=12)
+    args = arg_parser.parse_args()
+
+    ast = make_program(args.iterations, args.operands)
+    print(f"{'codegen':>10}{'instructions':>14}{'builders':>10}{'run (s)':>10}  output")
+    with JVMRunner() as runner:
+        for name, generator in (("pairwise", PairwiseCodeGenerator), ("fused", CodeGenerator)):
+            instructions, builders, elapsed, output = measure(runner, generator, ast)
+            print(f"{name:>10}{instructions:>14}{builders:>10}{elapsed:>10.3f}  {output}")
+
+
+if __name__ == "__main__":
+    main()
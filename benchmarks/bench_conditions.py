@@ -0,0 +1,166 @@
+"""
+Condition codegen benchmark for OPLang programming language.
+Compiles a loop whose body tests a compound condition, once with the
+previous materialized booleans (push 0/1, then test the value again) and
+once with jumping code, and compares the loop's bytecode and run time.
+A second loop stores a guarded boolean and compares the previous eager
+iand/ior evaluation with short-circuit evaluation.
+
+Usage: python benchmarks/bench_conditions.py [--iterations N]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, ROOT)
+
+from src.utils.nodes import *
+from src.codegen.codegen import CodeGenerator
+from src.utils.type_pool import BOOL_TYPE, FLOAT_TYPE, INT_TYPE
+from src.codegen.jvm_runner import JVMRunner
+
+RUNTIME_DIR = os.path.join(ROOT, "src", "runtime")
+
+
+class LegacyCodeGenerator(CodeGenerator):
+    """
+    Code generator with the previous boolean codegen: conditions are
+    materialized as 0/1 and tested again, && and || evaluate both operands
+    and combine them with iand/ior.
+    """
+
+    def generate_condition(self, node, o, label, jump_if):
+        code, typ = self.visit(node, o)
+        if jump_if:
+            return code + self.emit.emit_if_true(label, o.frame)
+        return code + self.emit.emit_if_false(label, o.frame)
+
+    def visit_binary_op(self, node, o=None):
+        op = node.operator
+        if o is None or op not in ("&&", "||", ">", ">=", "<", "<=", "==", "!="):
+            return super().visit_binary_op(node, o)
+        lc, lt = self.visit(node.left, o)
+        rc, rt = self.visit(node.right, o)
+        if op == "&&":
+            return lc + rc + self.emit.emit_and_op(o.frame), BOOL_TYPE
+        if op == "||":
+            return lc + rc + self.emit.emit_or_op(o.frame), BOOL_TYPE
+        typ = FLOAT_TYPE if FLOAT_TYPE in (lt, rt) else INT_TYPE
+        return lc + rc + self.emit.emit_re_op(op, typ, o.frame), BOOL_TYPE
+
+    def visit_unary_op(self, node, o=None):
+        if o is None or node.operator != "!":
+            return super().visit_unary_op(node, o)
+        code, typ = self.visit(node.operand, o)
+        return code + self.emit.emit_not(typ, o.frame), BOOL_TYPE
+
+
+def make_program(iterations: int):
+    """Count i in 1..iterations with (i % 3 == 0 && i % 5 != 0) || !(i % 7 < 6)."""
+    def rem(k):
+        return BinaryOp(Identifier("i"), "%", IntLiteral(k))
+
+    condition = BinaryOp(
+        BinaryOp(BinaryOp(rem(3), "==", IntLiteral(0)), "&&", BinaryOp(rem(5), "!=", IntLiteral(0))),
+        "||",
+        UnaryOp("!", ParenthesizedExpression(BinaryOp(rem(7), "<", IntLiteral(6)))),
+    )
+    count = AssignmentStatement(IdLHS("n"), BinaryOp(Identifier("n"), "+", IntLiteral(1)))
+    body = BlockStatement(
+        [
+            VariableDecl(False, PrimitiveType("int"), [Variable("i")]),
+            VariableDecl(False, PrimitiveType("int"), [Variable("n", IntLiteral(0))]),
+        ],
+        [
+            ForStatement("i", IntLiteral(1), "to", IntLiteral(iterations), IfStatement(condition, count, None)),
+            MethodInvocationStatement(PostfixExpression(Identifier("io"), [
+                MethodCall("writeInt", [Identifier("n")])
+            ])),
+        ],
+    )
+    main = MethodDecl(True, PrimitiveType("void"), "main", [], body)
+    return Program([ClassDecl("Main", None, [main])])
+
+
+def make_guard_program(iterations: int):
+    """Count i in 1..iterations with b := i % 16 == 0 && <long arithmetic test>."""
+    term = Identifier("i")
+    for k in range(2, 12):
+        term = BinaryOp(BinaryOp(term, "*", IntLiteral(k)), "%", IntLiteral(1009 + k))
+    guard = BinaryOp(
+        BinaryOp(BinaryOp(Identifier("i"), "%", IntLiteral(16)), "==", IntLiteral(0)),
+        "&&",
+        BinaryOp(term, ">", IntLiteral(500)),
+    )
+    loop_body = BlockStatement([], [
+        AssignmentStatement(IdLHS("b"), guard),
+        IfStatement(Identifier("b"), AssignmentStatement(IdLHS("n"), BinaryOp(Identifier("n"), "+", IntLiteral(1))), None),
+    ])
+    body = BlockStatement(
+        [
+            VariableDecl(False, PrimitiveType("int"), [Variable("i")]),
+            VariableDecl(False, PrimitiveType("int"), [Variable("n", IntLiteral(0))]),
+            VariableDecl(False, PrimitiveType("boolean"), [Variable("b")]),
+        ],
+        [
+            ForStatement("i", IntLiteral(1), "to", IntLiteral(iterations), loop_body),
+            MethodInvocationStatement(PostfixExpression(Identifier("io"), [
+                MethodCall("writeInt", [Identifier("n")])
+            ])),
+        ],
+    )
+    main = MethodDecl(True, PrimitiveType("void"), "main", [], body)
+    return Program([ClassDecl("Main", None, [main])])
+
+
+def instruction_counts(source: str):
+    lines = [line.strip() for line in source.splitlines()]
+    code = [line for line in lines if line and not line.startswith(".") and not line.endswith(":")]
+    branches = [line for line in code if line.startswith(("if", "goto"))]
+    return len(code), len(branches)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="OPLang condition codegen benchmark")
+    arg_parser.add_argument("--iterations", type=int, default=50_000_000)
+    args = arg_parser.parse_args()
+
+    print(f"{'codegen':>14}{'instructions':>14}{'branches':>10}{'run (s)':>10}{'output':>12}")
+    with JVMRunner() as runner:
+        for title, ast, generators in (
+            ("if condition", make_program(args.iterations),
+             (("materialized", LegacyCodeGenerator), ("jumping", CodeGenerator))),
+            ("guarded value", make_guard_program(args.iterations),
+             (("eager", LegacyCodeGenerator), ("short-circuit", CodeGenerator))),
+        ):
+            print(title)
+            for name, generator in generators:
+                instructions, branches, elapsed, output = measure(runner, generator, ast)
+                print(f"{name:>14}{instructions:>14}{branches:>10}{elapsed:>10.3f}{output:>12}")
+
+
+def measure(runner, generator, ast):
+    workspace = tempfile.mkdtemp(prefix="oplang-bench-")
+    try:
+        codegen = generator(class_files=True, output_dir=workspace)
+        codegen.visit(ast)
+        with open(os.path.join(workspace, "Main.j")) as f:
+            instructions, branches = instruction_counts(f.read())
+        shutil.copy(os.path.join(RUNTIME_DIR, "io.class"), workspace)
+        runner.run(workspace, "Main")  # warm up the JIT
+        start = time.perf_counter()
+        result = runner.run(workspace, "Main")
+        elapsed = time.perf_counter() - start
+    finally:
+        shutil.rmtree(workspace)
+    return instructions, branches, elapsed, result.stdout.strip()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Inheritance benchmark for OPLang programming language.
+Checks programs with long inheritance chains and many call sites, once with
+the flattened member tables and once with the previous parent-chain walks.
+
+Usage: python benchmarks/bench_hierarchy.py [--depth N] [--calls N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, ROOT)
+
+from src.utils.nodes import *
+from src.semantics.static_checker import StaticChecker
+
+
+class ChainWalkChecker(StaticChecker):
+    """Checker with the previous per-call parent-chain walks."""
+
+    def lookup_in_class_attrs(self, class_name, attr):
+        if self.currently_initializing_attr == attr and class_name == self.current_class:
+            return None
+        cur = class_name
+        visited = set()
+        while cur and cur not in visited:
+            visited.add(cur)
+            clsinfo = self.class_table.get(cur)
+            if clsinfo and attr in clsinfo["attributes"]:
+                return clsinfo["attributes"][attr]
+            cur = clsinfo["parent"] if clsinfo else None
+        return None
+
+    def lookup_method(self, class_name, method_name):
+        cur = class_name
+        visited = set()
+        while cur and cur not in visited:
+            visited.add(cur)
+            clsinfo = self.class_table.get(cur)
+            if clsinfo and method_name in clsinfo["methods"]:
+                return clsinfo["methods"][method_name]
+            cur = clsinfo["parent"] if clsinfo else None
+        return None
+
+    def is_subtype(self, sub, sup):
+        if isinstance(sub, ClassType) and isinstance(sup, ClassType):
+            cur = sub.class_name
+            visited = set()
+            while cur and cur not in visited:
+                if cur == sup.class_name:
+                    return True
+                visited.add(cur)
+                clsinfo = self.class_table.get(cur)
+                cur = clsinfo["parent"] if clsinfo else None
+        return False
+
+
+def make_program(depth: int, calls: int):
+    """
+    Chain C0 <- C1 <- ... <- C{depth-1}; each class declares attribute f<i>
+    and method m<i>. main() creates the deepest class, assigns it to a
+    variable of the root type and calls root-level members through it.
+    """
+    classes = []
+    for i in range(depth):
+        members = [
+            AttributeDecl(False, False, PrimitiveType("int"), [Attribute(f"f{i}", IntLiteral(i))]),
+            MethodDecl(False, PrimitiveType("int"), f"m{i}", [Parameter(PrimitiveType("int"), "p")],
+                       BlockStatement([], [ReturnStatement(Identifier("p"))])),
+        ]
+        classes.append(ClassDecl(f"C{i}", f"C{i - 1}" if i else None, members))
+
+    leaf = f"C{depth - 1}"
+    statements = []
+    for k in range(calls):
+        member = k % depth
+        call = PostfixExpression(Identifier("obj"), [MethodCall(f"m{member}", [IntLiteral(k)])])
+        field = PostfixExpression(Identifier("obj"), [MemberAccess(f"f{member}")])
+        statements.append(AssignmentStatement(IdLHS("x"), BinaryOp(call, "+", field)))
+        statements.append(AssignmentStatement(IdLHS("root"), Identifier("obj")))
+    body = BlockStatement(
+        [
+            VariableDecl(False, ClassType(leaf), [Variable("obj", ObjectCreation(leaf, []))]),
+            VariableDecl(False, ClassType("C0"), [Variable("root")]),
+            VariableDecl(False, PrimitiveType("int"), [Variable("x")]),
+        ],
+        statements,
+    )
+    main = MethodDecl(True, PrimitiveType("void"), "main", [], body)
+    classes.append(ClassDecl("Main", None, [main]))
+    return Program(classes)
+
+
+def time_check(checker_cls, ast) -> float:
+    start = time.perf_counter()
+    checker_cls().check_program(ast)
+    return time.perf_counter() - start
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="OPLang inheritance benchmark")
+    arg_parser.add_argument("--depth", type=int, default=200)
+    arg_parser.add_argument("--calls", type=int, default=5000)
+    args = arg_parser.parse_args()
+
+    print(f"{'depth':>6}{'calls':>8}{'chain walk (s)':>16}{'flattened (s)':>15}{'speedup':>9}")
+    for depth in (args.depth // 4, args.depth // 2, args.depth):
+        ast = make_program(depth, args.calls)
+        old = min(time_check(ChainWalkChecker, ast) for _ in range(2))
+        new = min(time_check(StaticChecker, ast) for _ in range(2))
+        print(f"{depth:>6}{args.calls:>8}{old:>16.3f}{new:>15.3f}{old / new:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
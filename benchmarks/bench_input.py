@@ -0,0 +1,102 @@
+"""
+Input benchmark for OPLang programming language.
+Runs an OPLang program that reads N integers (10^6 by default) with
+io.readInt and prints their sum, then the same with io.readFloat, and
+reports tokens read per second. --io-class runs the programs against
+another build of the io runtime as well, e.g. an older one taken with
+`git show <rev>:src/runtime/io.class > old-io.class`.
+
+Usage: python benchmarks/bench_input.py [--count N] [--io-class PATH]
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, ROOT)
+
+from src.utils.nodes import *
+from src.codegen.codegen import CodeGenerator
+from src.codegen.jvm_runner import JVMRunner
+
+RUNTIME_DIR = os.path.join(ROOT, "src", "runtime")
+
+
+def make_program(count: int, kind: str):
+    """Sum count values read with io.read<kind>, print the sum."""
+    typ = PrimitiveType(kind.lower())
+    zero = IntLiteral(0) if kind == "Int" else FloatLiteral(0.0)
+    read = PostfixExpression(Identifier("io"), [MethodCall("read" + kind, [])])
+    body = BlockStatement(
+        [
+            VariableDecl(False, PrimitiveType("int"), [Variable("i")]),
+            VariableDecl(False, typ, [Variable("s", zero)]),
+        ],
+        [
+            ForStatement("i", IntLiteral(1), "to", IntLiteral(count),
+                         AssignmentStatement(IdLHS("s"), BinaryOp(Identifier("s"), "+", read))),
+            MethodInvocationStatement(PostfixExpression(Identifier("io"), [
+                MethodCall("write" + kind, [Identifier("s")])
+            ])),
+        ],
+    )
+    main = MethodDecl(True, PrimitiveType("void"), "main", [], body)
+    return Program([ClassDecl("Main", None, [main])])
+
+
+def write_input(path: str, count: int, kind: str):
+    """Write count random values, several per line."""
+    rng = random.Random(count)
+    with open(path, "w") as f:
+        for k in range(count):
+            value = rng.randint(-10 ** 6, 10 ** 6)
+            f.write(str(value) if kind == "Int" else f"{value / 100}")
+            f.write("\n" if k % 8 == 7 else " ")
+
+
+def measure(runner, ast, io_class, stdin_path):
+    workspace = tempfile.mkdtemp(prefix="oplang-bench-")
+    try:
+        CodeGenerator(class_files=True, output_dir=workspace).visit(ast)
+        shutil.copy(io_class, os.path.join(workspace, "io.class"))
+        runner.run(workspace, "Main", stdin_path=stdin_path)  # warm up the JIT
+        start = time.perf_counter()
+        result = runner.run(workspace, "Main", stdin_path=stdin_path)
+        elapsed = time.perf_counter() - start
+    finally:
+        shutil.rmtree(workspace)
+    return elapsed, result.stdout.strip() or result.stderr.strip()
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="OPLang input benchmark")
+    arg_parser.add_argument("--count", type=int, default=1_000_000)
+    arg_parser.add_argument("--io-class", help="another io.class to compare against")
+    args = arg_parser.parse_args()
+
+    runtimes = [("current", os.path.join(RUNTIME_DIR, "io.class"))]
+    if args.io_class:
+        runtimes.insert(0, (os.path.basename(args.io_class), args.io_class))
+    data_dir = tempfile.mkdtemp(prefix="oplang-bench-")
+    try:
+        print(f"{'read':>10}  {'io.class':<20}{'run (s)':>10}{'tokens/s':>12}  output")
+        with JVMRunner() as runner:
+            for kind in ("Int", "Float"):
+                stdin_path = os.path.join(data_dir, kind + ".txt")
+                write_input(stdin_path, args.count, kind)
+                ast = make_program(args.count, kind)
+                for name, io_class in runtimes:
+                    elapsed, output = measure(runner, ast, io_class, stdin_path)
+                    print(f"{'read' + kind:>10}  {name:<20}{elapsed:>10.3f}{args.count / elapsed:>12.3g}  {output}")
+    finally:
+        shutil.rmtree(data_dir)
+
+
+if __name__ == "__main__":
+    main()
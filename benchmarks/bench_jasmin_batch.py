@@ -0,0 +1,98 @@
+"""
+Batch assembly benchmark for OPLang programming language.
+Generates a number of multi-class programs and assembles their .j files
+once with one `java -jar jasmin.jar` per file and once with a single
+JasminBatch process for all of them.
+
+Usage: python benchmarks/bench_jasmin_batch.py [--programs N] [--classes N]
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, ROOT)
+
+from src.utils.nodes import *
+from src.codegen.codegen import CodeGenerator
+from src.codegen.jasmin_batch import JasminBatch, JASMIN_JAR
+
+
+def make_program(classes: int, value: int):
+    """Main printing value, plus classes-1 small classes with one method each."""
+    decls = [
+        ClassDecl(f"C{i}", None, [
+            MethodDecl(False, PrimitiveType("int"), "get", [Parameter(PrimitiveType("int"), "p")],
+                       BlockStatement([], [ReturnStatement(BinaryOp(Identifier("p"), "+", IntLiteral(i)))]))
+        ])
+        for i in range(classes - 1)
+    ]
+    main = MethodDecl(True, PrimitiveType("void"), "main", [], BlockStatement([], [
+        MethodInvocationStatement(PostfixExpression(Identifier("io"), [
+            MethodCall("writeInt", [IntLiteral(value)])
+        ]))
+    ]))
+    decls.append(ClassDecl("Main", None, [main]))
+    return Program(decls)
+
+
+def generate(root: str, programs: int, classes: int):
+    """Generate every program into its own directory, return the .j paths."""
+    j_files = []
+    for n in range(programs):
+        workspace = os.path.join(root, f"p{n}")
+        os.makedirs(workspace)
+        codegen = CodeGenerator(output_dir=workspace)
+        codegen.visit(make_program(classes, n))
+        j_files.extend(os.path.join(workspace, name + ".j") for name in codegen.class_names)
+    return j_files
+
+
+def assemble_each(j_files) -> float:
+    start = time.perf_counter()
+    for j_file in j_files:
+        subprocess.run(
+            ["java", "-jar", JASMIN_JAR, "-d", os.path.dirname(j_file), j_file],
+            capture_output=True,
+            check=True,
+        )
+    return time.perf_counter() - start
+
+
+def assemble_batch(j_files) -> float:
+    start = time.perf_counter()
+    batch = JasminBatch()
+    for j_file in j_files:
+        batch.add(j_file)
+    errors = batch.assemble()
+    elapsed = time.perf_counter() - start
+    assert not any(errors.values()), errors
+    return elapsed
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="OPLang batch assembly benchmark")
+    arg_parser.add_argument("--programs", type=int, default=20)
+    arg_parser.add_argument("--classes", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    root = tempfile.mkdtemp(prefix="oplang-bench-")
+    try:
+        j_files = generate(root, args.programs, args.classes)
+        each = assemble_each(j_files)
+        batch = assemble_batch(j_files)
+    finally:
+        shutil.rmtree(root)
+
+    print(f"{'programs':>9}{'files':>7}{'jasmin per file (s)':>21}{'one batch (s)':>15}{'speedup':>9}")
+    print(f"{args.programs:>9}{len(j_files):>7}{each:>21.2f}{batch:>15.2f}{each / batch:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+List rule benchmark for OPLang programming language.
+Parses a single block holding many statements (and a class holding many
+members) and checks that parse and AST generation time grows linearly
+without hitting the recursion limit.
+
+Usage: python benchmarks/bench_lists.py [--statements N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "build"))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, ROOT)
+
+from antlr4 import InputStream, CommonTokenStream
+from build.OPLangLexer import OPLangLexer
+from build.OPLangParser import OPLangParser
+from src.utils.error_listener import NewErrorListener
+from src.utils.parsing import parse_two_stage
+from src.astgen.ast_generation import ASTGeneration
+
+
+def block_source(num_statements: int) -> str:
+    """One method whose body holds num_statements assignments."""
+    body = "\n".join(f"        x := x + {i};" for i in range(num_statements))
+    return f"""class Big {{
+    static void main() {{
+        int x := 0;
+{body}
+    }}
+}}"""
+
+
+def members_source(num_members: int) -> str:
+    """One class holding num_members attributes and methods."""
+    members = []
+    for i in range(num_members // 2):
+        members.append(f"    int a{i} := {i};")
+        members.append(f"    int m{i}(int p; float q) {{ return p; }}")
+    return "class Wide {\n" + "\n".join(members) + "\n}"
+
+
+def parse_and_build(source: str):
+    parser = OPLangParser(CommonTokenStream(OPLangLexer(InputStream(source))))
+    parser.removeErrorListeners()
+    parser.addErrorListener(NewErrorListener.INSTANCE)
+    start = time.perf_counter()
+    tree = parse_two_stage(parser, "program")
+    parsed = time.perf_counter()
+    ast = ASTGeneration().visit(tree)
+    built = time.perf_counter()
+    return ast, parsed - start, built - parsed
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="OPLang list rule benchmark")
+    arg_parser.add_argument("--statements", type=int, default=50000)
+    args = arg_parser.parse_args()
+
+    sizes = sorted({max(args.statements // 10, 1), args.statements})
+    print(f"{'workload':<22}{'parse (s)':>11}{'AST (s)':>10}{'us/item':>10}")
+    for size in sizes:
+        ast, parse_time, ast_time = parse_and_build(block_source(size))
+        statements = ast.class_decls[0].members[0].body.statements
+        assert len(statements) == size, "statement count mismatch"
+        per_item = (parse_time + ast_time) / size * 1e6
+        print(f"{f'{size} statements':<22}{parse_time:>11.3f}{ast_time:>10.3f}{per_item:>10.1f}")
+
+        ast, parse_time, ast_time = parse_and_build(members_source(size))
+        assert len(ast.class_decls[0].members) == size // 2 * 2, "member count mismatch"
+        per_item = (parse_time + ast_time) / size * 1e6
+        print(f"{f'{size} members':<22}{parse_time:>11.3f}{ast_time:>10.3f}{per_item:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
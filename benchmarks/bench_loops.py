@@ -0,0 +1,136 @@
+"""
+Loop codegen benchmark for OPLang programming language.
+Compiles nested for loops whose inner bound is computed from the outer
+counter, once with the previous lowering (the bound is evaluated again on
+every test, the counter is stepped with iload/iconst_1/iadd/istore) and
+once with iinc and the bound held in a hidden local, and compares the
+loop's bytecode and run time.
+
+Usage: python benchmarks/bench_loops.py [--outer N] [--inner N]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, ROOT)
+
+from src.utils.nodes import *
+from src.codegen.codegen import CodeGenerator, Access
+from src.utils.type_pool import INT_TYPE
+from src.codegen.jvm_runner import JVMRunner
+
+RUNTIME_DIR = os.path.join(ROOT, "src", "runtime")
+
+
+class LegacyCodeGenerator(CodeGenerator):
+    """
+    Code generator with the previous for loop lowering: the end bound is
+    evaluated before every test and the counter is updated through the
+    operand stack.
+    """
+
+    def visit_for_statement(self, node, o=None):
+        if o is None:
+            return
+        frame = o.frame
+        emit = self.emit
+        idx = o.sym.lookup(node.variable).value.value
+        code, typ = self.visit(node.start_expr, Access(frame, o.sym))
+        emit.print_out(code)
+        emit.print_out(emit.emit_write_var(node.variable, typ, idx, frame))
+
+        frame.enter_loop()
+        start_label = frame.get_new_label()
+        continue_label = frame.get_continue_label()
+        exit_label = frame.get_break_label()
+        emit.print_out(emit.emit_label(start_label, frame))
+        emit.print_out(emit.emit_read_var(node.variable, typ, idx, frame))
+        end_code, _ = self.visit(node.end_expr, Access(frame, o.sym))
+        emit.print_out(end_code)
+        op = "<=" if node.direction == "to" else ">="
+        emit.print_out(emit.emit_rel_op(op, typ, None, exit_label, frame))
+        self.visit(node.body, o)
+
+        emit.print_out(emit.emit_label(continue_label, frame))
+        emit.print_out(emit.emit_read_var(node.variable, typ, idx, frame))
+        emit.print_out(emit.emit_push_iconst(1, frame))
+        emit.print_out(emit.emit_add_op("+" if node.direction == "to" else "-", INT_TYPE, frame))
+        emit.print_out(emit.emit_write_var(node.variable, typ, idx, frame))
+        emit.print_out(emit.emit_goto(start_label, frame))
+        emit.print_out(emit.emit_label(exit_label, frame))
+        frame.exit_loop()
+
+
+def make_program(outer: int, inner: int):
+    """Sum (i + j) % 7 for i in 1..outer, j in 1..(inner + i % 2 * 2 - i % 2)."""
+    bound = BinaryOp(
+        BinaryOp(IntLiteral(inner), "+", BinaryOp(BinaryOp(Identifier("i"), "%", IntLiteral(2)), "*", IntLiteral(2))),
+        "-",
+        BinaryOp(Identifier("i"), "%", IntLiteral(2)),
+    )
+    add = AssignmentStatement(IdLHS("s"), BinaryOp(
+        Identifier("s"), "+", BinaryOp(BinaryOp(Identifier("i"), "+", Identifier("j")), "%", IntLiteral(7))
+    ))
+    body = BlockStatement(
+        [
+            VariableDecl(False, PrimitiveType("int"), [Variable("i"), Variable("j")]),
+            VariableDecl(False, PrimitiveType("int"), [Variable("s", IntLiteral(0))]),
+        ],
+        [
+            ForStatement("i", IntLiteral(1), "to", IntLiteral(outer),
+                         ForStatement("j", IntLiteral(1), "to", bound, add)),
+            MethodInvocationStatement(PostfixExpression(Identifier("io"), [
+                MethodCall("writeInt", [Identifier("s")])
+            ])),
+        ],
+    )
+    main = MethodDecl(True, PrimitiveType("void"), "main", [], body)
+    return Program([ClassDecl("Main", None, [main])])
+
+
+def loop_instructions(source: str) -> int:
+    """Count the instructions of the method body, directives and labels excluded."""
+    lines = [line.strip() for line in source.splitlines()]
+    return len([line for line in lines if line and not line.startswith(".") and not line.endswith(":")])
+
+
+def measure(runner, generator, ast):
+    workspace = tempfile.mkdtemp(prefix="oplang-bench-")
+    try:
+        codegen = generator(class_files=True, output_dir=workspace)
+        codegen.visit(ast)
+        with open(os.path.join(workspace, "Main.j")) as f:
+            instructions = loop_instructions(f.read())
+        shutil.copy(os.path.join(RUNTIME_DIR, "io.class"), workspace)
+        runner.run(workspace, "Main")  # warm up the JIT
+        start = time.perf_counter()
+        result = runner.run(workspace, "Main")
+        elapsed = time.perf_counter() - start
+    finally:
+        shutil.rmtree(workspace)
+    return instructions, elapsed, result.stdout.strip()
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="OPLang loop codegen benchmark")
+    arg_parser.add_argument("--outer", type=int, default=20_000)
+    arg_parser.add_argument("--inner", type=int, default=5_000)
+    args = arg_parser.parse_args()
+
+    ast = make_program(args.outer, args.inner)
+    print(f"{'codegen':>10}{'instructions':>14}{'run (s)':>10}{'iterations/s':>16}{'output':>14}")
+    with JVMRunner() as runner:
+        for name, generator in (("legacy", LegacyCodeGenerator), ("iinc", CodeGenerator)):
+            instructions, elapsed, output = measure(runner, generator, ast)
+            rate = args.outer * args.inner / elapsed
+            print(f"{name:>10}{instructions:>14}{elapsed:>10.3f}{rate:>16.3g}{output:>14}")
+
+
+if __name__ == "__main__":
+    main()
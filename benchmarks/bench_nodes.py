@@ -0,0 +1,91 @@
+"""
+AST node benchmark for OPLang programming language.
+Reports memory per node and construction throughput for the AST node
+classes. Extra nodes.py files can be passed to compare layouts, e.g. a
+copy taken with `git show <rev>:src/utils/nodes.py > /tmp/nodes_old.py`.
+
+Usage: python benchmarks/bench_nodes.py [--nodes FILE ...] [--count N]
+"""
+
+import argparse
+import importlib.util
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+NODES_PATH = os.path.join(ROOT, "src", "utils", "nodes.py")
+
+
+def load_nodes(path: str, name: str):
+    """Load a nodes.py file as a standalone module."""
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def build_expressions(nodes, count: int):
+    """
+    Build count small statements shaped like typical method bodies:
+    x := a.f(i, 2) + y[i] * 3.0;
+    Each statement holds 12 nodes.
+    """
+    statements = []
+    for i in range(count):
+        call = nodes.PostfixExpression(
+            nodes.Identifier("a"),
+            [nodes.MethodCall("f", [nodes.Identifier("i"), nodes.IntLiteral(i)])],
+        )
+        index = nodes.PostfixExpression(
+            nodes.Identifier("y"), [nodes.ArrayAccess(nodes.Identifier("i"))]
+        )
+        product = nodes.BinaryOp(index, "*", nodes.FloatLiteral(3.0))
+        statements.append(
+            nodes.AssignmentStatement(
+                nodes.IdLHS("x"), nodes.BinaryOp(call, "+", product)
+            )
+        )
+    return statements
+
+
+NODES_PER_STATEMENT = 12
+
+
+def measure(nodes, count: int):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    statements = build_expressions(nodes, count)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Exclude the list holding the statements and the argument lists
+    list_bytes = sys.getsizeof(statements) + count * (
+        sys.getsizeof([None]) * 2 + sys.getsizeof([None, None])
+    )
+    per_node = (after - before - list_bytes) / (count * NODES_PER_STATEMENT)
+    del statements
+
+    start = time.perf_counter()
+    build_expressions(nodes, count)
+    elapsed = time.perf_counter() - start
+    throughput = count * NODES_PER_STATEMENT / elapsed
+    return per_node, throughput
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="OPLang AST node benchmark")
+    arg_parser.add_argument("--nodes", nargs="*", default=[], help="extra nodes.py files to compare")
+    arg_parser.add_argument("--count", type=int, default=100000)
+    args = arg_parser.parse_args()
+
+    print(f"{'nodes module':<40}{'bytes/node':>12}{'nodes/s':>14}")
+    for i, path in enumerate([NODES_PATH] + args.nodes):
+        nodes = load_nodes(path, f"bench_nodes_{i}")
+        per_node, throughput = measure(nodes, args.count)
+        label = os.path.relpath(path, ROOT) if path == NODES_PATH else path
+        print(f"{label:<40}{per_node:>12.1f}{throughput:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
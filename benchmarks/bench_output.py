@@ -0,0 +1,71 @@
+"""
+Output benchmark for OPLang programming language.
+Runs a loop that prints one line per iteration with io.writeIntLn, once
+with an io.flush() after every write (what the unbuffered PrintStream
+calls used to cost) and once leaving the flushing to the io runtime, and
+compares run time and output size.
+
+Usage: python benchmarks/bench_output.py [--lines N]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, ROOT)
+
+from src.utils.nodes import *
+from src.codegen.codegen import CodeGenerator
+from src.codegen.jvm_runner import JVMRunner
+
+RUNTIME_DIR = os.path.join(ROOT, "src", "runtime")
+
+
+def make_program(lines: int, flush_each: bool):
+    """Print i * 7 for i in 1..lines, flushing after every line if flush_each."""
+    def call(name, *args):
+        return MethodInvocationStatement(PostfixExpression(Identifier("io"), [MethodCall(name, list(args))]))
+
+    write = call("writeIntLn", BinaryOp(Identifier("i"), "*", IntLiteral(7)))
+    loop_body = BlockStatement([], [write, call("flush")]) if flush_each else write
+    body = BlockStatement(
+        [VariableDecl(False, PrimitiveType("int"), [Variable("i")])],
+        [ForStatement("i", IntLiteral(1), "to", IntLiteral(lines), loop_body)],
+    )
+    main = MethodDecl(True, PrimitiveType("void"), "main", [], body)
+    return Program([ClassDecl("Main", None, [main])])
+
+
+def measure(runner, ast):
+    workspace = tempfile.mkdtemp(prefix="oplang-bench-")
+    try:
+        CodeGenerator(class_files=True, output_dir=workspace).visit(ast)
+        shutil.copy(os.path.join(RUNTIME_DIR, "io.class"), workspace)
+        runner.run(workspace, "Main")  # warm up the JIT
+        start = time.perf_counter()
+        result = runner.run(workspace, "Main")
+        elapsed = time.perf_counter() - start
+    finally:
+        shutil.rmtree(workspace)
+    return elapsed, len(result.stdout)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="OPLang output benchmark")
+    arg_parser.add_argument("--lines", type=int, default=1_000_000)
+    args = arg_parser.parse_args()
+
+    print(f"{'output':>10}{'run (s)':>10}{'lines/s':>12}{'bytes':>12}")
+    with JVMRunner() as runner:
+        for name, flush_each in (("flushed", True), ("buffered", False)):
+            elapsed, size = measure(runner, make_program(args.lines, flush_each))
+            print(f"{name:>10}{elapsed:>10.3f}{args.lines / elapsed:>12.3g}{size:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+Parsing benchmark for OPLang programming language.
+Compares plain LL parsing against two-stage SLL-then-LL parsing on large
+generated programs, checks that both produce identical ASTs and
+identical error messages, and that SLL alone parses the valid program.
+
+Usage: python benchmarks/bench_parse.py [--classes N] [--repeat N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "build"))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, ROOT)
+
+from antlr4 import InputStream, CommonTokenStream
+from antlr4.atn.PredictionMode import PredictionMode
+from antlr4.error.ErrorStrategy import BailErrorStrategy
+from antlr4.error.Errors import ParseCancellationException
+from build.OPLangLexer import OPLangLexer
+from build.OPLangParser import OPLangParser
+from src.utils.error_listener import NewErrorListener
+from src.utils.parsing import parse_two_stage
+from src.astgen.ast_generation import ASTGeneration
+
+
+def make_source(num_classes: int) -> str:
+    """Build a syntactically valid program with num_classes classes."""
+    classes = []
+    for i in range(num_classes):
+        cls = f"""class C{i} extends Base {{
+    static final int LIMIT := {i} * 2 + 1;
+    int x, y := {i};
+    float ratio := 1.5;
+    int[3] data := {{1, 2, 3}};
+    C{i}(int a; float b) {{
+        this.x := a;
+        this.ratio := b;
+    }}
+    int compute(int n; int & acc) {{
+        int i, total := 0;
+        for i := 0 to n do {{
+            if (i % 2 == 0) && !(i > LIMIT) then
+                total := total + i * this.x - (acc / 2);
+            else {{
+                total := total - 1;
+                continue;
+            }}
+        }}
+        acc := total;
+        return total;
+    }}
+    string describe() {{
+        string s := "C{i}" ^ " value";
+        io.writeStrLn(s);
+        return s;
+    }}
+    static void main() {{
+        C{i} obj := new C{i}(1, 2.0);
+        int r := 0;
+        obj.compute(10, r);
+        io.writeIntLn(obj.data[1] + r);
+    }}
+}}
+"""
+        classes.append(cls)
+    return "\n".join(classes)
+
+
+def make_parser(source: str) -> OPLangParser:
+    parser = OPLangParser(CommonTokenStream(OPLangLexer(InputStream(source))))
+    parser.removeErrorListeners()
+    parser.addErrorListener(NewErrorListener.INSTANCE)
+    return parser
+
+
+def parse_ll(source: str):
+    return make_parser(source).program()
+
+
+def parse_sll(source: str):
+    parser = make_parser(source)
+    parser._interp.predictionMode = PredictionMode.SLL
+    parser._errHandler = BailErrorStrategy()
+    return parser.program()
+
+
+def parse_sll_ll(source: str):
+    return parse_two_stage(make_parser(source), "program")
+
+
+def outcome(parse, source: str) -> str:
+    try:
+        return str(ASTGeneration().visit(parse(source)))
+    except Exception as e:
+        return f"error: {e}"
+
+
+def best_time(parse, source: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(source)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="OPLang parsing benchmark")
+    arg_parser.add_argument("--classes", type=int, default=20)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    source = make_source(args.classes)
+    broken = source[: len(source) // 2] + " := ;\n" + source[len(source) // 2 :]
+    workloads = (
+        ("valid", source),
+        ("syntax error", broken),
+    )
+
+    for name, text in workloads:
+        if outcome(parse_ll, text) != outcome(parse_sll_ll, text):
+            print(f"MISMATCH between LL and SLL/LL results on {name} input")
+            sys.exit(1)
+    try:
+        parse_sll(source)
+    except ParseCancellationException:
+        print("SLL prediction failed on valid input, every parse falls back to LL")
+        sys.exit(1)
+
+    print(f"Source: {args.classes} classes, {len(source.splitlines())} lines")
+    print(f"{'input':<14}{'LL (s)':>10}{'SLL/LL (s)':>12}{'speedup':>9}")
+    for name, text in workloads:
+        ll = best_time(lambda s: outcome(parse_ll, s), text, args.repeat)
+        two_stage = best_time(lambda s: outcome(parse_sll_ll, s), text, args.repeat)
+        print(f"{name:<14}{ll:>10.3f}{two_stage:>12.3f}{ll / two_stage:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Peephole optimizer benchmark for OPLang programming language.
+Compiles a loop over nested if/else statements, whose inner then parts
+end in jumps to jumps, with and without the peephole pass. Compares
+instruction counts, class file sizes and run time, then prints how often
+each rule fired.
+
+Usage: python benchmarks/bench_peephole.py [--iterations N]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, ROOT)
+
+from src.utils.nodes import *
+from src.codegen.codegen import CodeGenerator
+from src.codegen.peephole import PeepholeOptimizer
+from src.codegen.jvm_runner import JVMRunner
+
+RUNTIME_DIR = os.path.join(ROOT, "src", "runtime")
+
+
+def make_program(iterations: int):
+    """Add 1..4 to s for i in 1..iterations by nested if/else on i % 2, i % 3 and i % 5."""
+    def divides(k):
+        return BinaryOp(BinaryOp(Identifier("i"), "%", IntLiteral(k)), "==", IntLiteral(0))
+
+    def add(k):
+        return AssignmentStatement(IdLHS("s"), BinaryOp(Identifier("s"), "+", IntLiteral(k)))
+
+    loop_body = IfStatement(
+        divides(2),
+        IfStatement(divides(3), add(1), add(2)),
+        IfStatement(divides(5), add(3), add(4)),
+    )
+    body = BlockStatement(
+        [
+            VariableDecl(False, PrimitiveType("int"), [Variable("i")]),
+            VariableDecl(False, PrimitiveType("int"), [Variable("s", IntLiteral(0))]),
+        ],
+        [
+            ForStatement("i", IntLiteral(1), "to", IntLiteral(iterations), loop_body),
+            MethodInvocationStatement(PostfixExpression(Identifier("io"), [
+                MethodCall("writeInt", [Identifier("s")])
+            ])),
+        ],
+    )
+    main = MethodDecl(True, PrimitiveType("void"), "main", [], body)
+    return Program([ClassDecl("Main", None, [main])])
+
+
+def instruction_count(source: str) -> int:
+    lines = [line.strip() for line in source.splitlines()]
+    return len([line for line in lines if line and not line.startswith(".") and not line.endswith(":")])
+
+
+def measure(runner, ast, peephole):
+    workspace = tempfile.mkdtemp(prefix="oplang-bench-")
+    try:
+        codegen = CodeGenerator(class_files=True, output_dir=workspace, peephole=peephole)
+        codegen.visit(ast)
+        with open(os.path.join(workspace, "Main.j")) as f:
+            instructions = instruction_count(f.read())
+        size = os.path.getsize(os.path.join(workspace, "Main.class"))
+        shutil.copy(os.path.join(RUNTIME_DIR, "io.class"), workspace)
+        runner.run(workspace, "Main")  # warm up the JIT
+        start = time.perf_counter()
+        result = runner.run(workspace, "Main")
+        elapsed = time.perf_counter() - start
+    finally:
+        shutil.rmtree(workspace)
+    return instructions, size, elapsed, result.stdout.strip()
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="OPLang peephole optimizer benchmark")
+    arg_parser.add_argument("--iterations", type=int, default=50_000_000)
+    args = arg_parser.parse_args()
+
+    ast = make_program(args.iterations)
+    optimizer = PeepholeOptimizer()
+    print(f"{'peephole':>10}{'instructions':>14}{'class bytes':>13}{'run (s)':>10}{'output':>14}")
+    with JVMRunner() as runner:
+        for name, peephole in (("off", False), ("on", optimizer)):
+            instructions, size, elapsed, output = measure(runner, ast, peephole)
+            print(f"{name:>10}{instructions:>14}{size:>13}{elapsed:>10.3f}{output:>14}")
+    print()
+    print(f"{'rule':>16}{'hits':>6}")
+    for rule, hits in optimizer.stats.items():
+        print(f"{rule:>16}{hits:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Runner benchmark for OPLang programming language.
+Runs the same compiled program repeatedly, once with a new `java` process
+per run and once through the warm JVMRunner, and reports the latency.
+
+Usage: python benchmarks/bench_runner.py [--runs N]
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, ROOT)
+
+from src.codegen.class_writer import ClassWriter
+from src.codegen.jvm_runner import JVMRunner
+
+RUNTIME_DIR = os.path.join(ROOT, "src", "runtime")
+
+MAIN_SOURCE = """
+.source Main.java
+.class public Main
+.super java/lang/Object
+
+.method public static main([Ljava/lang/String;)V
+.limit stack 2
+.limit locals 1
+    ldc "hello"
+    invokestatic io/writeStrLn(Ljava/lang/String;)V
+    return
+.end method
+"""
+
+
+def time_runs(run, runs: int) -> float:
+    start = time.perf_counter()
+    for _ in range(runs):
+        result = run()
+        assert result.stdout.strip() == "hello", result
+    return (time.perf_counter() - start) / runs
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="OPLang runner benchmark")
+    arg_parser.add_argument("--runs", type=int, default=20)
+    args = arg_parser.parse_args()
+
+    class_dir = tempfile.mkdtemp(prefix="oplang-bench-")
+    try:
+        shutil.copy(os.path.join(RUNTIME_DIR, "io.class"), class_dir)
+        name, data = ClassWriter().assemble(MAIN_SOURCE)
+        ClassWriter.write(name, data, class_dir)
+
+        cold = time_runs(
+            lambda: subprocess.run(
+                ["java", "-cp", class_dir, "Main"], capture_output=True, text=True
+            ),
+            args.runs,
+        )
+        with JVMRunner() as runner:
+            runner.start()
+            runner.run(class_dir, "Main")  # exclude JVM startup from the warm numbers
+            warm = time_runs(lambda: runner.run(class_dir, "Main"), args.runs)
+    finally:
+        shutil.rmtree(class_dir)
+
+    print(f"{'runs':>6}{'java per run (ms)':>19}{'warm runner (ms)':>18}{'speedup':>9}")
+    print(f"{args.runs:>6}{cold * 1000:>19.1f}{warm * 1000:>18.1f}{cold / warm:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
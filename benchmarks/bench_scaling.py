@@ -0,0 +1,67 @@
+"""
+Scaling benchmark for OPLang programming language.
+Compiles generated programs of growing size (the number of classes doubles
+from one size to the next) through the lexer, parser, AST generation,
+static checker, code generator and assembler, and prints each stage's
+throughput, so a stage whose cost grows faster than the program shows up
+as a falling rate.
+
+Usage: python benchmarks/bench_scaling.py [--sizes 1,2,4,8] [--methods N] [--statements N]
+           [--depth N] [--array-size N] [--seed N]
+"""
+
+import argparse
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "build"))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, ROOT)
+
+from src.pipeline import run_pipeline
+from src.utils.instrumentation import Instrumentation
+from src.utils.program_generator import ProgramGenerator
+
+# Stage and the count its rate is given in
+RATES = (
+    ("lex", "tokens"),
+    ("parse", "tokens"),
+    ("ast", "nodes"),
+    ("check", "nodes"),
+    ("codegen", "instructions"),
+    ("assemble", "class_files"),
+)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="OPLang scaling benchmark")
+    arg_parser.add_argument("--sizes", default="1,2,4,8", help="numbers of classes, comma separated")
+    arg_parser.add_argument("--methods", type=int, default=4, help="methods per class")
+    arg_parser.add_argument("--statements", type=int, default=8, help="statements per method")
+    arg_parser.add_argument("--depth", type=int, default=3, help="expression depth")
+    arg_parser.add_argument("--array-size", type=int, default=4)
+    arg_parser.add_argument("--seed", type=int, default=0)
+    args = arg_parser.parse_args()
+
+    header = f"{'classes':>8}{'tokens':>9}{'nodes':>9}"
+    header += "".join(f"{stage + ' ' + count[:5] + '/s':>20}" for stage, count in RATES)
+    print(header)
+    for classes in (int(size) for size in args.sizes.split(",")):
+        source, _ = ProgramGenerator(
+            classes=classes,
+            methods_per_class=args.methods,
+            statements_per_method=args.statements,
+            expression_depth=args.depth,
+            array_size=args.array_size,
+            seed=args.seed,
+        ).generate()
+        instrumentation = Instrumentation(trace_memory=False)
+        run_pipeline(source, instrumentation, execute=False)
+        row = f"{classes:>8}{instrumentation['lex'].counts['tokens']:>9}{instrumentation['ast'].counts['nodes']:>9}"
+        row += "".join(f"{instrumentation[stage].rate(count):>20.4g}" for stage, count in RATES)
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
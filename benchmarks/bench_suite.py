@@ -0,0 +1,185 @@
+"""
+Compiler benchmark suite for OPLang programming language.
+Compiles a fixed corpus through every stage of the pipeline and reports the
+throughput of each stage: tokens/s for the lexer and parser, nodes/s for
+AST generation, static checking and constant folding, instructions/s for
+code generation, class files/s for assembly and programs/s for the JVM run.
+The corpus holds generated programs (ProgramGenerator, scaled by --scale)
+and the hand-written ones in benchmarks/corpus. Every program is compiled
+--repeat times and each stage keeps its fastest time.
+
+The results are compared with a JSON baseline, and the run fails when the
+throughput of a stage falls more than --threshold below the baseline's.
+--save records the results as the new baseline; a run without a baseline
+records one. Times depend on the machine, so a baseline is only meaningful
+on the machine that recorded it; the default one, benchmarks/baseline.json,
+is ignored by git. A baseline is only compared with runs of the same
+corpus, --scale and --repeat, since the best of more runs is faster.
+
+Usage: python benchmarks/bench_suite.py [--baseline PATH] [--save] [--threshold FRACTION]
+           [--repeat N] [--scale N] [--json PATH]
+"""
+
+import argparse
+import glob
+import json
+import os
+import platform
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "build"))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, ROOT)
+
+from src.codegen.jvm_runner import JVMRunner
+from src.pipeline import STAGES, run_pipeline
+from src.utils.instrumentation import Instrumentation
+from src.utils.program_generator import ProgramGenerator
+
+CORPUS_DIR = os.path.join(ROOT, "benchmarks", "corpus")
+DEFAULT_BASELINE = os.path.join(ROOT, "benchmarks", "baseline.json")
+
+# Generated programs: name -> ProgramGenerator parameters, sizes per unit of --scale
+GENERATED = {
+    "generated-classes": dict(classes=8, inheritance_depth=0, methods_per_class=3, statements_per_method=6,
+                              expression_depth=2, array_size=4),
+    "generated-hierarchy": dict(classes=8, inheritance_depth=7, methods_per_class=3, statements_per_method=6,
+                                expression_depth=2, array_size=4),
+    "generated-expressions": dict(classes=1, methods_per_class=4, statements_per_method=6,
+                                  expression_depth=5, array_size=8),
+    # Main only and no array stores, which the code generator compiles into runnable code
+    "generated-main": dict(classes=0, statements_per_method=100, expression_depth=3, array_size=0),
+}
+
+# Stage -> count its throughput is measured in
+UNITS = {
+    "lex": "tokens",
+    "parse": "tokens",
+    "ast": "nodes",
+    "check": "nodes",
+    "fold": "nodes",
+    "codegen": "instructions",
+    "assemble": "class_files",
+    "run": "programs",
+}
+
+
+def load_corpus(scale: int):
+    """Return [(name, source, runnable)] of the benchmark programs."""
+    corpus = []
+    for name, params in GENERATED.items():
+        params = dict(params, seed=0)
+        if params["classes"]:
+            params["classes"] *= scale
+        else:
+            params["statements_per_method"] *= scale
+        source, _ = ProgramGenerator(**params).generate()
+        corpus.append((name, source, params["classes"] == 0))
+    for path in sorted(glob.glob(os.path.join(CORPUS_DIR, "*.op"))):
+        with open(path) as f:
+            corpus.append((os.path.splitext(os.path.basename(path))[0], f.read(), True))
+    return corpus
+
+
+def measure(name, source, runnable, runner, repeat):
+    """Compile (and run) source repeat times, return {stage: (count, fastest wall)}."""
+    best = {}
+    for _ in range(repeat):
+        instrumentation = Instrumentation(trace_memory=False)
+        result = run_pipeline(source, instrumentation, runner=runner, execute=runnable, timeout=60)
+        if result.output is not None and result.output.returncode != 0:
+            raise RuntimeError(f"{name} failed: {result.output.stderr.strip()}")
+        for report in instrumentation.stages:
+            count = 1 if report.name == "run" else report.counts[UNITS[report.name]]
+            if report.name not in best or report.wall < best[report.name][1]:
+                best[report.name] = (count, report.wall)
+    return best
+
+
+def summarize(programs):
+    """Return {stage: {unit, count, wall, rate}} over all programs."""
+    stages = {}
+    for stage in STAGES:
+        measured = [program[stage] for program in programs.values() if stage in program]
+        if not measured:
+            continue
+        count = sum(count for count, _ in measured)
+        wall = sum(wall for _, wall in measured)
+        stages[stage] = {"unit": UNITS[stage], "count": count, "wall": wall, "rate": count / wall}
+    return stages
+
+
+def compare(stages, baseline, threshold):
+    """Print the throughputs against the baseline, return the regressed stages."""
+    regressed = []
+    print(f"{'stage':<10}{'unit':<14}{'count':>9}{'rate/s':>12}{'baseline/s':>12}{'change':>9}")
+    for stage, result in stages.items():
+        base = baseline["stages"].get(stage) if baseline else None
+        line = f"{stage:<10}{result['unit']:<14}{result['count']:>9}{result['rate']:>12.4g}"
+        if base is None:
+            print(line)
+            continue
+        change = result["rate"] / base["rate"] - 1
+        line += f"{base['rate']:>12.4g}{change:>+9.1%}"
+        if change < -threshold:
+            regressed.append(stage)
+            line += "  REGRESSION"
+        print(line)
+    return regressed
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="OPLang compiler benchmark suite")
+    arg_parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON file")
+    arg_parser.add_argument("--save", action="store_true", help="record the results as the new baseline")
+    arg_parser.add_argument("--threshold", type=float, default=0.25,
+                            help="fail when a stage's throughput falls this fraction below the baseline")
+    arg_parser.add_argument("--repeat", type=int, default=3, help="compilations of each program")
+    arg_parser.add_argument("--scale", type=int, default=1, help="size multiplier of the generated programs")
+    arg_parser.add_argument("--json", help="also write the results to this path")
+    args = arg_parser.parse_args()
+
+    corpus = load_corpus(args.scale)
+    programs = {}
+    with JVMRunner() as runner:
+        for name, source, runnable in corpus:
+            programs[name] = measure(name, source, runnable, runner, args.repeat)
+    results = {
+        "meta": {
+            "corpus": [name for name, _, _ in corpus],
+            "scale": args.scale,
+            "repeat": args.repeat,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+        },
+        "stages": summarize(programs),
+        "programs": {
+            name: {stage: {"count": count, "wall": wall} for stage, (count, wall) in stages.items()}
+            for name, stages in programs.items()
+        },
+    }
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+
+    baseline = None
+    if os.path.exists(args.baseline) and not args.save:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        for key in ("corpus", "scale", "repeat"):
+            if baseline["meta"][key] != results["meta"][key]:
+                sys.exit(f"{args.baseline} was recorded with another {key}; rerun with --save to replace it")
+    regressed = compare(results["stages"], baseline, args.threshold)
+    if baseline is None:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+        print(f"baseline saved to {args.baseline}")
+    elif regressed:
+        sys.exit(f"throughput of {', '.join(regressed)} fell more than {args.threshold:.0%} below the baseline")
+
+
+if __name__ == "__main__":
+    main()
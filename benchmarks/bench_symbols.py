@@ -0,0 +1,102 @@
+"""
+Symbol table benchmark for OPLang programming language.
+Generates code for a method with many local variables and nested blocks,
+once with the scoped hash-map symbol table and once with the previous
+linear list scans (every lookup walked the whole list, every declaration
+copied it).
+
+Usage: python benchmarks/bench_symbols.py [--locals N] [--uses N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, ROOT)
+
+from src.utils.nodes import *
+from src.codegen import codegen
+from src.codegen.codegen import CodeGenerator
+from src.codegen.utils import SymbolTable
+
+
+class ListSymbolTable(SymbolTable):
+    """Symbol table with the previous list semantics: newest first, linear scans."""
+
+    def __init__(self, symbols=()):
+        self.symbols = []
+        self.marks = []
+        for sym in symbols:
+            self.add(sym)
+
+    def push_scope(self):
+        self.marks.append(len(self.symbols))
+
+    def pop_scope(self):
+        # Leaving a block dropped the block's SubBody together with its list
+        del self.symbols[: len(self.symbols) - self.marks.pop()]
+
+    def add(self, sym):
+        # Each declaration built a new list: new_sym + o.sym
+        self.symbols = [sym] + self.symbols
+
+    def lookup(self, name):
+        return next(filter(lambda x: x.name == name, self.symbols), None)
+
+
+def make_program(num_locals: int, uses: int):
+    """
+    main() declares num_locals ints at the top and, inside a nested block,
+    reads and writes them uses times.
+    """
+    decls = [
+        VariableDecl(False, PrimitiveType("int"), [Variable(f"v{i}", IntLiteral(i))])
+        for i in range(num_locals)
+    ]
+    statements = []
+    for k in range(uses):
+        target = f"v{(k * 7) % num_locals}"
+        source = BinaryOp(Identifier(f"v{k % num_locals}"), "+", Identifier(f"v{(k * 3) % num_locals}"))
+        statements.append(AssignmentStatement(IdLHS(target), source))
+    inner = BlockStatement([VariableDecl(False, PrimitiveType("int"), [Variable("t", IntLiteral(0))])], statements)
+    body = BlockStatement(decls, [inner])
+    main = MethodDecl(True, PrimitiveType("void"), "main", [], body)
+    return Program([ClassDecl("Bench", None, [main])])
+
+
+def time_codegen(table_cls, ast) -> float:
+    # Code generation writes Bench.j next to the runtime; clean it up afterwards
+    saved = codegen.SymbolTable
+    codegen.SymbolTable = table_cls
+    try:
+        generator = CodeGenerator()
+        start = time.perf_counter()
+        generator.visit(ast)
+        elapsed = time.perf_counter() - start
+    finally:
+        codegen.SymbolTable = saved
+    path = generator.emit.filepath
+    if os.path.exists(path):
+        os.remove(path)
+    return elapsed
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="OPLang symbol table benchmark")
+    arg_parser.add_argument("--locals", type=int, default=2000)
+    arg_parser.add_argument("--uses", type=int, default=20000)
+    args = arg_parser.parse_args()
+
+    print(f"{'locals':>8}{'uses':>8}{'list scan (s)':>15}{'hash map (s)':>14}{'speedup':>9}")
+    for num_locals in (args.locals // 4, args.locals // 2, args.locals):
+        ast = make_program(num_locals, args.uses)
+        old = min(time_codegen(ListSymbolTable, ast) for _ in range(2))
+        new = min(time_codegen(SymbolTable, ast) for _ in range(2))
+        print(f"{num_locals:>8}{args.uses:>8}{old:>15.3f}{new:>14.3f}{old / new:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
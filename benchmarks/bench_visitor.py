@@ -0,0 +1,105 @@
+"""
+Visitor dispatch benchmark for OPLang programming language.
+Runs the static checker and the code generator over an expression-heavy
+AST of about a million nodes, once with the per-class dispatch tables and
+once with the previous dispatch (getattr on an f-string for the checker,
+accept() double dispatch for the code generator).
+
+Usage: python benchmarks/bench_visitor.py [--nodes N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, ROOT)
+
+from src.utils.nodes import *
+from src.semantics.static_checker import StaticChecker
+from src.codegen.codegen import CodeGenerator
+
+
+class GetattrChecker(StaticChecker):
+    """Checker with the previous name-building dispatch."""
+
+    def visit(self, node):
+        if node is None:
+            return None
+        visitor = getattr(self, f"visit{node.__class__.__name__}", None)
+        if visitor:
+            return visitor(node)
+        return None
+
+
+class AcceptCodeGenerator(CodeGenerator):
+    """Code generator with the previous accept() double dispatch."""
+
+    def visit(self, node, o=None):
+        return node.accept(self, o)
+
+
+def expression(depth: int, seed: int):
+    """Balanced int expression over a and b with 2**(depth+1) - 1 nodes."""
+    if depth == 0:
+        return Identifier("a") if seed % 3 else IntLiteral(seed)
+    op = "+-*"[seed % 3]
+    return BinaryOp(expression(depth - 1, seed * 2 + 1), op, expression(depth - 1, seed * 2 + 2))
+
+
+def make_program(target_nodes: int, depth: int = 6):
+    """Program whose main method assigns target_nodes worth of expressions."""
+    per_statement = 2 ** (depth + 1) - 1 + 2
+    statements = [
+        AssignmentStatement(IdLHS("x"), expression(depth, i))
+        for i in range(target_nodes // per_statement)
+    ]
+    body = BlockStatement(
+        [VariableDecl(False, PrimitiveType("int"), [
+            Variable("a", IntLiteral(1)), Variable("x", IntLiteral(0))
+        ])],
+        statements,
+    )
+    main = MethodDecl(True, PrimitiveType("void"), "main", [], body)
+    return Program([ClassDecl("Bench", None, [main])]), len(statements) * per_statement
+
+
+def time_check(checker_cls, ast) -> float:
+    start = time.perf_counter()
+    checker_cls().check_program(ast)
+    return time.perf_counter() - start
+
+
+def time_codegen(codegen_cls, ast) -> float:
+    # Code generation writes Bench.j next to the runtime; clean it up afterwards
+    generator = codegen_cls()
+    start = time.perf_counter()
+    generator.visit(ast)
+    elapsed = time.perf_counter() - start
+    path = generator.emit.filepath
+    if os.path.exists(path):
+        os.remove(path)
+    return elapsed
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="OPLang visitor dispatch benchmark")
+    arg_parser.add_argument("--nodes", type=int, default=1000000)
+    args = arg_parser.parse_args()
+
+    ast, nodes = make_program(args.nodes)
+    print(f"AST: {nodes:,} nodes")
+    print(f"{'pass':<12}{'previous (s)':>14}{'tables (s)':>12}{'speedup':>9}")
+    for name, run, old_cls, new_cls in (
+        ("check", time_check, GetattrChecker, StaticChecker),
+        ("codegen", time_codegen, AcceptCodeGenerator, CodeGenerator),
+    ):
+        old = min(run(old_cls, ast) for _ in range(2))
+        new = min(run(new_cls, ast) for _ in range(2))
+        print(f"{name:<12}{old:>14.3f}{new:>12.3f}{old / new:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Pipeline profile for OPLang programming language.
+Compiles an OPLang source file through every stage (lexer, parser, AST
+generation, static checker, constant folder, code generator, assembler)
+and runs it, then prints wall time, CPU time, peak Python memory and the
+token, node and instruction counts of each stage. --json writes the same
+report as JSON, --profile-dir dumps a cProfile profile per stage (read
+them with `python -m pstats <file>`).
+
+Usage: python benchmarks/profile_pipeline.py FILE [--json PATH] [--profile-dir DIR]
+           [--assembler python|jasmin] [--no-run] [--no-memory] [--stdin FILE]
+"""
+
+import argparse
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "build"))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, ROOT)
+
+from src.pipeline import run_pipeline
+from src.utils.instrumentation import Instrumentation
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="OPLang pipeline profile")
+    arg_parser.add_argument("file", help="OPLang source file")
+    arg_parser.add_argument("--json", help="write the report as JSON to this path")
+    arg_parser.add_argument("--profile-dir", help="dump a cProfile profile per stage into this directory")
+    arg_parser.add_argument("--assembler", choices=("python", "jasmin"), default="python")
+    arg_parser.add_argument("--no-run", action="store_true", help="stop after assembling")
+    arg_parser.add_argument("--no-memory", action="store_true", help="do not trace memory (more accurate times)")
+    arg_parser.add_argument("--stdin", help="file to use as the program's standard input")
+    args = arg_parser.parse_args()
+
+    with open(args.file) as f:
+        source = f.read()
+    instrumentation = Instrumentation(trace_memory=not args.no_memory, profile_dir=args.profile_dir)
+    instrumentation.meta["file"] = args.file
+    try:
+        result = run_pipeline(
+            source,
+            instrumentation,
+            assembler=args.assembler,
+            execute=not args.no_run,
+            stdin_path=args.stdin,
+        )
+    finally:
+        print(instrumentation.table())
+        if args.json:
+            instrumentation.to_json(args.json)
+    if result.output is not None and result.output.returncode != 0:
+        print(result.output.stderr, file=sys.stderr, end="")
+        sys.exit(result.output.returncode)
+
+
+if __name__ == "__main__":
+    main()
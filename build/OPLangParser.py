@@ -0,0 +1,5143 @@
+# Generated from OPLang.g4 by ANTLR 4.13.2
+# encoding: utf-8
+from antlr4 import *
+from io import StringIO
+import sys
+if sys.version_info[1] > 5:
+	from typing import TextIO
+else:
+	from typing.io import TextIO
+
+def serializedATN():
+    return [
+        4,1,62,658,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,7,
+        6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,13,7,13,
+        2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,19,2,20,
+        7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,2,26,7,26,
+        2,27,7,27,2,28,7,28,2,29,7,29,2,30,7,30,2,31,7,31,2,32,7,32,2,33,
+        7,33,2,34,7,34,2,35,7,35,2,36,7,36,2,37,7,37,2,38,7,38,2,39,7,39,
+        2,40,7,40,2,41,7,41,2,42,7,42,2,43,7,43,2,44,7,44,2,45,7,45,2,46,
+        7,46,2,47,7,47,2,48,7,48,2,49,7,49,2,50,7,50,2,51,7,51,2,52,7,52,
+        2,53,7,53,2,54,7,54,2,55,7,55,2,56,7,56,2,57,7,57,2,58,7,58,2,59,
+        7,59,2,60,7,60,2,61,7,61,2,62,7,62,2,63,7,63,2,64,7,64,2,65,7,65,
+        2,66,7,66,2,67,7,67,1,0,1,0,1,0,1,1,1,1,3,1,142,8,1,1,1,1,1,1,2,
+        1,2,1,2,5,2,149,8,2,10,2,12,2,152,9,2,1,3,1,3,3,3,156,8,3,1,4,1,
+        4,1,4,3,4,161,8,4,1,5,1,5,1,6,1,6,3,6,167,8,6,1,7,1,7,1,7,1,7,1,
+        7,1,8,1,8,1,8,1,8,1,8,1,9,1,9,1,9,3,9,182,8,9,1,9,1,9,1,10,1,10,
+        1,11,1,11,1,11,1,12,1,12,1,12,1,12,1,12,1,13,5,13,197,8,13,10,13,
+        12,13,200,9,13,1,14,1,14,1,14,1,14,1,14,1,14,1,14,1,14,3,14,210,
+        8,14,1,15,1,15,1,15,1,15,1,15,1,15,1,15,3,15,219,8,15,1,15,1,15,
+        1,15,1,16,1,16,1,16,1,17,1,17,1,17,1,17,1,17,1,17,3,17,233,8,17,
+        1,17,1,17,1,17,3,17,238,8,17,1,17,1,17,1,18,1,18,1,18,3,18,245,8,
+        18,1,18,3,18,248,8,18,1,19,1,19,1,19,1,19,1,19,1,19,1,19,1,19,3,
+        19,258,8,19,1,19,1,19,1,19,1,19,1,19,1,19,3,19,266,8,19,1,19,1,19,
+        1,19,3,19,271,8,19,1,20,1,20,1,20,1,21,1,21,1,21,1,22,1,22,1,22,
+        1,22,1,23,1,23,1,23,1,24,1,24,1,25,1,25,1,25,1,25,1,25,1,26,1,26,
+        3,26,295,8,26,1,27,1,27,1,27,5,27,300,8,27,10,27,12,27,303,9,27,
+        1,28,1,28,1,28,1,28,1,28,3,28,310,8,28,1,29,1,29,5,29,314,8,29,10,
+        29,12,29,317,9,29,1,30,4,30,320,8,30,11,30,12,30,321,1,31,1,31,1,
+        31,1,31,1,31,1,31,1,31,1,31,1,31,1,31,1,31,1,31,1,31,1,31,3,31,338,
+        8,31,1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,3,32,350,
+        8,32,1,33,1,33,1,33,3,33,355,8,33,1,33,1,33,1,33,1,33,1,33,1,33,
+        3,33,363,8,33,3,33,365,8,33,1,34,1,34,1,34,1,34,1,34,1,34,1,34,1,
+        34,3,34,375,8,34,1,35,1,35,1,36,1,36,1,37,1,37,1,37,3,37,384,8,37,
+        1,38,1,38,3,38,388,8,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,3,38,
+        397,8,38,1,38,1,38,3,38,401,8,38,1,38,1,38,1,38,1,38,1,38,1,38,3,
+        38,409,8,38,1,39,1,39,1,39,3,39,414,8,39,1,40,1,40,1,40,1,40,1,40,
+        1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,42,1,42,1,42,1,42,1,42,1,42,
+        1,43,1,43,1,43,1,43,1,43,1,43,1,44,1,44,3,44,442,8,44,1,45,1,45,
+        1,45,5,45,447,8,45,10,45,12,45,450,9,45,1,46,1,46,3,46,454,8,46,
+        1,46,1,46,1,47,1,47,1,47,1,47,1,47,3,47,463,8,47,1,48,5,48,466,8,
+        48,10,48,12,48,469,9,48,1,49,1,49,3,49,473,8,49,1,49,1,49,1,49,1,
+        49,1,49,1,49,3,49,481,8,49,1,49,1,49,1,49,1,49,3,49,487,8,49,1,50,
+        1,50,1,50,1,50,1,50,1,50,1,50,1,50,1,50,1,50,3,50,499,8,50,1,51,
+        1,51,1,51,1,51,1,51,1,51,1,51,3,51,508,8,51,1,52,1,52,1,52,3,52,
+        513,8,52,1,52,1,52,1,52,1,52,1,52,1,52,3,52,521,8,52,3,52,523,8,
+        52,1,53,1,53,1,53,1,53,1,53,1,53,1,53,1,53,3,53,533,8,53,1,54,1,
+        54,1,55,1,55,1,55,1,55,1,55,3,55,542,8,55,1,56,1,56,1,56,1,56,1,
+        56,3,56,549,8,56,1,57,1,57,1,57,1,57,1,57,1,57,5,57,557,8,57,10,
+        57,12,57,560,9,57,1,58,1,58,1,58,1,58,1,58,1,58,5,58,568,8,58,10,
+        58,12,58,571,9,58,1,59,1,59,1,59,1,59,1,59,1,59,5,59,579,8,59,10,
+        59,12,59,582,9,59,1,60,1,60,1,60,1,60,1,60,1,60,5,60,590,8,60,10,
+        60,12,60,593,9,60,1,61,1,61,1,61,3,61,598,8,61,1,62,1,62,1,62,3,
+        62,603,8,62,1,63,1,63,1,63,1,63,1,63,1,63,1,63,1,63,5,63,613,8,63,
+        10,63,12,63,616,9,63,1,64,1,64,1,64,1,64,1,64,1,64,1,64,1,64,3,64,
+        626,8,64,1,65,1,65,1,65,1,65,1,65,5,65,633,8,65,10,65,12,65,636,
+        9,65,1,66,1,66,1,66,3,66,641,8,66,1,67,1,67,1,67,1,67,1,67,1,67,
+        1,67,1,67,1,67,1,67,1,67,1,67,1,67,3,67,656,8,67,1,67,0,6,114,116,
+        118,120,126,130,68,0,2,4,6,8,10,12,14,16,18,20,22,24,26,28,30,32,
+        34,36,38,40,42,44,46,48,50,52,54,56,58,60,62,64,66,68,70,72,74,76,
+        78,80,82,84,86,88,90,92,94,96,98,100,102,104,106,108,110,112,114,
+        116,118,120,122,124,126,128,130,132,134,0,7,1,0,5,8,2,0,18,18,22,
+        22,1,0,48,51,1,0,46,47,1,0,52,53,1,0,40,41,1,0,42,45,676,0,136,1,
+        0,0,0,2,139,1,0,0,0,4,145,1,0,0,0,6,155,1,0,0,0,8,160,1,0,0,0,10,
+        162,1,0,0,0,12,166,1,0,0,0,14,168,1,0,0,0,16,173,1,0,0,0,18,181,
+        1,0,0,0,20,185,1,0,0,0,22,187,1,0,0,0,24,190,1,0,0,0,26,198,1,0,
+        0,0,28,209,1,0,0,0,30,218,1,0,0,0,32,223,1,0,0,0,34,226,1,0,0,0,
+        36,247,1,0,0,0,38,249,1,0,0,0,40,272,1,0,0,0,42,275,1,0,0,0,44,278,
+        1,0,0,0,46,282,1,0,0,0,48,285,1,0,0,0,50,287,1,0,0,0,52,294,1,0,
+        0,0,54,296,1,0,0,0,56,309,1,0,0,0,58,315,1,0,0,0,60,319,1,0,0,0,
+        62,337,1,0,0,0,64,349,1,0,0,0,66,364,1,0,0,0,68,374,1,0,0,0,70,376,
+        1,0,0,0,72,378,1,0,0,0,74,383,1,0,0,0,76,408,1,0,0,0,78,413,1,0,
+        0,0,80,415,1,0,0,0,82,420,1,0,0,0,84,427,1,0,0,0,86,433,1,0,0,0,
+        88,441,1,0,0,0,90,443,1,0,0,0,92,453,1,0,0,0,94,462,1,0,0,0,96,467,
+        1,0,0,0,98,486,1,0,0,0,100,498,1,0,0,0,102,507,1,0,0,0,104,522,1,
+        0,0,0,106,532,1,0,0,0,108,534,1,0,0,0,110,541,1,0,0,0,112,548,1,
+        0,0,0,114,550,1,0,0,0,116,561,1,0,0,0,118,572,1,0,0,0,120,583,1,
+        0,0,0,122,597,1,0,0,0,124,602,1,0,0,0,126,604,1,0,0,0,128,617,1,
+        0,0,0,130,627,1,0,0,0,132,640,1,0,0,0,134,655,1,0,0,0,136,137,3,
+        60,30,0,137,138,5,0,0,1,138,1,1,0,0,0,139,141,5,30,0,0,140,142,3,
+        4,2,0,141,140,1,0,0,0,141,142,1,0,0,0,142,143,1,0,0,0,143,144,5,
+        31,0,0,144,3,1,0,0,0,145,150,3,110,55,0,146,147,5,37,0,0,147,149,
+        3,110,55,0,148,146,1,0,0,0,149,152,1,0,0,0,150,148,1,0,0,0,150,151,
+        1,0,0,0,151,5,1,0,0,0,152,150,1,0,0,0,153,156,3,8,4,0,154,156,5,
+        9,0,0,155,153,1,0,0,0,155,154,1,0,0,0,156,7,1,0,0,0,157,161,3,10,
+        5,0,158,161,3,12,6,0,159,161,3,20,10,0,160,157,1,0,0,0,160,158,1,
+        0,0,0,160,159,1,0,0,0,161,9,1,0,0,0,162,163,7,0,0,0,163,11,1,0,0,
+        0,164,167,3,14,7,0,165,167,3,16,8,0,166,164,1,0,0,0,166,165,1,0,
+        0,0,167,13,1,0,0,0,168,169,3,10,5,0,169,170,5,35,0,0,170,171,5,26,
+        0,0,171,172,5,36,0,0,172,15,1,0,0,0,173,174,5,58,0,0,174,175,5,35,
+        0,0,175,176,5,26,0,0,176,177,5,36,0,0,177,17,1,0,0,0,178,182,3,10,
+        5,0,179,182,3,20,10,0,180,182,3,12,6,0,181,178,1,0,0,0,181,179,1,
+        0,0,0,181,180,1,0,0,0,182,183,1,0,0,0,183,184,5,32,0,0,184,19,1,
+        0,0,0,185,186,5,58,0,0,186,21,1,0,0,0,187,188,5,9,0,0,188,189,5,
+        10,0,0,189,23,1,0,0,0,190,191,5,30,0,0,191,192,3,96,48,0,192,193,
+        3,26,13,0,193,194,5,31,0,0,194,25,1,0,0,0,195,197,3,28,14,0,196,
+        195,1,0,0,0,197,200,1,0,0,0,198,196,1,0,0,0,198,199,1,0,0,0,199,
+        27,1,0,0,0,200,198,1,0,0,0,201,210,3,30,15,0,202,210,3,34,17,0,203,
+        210,3,38,19,0,204,210,3,40,20,0,205,210,3,42,21,0,206,210,3,44,22,
+        0,207,210,3,46,23,0,208,210,3,24,12,0,209,201,1,0,0,0,209,202,1,
+        0,0,0,209,203,1,0,0,0,209,204,1,0,0,0,209,205,1,0,0,0,209,206,1,
+        0,0,0,209,207,1,0,0,0,209,208,1,0,0,0,210,29,1,0,0,0,211,219,5,58,
+        0,0,212,213,5,58,0,0,213,214,5,35,0,0,214,215,3,110,55,0,215,216,
+        5,36,0,0,216,219,1,0,0,0,217,219,3,48,24,0,218,211,1,0,0,0,218,212,
+        1,0,0,0,218,217,1,0,0,0,219,220,1,0,0,0,220,221,3,32,16,0,221,222,
+        5,29,0,0,222,31,1,0,0,0,223,224,5,57,0,0,224,225,3,110,55,0,225,
+        33,1,0,0,0,226,232,5,14,0,0,227,228,5,33,0,0,228,229,3,110,55,0,
+        229,230,5,34,0,0,230,233,1,0,0,0,231,233,3,110,55,0,232,227,1,0,
+        0,0,232,231,1,0,0,0,233,234,1,0,0,0,234,237,5,15,0,0,235,238,3,28,
+        14,0,236,238,3,24,12,0,237,235,1,0,0,0,237,236,1,0,0,0,238,239,1,
+        0,0,0,239,240,3,36,18,0,240,35,1,0,0,0,241,244,5,16,0,0,242,245,
+        3,28,14,0,243,245,3,24,12,0,244,242,1,0,0,0,244,243,1,0,0,0,245,
+        248,1,0,0,0,246,248,1,0,0,0,247,241,1,0,0,0,247,246,1,0,0,0,248,
+        37,1,0,0,0,249,250,5,17,0,0,250,251,5,58,0,0,251,257,5,57,0,0,252,
+        253,5,33,0,0,253,254,3,110,55,0,254,255,5,34,0,0,255,258,1,0,0,0,
+        256,258,3,110,55,0,257,252,1,0,0,0,257,256,1,0,0,0,258,259,1,0,0,
+        0,259,265,7,1,0,0,260,261,5,33,0,0,261,262,3,110,55,0,262,263,5,
+        34,0,0,263,266,1,0,0,0,264,266,3,110,55,0,265,260,1,0,0,0,265,264,
+        1,0,0,0,266,267,1,0,0,0,267,270,5,19,0,0,268,271,3,24,12,0,269,271,
+        3,28,14,0,270,268,1,0,0,0,270,269,1,0,0,0,271,39,1,0,0,0,272,273,
+        5,20,0,0,273,274,5,29,0,0,274,41,1,0,0,0,275,276,5,21,0,0,276,277,
+        5,29,0,0,277,43,1,0,0,0,278,279,5,23,0,0,279,280,3,110,55,0,280,
+        281,5,29,0,0,281,45,1,0,0,0,282,283,3,48,24,0,283,284,5,29,0,0,284,
+        47,1,0,0,0,285,286,3,130,65,0,286,49,1,0,0,0,287,288,5,58,0,0,288,
+        289,5,33,0,0,289,290,3,52,26,0,290,291,5,34,0,0,291,51,1,0,0,0,292,
+        295,3,54,27,0,293,295,1,0,0,0,294,292,1,0,0,0,294,293,1,0,0,0,295,
+        53,1,0,0,0,296,301,3,56,28,0,297,298,5,37,0,0,298,300,3,56,28,0,
+        299,297,1,0,0,0,300,303,1,0,0,0,301,299,1,0,0,0,301,302,1,0,0,0,
+        302,55,1,0,0,0,303,301,1,0,0,0,304,310,5,26,0,0,305,310,5,27,0,0,
+        306,310,5,28,0,0,307,310,5,58,0,0,308,310,3,110,55,0,309,304,1,0,
+        0,0,309,305,1,0,0,0,309,306,1,0,0,0,309,307,1,0,0,0,309,308,1,0,
+        0,0,310,57,1,0,0,0,311,314,3,64,32,0,312,314,3,74,37,0,313,311,1,
+        0,0,0,313,312,1,0,0,0,314,317,1,0,0,0,315,313,1,0,0,0,315,316,1,
+        0,0,0,316,59,1,0,0,0,317,315,1,0,0,0,318,320,3,62,31,0,319,318,1,
+        0,0,0,320,321,1,0,0,0,321,319,1,0,0,0,321,322,1,0,0,0,322,61,1,0,
+        0,0,323,324,5,3,0,0,324,325,5,58,0,0,325,326,5,30,0,0,326,327,3,
+        72,36,0,327,328,5,31,0,0,328,338,1,0,0,0,329,330,5,3,0,0,330,331,
+        5,58,0,0,331,332,5,4,0,0,332,333,5,58,0,0,333,334,5,30,0,0,334,335,
+        3,72,36,0,335,336,5,31,0,0,336,338,1,0,0,0,337,323,1,0,0,0,337,329,
+        1,0,0,0,338,63,1,0,0,0,339,340,3,102,51,0,340,341,3,8,4,0,341,342,
+        3,66,33,0,342,343,5,29,0,0,343,350,1,0,0,0,344,345,3,102,51,0,345,
+        346,3,18,9,0,346,347,3,68,34,0,347,348,5,29,0,0,348,350,1,0,0,0,
+        349,339,1,0,0,0,349,344,1,0,0,0,350,65,1,0,0,0,351,354,3,70,35,0,
+        352,355,3,32,16,0,353,355,1,0,0,0,354,352,1,0,0,0,354,353,1,0,0,
+        0,355,356,1,0,0,0,356,357,5,37,0,0,357,358,3,66,33,0,358,365,1,0,
+        0,0,359,362,3,70,35,0,360,363,3,32,16,0,361,363,1,0,0,0,362,360,
+        1,0,0,0,362,361,1,0,0,0,363,365,1,0,0,0,364,351,1,0,0,0,364,359,
+        1,0,0,0,365,67,1,0,0,0,366,367,3,70,35,0,367,368,3,32,16,0,368,369,
+        5,37,0,0,369,370,3,68,34,0,370,375,1,0,0,0,371,372,3,70,35,0,372,
+        373,3,32,16,0,373,375,1,0,0,0,374,366,1,0,0,0,374,371,1,0,0,0,375,
+        69,1,0,0,0,376,377,5,58,0,0,377,71,1,0,0,0,378,379,3,58,29,0,379,
+        73,1,0,0,0,380,384,3,76,38,0,381,384,3,78,39,0,382,384,3,86,43,0,
+        383,380,1,0,0,0,383,381,1,0,0,0,383,382,1,0,0,0,384,75,1,0,0,0,385,
+        388,5,12,0,0,386,388,1,0,0,0,387,385,1,0,0,0,387,386,1,0,0,0,388,
+        389,1,0,0,0,389,390,3,22,11,0,390,391,5,33,0,0,391,392,5,34,0,0,
+        392,393,3,24,12,0,393,409,1,0,0,0,394,397,5,12,0,0,395,397,1,0,0,
+        0,396,394,1,0,0,0,396,395,1,0,0,0,397,400,1,0,0,0,398,401,3,6,3,
+        0,399,401,3,18,9,0,400,398,1,0,0,0,400,399,1,0,0,0,401,402,1,0,0,
+        0,402,403,5,58,0,0,403,404,5,33,0,0,404,405,3,88,44,0,405,406,5,
+        34,0,0,406,407,3,24,12,0,407,409,1,0,0,0,408,387,1,0,0,0,408,396,
+        1,0,0,0,409,77,1,0,0,0,410,414,3,80,40,0,411,414,3,82,41,0,412,414,
+        3,84,42,0,413,410,1,0,0,0,413,411,1,0,0,0,413,412,1,0,0,0,414,79,
+        1,0,0,0,415,416,5,58,0,0,416,417,5,33,0,0,417,418,5,34,0,0,418,419,
+        3,24,12,0,419,81,1,0,0,0,420,421,5,58,0,0,421,422,5,33,0,0,422,423,
+        5,58,0,0,423,424,5,58,0,0,424,425,5,34,0,0,425,426,3,24,12,0,426,
+        83,1,0,0,0,427,428,5,58,0,0,428,429,5,33,0,0,429,430,3,88,44,0,430,
+        431,5,34,0,0,431,432,3,24,12,0,432,85,1,0,0,0,433,434,5,1,0,0,434,
+        435,5,58,0,0,435,436,5,33,0,0,436,437,5,34,0,0,437,438,3,24,12,0,
+        438,87,1,0,0,0,439,442,3,90,45,0,440,442,1,0,0,0,441,439,1,0,0,0,
+        441,440,1,0,0,0,442,89,1,0,0,0,443,448,3,92,46,0,444,445,5,29,0,
+        0,445,447,3,92,46,0,446,444,1,0,0,0,447,450,1,0,0,0,448,446,1,0,
+        0,0,448,449,1,0,0,0,449,91,1,0,0,0,450,448,1,0,0,0,451,454,3,8,4,
+        0,452,454,3,18,9,0,453,451,1,0,0,0,453,452,1,0,0,0,454,455,1,0,0,
+        0,455,456,3,94,47,0,456,93,1,0,0,0,457,458,3,108,54,0,458,459,5,
+        37,0,0,459,460,3,94,47,0,460,463,1,0,0,0,461,463,3,108,54,0,462,
+        457,1,0,0,0,462,461,1,0,0,0,463,95,1,0,0,0,464,466,3,98,49,0,465,
+        464,1,0,0,0,466,469,1,0,0,0,467,465,1,0,0,0,467,468,1,0,0,0,468,
+        97,1,0,0,0,469,467,1,0,0,0,470,473,5,13,0,0,471,473,1,0,0,0,472,
+        470,1,0,0,0,472,471,1,0,0,0,473,474,1,0,0,0,474,475,3,8,4,0,475,
+        476,3,104,52,0,476,477,5,29,0,0,477,487,1,0,0,0,478,481,5,13,0,0,
+        479,481,1,0,0,0,480,478,1,0,0,0,480,479,1,0,0,0,481,482,1,0,0,0,
+        482,483,3,18,9,0,483,484,3,106,53,0,484,485,5,29,0,0,485,487,1,0,
+        0,0,486,472,1,0,0,0,486,480,1,0,0,0,487,99,1,0,0,0,488,489,3,102,
+        51,0,489,490,3,8,4,0,490,491,3,104,52,0,491,492,5,29,0,0,492,499,
+        1,0,0,0,493,494,3,102,51,0,494,495,3,18,9,0,495,496,3,106,53,0,496,
+        497,5,29,0,0,497,499,1,0,0,0,498,488,1,0,0,0,498,493,1,0,0,0,499,
+        101,1,0,0,0,500,501,5,12,0,0,501,508,5,13,0,0,502,503,5,13,0,0,503,
+        508,5,12,0,0,504,508,5,12,0,0,505,508,5,13,0,0,506,508,1,0,0,0,507,
+        500,1,0,0,0,507,502,1,0,0,0,507,504,1,0,0,0,507,505,1,0,0,0,507,
+        506,1,0,0,0,508,103,1,0,0,0,509,512,3,108,54,0,510,513,3,32,16,0,
+        511,513,1,0,0,0,512,510,1,0,0,0,512,511,1,0,0,0,513,514,1,0,0,0,
+        514,515,5,37,0,0,515,516,3,104,52,0,516,523,1,0,0,0,517,520,3,108,
+        54,0,518,521,3,32,16,0,519,521,1,0,0,0,520,518,1,0,0,0,520,519,1,
+        0,0,0,521,523,1,0,0,0,522,509,1,0,0,0,522,517,1,0,0,0,523,105,1,
+        0,0,0,524,525,3,108,54,0,525,526,3,32,16,0,526,527,5,37,0,0,527,
+        528,3,106,53,0,528,533,1,0,0,0,529,530,3,108,54,0,530,531,3,32,16,
+        0,531,533,1,0,0,0,532,524,1,0,0,0,532,529,1,0,0,0,533,107,1,0,0,
+        0,534,535,5,58,0,0,535,109,1,0,0,0,536,537,3,112,56,0,537,538,7,
+        2,0,0,538,539,3,112,56,0,539,542,1,0,0,0,540,542,3,112,56,0,541,
+        536,1,0,0,0,541,540,1,0,0,0,542,111,1,0,0,0,543,544,3,114,57,0,544,
+        545,7,3,0,0,545,546,3,114,57,0,546,549,1,0,0,0,547,549,3,114,57,
+        0,548,543,1,0,0,0,548,547,1,0,0,0,549,113,1,0,0,0,550,551,6,57,-1,
+        0,551,552,3,116,58,0,552,558,1,0,0,0,553,554,10,2,0,0,554,555,7,
+        4,0,0,555,557,3,116,58,0,556,553,1,0,0,0,557,560,1,0,0,0,558,556,
+        1,0,0,0,558,559,1,0,0,0,559,115,1,0,0,0,560,558,1,0,0,0,561,562,
+        6,58,-1,0,562,563,3,118,59,0,563,569,1,0,0,0,564,565,10,2,0,0,565,
+        566,7,5,0,0,566,568,3,118,59,0,567,564,1,0,0,0,568,571,1,0,0,0,569,
+        567,1,0,0,0,569,570,1,0,0,0,570,117,1,0,0,0,571,569,1,0,0,0,572,
+        573,6,59,-1,0,573,574,3,120,60,0,574,580,1,0,0,0,575,576,10,2,0,
+        0,576,577,7,6,0,0,577,579,3,120,60,0,578,575,1,0,0,0,579,582,1,0,
+        0,0,580,578,1,0,0,0,580,581,1,0,0,0,581,119,1,0,0,0,582,580,1,0,
+        0,0,583,584,6,60,-1,0,584,585,3,122,61,0,585,591,1,0,0,0,586,587,
+        10,2,0,0,587,588,5,56,0,0,588,590,3,122,61,0,589,586,1,0,0,0,590,
+        593,1,0,0,0,591,589,1,0,0,0,591,592,1,0,0,0,592,121,1,0,0,0,593,
+        591,1,0,0,0,594,595,5,54,0,0,595,598,3,122,61,0,596,598,3,124,62,
+        0,597,594,1,0,0,0,597,596,1,0,0,0,598,123,1,0,0,0,599,600,7,5,0,
+        0,600,603,3,124,62,0,601,603,3,126,63,0,602,599,1,0,0,0,602,601,
+        1,0,0,0,603,125,1,0,0,0,604,605,6,63,-1,0,605,606,3,130,65,0,606,
+        614,1,0,0,0,607,608,10,2,0,0,608,609,5,35,0,0,609,610,3,110,55,0,
+        610,611,5,36,0,0,611,613,1,0,0,0,612,607,1,0,0,0,613,616,1,0,0,0,
+        614,612,1,0,0,0,614,615,1,0,0,0,615,127,1,0,0,0,616,614,1,0,0,0,
+        617,625,5,38,0,0,618,626,5,58,0,0,619,626,3,50,25,0,620,621,5,58,
+        0,0,621,622,5,35,0,0,622,623,3,110,55,0,623,624,5,36,0,0,624,626,
+        1,0,0,0,625,618,1,0,0,0,625,619,1,0,0,0,625,620,1,0,0,0,626,129,
+        1,0,0,0,627,628,6,65,-1,0,628,629,3,132,66,0,629,634,1,0,0,0,630,
+        631,10,2,0,0,631,633,3,128,64,0,632,630,1,0,0,0,633,636,1,0,0,0,
+        634,632,1,0,0,0,634,635,1,0,0,0,635,131,1,0,0,0,636,634,1,0,0,0,
+        637,638,5,55,0,0,638,641,3,132,66,0,639,641,3,134,67,0,640,637,1,
+        0,0,0,640,639,1,0,0,0,641,133,1,0,0,0,642,656,5,26,0,0,643,656,5,
+        27,0,0,644,656,5,28,0,0,645,656,5,25,0,0,646,656,5,58,0,0,647,656,
+        3,50,25,0,648,656,3,2,1,0,649,656,5,11,0,0,650,656,5,24,0,0,651,
+        652,5,33,0,0,652,653,3,110,55,0,653,654,5,34,0,0,654,656,1,0,0,0,
+        655,642,1,0,0,0,655,643,1,0,0,0,655,644,1,0,0,0,655,645,1,0,0,0,
+        655,646,1,0,0,0,655,647,1,0,0,0,655,648,1,0,0,0,655,649,1,0,0,0,
+        655,650,1,0,0,0,655,651,1,0,0,0,656,135,1,0,0,0,61,141,150,155,160,
+        166,181,198,209,218,232,237,244,247,257,265,270,294,301,309,313,
+        315,321,337,349,354,362,364,374,383,387,396,400,408,413,441,448,
+        453,462,467,472,480,486,498,507,512,520,522,532,541,548,558,569,
+        580,591,597,602,614,625,634,640,655
+    ]
+
+class OPLangParser ( Parser ):
+
+    grammarFileName = "OPLang.g4"
+
+    atn = ATNDeserializer().deserialize(serializedATN())
+
+    decisionsToDFA = [ DFA(ds, i) for i, ds in enumerate(atn.decisionToState) ]
+
+    sharedContextCache = PredictionContextCache()
+
+    literalNames = [ "<INVALID>", "'~'", "<INVALID>", "'class'", "'extends'", 
+                     "'int'", "'float'", "'string'", "'boolean'", "'void'", 
+                     "'main'", "'this'", "'static'", "'final'", "'if'", 
+                     "'then'", "'else'", "'for'", "'to'", "'do'", "'break'", 
+                     "'continue'", "'downto'", "'return'", "'nil'", "<INVALID>", 
+                     "<INVALID>", "<INVALID>", "<INVALID>", "';'", "'{'", 
+                     "'}'", "'&'", "'('", "')'", "'['", "']'", "','", "'.'", 
+                     "':'", "'+'", "'-'", "'*'", "'\\'", "'/'", "'%'", "'=='", 
+                     "'!='", "'<'", "'<='", "'>'", "'>='", "'||'", "'&&'", 
+                     "'!'", "'new'", "'^'", "':='" ]
+
+    symbolicNames = [ "<INVALID>", "<INVALID>", "COMMENT", "CLASS", "EXTEND", 
+                      "INT", "FLOAT", "STRING", "BOOL", "VOID", "MAIN", 
+                      "THIS", "STA", "FIN", "IF", "THEN", "ELSE", "FOR", 
+                      "TO", "DO", "BREAK", "CON", "DOWNTO", "RETURN", "NIL", 
+                      "BOOLLIT", "INTLIT", "FLOATLIT", "STRINGLIT", "SEMI", 
+                      "LB", "RB", "REF", "LRB", "RRB", "LSB", "RSB", "COMMA", 
+                      "DOT", "COLON", "ADD", "SUB", "MUL", "INTDIV", "FLOATDIV", 
+                      "MOD", "EQ", "NEQ", "LESST", "LESSEQ", "MORET", "MOREEQ", 
+                      "OR", "AND", "NOT", "NEW", "CONCAT", "ASSIGN", "ID", 
+                      "WS", "ERROR_CHAR", "ILLEGAL_ESCAPE", "UNCLOSE_STRING" ]
+
+    RULE_program = 0
+    RULE_array = 1
+    RULE_array_element_list = 2
+    RULE_func_type = 3
+    RULE_type = 4
+    RULE_primitivetype = 5
+    RULE_arraytype = 6
+    RULE_arraytype_primitive = 7
+    RULE_arraytype_non_primitive = 8
+    RULE_referencetype = 9
+    RULE_classtype = 10
+    RULE_main_func = 11
+    RULE_blockstm = 12
+    RULE_stmlist = 13
+    RULE_stm = 14
+    RULE_assingstm = 15
+    RULE_vardecl_assign = 16
+    RULE_ifstm = 17
+    RULE_elsestm = 18
+    RULE_forstm = 19
+    RULE_breakstm = 20
+    RULE_continuestm = 21
+    RULE_returnstm = 22
+    RULE_invocationstm = 23
+    RULE_invocationstm_frame = 24
+    RULE_callfuncstm = 25
+    RULE_input_func_param_list = 26
+    RULE_input_func_param_prime = 27
+    RULE_input_func_param = 28
+    RULE_decl = 29
+    RULE_class_decl_list = 30
+    RULE_class_decl = 31
+    RULE_attr_decl = 32
+    RULE_attr_decl_list = 33
+    RULE_attr_decl_list_ref = 34
+    RULE_attr_name = 35
+    RULE_class_member = 36
+    RULE_func_decl = 37
+    RULE_normal_func = 38
+    RULE_constructor = 39
+    RULE_default_constructor = 40
+    RULE_copy_constructor = 41
+    RULE_user_constructor = 42
+    RULE_destructor = 43
+    RULE_func_param_list = 44
+    RULE_func_param_prime = 45
+    RULE_func_param_group = 46
+    RULE_func_param = 47
+    RULE_var_decl_stm = 48
+    RULE_var_decl_no_stafin = 49
+    RULE_var_decl = 50
+    RULE_stafin = 51
+    RULE_var_decl_list = 52
+    RULE_var_decl_list_ref = 53
+    RULE_var_name = 54
+    RULE_expr = 55
+    RULE_expr1 = 56
+    RULE_expr2 = 57
+    RULE_expr3 = 58
+    RULE_expr4 = 59
+    RULE_expr5 = 60
+    RULE_expr6 = 61
+    RULE_expr7 = 62
+    RULE_expr8 = 63
+    RULE_dotting = 64
+    RULE_expr9 = 65
+    RULE_expr10 = 66
+    RULE_expr11 = 67
+
+    ruleNames =  [ "program", "array", "array_element_list", "func_type", 
+                   "type", "primitivetype", "arraytype", "arraytype_primitive", 
+                   "arraytype_non_primitive", "referencetype", "classtype", 
+                   "main_func", "blockstm", "stmlist", "stm", "assingstm", 
+                   "vardecl_assign", "ifstm", "elsestm", "forstm", "breakstm", 
+                   "continuestm", "returnstm", "invocationstm", "invocationstm_frame", 
+                   "callfuncstm", "input_func_param_list", "input_func_param_prime", 
+                   "input_func_param", "decl", "class_decl_list", "class_decl", 
+                   "attr_decl", "attr_decl_list", "attr_decl_list_ref", 
+                   "attr_name", "class_member", "func_decl", "normal_func", 
+                   "constructor", "default_constructor", "copy_constructor", 
+                   "user_constructor", "destructor", "func_param_list", 
+                   "func_param_prime", "func_param_group", "func_param", 
+                   "var_decl_stm", "var_decl_no_stafin", "var_decl", "stafin", 
+                   "var_decl_list", "var_decl_list_ref", "var_name", "expr", 
+                   "expr1", "expr2", "expr3", "expr4", "expr5", "expr6", 
+                   "expr7", "expr8", "dotting", "expr9", "expr10", "expr11" ]
+
+    EOF = Token.EOF
+    T__0=1
+    COMMENT=2
+    CLASS=3
+    EXTEND=4
+    INT=5
+    FLOAT=6
+    STRING=7
+    BOOL=8
+    VOID=9
+    MAIN=10
+    THIS=11
+    STA=12
+    FIN=13
+    IF=14
+    THEN=15
+    ELSE=16
+    FOR=17
+    TO=18
+    DO=19
+    BREAK=20
+    CON=21
+    DOWNTO=22
+    RETURN=23
+    NIL=24
+    BOOLLIT=25
+    INTLIT=26
+    FLOATLIT=27
+    STRINGLIT=28
+    SEMI=29
+    LB=30
+    RB=31
+    REF=32
+    LRB=33
+    RRB=34
+    LSB=35
+    RSB=36
+    COMMA=37
+    DOT=38
+    COLON=39
+    ADD=40
+    SUB=41
+    MUL=42
+    INTDIV=43
+    FLOATDIV=44
+    MOD=45
+    EQ=46
+    NEQ=47
+    LESST=48
+    LESSEQ=49
+    MORET=50
+    MOREEQ=51
+    OR=52
+    AND=53
+    NOT=54
+    NEW=55
+    CONCAT=56
+    ASSIGN=57
+    ID=58
+    WS=59
+    ERROR_CHAR=60
+    ILLEGAL_ESCAPE=61
+    UNCLOSE_STRING=62
+
+    def __init__(self, input:TokenStream, output:TextIO = sys.stdout):
+        super().__init__(input, output)
+        self.checkVersion("4.13.2")
+        self._interp = ParserATNSimulator(self, self.atn, self.decisionsToDFA, self.sharedContextCache)
+        self._predicates = None
+
+
+
+
+    class ProgramContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def class_decl_list(self):
+            return self.getTypedRuleContext(OPLangParser.Class_decl_listContext,0)
+
+
+        def EOF(self):
+            return self.getToken(OPLangParser.EOF, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_program
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitProgram" ):
+                return visitor.visitProgram(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def program(self):
+
+        localctx = OPLangParser.ProgramContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 0, self.RULE_program)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 136
+            self.class_decl_list()
+            self.state = 137
+            self.match(OPLangParser.EOF)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ArrayContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def LB(self):
+            return self.getToken(OPLangParser.LB, 0)
+
+        def RB(self):
+            return self.getToken(OPLangParser.RB, 0)
+
+        def array_element_list(self):
+            return self.getTypedRuleContext(OPLangParser.Array_element_listContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_array
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitArray" ):
+                return visitor.visitArray(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def array(self):
+
+        localctx = OPLangParser.ArrayContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 2, self.RULE_array)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 139
+            self.match(OPLangParser.LB)
+            self.state = 141
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 342276880398813184) != 0):
+                self.state = 140
+                self.array_element_list()
+
+
+            self.state = 143
+            self.match(OPLangParser.RB)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Array_element_listContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.ExprContext,i)
+
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(OPLangParser.COMMA)
+            else:
+                return self.getToken(OPLangParser.COMMA, i)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_array_element_list
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitArray_element_list" ):
+                return visitor.visitArray_element_list(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def array_element_list(self):
+
+        localctx = OPLangParser.Array_element_listContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 4, self.RULE_array_element_list)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 145
+            self.expr()
+            self.state = 150
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==37:
+                self.state = 146
+                self.match(OPLangParser.COMMA)
+                self.state = 147
+                self.expr()
+                self.state = 152
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Func_typeContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def type_(self):
+            return self.getTypedRuleContext(OPLangParser.TypeContext,0)
+
+
+        def VOID(self):
+            return self.getToken(OPLangParser.VOID, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_func_type
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitFunc_type" ):
+                return visitor.visitFunc_type(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def func_type(self):
+
+        localctx = OPLangParser.Func_typeContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 6, self.RULE_func_type)
+        try:
+            self.state = 155
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [5, 6, 7, 8, 58]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 153
+                self.type_()
+                pass
+            elif token in [9]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 154
+                self.match(OPLangParser.VOID)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class TypeContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def primitivetype(self):
+            return self.getTypedRuleContext(OPLangParser.PrimitivetypeContext,0)
+
+
+        def arraytype(self):
+            return self.getTypedRuleContext(OPLangParser.ArraytypeContext,0)
+
+
+        def classtype(self):
+            return self.getTypedRuleContext(OPLangParser.ClasstypeContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_type
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitType" ):
+                return visitor.visitType(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def type_(self):
+
+        localctx = OPLangParser.TypeContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 8, self.RULE_type)
+        try:
+            self.state = 160
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,3,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 157
+                self.primitivetype()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 158
+                self.arraytype()
+                pass
+
+            elif la_ == 3:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 159
+                self.classtype()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class PrimitivetypeContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def INT(self):
+            return self.getToken(OPLangParser.INT, 0)
+
+        def FLOAT(self):
+            return self.getToken(OPLangParser.FLOAT, 0)
+
+        def STRING(self):
+            return self.getToken(OPLangParser.STRING, 0)
+
+        def BOOL(self):
+            return self.getToken(OPLangParser.BOOL, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_primitivetype
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitPrimitivetype" ):
+                return visitor.visitPrimitivetype(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def primitivetype(self):
+
+        localctx = OPLangParser.PrimitivetypeContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 10, self.RULE_primitivetype)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 162
+            _la = self._input.LA(1)
+            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 480) != 0)):
+                self._errHandler.recoverInline(self)
+            else:
+                self._errHandler.reportMatch(self)
+                self.consume()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ArraytypeContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def arraytype_primitive(self):
+            return self.getTypedRuleContext(OPLangParser.Arraytype_primitiveContext,0)
+
+
+        def arraytype_non_primitive(self):
+            return self.getTypedRuleContext(OPLangParser.Arraytype_non_primitiveContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_arraytype
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitArraytype" ):
+                return visitor.visitArraytype(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def arraytype(self):
+
+        localctx = OPLangParser.ArraytypeContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 12, self.RULE_arraytype)
+        try:
+            self.state = 166
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [5, 6, 7, 8]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 164
+                self.arraytype_primitive()
+                pass
+            elif token in [58]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 165
+                self.arraytype_non_primitive()
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Arraytype_primitiveContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def primitivetype(self):
+            return self.getTypedRuleContext(OPLangParser.PrimitivetypeContext,0)
+
+
+        def LSB(self):
+            return self.getToken(OPLangParser.LSB, 0)
+
+        def INTLIT(self):
+            return self.getToken(OPLangParser.INTLIT, 0)
+
+        def RSB(self):
+            return self.getToken(OPLangParser.RSB, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_arraytype_primitive
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitArraytype_primitive" ):
+                return visitor.visitArraytype_primitive(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def arraytype_primitive(self):
+
+        localctx = OPLangParser.Arraytype_primitiveContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 14, self.RULE_arraytype_primitive)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 168
+            self.primitivetype()
+            self.state = 169
+            self.match(OPLangParser.LSB)
+            self.state = 170
+            self.match(OPLangParser.INTLIT)
+            self.state = 171
+            self.match(OPLangParser.RSB)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Arraytype_non_primitiveContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ID(self):
+            return self.getToken(OPLangParser.ID, 0)
+
+        def LSB(self):
+            return self.getToken(OPLangParser.LSB, 0)
+
+        def INTLIT(self):
+            return self.getToken(OPLangParser.INTLIT, 0)
+
+        def RSB(self):
+            return self.getToken(OPLangParser.RSB, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_arraytype_non_primitive
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitArraytype_non_primitive" ):
+                return visitor.visitArraytype_non_primitive(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def arraytype_non_primitive(self):
+
+        localctx = OPLangParser.Arraytype_non_primitiveContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 16, self.RULE_arraytype_non_primitive)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 173
+            self.match(OPLangParser.ID)
+            self.state = 174
+            self.match(OPLangParser.LSB)
+            self.state = 175
+            self.match(OPLangParser.INTLIT)
+            self.state = 176
+            self.match(OPLangParser.RSB)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ReferencetypeContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def REF(self):
+            return self.getToken(OPLangParser.REF, 0)
+
+        def primitivetype(self):
+            return self.getTypedRuleContext(OPLangParser.PrimitivetypeContext,0)
+
+
+        def classtype(self):
+            return self.getTypedRuleContext(OPLangParser.ClasstypeContext,0)
+
+
+        def arraytype(self):
+            return self.getTypedRuleContext(OPLangParser.ArraytypeContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_referencetype
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitReferencetype" ):
+                return visitor.visitReferencetype(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def referencetype(self):
+
+        localctx = OPLangParser.ReferencetypeContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 18, self.RULE_referencetype)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 181
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,5,self._ctx)
+            if la_ == 1:
+                self.state = 178
+                self.primitivetype()
+                pass
+
+            elif la_ == 2:
+                self.state = 179
+                self.classtype()
+                pass
+
+            elif la_ == 3:
+                self.state = 180
+                self.arraytype()
+                pass
+
+
+            self.state = 183
+            self.match(OPLangParser.REF)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ClasstypeContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ID(self):
+            return self.getToken(OPLangParser.ID, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_classtype
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitClasstype" ):
+                return visitor.visitClasstype(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def classtype(self):
+
+        localctx = OPLangParser.ClasstypeContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 20, self.RULE_classtype)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 185
+            self.match(OPLangParser.ID)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Main_funcContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def VOID(self):
+            return self.getToken(OPLangParser.VOID, 0)
+
+        def MAIN(self):
+            return self.getToken(OPLangParser.MAIN, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_main_func
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitMain_func" ):
+                return visitor.visitMain_func(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def main_func(self):
+
+        localctx = OPLangParser.Main_funcContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 22, self.RULE_main_func)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 187
+            self.match(OPLangParser.VOID)
+            self.state = 188
+            self.match(OPLangParser.MAIN)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class BlockstmContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def LB(self):
+            return self.getToken(OPLangParser.LB, 0)
+
+        def var_decl_stm(self):
+            return self.getTypedRuleContext(OPLangParser.Var_decl_stmContext,0)
+
+
+        def stmlist(self):
+            return self.getTypedRuleContext(OPLangParser.StmlistContext,0)
+
+
+        def RB(self):
+            return self.getToken(OPLangParser.RB, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_blockstm
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitBlockstm" ):
+                return visitor.visitBlockstm(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def blockstm(self):
+
+        localctx = OPLangParser.BlockstmContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 24, self.RULE_blockstm)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 190
+            self.match(OPLangParser.LB)
+            self.state = 191
+            self.var_decl_stm()
+            self.state = 192
+            self.stmlist()
+            self.state = 193
+            self.match(OPLangParser.RB)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class StmlistContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def stm(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.StmContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.StmContext,i)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_stmlist
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitStmlist" ):
+                return visitor.visitStmlist(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def stmlist(self):
+
+        localctx = OPLangParser.StmlistContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 26, self.RULE_stmlist)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 198
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 324259183366129664) != 0):
+                self.state = 195
+                self.stm()
+                self.state = 200
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class StmContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def assingstm(self):
+            return self.getTypedRuleContext(OPLangParser.AssingstmContext,0)
+
+
+        def ifstm(self):
+            return self.getTypedRuleContext(OPLangParser.IfstmContext,0)
+
+
+        def forstm(self):
+            return self.getTypedRuleContext(OPLangParser.ForstmContext,0)
+
+
+        def breakstm(self):
+            return self.getTypedRuleContext(OPLangParser.BreakstmContext,0)
+
+
+        def continuestm(self):
+            return self.getTypedRuleContext(OPLangParser.ContinuestmContext,0)
+
+
+        def returnstm(self):
+            return self.getTypedRuleContext(OPLangParser.ReturnstmContext,0)
+
+
+        def invocationstm(self):
+            return self.getTypedRuleContext(OPLangParser.InvocationstmContext,0)
+
+
+        def blockstm(self):
+            return self.getTypedRuleContext(OPLangParser.BlockstmContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_stm
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitStm" ):
+                return visitor.visitStm(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def stm(self):
+
+        localctx = OPLangParser.StmContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 28, self.RULE_stm)
+        try:
+            self.state = 209
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,7,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 201
+                self.assingstm()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 202
+                self.ifstm()
+                pass
+
+            elif la_ == 3:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 203
+                self.forstm()
+                pass
+
+            elif la_ == 4:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 204
+                self.breakstm()
+                pass
+
+            elif la_ == 5:
+                self.enterOuterAlt(localctx, 5)
+                self.state = 205
+                self.continuestm()
+                pass
+
+            elif la_ == 6:
+                self.enterOuterAlt(localctx, 6)
+                self.state = 206
+                self.returnstm()
+                pass
+
+            elif la_ == 7:
+                self.enterOuterAlt(localctx, 7)
+                self.state = 207
+                self.invocationstm()
+                pass
+
+            elif la_ == 8:
+                self.enterOuterAlt(localctx, 8)
+                self.state = 208
+                self.blockstm()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class AssingstmContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def vardecl_assign(self):
+            return self.getTypedRuleContext(OPLangParser.Vardecl_assignContext,0)
+
+
+        def SEMI(self):
+            return self.getToken(OPLangParser.SEMI, 0)
+
+        def ID(self):
+            return self.getToken(OPLangParser.ID, 0)
+
+        def LSB(self):
+            return self.getToken(OPLangParser.LSB, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(OPLangParser.ExprContext,0)
+
+
+        def RSB(self):
+            return self.getToken(OPLangParser.RSB, 0)
+
+        def invocationstm_frame(self):
+            return self.getTypedRuleContext(OPLangParser.Invocationstm_frameContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_assingstm
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAssingstm" ):
+                return visitor.visitAssingstm(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def assingstm(self):
+
+        localctx = OPLangParser.AssingstmContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 30, self.RULE_assingstm)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 218
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,8,self._ctx)
+            if la_ == 1:
+                self.state = 211
+                self.match(OPLangParser.ID)
+                pass
+
+            elif la_ == 2:
+                self.state = 212
+                self.match(OPLangParser.ID)
+                self.state = 213
+                self.match(OPLangParser.LSB)
+                self.state = 214
+                self.expr()
+                self.state = 215
+                self.match(OPLangParser.RSB)
+                pass
+
+            elif la_ == 3:
+                self.state = 217
+                self.invocationstm_frame()
+                pass
+
+
+            self.state = 220
+            self.vardecl_assign()
+            self.state = 221
+            self.match(OPLangParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Vardecl_assignContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ASSIGN(self):
+            return self.getToken(OPLangParser.ASSIGN, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(OPLangParser.ExprContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_vardecl_assign
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitVardecl_assign" ):
+                return visitor.visitVardecl_assign(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def vardecl_assign(self):
+
+        localctx = OPLangParser.Vardecl_assignContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 32, self.RULE_vardecl_assign)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 223
+            self.match(OPLangParser.ASSIGN)
+            self.state = 224
+            self.expr()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class IfstmContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def IF(self):
+            return self.getToken(OPLangParser.IF, 0)
+
+        def THEN(self):
+            return self.getToken(OPLangParser.THEN, 0)
+
+        def elsestm(self):
+            return self.getTypedRuleContext(OPLangParser.ElsestmContext,0)
+
+
+        def LRB(self):
+            return self.getToken(OPLangParser.LRB, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(OPLangParser.ExprContext,0)
+
+
+        def RRB(self):
+            return self.getToken(OPLangParser.RRB, 0)
+
+        def stm(self):
+            return self.getTypedRuleContext(OPLangParser.StmContext,0)
+
+
+        def blockstm(self):
+            return self.getTypedRuleContext(OPLangParser.BlockstmContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_ifstm
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitIfstm" ):
+                return visitor.visitIfstm(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def ifstm(self):
+
+        localctx = OPLangParser.IfstmContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 34, self.RULE_ifstm)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 226
+            self.match(OPLangParser.IF)
+            self.state = 232
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,9,self._ctx)
+            if la_ == 1:
+                self.state = 227
+                self.match(OPLangParser.LRB)
+                self.state = 228
+                self.expr()
+                self.state = 229
+                self.match(OPLangParser.RRB)
+                pass
+
+            elif la_ == 2:
+                self.state = 231
+                self.expr()
+                pass
+
+
+            self.state = 234
+            self.match(OPLangParser.THEN)
+            self.state = 237
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,10,self._ctx)
+            if la_ == 1:
+                self.state = 235
+                self.stm()
+                pass
+
+            elif la_ == 2:
+                self.state = 236
+                self.blockstm()
+                pass
+
+
+            self.state = 239
+            self.elsestm()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ElsestmContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ELSE(self):
+            return self.getToken(OPLangParser.ELSE, 0)
+
+        def stm(self):
+            return self.getTypedRuleContext(OPLangParser.StmContext,0)
+
+
+        def blockstm(self):
+            return self.getTypedRuleContext(OPLangParser.BlockstmContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_elsestm
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitElsestm" ):
+                return visitor.visitElsestm(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def elsestm(self):
+
+        localctx = OPLangParser.ElsestmContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 36, self.RULE_elsestm)
+        try:
+            self.state = 247
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,12,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 241
+                self.match(OPLangParser.ELSE)
+                self.state = 244
+                self._errHandler.sync(self)
+                la_ = self._interp.adaptivePredict(self._input,11,self._ctx)
+                if la_ == 1:
+                    self.state = 242
+                    self.stm()
+                    pass
+
+                elif la_ == 2:
+                    self.state = 243
+                    self.blockstm()
+                    pass
+
+
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ForstmContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def FOR(self):
+            return self.getToken(OPLangParser.FOR, 0)
+
+        def ID(self):
+            return self.getToken(OPLangParser.ID, 0)
+
+        def ASSIGN(self):
+            return self.getToken(OPLangParser.ASSIGN, 0)
+
+        def DO(self):
+            return self.getToken(OPLangParser.DO, 0)
+
+        def TO(self):
+            return self.getToken(OPLangParser.TO, 0)
+
+        def DOWNTO(self):
+            return self.getToken(OPLangParser.DOWNTO, 0)
+
+        def LRB(self, i:int=None):
+            if i is None:
+                return self.getTokens(OPLangParser.LRB)
+            else:
+                return self.getToken(OPLangParser.LRB, i)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.ExprContext,i)
+
+
+        def RRB(self, i:int=None):
+            if i is None:
+                return self.getTokens(OPLangParser.RRB)
+            else:
+                return self.getToken(OPLangParser.RRB, i)
+
+        def blockstm(self):
+            return self.getTypedRuleContext(OPLangParser.BlockstmContext,0)
+
+
+        def stm(self):
+            return self.getTypedRuleContext(OPLangParser.StmContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_forstm
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitForstm" ):
+                return visitor.visitForstm(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def forstm(self):
+
+        localctx = OPLangParser.ForstmContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 38, self.RULE_forstm)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 249
+            self.match(OPLangParser.FOR)
+            self.state = 250
+            self.match(OPLangParser.ID)
+            self.state = 251
+            self.match(OPLangParser.ASSIGN)
+            self.state = 257
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,13,self._ctx)
+            if la_ == 1:
+                self.state = 252
+                self.match(OPLangParser.LRB)
+                self.state = 253
+                self.expr()
+                self.state = 254
+                self.match(OPLangParser.RRB)
+                pass
+
+            elif la_ == 2:
+                self.state = 256
+                self.expr()
+                pass
+
+
+            self.state = 259
+            _la = self._input.LA(1)
+            if not(_la==18 or _la==22):
+                self._errHandler.recoverInline(self)
+            else:
+                self._errHandler.reportMatch(self)
+                self.consume()
+            self.state = 265
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,14,self._ctx)
+            if la_ == 1:
+                self.state = 260
+                self.match(OPLangParser.LRB)
+                self.state = 261
+                self.expr()
+                self.state = 262
+                self.match(OPLangParser.RRB)
+                pass
+
+            elif la_ == 2:
+                self.state = 264
+                self.expr()
+                pass
+
+
+            self.state = 267
+            self.match(OPLangParser.DO)
+            self.state = 270
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,15,self._ctx)
+            if la_ == 1:
+                self.state = 268
+                self.blockstm()
+                pass
+
+            elif la_ == 2:
+                self.state = 269
+                self.stm()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class BreakstmContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def BREAK(self):
+            return self.getToken(OPLangParser.BREAK, 0)
+
+        def SEMI(self):
+            return self.getToken(OPLangParser.SEMI, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_breakstm
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitBreakstm" ):
+                return visitor.visitBreakstm(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def breakstm(self):
+
+        localctx = OPLangParser.BreakstmContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 40, self.RULE_breakstm)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 272
+            self.match(OPLangParser.BREAK)
+            self.state = 273
+            self.match(OPLangParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ContinuestmContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def CON(self):
+            return self.getToken(OPLangParser.CON, 0)
+
+        def SEMI(self):
+            return self.getToken(OPLangParser.SEMI, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_continuestm
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitContinuestm" ):
+                return visitor.visitContinuestm(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def continuestm(self):
+
+        localctx = OPLangParser.ContinuestmContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 42, self.RULE_continuestm)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 275
+            self.match(OPLangParser.CON)
+            self.state = 276
+            self.match(OPLangParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ReturnstmContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def RETURN(self):
+            return self.getToken(OPLangParser.RETURN, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(OPLangParser.ExprContext,0)
+
+
+        def SEMI(self):
+            return self.getToken(OPLangParser.SEMI, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_returnstm
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitReturnstm" ):
+                return visitor.visitReturnstm(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def returnstm(self):
+
+        localctx = OPLangParser.ReturnstmContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 44, self.RULE_returnstm)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 278
+            self.match(OPLangParser.RETURN)
+            self.state = 279
+            self.expr()
+            self.state = 280
+            self.match(OPLangParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class InvocationstmContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def invocationstm_frame(self):
+            return self.getTypedRuleContext(OPLangParser.Invocationstm_frameContext,0)
+
+
+        def SEMI(self):
+            return self.getToken(OPLangParser.SEMI, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_invocationstm
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitInvocationstm" ):
+                return visitor.visitInvocationstm(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def invocationstm(self):
+
+        localctx = OPLangParser.InvocationstmContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 46, self.RULE_invocationstm)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 282
+            self.invocationstm_frame()
+            self.state = 283
+            self.match(OPLangParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Invocationstm_frameContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def expr9(self):
+            return self.getTypedRuleContext(OPLangParser.Expr9Context,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_invocationstm_frame
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitInvocationstm_frame" ):
+                return visitor.visitInvocationstm_frame(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def invocationstm_frame(self):
+
+        localctx = OPLangParser.Invocationstm_frameContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 48, self.RULE_invocationstm_frame)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 285
+            self.expr9(0)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class CallfuncstmContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ID(self):
+            return self.getToken(OPLangParser.ID, 0)
+
+        def LRB(self):
+            return self.getToken(OPLangParser.LRB, 0)
+
+        def input_func_param_list(self):
+            return self.getTypedRuleContext(OPLangParser.Input_func_param_listContext,0)
+
+
+        def RRB(self):
+            return self.getToken(OPLangParser.RRB, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_callfuncstm
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitCallfuncstm" ):
+                return visitor.visitCallfuncstm(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def callfuncstm(self):
+
+        localctx = OPLangParser.CallfuncstmContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 50, self.RULE_callfuncstm)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 287
+            self.match(OPLangParser.ID)
+            self.state = 288
+            self.match(OPLangParser.LRB)
+            self.state = 289
+            self.input_func_param_list()
+            self.state = 290
+            self.match(OPLangParser.RRB)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Input_func_param_listContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def input_func_param_prime(self):
+            return self.getTypedRuleContext(OPLangParser.Input_func_param_primeContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_input_func_param_list
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitInput_func_param_list" ):
+                return visitor.visitInput_func_param_list(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def input_func_param_list(self):
+
+        localctx = OPLangParser.Input_func_param_listContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 52, self.RULE_input_func_param_list)
+        try:
+            self.state = 294
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [11, 24, 25, 26, 27, 28, 30, 33, 40, 41, 54, 55, 58]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 292
+                self.input_func_param_prime()
+                pass
+            elif token in [34]:
+                self.enterOuterAlt(localctx, 2)
+
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Input_func_param_primeContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def input_func_param(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.Input_func_paramContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.Input_func_paramContext,i)
+
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(OPLangParser.COMMA)
+            else:
+                return self.getToken(OPLangParser.COMMA, i)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_input_func_param_prime
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitInput_func_param_prime" ):
+                return visitor.visitInput_func_param_prime(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def input_func_param_prime(self):
+
+        localctx = OPLangParser.Input_func_param_primeContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 54, self.RULE_input_func_param_prime)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 296
+            self.input_func_param()
+            self.state = 301
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==37:
+                self.state = 297
+                self.match(OPLangParser.COMMA)
+                self.state = 298
+                self.input_func_param()
+                self.state = 303
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Input_func_paramContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def INTLIT(self):
+            return self.getToken(OPLangParser.INTLIT, 0)
+
+        def FLOATLIT(self):
+            return self.getToken(OPLangParser.FLOATLIT, 0)
+
+        def STRINGLIT(self):
+            return self.getToken(OPLangParser.STRINGLIT, 0)
+
+        def ID(self):
+            return self.getToken(OPLangParser.ID, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(OPLangParser.ExprContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_input_func_param
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitInput_func_param" ):
+                return visitor.visitInput_func_param(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def input_func_param(self):
+
+        localctx = OPLangParser.Input_func_paramContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 56, self.RULE_input_func_param)
+        try:
+            self.state = 309
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,18,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 304
+                self.match(OPLangParser.INTLIT)
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 305
+                self.match(OPLangParser.FLOATLIT)
+                pass
+
+            elif la_ == 3:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 306
+                self.match(OPLangParser.STRINGLIT)
+                pass
+
+            elif la_ == 4:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 307
+                self.match(OPLangParser.ID)
+                pass
+
+            elif la_ == 5:
+                self.enterOuterAlt(localctx, 5)
+                self.state = 308
+                self.expr()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class DeclContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def attr_decl(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.Attr_declContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.Attr_declContext,i)
+
+
+        def func_decl(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.Func_declContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.Func_declContext,i)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_decl
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitDecl" ):
+                return visitor.visitDecl(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def decl(self):
+
+        localctx = OPLangParser.DeclContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 58, self.RULE_decl)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 315
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 288230376151725026) != 0):
+                self.state = 313
+                self._errHandler.sync(self)
+                la_ = self._interp.adaptivePredict(self._input,19,self._ctx)
+                if la_ == 1:
+                    self.state = 311
+                    self.attr_decl()
+                    pass
+
+                elif la_ == 2:
+                    self.state = 312
+                    self.func_decl()
+                    pass
+
+
+                self.state = 317
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Class_decl_listContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def class_decl(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.Class_declContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.Class_declContext,i)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_class_decl_list
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitClass_decl_list" ):
+                return visitor.visitClass_decl_list(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def class_decl_list(self):
+
+        localctx = OPLangParser.Class_decl_listContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 60, self.RULE_class_decl_list)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 319 
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while True:
+                self.state = 318
+                self.class_decl()
+                self.state = 321 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if not (_la==3):
+                    break
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Class_declContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def CLASS(self):
+            return self.getToken(OPLangParser.CLASS, 0)
+
+        def ID(self, i:int=None):
+            if i is None:
+                return self.getTokens(OPLangParser.ID)
+            else:
+                return self.getToken(OPLangParser.ID, i)
+
+        def LB(self):
+            return self.getToken(OPLangParser.LB, 0)
+
+        def class_member(self):
+            return self.getTypedRuleContext(OPLangParser.Class_memberContext,0)
+
+
+        def RB(self):
+            return self.getToken(OPLangParser.RB, 0)
+
+        def EXTEND(self):
+            return self.getToken(OPLangParser.EXTEND, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_class_decl
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitClass_decl" ):
+                return visitor.visitClass_decl(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def class_decl(self):
+
+        localctx = OPLangParser.Class_declContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 62, self.RULE_class_decl)
+        try:
+            self.state = 337
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,22,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 323
+                self.match(OPLangParser.CLASS)
+                self.state = 324
+                self.match(OPLangParser.ID)
+                self.state = 325
+                self.match(OPLangParser.LB)
+                self.state = 326
+                self.class_member()
+                self.state = 327
+                self.match(OPLangParser.RB)
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 329
+                self.match(OPLangParser.CLASS)
+                self.state = 330
+                self.match(OPLangParser.ID)
+                self.state = 331
+                self.match(OPLangParser.EXTEND)
+                self.state = 332
+                self.match(OPLangParser.ID)
+                self.state = 333
+                self.match(OPLangParser.LB)
+                self.state = 334
+                self.class_member()
+                self.state = 335
+                self.match(OPLangParser.RB)
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Attr_declContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def stafin(self):
+            return self.getTypedRuleContext(OPLangParser.StafinContext,0)
+
+
+        def type_(self):
+            return self.getTypedRuleContext(OPLangParser.TypeContext,0)
+
+
+        def attr_decl_list(self):
+            return self.getTypedRuleContext(OPLangParser.Attr_decl_listContext,0)
+
+
+        def SEMI(self):
+            return self.getToken(OPLangParser.SEMI, 0)
+
+        def referencetype(self):
+            return self.getTypedRuleContext(OPLangParser.ReferencetypeContext,0)
+
+
+        def attr_decl_list_ref(self):
+            return self.getTypedRuleContext(OPLangParser.Attr_decl_list_refContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_attr_decl
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAttr_decl" ):
+                return visitor.visitAttr_decl(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def attr_decl(self):
+
+        localctx = OPLangParser.Attr_declContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 64, self.RULE_attr_decl)
+        try:
+            self.state = 349
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,23,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 339
+                self.stafin()
+                self.state = 340
+                self.type_()
+                self.state = 341
+                self.attr_decl_list()
+                self.state = 342
+                self.match(OPLangParser.SEMI)
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 344
+                self.stafin()
+                self.state = 345
+                self.referencetype()
+                self.state = 346
+                self.attr_decl_list_ref()
+                self.state = 347
+                self.match(OPLangParser.SEMI)
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Attr_decl_listContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def attr_name(self):
+            return self.getTypedRuleContext(OPLangParser.Attr_nameContext,0)
+
+
+        def COMMA(self):
+            return self.getToken(OPLangParser.COMMA, 0)
+
+        def attr_decl_list(self):
+            return self.getTypedRuleContext(OPLangParser.Attr_decl_listContext,0)
+
+
+        def vardecl_assign(self):
+            return self.getTypedRuleContext(OPLangParser.Vardecl_assignContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_attr_decl_list
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAttr_decl_list" ):
+                return visitor.visitAttr_decl_list(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def attr_decl_list(self):
+
+        localctx = OPLangParser.Attr_decl_listContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 66, self.RULE_attr_decl_list)
+        try:
+            self.state = 364
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,26,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 351
+                self.attr_name()
+                self.state = 354
+                self._errHandler.sync(self)
+                token = self._input.LA(1)
+                if token in [57]:
+                    self.state = 352
+                    self.vardecl_assign()
+                    pass
+                elif token in [37]:
+                    pass
+                else:
+                    raise NoViableAltException(self)
+
+                self.state = 356
+                self.match(OPLangParser.COMMA)
+                self.state = 357
+                self.attr_decl_list()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 359
+                self.attr_name()
+                self.state = 362
+                self._errHandler.sync(self)
+                token = self._input.LA(1)
+                if token in [57]:
+                    self.state = 360
+                    self.vardecl_assign()
+                    pass
+                elif token in [29]:
+                    pass
+                else:
+                    raise NoViableAltException(self)
+
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Attr_decl_list_refContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def attr_name(self):
+            return self.getTypedRuleContext(OPLangParser.Attr_nameContext,0)
+
+
+        def vardecl_assign(self):
+            return self.getTypedRuleContext(OPLangParser.Vardecl_assignContext,0)
+
+
+        def COMMA(self):
+            return self.getToken(OPLangParser.COMMA, 0)
+
+        def attr_decl_list_ref(self):
+            return self.getTypedRuleContext(OPLangParser.Attr_decl_list_refContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_attr_decl_list_ref
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAttr_decl_list_ref" ):
+                return visitor.visitAttr_decl_list_ref(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def attr_decl_list_ref(self):
+
+        localctx = OPLangParser.Attr_decl_list_refContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 68, self.RULE_attr_decl_list_ref)
+        try:
+            self.state = 374
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,27,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 366
+                self.attr_name()
+                self.state = 367
+                self.vardecl_assign()
+                self.state = 368
+                self.match(OPLangParser.COMMA)
+                self.state = 369
+                self.attr_decl_list_ref()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 371
+                self.attr_name()
+                self.state = 372
+                self.vardecl_assign()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Attr_nameContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ID(self):
+            return self.getToken(OPLangParser.ID, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_attr_name
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAttr_name" ):
+                return visitor.visitAttr_name(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def attr_name(self):
+
+        localctx = OPLangParser.Attr_nameContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 70, self.RULE_attr_name)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 376
+            self.match(OPLangParser.ID)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Class_memberContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def decl(self):
+            return self.getTypedRuleContext(OPLangParser.DeclContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_class_member
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitClass_member" ):
+                return visitor.visitClass_member(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def class_member(self):
+
+        localctx = OPLangParser.Class_memberContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 72, self.RULE_class_member)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 378
+            self.decl()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Func_declContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def normal_func(self):
+            return self.getTypedRuleContext(OPLangParser.Normal_funcContext,0)
+
+
+        def constructor(self):
+            return self.getTypedRuleContext(OPLangParser.ConstructorContext,0)
+
+
+        def destructor(self):
+            return self.getTypedRuleContext(OPLangParser.DestructorContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_func_decl
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitFunc_decl" ):
+                return visitor.visitFunc_decl(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def func_decl(self):
+
+        localctx = OPLangParser.Func_declContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 74, self.RULE_func_decl)
+        try:
+            self.state = 383
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,28,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 380
+                self.normal_func()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 381
+                self.constructor()
+                pass
+
+            elif la_ == 3:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 382
+                self.destructor()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Normal_funcContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def main_func(self):
+            return self.getTypedRuleContext(OPLangParser.Main_funcContext,0)
+
+
+        def LRB(self):
+            return self.getToken(OPLangParser.LRB, 0)
+
+        def RRB(self):
+            return self.getToken(OPLangParser.RRB, 0)
+
+        def blockstm(self):
+            return self.getTypedRuleContext(OPLangParser.BlockstmContext,0)
+
+
+        def STA(self):
+            return self.getToken(OPLangParser.STA, 0)
+
+        def ID(self):
+            return self.getToken(OPLangParser.ID, 0)
+
+        def func_param_list(self):
+            return self.getTypedRuleContext(OPLangParser.Func_param_listContext,0)
+
+
+        def func_type(self):
+            return self.getTypedRuleContext(OPLangParser.Func_typeContext,0)
+
+
+        def referencetype(self):
+            return self.getTypedRuleContext(OPLangParser.ReferencetypeContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_normal_func
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitNormal_func" ):
+                return visitor.visitNormal_func(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def normal_func(self):
+
+        localctx = OPLangParser.Normal_funcContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 76, self.RULE_normal_func)
+        try:
+            self.state = 408
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,32,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 387
+                self._errHandler.sync(self)
+                token = self._input.LA(1)
+                if token in [12]:
+                    self.state = 385
+                    self.match(OPLangParser.STA)
+                    pass
+                elif token in [9]:
+                    pass
+                else:
+                    raise NoViableAltException(self)
+
+                self.state = 389
+                self.main_func()
+                self.state = 390
+                self.match(OPLangParser.LRB)
+                self.state = 391
+                self.match(OPLangParser.RRB)
+                self.state = 392
+                self.blockstm()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 396
+                self._errHandler.sync(self)
+                token = self._input.LA(1)
+                if token in [12]:
+                    self.state = 394
+                    self.match(OPLangParser.STA)
+                    pass
+                elif token in [5, 6, 7, 8, 9, 58]:
+                    pass
+                else:
+                    raise NoViableAltException(self)
+
+                self.state = 400
+                self._errHandler.sync(self)
+                la_ = self._interp.adaptivePredict(self._input,31,self._ctx)
+                if la_ == 1:
+                    self.state = 398
+                    self.func_type()
+                    pass
+
+                elif la_ == 2:
+                    self.state = 399
+                    self.referencetype()
+                    pass
+
+
+                self.state = 402
+                self.match(OPLangParser.ID)
+                self.state = 403
+                self.match(OPLangParser.LRB)
+                self.state = 404
+                self.func_param_list()
+                self.state = 405
+                self.match(OPLangParser.RRB)
+                self.state = 406
+                self.blockstm()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ConstructorContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def default_constructor(self):
+            return self.getTypedRuleContext(OPLangParser.Default_constructorContext,0)
+
+
+        def copy_constructor(self):
+            return self.getTypedRuleContext(OPLangParser.Copy_constructorContext,0)
+
+
+        def user_constructor(self):
+            return self.getTypedRuleContext(OPLangParser.User_constructorContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_constructor
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitConstructor" ):
+                return visitor.visitConstructor(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def constructor(self):
+
+        localctx = OPLangParser.ConstructorContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 78, self.RULE_constructor)
+        try:
+            self.state = 413
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,33,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 410
+                self.default_constructor()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 411
+                self.copy_constructor()
+                pass
+
+            elif la_ == 3:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 412
+                self.user_constructor()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Default_constructorContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ID(self):
+            return self.getToken(OPLangParser.ID, 0)
+
+        def LRB(self):
+            return self.getToken(OPLangParser.LRB, 0)
+
+        def RRB(self):
+            return self.getToken(OPLangParser.RRB, 0)
+
+        def blockstm(self):
+            return self.getTypedRuleContext(OPLangParser.BlockstmContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_default_constructor
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitDefault_constructor" ):
+                return visitor.visitDefault_constructor(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def default_constructor(self):
+
+        localctx = OPLangParser.Default_constructorContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 80, self.RULE_default_constructor)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 415
+            self.match(OPLangParser.ID)
+            self.state = 416
+            self.match(OPLangParser.LRB)
+            self.state = 417
+            self.match(OPLangParser.RRB)
+            self.state = 418
+            self.blockstm()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Copy_constructorContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ID(self, i:int=None):
+            if i is None:
+                return self.getTokens(OPLangParser.ID)
+            else:
+                return self.getToken(OPLangParser.ID, i)
+
+        def LRB(self):
+            return self.getToken(OPLangParser.LRB, 0)
+
+        def RRB(self):
+            return self.getToken(OPLangParser.RRB, 0)
+
+        def blockstm(self):
+            return self.getTypedRuleContext(OPLangParser.BlockstmContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_copy_constructor
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitCopy_constructor" ):
+                return visitor.visitCopy_constructor(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def copy_constructor(self):
+
+        localctx = OPLangParser.Copy_constructorContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 82, self.RULE_copy_constructor)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 420
+            self.match(OPLangParser.ID)
+            self.state = 421
+            self.match(OPLangParser.LRB)
+            self.state = 422
+            self.match(OPLangParser.ID)
+            self.state = 423
+            self.match(OPLangParser.ID)
+            self.state = 424
+            self.match(OPLangParser.RRB)
+            self.state = 425
+            self.blockstm()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class User_constructorContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ID(self):
+            return self.getToken(OPLangParser.ID, 0)
+
+        def LRB(self):
+            return self.getToken(OPLangParser.LRB, 0)
+
+        def func_param_list(self):
+            return self.getTypedRuleContext(OPLangParser.Func_param_listContext,0)
+
+
+        def RRB(self):
+            return self.getToken(OPLangParser.RRB, 0)
+
+        def blockstm(self):
+            return self.getTypedRuleContext(OPLangParser.BlockstmContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_user_constructor
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitUser_constructor" ):
+                return visitor.visitUser_constructor(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def user_constructor(self):
+
+        localctx = OPLangParser.User_constructorContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 84, self.RULE_user_constructor)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 427
+            self.match(OPLangParser.ID)
+            self.state = 428
+            self.match(OPLangParser.LRB)
+            self.state = 429
+            self.func_param_list()
+            self.state = 430
+            self.match(OPLangParser.RRB)
+            self.state = 431
+            self.blockstm()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class DestructorContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ID(self):
+            return self.getToken(OPLangParser.ID, 0)
+
+        def LRB(self):
+            return self.getToken(OPLangParser.LRB, 0)
+
+        def RRB(self):
+            return self.getToken(OPLangParser.RRB, 0)
+
+        def blockstm(self):
+            return self.getTypedRuleContext(OPLangParser.BlockstmContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_destructor
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitDestructor" ):
+                return visitor.visitDestructor(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def destructor(self):
+
+        localctx = OPLangParser.DestructorContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 86, self.RULE_destructor)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 433
+            self.match(OPLangParser.T__0)
+            self.state = 434
+            self.match(OPLangParser.ID)
+            self.state = 435
+            self.match(OPLangParser.LRB)
+            self.state = 436
+            self.match(OPLangParser.RRB)
+            self.state = 437
+            self.blockstm()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Func_param_listContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def func_param_prime(self):
+            return self.getTypedRuleContext(OPLangParser.Func_param_primeContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_func_param_list
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitFunc_param_list" ):
+                return visitor.visitFunc_param_list(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def func_param_list(self):
+
+        localctx = OPLangParser.Func_param_listContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 88, self.RULE_func_param_list)
+        try:
+            self.state = 441
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [5, 6, 7, 8, 58]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 439
+                self.func_param_prime()
+                pass
+            elif token in [34]:
+                self.enterOuterAlt(localctx, 2)
+
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Func_param_primeContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def func_param_group(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.Func_param_groupContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.Func_param_groupContext,i)
+
+
+        def SEMI(self, i:int=None):
+            if i is None:
+                return self.getTokens(OPLangParser.SEMI)
+            else:
+                return self.getToken(OPLangParser.SEMI, i)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_func_param_prime
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitFunc_param_prime" ):
+                return visitor.visitFunc_param_prime(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def func_param_prime(self):
+
+        localctx = OPLangParser.Func_param_primeContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 90, self.RULE_func_param_prime)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 443
+            self.func_param_group()
+            self.state = 448
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==29:
+                self.state = 444
+                self.match(OPLangParser.SEMI)
+                self.state = 445
+                self.func_param_group()
+                self.state = 450
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Func_param_groupContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def func_param(self):
+            return self.getTypedRuleContext(OPLangParser.Func_paramContext,0)
+
+
+        def type_(self):
+            return self.getTypedRuleContext(OPLangParser.TypeContext,0)
+
+
+        def referencetype(self):
+            return self.getTypedRuleContext(OPLangParser.ReferencetypeContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_func_param_group
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitFunc_param_group" ):
+                return visitor.visitFunc_param_group(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def func_param_group(self):
+
+        localctx = OPLangParser.Func_param_groupContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 92, self.RULE_func_param_group)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 453
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,36,self._ctx)
+            if la_ == 1:
+                self.state = 451
+                self.type_()
+                pass
+
+            elif la_ == 2:
+                self.state = 452
+                self.referencetype()
+                pass
+
+
+            self.state = 455
+            self.func_param()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Func_paramContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def var_name(self):
+            return self.getTypedRuleContext(OPLangParser.Var_nameContext,0)
+
+
+        def COMMA(self):
+            return self.getToken(OPLangParser.COMMA, 0)
+
+        def func_param(self):
+            return self.getTypedRuleContext(OPLangParser.Func_paramContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_func_param
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitFunc_param" ):
+                return visitor.visitFunc_param(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def func_param(self):
+
+        localctx = OPLangParser.Func_paramContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 94, self.RULE_func_param)
+        try:
+            self.state = 462
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,37,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 457
+                self.var_name()
+                self.state = 458
+                self.match(OPLangParser.COMMA)
+                self.state = 459
+                self.func_param()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 461
+                self.var_name()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Var_decl_stmContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def var_decl_no_stafin(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.Var_decl_no_stafinContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.Var_decl_no_stafinContext,i)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_var_decl_stm
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitVar_decl_stm" ):
+                return visitor.visitVar_decl_stm(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def var_decl_stm(self):
+
+        localctx = OPLangParser.Var_decl_stmContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 96, self.RULE_var_decl_stm)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 467
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,38,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    self.state = 464
+                    self.var_decl_no_stafin() 
+                self.state = 469
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,38,self._ctx)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Var_decl_no_stafinContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def type_(self):
+            return self.getTypedRuleContext(OPLangParser.TypeContext,0)
+
+
+        def var_decl_list(self):
+            return self.getTypedRuleContext(OPLangParser.Var_decl_listContext,0)
+
+
+        def SEMI(self):
+            return self.getToken(OPLangParser.SEMI, 0)
+
+        def FIN(self):
+            return self.getToken(OPLangParser.FIN, 0)
+
+        def referencetype(self):
+            return self.getTypedRuleContext(OPLangParser.ReferencetypeContext,0)
+
+
+        def var_decl_list_ref(self):
+            return self.getTypedRuleContext(OPLangParser.Var_decl_list_refContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_var_decl_no_stafin
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitVar_decl_no_stafin" ):
+                return visitor.visitVar_decl_no_stafin(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def var_decl_no_stafin(self):
+
+        localctx = OPLangParser.Var_decl_no_stafinContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 98, self.RULE_var_decl_no_stafin)
+        try:
+            self.state = 486
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,41,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 472
+                self._errHandler.sync(self)
+                token = self._input.LA(1)
+                if token in [13]:
+                    self.state = 470
+                    self.match(OPLangParser.FIN)
+                    pass
+                elif token in [5, 6, 7, 8, 58]:
+                    pass
+                else:
+                    raise NoViableAltException(self)
+
+                self.state = 474
+                self.type_()
+                self.state = 475
+                self.var_decl_list()
+                self.state = 476
+                self.match(OPLangParser.SEMI)
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 480
+                self._errHandler.sync(self)
+                token = self._input.LA(1)
+                if token in [13]:
+                    self.state = 478
+                    self.match(OPLangParser.FIN)
+                    pass
+                elif token in [5, 6, 7, 8, 58]:
+                    pass
+                else:
+                    raise NoViableAltException(self)
+
+                self.state = 482
+                self.referencetype()
+                self.state = 483
+                self.var_decl_list_ref()
+                self.state = 484
+                self.match(OPLangParser.SEMI)
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Var_declContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def stafin(self):
+            return self.getTypedRuleContext(OPLangParser.StafinContext,0)
+
+
+        def type_(self):
+            return self.getTypedRuleContext(OPLangParser.TypeContext,0)
+
+
+        def var_decl_list(self):
+            return self.getTypedRuleContext(OPLangParser.Var_decl_listContext,0)
+
+
+        def SEMI(self):
+            return self.getToken(OPLangParser.SEMI, 0)
+
+        def referencetype(self):
+            return self.getTypedRuleContext(OPLangParser.ReferencetypeContext,0)
+
+
+        def var_decl_list_ref(self):
+            return self.getTypedRuleContext(OPLangParser.Var_decl_list_refContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_var_decl
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitVar_decl" ):
+                return visitor.visitVar_decl(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def var_decl(self):
+
+        localctx = OPLangParser.Var_declContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 100, self.RULE_var_decl)
+        try:
+            self.state = 498
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,42,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 488
+                self.stafin()
+                self.state = 489
+                self.type_()
+                self.state = 490
+                self.var_decl_list()
+                self.state = 491
+                self.match(OPLangParser.SEMI)
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 493
+                self.stafin()
+                self.state = 494
+                self.referencetype()
+                self.state = 495
+                self.var_decl_list_ref()
+                self.state = 496
+                self.match(OPLangParser.SEMI)
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class StafinContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def STA(self):
+            return self.getToken(OPLangParser.STA, 0)
+
+        def FIN(self):
+            return self.getToken(OPLangParser.FIN, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_stafin
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitStafin" ):
+                return visitor.visitStafin(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def stafin(self):
+
+        localctx = OPLangParser.StafinContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 102, self.RULE_stafin)
+        try:
+            self.state = 507
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,43,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 500
+                self.match(OPLangParser.STA)
+                self.state = 501
+                self.match(OPLangParser.FIN)
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 502
+                self.match(OPLangParser.FIN)
+                self.state = 503
+                self.match(OPLangParser.STA)
+                pass
+
+            elif la_ == 3:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 504
+                self.match(OPLangParser.STA)
+                pass
+
+            elif la_ == 4:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 505
+                self.match(OPLangParser.FIN)
+                pass
+
+            elif la_ == 5:
+                self.enterOuterAlt(localctx, 5)
+
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Var_decl_listContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def var_name(self):
+            return self.getTypedRuleContext(OPLangParser.Var_nameContext,0)
+
+
+        def COMMA(self):
+            return self.getToken(OPLangParser.COMMA, 0)
+
+        def var_decl_list(self):
+            return self.getTypedRuleContext(OPLangParser.Var_decl_listContext,0)
+
+
+        def vardecl_assign(self):
+            return self.getTypedRuleContext(OPLangParser.Vardecl_assignContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_var_decl_list
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitVar_decl_list" ):
+                return visitor.visitVar_decl_list(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def var_decl_list(self):
+
+        localctx = OPLangParser.Var_decl_listContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 104, self.RULE_var_decl_list)
+        try:
+            self.state = 522
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,46,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 509
+                self.var_name()
+                self.state = 512
+                self._errHandler.sync(self)
+                token = self._input.LA(1)
+                if token in [57]:
+                    self.state = 510
+                    self.vardecl_assign()
+                    pass
+                elif token in [37]:
+                    pass
+                else:
+                    raise NoViableAltException(self)
+
+                self.state = 514
+                self.match(OPLangParser.COMMA)
+                self.state = 515
+                self.var_decl_list()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 517
+                self.var_name()
+                self.state = 520
+                self._errHandler.sync(self)
+                token = self._input.LA(1)
+                if token in [57]:
+                    self.state = 518
+                    self.vardecl_assign()
+                    pass
+                elif token in [29]:
+                    pass
+                else:
+                    raise NoViableAltException(self)
+
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Var_decl_list_refContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def var_name(self):
+            return self.getTypedRuleContext(OPLangParser.Var_nameContext,0)
+
+
+        def vardecl_assign(self):
+            return self.getTypedRuleContext(OPLangParser.Vardecl_assignContext,0)
+
+
+        def COMMA(self):
+            return self.getToken(OPLangParser.COMMA, 0)
+
+        def var_decl_list_ref(self):
+            return self.getTypedRuleContext(OPLangParser.Var_decl_list_refContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_var_decl_list_ref
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitVar_decl_list_ref" ):
+                return visitor.visitVar_decl_list_ref(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def var_decl_list_ref(self):
+
+        localctx = OPLangParser.Var_decl_list_refContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 106, self.RULE_var_decl_list_ref)
+        try:
+            self.state = 532
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,47,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 524
+                self.var_name()
+                self.state = 525
+                self.vardecl_assign()
+                self.state = 526
+                self.match(OPLangParser.COMMA)
+                self.state = 527
+                self.var_decl_list_ref()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 529
+                self.var_name()
+                self.state = 530
+                self.vardecl_assign()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Var_nameContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ID(self):
+            return self.getToken(OPLangParser.ID, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_var_name
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitVar_name" ):
+                return visitor.visitVar_name(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def var_name(self):
+
+        localctx = OPLangParser.Var_nameContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 108, self.RULE_var_name)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 534
+            self.match(OPLangParser.ID)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def expr1(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.Expr1Context)
+            else:
+                return self.getTypedRuleContext(OPLangParser.Expr1Context,i)
+
+
+        def LESST(self):
+            return self.getToken(OPLangParser.LESST, 0)
+
+        def LESSEQ(self):
+            return self.getToken(OPLangParser.LESSEQ, 0)
+
+        def MORET(self):
+            return self.getToken(OPLangParser.MORET, 0)
+
+        def MOREEQ(self):
+            return self.getToken(OPLangParser.MOREEQ, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_expr
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitExpr" ):
+                return visitor.visitExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def expr(self):
+
+        localctx = OPLangParser.ExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 110, self.RULE_expr)
+        self._la = 0 # Token type
+        try:
+            self.state = 541
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,48,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 536
+                self.expr1()
+                self.state = 537
+                _la = self._input.LA(1)
+                if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 4222124650659840) != 0)):
+                    self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
+                self.state = 538
+                self.expr1()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 540
+                self.expr1()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Expr1Context(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def expr2(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.Expr2Context)
+            else:
+                return self.getTypedRuleContext(OPLangParser.Expr2Context,i)
+
+
+        def EQ(self):
+            return self.getToken(OPLangParser.EQ, 0)
+
+        def NEQ(self):
+            return self.getToken(OPLangParser.NEQ, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_expr1
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitExpr1" ):
+                return visitor.visitExpr1(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def expr1(self):
+
+        localctx = OPLangParser.Expr1Context(self, self._ctx, self.state)
+        self.enterRule(localctx, 112, self.RULE_expr1)
+        self._la = 0 # Token type
+        try:
+            self.state = 548
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,49,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 543
+                self.expr2(0)
+                self.state = 544
+                _la = self._input.LA(1)
+                if not(_la==46 or _la==47):
+                    self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
+                self.state = 545
+                self.expr2(0)
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 547
+                self.expr2(0)
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Expr2Context(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def expr3(self):
+            return self.getTypedRuleContext(OPLangParser.Expr3Context,0)
+
+
+        def expr2(self):
+            return self.getTypedRuleContext(OPLangParser.Expr2Context,0)
+
+
+        def AND(self):
+            return self.getToken(OPLangParser.AND, 0)
+
+        def OR(self):
+            return self.getToken(OPLangParser.OR, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_expr2
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitExpr2" ):
+                return visitor.visitExpr2(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def expr2(self, _p:int=0):
+        _parentctx = self._ctx
+        _parentState = self.state
+        localctx = OPLangParser.Expr2Context(self, self._ctx, _parentState)
+        _prevctx = localctx
+        _startState = 114
+        self.enterRecursionRule(localctx, 114, self.RULE_expr2, _p)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 551
+            self.expr3(0)
+            self._ctx.stop = self._input.LT(-1)
+            self.state = 558
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,50,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    if self._parseListeners is not None:
+                        self.triggerExitRuleEvent()
+                    _prevctx = localctx
+                    localctx = OPLangParser.Expr2Context(self, _parentctx, _parentState)
+                    self.pushNewRecursionContext(localctx, _startState, self.RULE_expr2)
+                    self.state = 553
+                    if not self.precpred(self._ctx, 2):
+                        from antlr4.error.Errors import FailedPredicateException
+                        raise FailedPredicateException(self, "self.precpred(self._ctx, 2)")
+                    self.state = 554
+                    _la = self._input.LA(1)
+                    if not(_la==52 or _la==53):
+                        self._errHandler.recoverInline(self)
+                    else:
+                        self._errHandler.reportMatch(self)
+                        self.consume()
+                    self.state = 555
+                    self.expr3(0) 
+                self.state = 560
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,50,self._ctx)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.unrollRecursionContexts(_parentctx)
+        return localctx
+
+
+    class Expr3Context(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def expr4(self):
+            return self.getTypedRuleContext(OPLangParser.Expr4Context,0)
+
+
+        def expr3(self):
+            return self.getTypedRuleContext(OPLangParser.Expr3Context,0)
+
+
+        def ADD(self):
+            return self.getToken(OPLangParser.ADD, 0)
+
+        def SUB(self):
+            return self.getToken(OPLangParser.SUB, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_expr3
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitExpr3" ):
+                return visitor.visitExpr3(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def expr3(self, _p:int=0):
+        _parentctx = self._ctx
+        _parentState = self.state
+        localctx = OPLangParser.Expr3Context(self, self._ctx, _parentState)
+        _prevctx = localctx
+        _startState = 116
+        self.enterRecursionRule(localctx, 116, self.RULE_expr3, _p)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 562
+            self.expr4(0)
+            self._ctx.stop = self._input.LT(-1)
+            self.state = 569
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,51,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    if self._parseListeners is not None:
+                        self.triggerExitRuleEvent()
+                    _prevctx = localctx
+                    localctx = OPLangParser.Expr3Context(self, _parentctx, _parentState)
+                    self.pushNewRecursionContext(localctx, _startState, self.RULE_expr3)
+                    self.state = 564
+                    if not self.precpred(self._ctx, 2):
+                        from antlr4.error.Errors import FailedPredicateException
+                        raise FailedPredicateException(self, "self.precpred(self._ctx, 2)")
+                    self.state = 565
+                    _la = self._input.LA(1)
+                    if not(_la==40 or _la==41):
+                        self._errHandler.recoverInline(self)
+                    else:
+                        self._errHandler.reportMatch(self)
+                        self.consume()
+                    self.state = 566
+                    self.expr4(0) 
+                self.state = 571
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,51,self._ctx)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.unrollRecursionContexts(_parentctx)
+        return localctx
+
+
+    class Expr4Context(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def expr5(self):
+            return self.getTypedRuleContext(OPLangParser.Expr5Context,0)
+
+
+        def expr4(self):
+            return self.getTypedRuleContext(OPLangParser.Expr4Context,0)
+
+
+        def MUL(self):
+            return self.getToken(OPLangParser.MUL, 0)
+
+        def INTDIV(self):
+            return self.getToken(OPLangParser.INTDIV, 0)
+
+        def FLOATDIV(self):
+            return self.getToken(OPLangParser.FLOATDIV, 0)
+
+        def MOD(self):
+            return self.getToken(OPLangParser.MOD, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_expr4
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitExpr4" ):
+                return visitor.visitExpr4(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def expr4(self, _p:int=0):
+        _parentctx = self._ctx
+        _parentState = self.state
+        localctx = OPLangParser.Expr4Context(self, self._ctx, _parentState)
+        _prevctx = localctx
+        _startState = 118
+        self.enterRecursionRule(localctx, 118, self.RULE_expr4, _p)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 573
+            self.expr5(0)
+            self._ctx.stop = self._input.LT(-1)
+            self.state = 580
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,52,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    if self._parseListeners is not None:
+                        self.triggerExitRuleEvent()
+                    _prevctx = localctx
+                    localctx = OPLangParser.Expr4Context(self, _parentctx, _parentState)
+                    self.pushNewRecursionContext(localctx, _startState, self.RULE_expr4)
+                    self.state = 575
+                    if not self.precpred(self._ctx, 2):
+                        from antlr4.error.Errors import FailedPredicateException
+                        raise FailedPredicateException(self, "self.precpred(self._ctx, 2)")
+                    self.state = 576
+                    _la = self._input.LA(1)
+                    if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 65970697666560) != 0)):
+                        self._errHandler.recoverInline(self)
+                    else:
+                        self._errHandler.reportMatch(self)
+                        self.consume()
+                    self.state = 577
+                    self.expr5(0) 
+                self.state = 582
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,52,self._ctx)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.unrollRecursionContexts(_parentctx)
+        return localctx
+
+
+    class Expr5Context(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def expr6(self):
+            return self.getTypedRuleContext(OPLangParser.Expr6Context,0)
+
+
+        def expr5(self):
+            return self.getTypedRuleContext(OPLangParser.Expr5Context,0)
+
+
+        def CONCAT(self):
+            return self.getToken(OPLangParser.CONCAT, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_expr5
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitExpr5" ):
+                return visitor.visitExpr5(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def expr5(self, _p:int=0):
+        _parentctx = self._ctx
+        _parentState = self.state
+        localctx = OPLangParser.Expr5Context(self, self._ctx, _parentState)
+        _prevctx = localctx
+        _startState = 120
+        self.enterRecursionRule(localctx, 120, self.RULE_expr5, _p)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 584
+            self.expr6()
+            self._ctx.stop = self._input.LT(-1)
+            self.state = 591
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,53,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    if self._parseListeners is not None:
+                        self.triggerExitRuleEvent()
+                    _prevctx = localctx
+                    localctx = OPLangParser.Expr5Context(self, _parentctx, _parentState)
+                    self.pushNewRecursionContext(localctx, _startState, self.RULE_expr5)
+                    self.state = 586
+                    if not self.precpred(self._ctx, 2):
+                        from antlr4.error.Errors import FailedPredicateException
+                        raise FailedPredicateException(self, "self.precpred(self._ctx, 2)")
+                    self.state = 587
+                    self.match(OPLangParser.CONCAT)
+                    self.state = 588
+                    self.expr6() 
+                self.state = 593
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,53,self._ctx)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.unrollRecursionContexts(_parentctx)
+        return localctx
+
+
+    class Expr6Context(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def NOT(self):
+            return self.getToken(OPLangParser.NOT, 0)
+
+        def expr6(self):
+            return self.getTypedRuleContext(OPLangParser.Expr6Context,0)
+
+
+        def expr7(self):
+            return self.getTypedRuleContext(OPLangParser.Expr7Context,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_expr6
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitExpr6" ):
+                return visitor.visitExpr6(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def expr6(self):
+
+        localctx = OPLangParser.Expr6Context(self, self._ctx, self.state)
+        self.enterRule(localctx, 122, self.RULE_expr6)
+        try:
+            self.state = 597
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [54]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 594
+                self.match(OPLangParser.NOT)
+                self.state = 595
+                self.expr6()
+                pass
+            elif token in [11, 24, 25, 26, 27, 28, 30, 33, 40, 41, 55, 58]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 596
+                self.expr7()
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Expr7Context(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def expr7(self):
+            return self.getTypedRuleContext(OPLangParser.Expr7Context,0)
+
+
+        def ADD(self):
+            return self.getToken(OPLangParser.ADD, 0)
+
+        def SUB(self):
+            return self.getToken(OPLangParser.SUB, 0)
+
+        def expr8(self):
+            return self.getTypedRuleContext(OPLangParser.Expr8Context,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_expr7
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitExpr7" ):
+                return visitor.visitExpr7(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def expr7(self):
+
+        localctx = OPLangParser.Expr7Context(self, self._ctx, self.state)
+        self.enterRule(localctx, 124, self.RULE_expr7)
+        self._la = 0 # Token type
+        try:
+            self.state = 602
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [40, 41]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 599
+                _la = self._input.LA(1)
+                if not(_la==40 or _la==41):
+                    self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
+                self.state = 600
+                self.expr7()
+                pass
+            elif token in [11, 24, 25, 26, 27, 28, 30, 33, 55, 58]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 601
+                self.expr8(0)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Expr8Context(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def expr9(self):
+            return self.getTypedRuleContext(OPLangParser.Expr9Context,0)
+
+
+        def expr8(self):
+            return self.getTypedRuleContext(OPLangParser.Expr8Context,0)
+
+
+        def LSB(self):
+            return self.getToken(OPLangParser.LSB, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(OPLangParser.ExprContext,0)
+
+
+        def RSB(self):
+            return self.getToken(OPLangParser.RSB, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_expr8
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitExpr8" ):
+                return visitor.visitExpr8(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def expr8(self, _p:int=0):
+        _parentctx = self._ctx
+        _parentState = self.state
+        localctx = OPLangParser.Expr8Context(self, self._ctx, _parentState)
+        _prevctx = localctx
+        _startState = 126
+        self.enterRecursionRule(localctx, 126, self.RULE_expr8, _p)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 605
+            self.expr9(0)
+            self._ctx.stop = self._input.LT(-1)
+            self.state = 614
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,56,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    if self._parseListeners is not None:
+                        self.triggerExitRuleEvent()
+                    _prevctx = localctx
+                    localctx = OPLangParser.Expr8Context(self, _parentctx, _parentState)
+                    self.pushNewRecursionContext(localctx, _startState, self.RULE_expr8)
+                    self.state = 607
+                    if not self.precpred(self._ctx, 2):
+                        from antlr4.error.Errors import FailedPredicateException
+                        raise FailedPredicateException(self, "self.precpred(self._ctx, 2)")
+                    self.state = 608
+                    self.match(OPLangParser.LSB)
+                    self.state = 609
+                    self.expr()
+                    self.state = 610
+                    self.match(OPLangParser.RSB) 
+                self.state = 616
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,56,self._ctx)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.unrollRecursionContexts(_parentctx)
+        return localctx
+
+
+    class DottingContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def DOT(self):
+            return self.getToken(OPLangParser.DOT, 0)
+
+        def ID(self):
+            return self.getToken(OPLangParser.ID, 0)
+
+        def callfuncstm(self):
+            return self.getTypedRuleContext(OPLangParser.CallfuncstmContext,0)
+
+
+        def LSB(self):
+            return self.getToken(OPLangParser.LSB, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(OPLangParser.ExprContext,0)
+
+
+        def RSB(self):
+            return self.getToken(OPLangParser.RSB, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_dotting
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitDotting" ):
+                return visitor.visitDotting(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def dotting(self):
+
+        localctx = OPLangParser.DottingContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 128, self.RULE_dotting)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 617
+            self.match(OPLangParser.DOT)
+            self.state = 625
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,57,self._ctx)
+            if la_ == 1:
+                self.state = 618
+                self.match(OPLangParser.ID)
+                pass
+
+            elif la_ == 2:
+                self.state = 619
+                self.callfuncstm()
+                pass
+
+            elif la_ == 3:
+                self.state = 620
+                self.match(OPLangParser.ID)
+                self.state = 621
+                self.match(OPLangParser.LSB)
+                self.state = 622
+                self.expr()
+                self.state = 623
+                self.match(OPLangParser.RSB)
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Expr9Context(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def expr10(self):
+            return self.getTypedRuleContext(OPLangParser.Expr10Context,0)
+
+
+        def expr9(self):
+            return self.getTypedRuleContext(OPLangParser.Expr9Context,0)
+
+
+        def dotting(self):
+            return self.getTypedRuleContext(OPLangParser.DottingContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_expr9
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitExpr9" ):
+                return visitor.visitExpr9(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def expr9(self, _p:int=0):
+        _parentctx = self._ctx
+        _parentState = self.state
+        localctx = OPLangParser.Expr9Context(self, self._ctx, _parentState)
+        _prevctx = localctx
+        _startState = 130
+        self.enterRecursionRule(localctx, 130, self.RULE_expr9, _p)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 628
+            self.expr10()
+            self._ctx.stop = self._input.LT(-1)
+            self.state = 634
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,58,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    if self._parseListeners is not None:
+                        self.triggerExitRuleEvent()
+                    _prevctx = localctx
+                    localctx = OPLangParser.Expr9Context(self, _parentctx, _parentState)
+                    self.pushNewRecursionContext(localctx, _startState, self.RULE_expr9)
+                    self.state = 630
+                    if not self.precpred(self._ctx, 2):
+                        from antlr4.error.Errors import FailedPredicateException
+                        raise FailedPredicateException(self, "self.precpred(self._ctx, 2)")
+                    self.state = 631
+                    self.dotting() 
+                self.state = 636
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,58,self._ctx)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.unrollRecursionContexts(_parentctx)
+        return localctx
+
+
+    class Expr10Context(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def NEW(self):
+            return self.getToken(OPLangParser.NEW, 0)
+
+        def expr10(self):
+            return self.getTypedRuleContext(OPLangParser.Expr10Context,0)
+
+
+        def expr11(self):
+            return self.getTypedRuleContext(OPLangParser.Expr11Context,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_expr10
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitExpr10" ):
+                return visitor.visitExpr10(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def expr10(self):
+
+        localctx = OPLangParser.Expr10Context(self, self._ctx, self.state)
+        self.enterRule(localctx, 132, self.RULE_expr10)
+        try:
+            self.state = 640
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [55]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 637
+                self.match(OPLangParser.NEW)
+                self.state = 638
+                self.expr10()
+                pass
+            elif token in [11, 24, 25, 26, 27, 28, 30, 33, 58]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 639
+                self.expr11()
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Expr11Context(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def INTLIT(self):
+            return self.getToken(OPLangParser.INTLIT, 0)
+
+        def FLOATLIT(self):
+            return self.getToken(OPLangParser.FLOATLIT, 0)
+
+        def STRINGLIT(self):
+            return self.getToken(OPLangParser.STRINGLIT, 0)
+
+        def BOOLLIT(self):
+            return self.getToken(OPLangParser.BOOLLIT, 0)
+
+        def ID(self):
+            return self.getToken(OPLangParser.ID, 0)
+
+        def callfuncstm(self):
+            return self.getTypedRuleContext(OPLangParser.CallfuncstmContext,0)
+
+
+        def array(self):
+            return self.getTypedRuleContext(OPLangParser.ArrayContext,0)
+
+
+        def THIS(self):
+            return self.getToken(OPLangParser.THIS, 0)
+
+        def NIL(self):
+            return self.getToken(OPLangParser.NIL, 0)
+
+        def LRB(self):
+            return self.getToken(OPLangParser.LRB, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(OPLangParser.ExprContext,0)
+
+
+        def RRB(self):
+            return self.getToken(OPLangParser.RRB, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_expr11
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitExpr11" ):
+                return visitor.visitExpr11(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def expr11(self):
+
+        localctx = OPLangParser.Expr11Context(self, self._ctx, self.state)
+        self.enterRule(localctx, 134, self.RULE_expr11)
+        try:
+            self.state = 655
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,60,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 642
+                self.match(OPLangParser.INTLIT)
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 643
+                self.match(OPLangParser.FLOATLIT)
+                pass
+
+            elif la_ == 3:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 644
+                self.match(OPLangParser.STRINGLIT)
+                pass
+
+            elif la_ == 4:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 645
+                self.match(OPLangParser.BOOLLIT)
+                pass
+
+            elif la_ == 5:
+                self.enterOuterAlt(localctx, 5)
+                self.state = 646
+                self.match(OPLangParser.ID)
+                pass
+
+            elif la_ == 6:
+                self.enterOuterAlt(localctx, 6)
+                self.state = 647
+                self.callfuncstm()
+                pass
+
+            elif la_ == 7:
+                self.enterOuterAlt(localctx, 7)
+                self.state = 648
+                self.array()
+                pass
+
+            elif la_ == 8:
+                self.enterOuterAlt(localctx, 8)
+                self.state = 649
+                self.match(OPLangParser.THIS)
+                pass
+
+            elif la_ == 9:
+                self.enterOuterAlt(localctx, 9)
+                self.state = 650
+                self.match(OPLangParser.NIL)
+                pass
+
+            elif la_ == 10:
+                self.enterOuterAlt(localctx, 10)
+                self.state = 651
+                self.match(OPLangParser.LRB)
+                self.state = 652
+                self.expr()
+                self.state = 653
+                self.match(OPLangParser.RRB)
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+
+    def sempred(self, localctx:RuleContext, ruleIndex:int, predIndex:int):
+        if self._predicates == None:
+            self._predicates = dict()
+        self._predicates[57] = self.expr2_sempred
+        self._predicates[58] = self.expr3_sempred
+        self._predicates[59] = self.expr4_sempred
+        self._predicates[60] = self.expr5_sempred
+        self._predicates[63] = self.expr8_sempred
+        self._predicates[65] = self.expr9_sempred
+        pred = self._predicates.get(ruleIndex, None)
+        if pred is None:
+            raise Exception("No predicate with index:" + str(ruleIndex))
+        else:
+            return pred(localctx, predIndex)
+
+    def expr2_sempred(self, localctx:Expr2Context, predIndex:int):
+            if predIndex == 0:
+                return self.precpred(self._ctx, 2)
+         
+
+    def expr3_sempred(self, localctx:Expr3Context, predIndex:int):
+            if predIndex == 1:
+                return self.precpred(self._ctx, 2)
+         
+
+    def expr4_sempred(self, localctx:Expr4Context, predIndex:int):
+            if predIndex == 2:
+                return self.precpred(self._ctx, 2)
+         
+
+    def expr5_sempred(self, localctx:Expr5Context, predIndex:int):
+            if predIndex == 3:
+                return self.precpred(self._ctx, 2)
+         
+
+    def expr8_sempred(self, localctx:Expr8Context, predIndex:int):
+            if predIndex == 4:
+                return self.precpred(self._ctx, 2)
+         
+
+    def expr9_sempred(self, localctx:Expr9Context, predIndex:int):
+            if predIndex == 5:
+                return self.precpred(self._ctx, 2)
+         
+
+
+
+
@@ -16,6 +16,7 @@ Usage:
     python run.py test-ast
     python run.py test-checker
     python run.py test-codegen
+    python run.py bench
     python run.py clean
 
     # On macOS/Linux:
@@ -27,6 +28,7 @@ Usage:
     python3 run.py test-ast
     python3 run.py test-checker
     python3 run.py test-codegen
+    python3 run.py bench
     python3 run.py clean
 """
 
@@ -90,6 +92,19 @@ class OPLangBuilder:
 
         self.python_version = "3.12"
 
+        # Code generation back end: program-to-output tests, then its components
+        self.codegen_tests = [
+            "tests/test_codegen.py",
+            "tests/test_code_buffer.py",
+            "tests/test_constant_folder.py",
+            "tests/test_peephole.py",
+            "tests/test_jasmin_batch.py",
+            "tests/test_class_cache.py",
+            "tests/test_concurrency.py",
+            "tests/test_pipeline.py",
+            "tests/test_program_generator.py",
+        ]
+
         self.colors = Colors()
 
         # Platform-specific paths
@@ -215,6 +230,18 @@ class OPLangBuilder:
             )
         )
         print()
+        print(self.colors.green("Benchmarks:"))
+        print(
+            self.colors.yellow(
+                "  python3 run.py bench [options] - Run the compiler benchmark suite against its baseline"
+            )
+        )
+        print(
+            self.colors.yellow(
+                "                                   (--save, --threshold FRACTION, --repeat N, --scale N)"
+            )
+        )
+        print()
         print(self.colors.green("Cleaning:"))
         print(
             self.colors.yellow(
@@ -681,7 +708,7 @@ class OPLangBuilder:
                 str(self.venv_python3),
                 "-m",
                 "pytest",
-                "tests/test_codegen.py",
+                *self.codegen_tests,
                 f"--html={codegen_report_dir}/index.html",
                 "--timeout=10",
                 "--self-contained-html",
@@ -697,6 +724,21 @@ class OPLangBuilder:
         )
         self.clean_cache()
 
+    def run_benchmarks(self, bench_args):
+        """Run the compiler benchmark suite, failing on a throughput regression."""
+        if not self.build_dir.exists():
+            print(
+                self.colors.yellow("Build directory not found. Running build first...")
+            )
+            self.build_grammar()
+
+        print(self.colors.yellow("Running compiler benchmarks..."))
+        self.run_command(
+            [str(self.venv_python3), "benchmarks/bench_suite.py"] + list(bench_args)
+        )  # Fails on a regression
+        print(self.colors.green("Compiler benchmarks completed."))
+        self.clean_cache()
+
 
 def main():
     """Main entry point."""
@@ -718,12 +760,15 @@ Available commands:
   test-ast      Run AST generation tests
   test-checker  Run semantic checker tests
   test-codegen  Run code generation tests
+  bench         Run the compiler benchmark suite against its baseline
+                (options after it go to benchmarks/bench_suite.py)
 
 Examples:
   python3 run.py setup
   python3 run.py build
   python3 run.py test-lexer
   python3 run.py test-ast
+  python3 run.py bench --threshold 0.1
         """,
     )
 
@@ -745,11 +790,19 @@ Examples:
             "test-ast",
             "test-checker",
             "test-codegen",
+            "bench",
         ],
         help="Command to execute",
     )
+    parser.add_argument(
+        "args",
+        nargs=argparse.REMAINDER,
+        help="Options for the bench command, e.g. --save or --threshold 0.1",
+    )
 
     args = parser.parse_args()
+    if args.args and args.command != "bench":
+        parser.error(f"unrecognized arguments: {' '.join(args.args)}")
 
     builder = OPLangBuilder()
 
@@ -767,6 +820,7 @@ Examples:
         "test-ast": builder.test_ast,
         "test-checker": builder.test_checker,
         "test-codegen": builder.test_codegen,
+        "bench": lambda: builder.run_benchmarks(args.args),
     }
 
     if args.command in commands:
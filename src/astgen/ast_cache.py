@@ -0,0 +1,92 @@
+"""
+AST cache module for OPLang programming language.
+This module contains the ASTCache class that stores Program ASTs on disk,
+keyed by the source text and the grammar version, so unchanged programs
+skip lexing and parsing.
+"""
+
+import hashlib
+import os
+import pickle
+import zlib
+from typing import Optional
+
+from src.utils.disk_cache import DiskCache
+from src.utils.nodes import Program
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Files whose contents decide the shape of the produced AST
+_VERSION_FILES = (
+    os.path.join(_ROOT, "grammar", "OPLang.g4"),
+    os.path.join(_ROOT, "astgen", "ast_generation.py"),
+    os.path.join(_ROOT, "utils", "nodes.py"),
+)
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+CACHE_ENV = "OPLANG_AST_CACHE"
+
+
+def grammar_version() -> str:
+    """Return a digest of the grammar and AST generation sources."""
+    digest = hashlib.sha256()
+    for path in _VERSION_FILES:
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+class ASTCache:
+    """
+    On-disk cache of Program ASTs.
+
+    Entries are zlib-compressed pickles keyed by a SHA-256 digest of the
+    grammar version and the source text. Caching is best effort: ASTs that
+    cannot be serialized (for example very deep expressions) are simply
+    not stored.
+
+    Attributes:
+        store (DiskCache): Backing file store with LRU eviction
+        version (str): Grammar version folded into every key
+    """
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize ASTCache.
+
+        Args:
+            directory: Directory holding the cache entries
+            max_bytes: Upper bound for the total size of all entries
+        """
+        self.store = DiskCache(directory, max_bytes, suffix=".ast")
+        self.version = grammar_version()
+
+    @classmethod
+    def from_env(cls) -> Optional["ASTCache"]:
+        """Return a cache in $OPLANG_AST_CACHE, or None when it is unset."""
+        directory = os.environ.get(CACHE_ENV)
+        return cls(directory) if directory else None
+
+    def key(self, source: str) -> str:
+        """Return the cache key of a source text."""
+        digest = hashlib.sha256(self.version.encode())
+        digest.update(source.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, source: str) -> Optional[Program]:
+        """Return the cached AST of source, or None on a miss."""
+        data = self.store.get(self.key(source))
+        if data is None:
+            return None
+        try:
+            return pickle.loads(zlib.decompress(data))
+        except Exception:
+            return None
+
+    def put(self, source: str, ast: Program) -> None:
+        """Store the AST of source."""
+        try:
+            data = zlib.compress(pickle.dumps(ast, pickle.HIGHEST_PROTOCOL))
+        except (RecursionError, pickle.PicklingError):
+            return
+        self.store.put(self.key(source), data)
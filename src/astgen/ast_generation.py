@@ -8,6 +8,7 @@ from functools import reduce
 from build.OPLangVisitor import OPLangVisitor
 from build.OPLangParser import OPLangParser
 from src.utils.nodes import *
+from src.utils.error_listener import SyntaxException
 
 
 class ASTGeneration(OPLangVisitor):
@@ -23,13 +24,8 @@ class ASTGeneration(OPLangVisitor):
         return Program(class_decls)
 
     def visitClass_decl_list(self, ctx: OPLangParser.Class_decl_listContext):
-        """Visit class_decl_list: class_decl class_decl_list | class_decl"""
-        class_decls = []
-        # Handle both cases: single class_decl or class_decl followed by class_decl_list
-        class_decls.append(self.visit(ctx.class_decl()))
-        if ctx.class_decl_list():
-            class_decls.extend(self.visit(ctx.class_decl_list()))
-        return class_decls
+        """Visit class_decl_list: class_decl+"""
+        return [self.visit(class_decl) for class_decl in ctx.class_decl()]
 
     def visitClass_decl(self, ctx: OPLangParser.Class_declContext):
         """Visit class declaration with optional extends"""
@@ -50,31 +46,17 @@ class ASTGeneration(OPLangVisitor):
         return self.visit(ctx.decl()) if ctx.decl() else []
 
     def visitDecl(self, ctx: OPLangParser.DeclContext):
-        """Visit decl: (attr_decl|func_decl) decl | empty"""
-        current_decl = []
-        
-        if ctx.attr_decl():
-            current_decl = [self.visit(ctx.attr_decl())]
-        elif ctx.func_decl():
-            current_decl = [self.visit(ctx.func_decl())]
-        
-        # Get remaining declarations recursively
-        remaining_decls = self.visit(ctx.decl()) if ctx.decl() else []
-        
-        return current_decl + remaining_decls
+        """Visit decl: (attr_decl|func_decl)*"""
+        # Children are attr_decl/func_decl contexts in source order
+        return [self.visit(child) for child in ctx.getChildren()]
 
     # ============================================================================
     # Variable/Attribute Declarations
     # ============================================================================
 
     def visitVar_decl_stm(self, ctx: OPLangParser.Var_decl_stmContext):
-        """Visit var_decl_stm: var_decl_no_stafin var_decl_stm | empty"""
-        var_decls = []
-        if ctx.var_decl_no_stafin():
-            var_decls.append(self.visit(ctx.var_decl_no_stafin()))
-        if ctx.var_decl_stm():
-            var_decls.extend(self.visit(ctx.var_decl_stm()))
-        return var_decls
+        """Visit var_decl_stm: var_decl_no_stafin*"""
+        return [self.visit(var_decl) for var_decl in ctx.var_decl_no_stafin()]
 
     def visitStafin(self, ctx: OPLangParser.StafinContext):
         """Visit stafin: STA FIN | FIN STA | STA | FIN | empty"""
@@ -256,25 +238,23 @@ class ASTGeneration(OPLangVisitor):
         return []
 
     def visitFunc_param_prime(self, ctx: OPLangParser.Func_param_primeContext):
-        """Visit func_param_prime"""
+        """Visit func_param_prime: func_param_group (SEMI func_param_group)*"""
         params = []
-        
+        for group in ctx.func_param_group():
+            params.extend(self.visit(group))
+        return params
+
+    def visitFunc_param_group(self, ctx: OPLangParser.Func_param_groupContext):
+        """Visit func_param_group: (type | referencetype) func_param"""
         # Get parameter type
         if ctx.type_():
             param_type = self.visit(ctx.type_())
         else:  # referencetype
             param_type = self.visit(ctx.referencetype())
-            
+
         # Get parameter names from func_param
         param_names = self.visit(ctx.func_param())
-        for name in param_names:
-            params.append(Parameter(param_type, name))
-            
-        # Process remaining parameters if any
-        if ctx.func_param_prime():
-            params.extend(self.visit(ctx.func_param_prime()))
-            
-        return params
+        return [Parameter(param_type, name) for name in param_names]
 
     def visitFunc_param(self, ctx: OPLangParser.Func_paramContext):
         """Visit func_param: var_name COMMA func_param | var_name"""
@@ -359,13 +339,8 @@ class ASTGeneration(OPLangVisitor):
         return BlockStatement(var_decls, statements)
 
     def visitStmlist(self, ctx: OPLangParser.StmlistContext):
-        """Visit stmlist: stm stmlist | empty"""
-        statements = []
-        if ctx.stm():
-            statements.append(self.visit(ctx.stm()))
-        if ctx.stmlist():
-            statements.extend(self.visit(ctx.stmlist()))
-        return statements
+        """Visit stmlist: stm*"""
+        return [self.visit(stm) for stm in ctx.stm()]
 
     def visitStm(self, ctx: OPLangParser.StmContext):
         """Visit stm: various statement types"""
@@ -391,6 +366,8 @@ class ASTGeneration(OPLangVisitor):
         # Determine LHS type based on what's present
         if ctx.invocationstm_frame():
             # Method/member access on LHS (like obj.field or obj.method())
+            if not ctx.invocationstm_frame().expr9().dotting():
+                self._syntax_error(ctx.vardecl_assign().ASSIGN().getSymbol())
             postfix_expr = self.visit(ctx.invocationstm_frame())
             lhs = PostfixLHS(postfix_expr)
         elif ctx.ID() and ctx.LSB():  
@@ -468,14 +445,21 @@ class ASTGeneration(OPLangVisitor):
 
     def visitInvocationstm(self, ctx: OPLangParser.InvocationstmContext):
         """Visit invocation statement"""
+        # The grammar takes any postfix expression so SLL prediction never
+        # has to split it; only one ending in .method(...) is a statement
+        dotting = ctx.invocationstm_frame().expr9().dotting()
+        if not dotting or not dotting.callfuncstm():
+            self._syntax_error(ctx.SEMI().getSymbol())
         method_call = self.visit(ctx.invocationstm_frame())
         return MethodInvocationStatement(method_call)
 
     def visitInvocationstm_frame(self, ctx: OPLangParser.Invocationstm_frameContext):
-        """Visit invocationstm_frame: expr dotting"""
-        left_expr = self.visit(ctx.expr())
-        postfix_ops = self.visit(ctx.dotting())
-        return PostfixExpression(left_expr, postfix_ops)
+        """Visit invocationstm_frame: expr9"""
+        return self.visit(ctx.expr9())
+
+    def _syntax_error(self, token):
+        """Report token the way the parser's error listener reports it"""
+        raise SyntaxException(f"Error on line {token.line} col {token.column}: {token.text}")
 
     # ============================================================================
     # Expressions
@@ -594,10 +578,6 @@ class ASTGeneration(OPLangVisitor):
         elif ctx.ID():
             ops.append(MemberAccess(ctx.ID().getText()))
         
-        # Xử lý đệ quy
-        if ctx.dotting():
-            ops.extend(self.visit(ctx.dotting()))
-        
         return ops
 
     def visitExpr10(self, ctx: OPLangParser.Expr10Context):
@@ -653,11 +633,8 @@ class ASTGeneration(OPLangVisitor):
         return []
 
     def visitInput_func_param_prime(self, ctx: OPLangParser.Input_func_param_primeContext):
-        """Visit input_func_param_prime"""
-        params = [self.visit(ctx.input_func_param())]
-        if ctx.input_func_param_prime():
-            params.extend(self.visit(ctx.input_func_param_prime()))
-        return params
+        """Visit input_func_param_prime: input_func_param (COMMA input_func_param)*"""
+        return [self.visit(param) for param in ctx.input_func_param()]
 
     def visitInput_func_param(self, ctx: OPLangParser.Input_func_paramContext):
         """Visit input_func_param"""
@@ -0,0 +1,208 @@
+"""
+Class file cache for OPLang programming language.
+This module contains the ClassCache class that stores the class files of
+compiled programs on disk, keyed by the normalized Program AST, the
+compiler version and the compiler options, so unchanged programs skip code
+generation and assembly.
+"""
+
+import hashlib
+import os
+import pickle
+import zlib
+from typing import Any, Dict, Mapping, Optional
+
+from src.utils.disk_cache import DiskCache
+from src.utils.nodes import ASTNode, Program
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Files whose contents decide the produced class files
+_VERSION_FILES = (
+    os.path.join(_ROOT, "codegen", "codegen.py"),
+    os.path.join(_ROOT, "codegen", "emitter.py"),
+    os.path.join(_ROOT, "codegen", "jasmin_code.py"),
+    os.path.join(_ROOT, "codegen", "class_writer.py"),
+    os.path.join(_ROOT, "codegen", "frame.py"),
+    os.path.join(_ROOT, "codegen", "peephole.py"),
+    os.path.join(_ROOT, "codegen", "io.py"),
+    os.path.join(_ROOT, "codegen", "utils.py"),
+    os.path.join(_ROOT, "semantics", "constant_folder.py"),
+    os.path.join(_ROOT, "semantics", "static_checker.py"),
+    os.path.join(_ROOT, "utils", "nodes.py"),
+    os.path.join(_ROOT, "utils", "type_pool.py"),
+    os.path.join(_ROOT, "utils", "visitor.py"),
+)
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+CACHE_ENV = "OPLANG_CLASS_CACHE"
+
+# Source positions do not change the generated code
+_IGNORED_FIELDS = ("line", "column")
+
+
+class _Close(str):
+    """Closing delimiter pushed on the hash_ast stack, told apart from str leaves."""
+
+
+_END_NODE = _Close(")")
+_END_LIST = _Close("]")
+
+# Hashed fields of every node type seen so far, None for non-node types
+_node_fields: Dict[type, Optional[tuple]] = {}
+
+
+def compiler_version() -> str:
+    """Return a digest of the code generator sources."""
+    digest = hashlib.sha256()
+    for path in _VERSION_FILES:
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _fields(item_type: type) -> Optional[tuple]:
+    fields = None
+    if issubclass(item_type, ASTNode):
+        fields = tuple(
+            name
+            for cls in reversed(item_type.__mro__)
+            for name in cls.__dict__.get("__slots__", ())
+            if name not in _IGNORED_FIELDS
+        )
+    _node_fields[item_type] = fields
+    return fields
+
+
+def hash_ast(ast: ASTNode, digest) -> None:
+    """
+    Feed a normalized serialization of an AST into a hashlib digest.
+
+    The walk is iterative so deep expressions do not hit the recursion
+    limit, and it leaves out source positions.
+
+    Args:
+        ast: Root node to hash
+        digest: hashlib object updated in place
+    """
+    parts = []
+    stack = [ast]
+    while stack:
+        item = stack.pop()
+        item_type = type(item)
+        fields = _node_fields[item_type] if item_type in _node_fields else _fields(item_type)
+        if fields is not None:
+            parts.append("(" + item_type.__name__)
+            stack.append(_END_NODE)
+            for name in reversed(fields):
+                stack.append(getattr(item, name, None))
+        elif item_type is list or item_type is tuple:
+            parts.append("[")
+            stack.append(_END_LIST)
+            stack.extend(reversed(item))
+        elif item_type is _Close:
+            parts.append(item)
+        else:
+            parts.append(f"{item_type.__name__}:{item!r};")
+    digest.update("".join(parts).encode("utf-8"))
+
+
+class CompiledProgram:
+    """
+    Class files of one compiled program.
+
+    Attributes:
+        main_class (str): Class holding the static main method, or None
+        classes (dict): Class name to class file bytes, in declaration order
+    """
+
+    __slots__ = ("main_class", "classes")
+
+    def __init__(self, main_class: Optional[str], classes: Dict[str, bytes]):
+        self.main_class = main_class
+        self.classes = classes
+
+    @property
+    def class_names(self):
+        return list(self.classes)
+
+    @property
+    def size(self) -> int:
+        return sum(len(data) for data in self.classes.values())
+
+    def write(self, output_dir: str) -> None:
+        """Write the class files into output_dir."""
+        for name, data in self.classes.items():
+            with open(os.path.join(output_dir, name + ".class"), "wb") as f:
+                f.write(data)
+
+
+class ClassCache:
+    """
+    On-disk cache of compiled programs.
+
+    Entries are zlib-compressed pickles of CompiledProgram contents keyed by
+    a SHA-256 digest of the compiler version, the options and the
+    normalized AST. Hit, miss and saved-byte counts are kept per instance.
+
+    Attributes:
+        store (DiskCache): Backing file store with LRU eviction
+        version (str): Compiler version folded into every key
+        hits (int): Number of get() calls that found an entry
+        misses (int): Number of get() calls that did not
+        bytes_saved (int): Class file bytes served from the cache
+    """
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize ClassCache.
+
+        Args:
+            directory: Directory holding the cache entries
+            max_bytes: Upper bound for the total size of all entries
+        """
+        self.store = DiskCache(directory, max_bytes, suffix=".classes")
+        self.version = compiler_version()
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+
+    @classmethod
+    def from_env(cls) -> Optional["ClassCache"]:
+        """Return a cache in $OPLANG_CLASS_CACHE, or None when it is unset."""
+        directory = os.environ.get(CACHE_ENV)
+        return cls(directory) if directory else None
+
+    def key(self, ast: Program, options: Optional[Mapping[str, Any]] = None) -> str:
+        """Return the cache key of an AST compiled with the given options."""
+        digest = hashlib.sha256(self.version.encode())
+        digest.update(repr(sorted((options or {}).items())).encode("utf-8"))
+        hash_ast(ast, digest)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[CompiledProgram]:
+        """Return the compiled program stored under key, or None on a miss."""
+        data = self.store.get(key)
+        program = None
+        if data is not None:
+            try:
+                program = CompiledProgram(*pickle.loads(zlib.decompress(data)))
+            except Exception:
+                program = None
+        if program is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.bytes_saved += program.size
+        return program
+
+    def put(self, key: str, program: CompiledProgram) -> None:
+        """Store a compiled program under key."""
+        data = zlib.compress(
+            pickle.dumps((program.main_class, program.classes), pickle.HIGHEST_PROTOCOL)
+        )
+        self.store.put(key, data)
+
+    def stats(self) -> Dict[str, int]:
+        """Return the hit, miss and saved-byte counts."""
+        return {"hits": self.hits, "misses": self.misses, "bytes_saved": self.bytes_saved}
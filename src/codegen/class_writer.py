@@ -0,0 +1,537 @@
+"""
+Class file writer for OPLang programming language.
+This module assembles the Jasmin code produced by JasminCode directly into
+JVM class files, so programs can be run without starting a JVM for
+jasmin.jar. It understands the directives and instructions JasminCode
+emits and writes class files of the same version as Jasmin (45.3), which
+need no stack map frames.
+"""
+
+import os
+import struct
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .error import AssemblyException
+
+MAGIC = 0xCAFEBABE
+MINOR_VERSION = 3
+MAJOR_VERSION = 45
+
+ACCESS_FLAGS = {
+    "public": 0x0001,
+    "private": 0x0002,
+    "protected": 0x0004,
+    "static": 0x0008,
+    "final": 0x0010,
+    "synchronized": 0x0020,
+    "volatile": 0x0040,
+    "transient": 0x0080,
+    "native": 0x0100,
+    "interface": 0x0200,
+    "abstract": 0x0400,
+}
+ACC_SUPER = 0x0020
+
+# Instructions without operands
+SIMPLE_OPCODES = {
+    "nop": 0x00, "aconst_null": 0x01,
+    "iconst_m1": 0x02, "iconst_0": 0x03, "iconst_1": 0x04, "iconst_2": 0x05,
+    "iconst_3": 0x06, "iconst_4": 0x07, "iconst_5": 0x08,
+    "fconst_0": 0x0B, "fconst_1": 0x0C, "fconst_2": 0x0D,
+    "iload_0": 0x1A, "iload_1": 0x1B, "iload_2": 0x1C, "iload_3": 0x1D,
+    "fload_0": 0x22, "fload_1": 0x23, "fload_2": 0x24, "fload_3": 0x25,
+    "aload_0": 0x2A, "aload_1": 0x2B, "aload_2": 0x2C, "aload_3": 0x2D,
+    "iaload": 0x2E, "faload": 0x30, "aaload": 0x32, "baload": 0x33,
+    "istore_0": 0x3B, "istore_1": 0x3C, "istore_2": 0x3D, "istore_3": 0x3E,
+    "fstore_0": 0x43, "fstore_1": 0x44, "fstore_2": 0x45, "fstore_3": 0x46,
+    "astore_0": 0x4B, "astore_1": 0x4C, "astore_2": 0x4D, "astore_3": 0x4E,
+    "iastore": 0x4F, "fastore": 0x51, "aastore": 0x53, "bastore": 0x54,
+    "pop": 0x57, "pop2": 0x58, "dup": 0x59, "dup_x1": 0x5A, "dup_x2": 0x5B,
+    "dup2": 0x5C, "swap": 0x5F,
+    "iadd": 0x60, "fadd": 0x62, "isub": 0x64, "fsub": 0x66,
+    "imul": 0x68, "fmul": 0x6A, "idiv": 0x6C, "fdiv": 0x6E,
+    "irem": 0x70, "frem": 0x72, "ineg": 0x74, "fneg": 0x76,
+    "iand": 0x7E, "ior": 0x80, "ixor": 0x82,
+    "i2f": 0x86, "f2i": 0x8B, "fcmpl": 0x95, "fcmpg": 0x96,
+    "ireturn": 0xAC, "freturn": 0xAE, "areturn": 0xB0, "return": 0xB1,
+    "arraylength": 0xBE, "athrow": 0xBF,
+}
+
+# Instructions taking a local variable index
+LOCAL_OPCODES = {
+    "iload": 0x15, "fload": 0x17, "aload": 0x19,
+    "istore": 0x36, "fstore": 0x38, "astore": 0x3A,
+}
+
+# Instructions taking a label
+BRANCH_OPCODES = {
+    "ifeq": 0x99, "ifne": 0x9A, "iflt": 0x9B, "ifge": 0x9C, "ifgt": 0x9D, "ifle": 0x9E,
+    "if_icmpeq": 0x9F, "if_icmpne": 0xA0, "if_icmplt": 0xA1,
+    "if_icmpge": 0xA2, "if_icmpgt": 0xA3, "if_icmple": 0xA4,
+    "if_acmpeq": 0xA5, "if_acmpne": 0xA6, "goto": 0xA7,
+    "ifnull": 0xC6, "ifnonnull": 0xC7,
+}
+
+FIELD_OPCODES = {"getstatic": 0xB2, "putstatic": 0xB3, "getfield": 0xB4, "putfield": 0xB5}
+METHOD_OPCODES = {"invokevirtual": 0xB6, "invokespecial": 0xB7, "invokestatic": 0xB8}
+CLASS_OPCODES = {"new": 0xBB, "anewarray": 0xBD, "checkcast": 0xC0, "instanceof": 0xC1}
+
+BIPUSH = 0x10
+SIPUSH = 0x11
+LDC = 0x12
+LDC_W = 0x13
+IINC = 0x84
+NEWARRAY = 0xBC
+WIDE = 0xC4
+MULTIANEWARRAY = 0xC5
+
+ARRAY_TYPES = {
+    "boolean": 4, "char": 5, "float": 6, "double": 7,
+    "byte": 8, "short": 9, "int": 10, "long": 11,
+}
+
+STRING_ESCAPES = {
+    "b": "\b", "t": "\t", "n": "\n", "f": "\f", "r": "\r",
+    '"': '"', "'": "'", "\\": "\\",
+}
+
+MAX_CODE_LENGTH = 65535
+
+
+def encode_modified_utf8(s: str) -> bytes:
+    """Encode s in the modified UTF-8 used by class file constant pools."""
+    out = bytearray()
+    for ch in s:
+        c = ord(ch)
+        if 0 < c < 0x80:
+            out.append(c)
+        elif c < 0x800:
+            out += bytes((0xC0 | (c >> 6), 0x80 | (c & 0x3F)))
+        elif c < 0x10000:
+            out += bytes((0xE0 | (c >> 12), 0x80 | ((c >> 6) & 0x3F), 0x80 | (c & 0x3F)))
+        else:
+            # Supplementary characters are stored as two encoded surrogates
+            c -= 0x10000
+            for unit in (0xD800 | (c >> 10), 0xDC00 | (c & 0x3FF)):
+                out += bytes((0xE0 | (unit >> 12), 0x80 | ((unit >> 6) & 0x3F), 0x80 | (unit & 0x3F)))
+    return bytes(out)
+
+
+def parse_string_literal(text: str) -> str:
+    """Decode a double-quoted Jasmin string literal with Java escapes."""
+    if len(text) < 2 or text[0] != '"' or text[-1] != '"':
+        raise ValueError(f"bad string constant {text}")
+    body = text[1:-1]
+    out = []
+    i = 0
+    while i < len(body):
+        ch = body[i]
+        if ch != "\\" or i + 1 == len(body):
+            out.append(ch)
+            i += 1
+            continue
+        nxt = body[i + 1]
+        if nxt in STRING_ESCAPES:
+            out.append(STRING_ESCAPES[nxt])
+            i += 2
+        elif nxt == "u" and i + 6 <= len(body):
+            out.append(chr(int(body[i + 2:i + 6], 16)))
+            i += 6
+        elif nxt in "01234567":
+            j = i + 1
+            while j < len(body) and j < i + 4 and body[j] in "01234567":
+                j += 1
+            out.append(chr(int(body[i + 1:j], 8)))
+            i = j
+        else:
+            out.append(nxt)
+            i += 2
+    return "".join(out)
+
+
+class ConstantPool:
+    """
+    Constant pool of a class file under construction.
+
+    Equal constants share one entry; entries are kept in insertion order.
+    """
+
+    def __init__(self):
+        self.entries: List[bytes] = []
+        self.indices: Dict[tuple, int] = {}
+        self.count = 1
+
+    def _add(self, key: tuple, data: bytes) -> int:
+        index = self.indices.get(key)
+        if index is None:
+            if self.count > 0xFFFF:
+                raise ValueError("too many constants")
+            index = self.indices[key] = self.count
+            self.entries.append(data)
+            self.count += 1
+        return index
+
+    def utf8(self, value: str) -> int:
+        data = encode_modified_utf8(value)
+        return self._add(("Utf8", value), struct.pack(">BH", 1, len(data)) + data)
+
+    def integer(self, value: int) -> int:
+        return self._add(("Integer", value), struct.pack(">Bi", 3, value))
+
+    def float32(self, value: float) -> int:
+        bits = struct.unpack(">I", struct.pack(">f", value))[0]
+        return self._add(("Float", bits), struct.pack(">BI", 4, bits))
+
+    def class_ref(self, name: str) -> int:
+        return self._add(("Class", name), struct.pack(">BH", 7, self.utf8(name)))
+
+    def string(self, value: str) -> int:
+        return self._add(("String", value), struct.pack(">BH", 8, self.utf8(value)))
+
+    def name_and_type(self, name: str, descriptor: str) -> int:
+        return self._add(
+            ("NameAndType", name, descriptor),
+            struct.pack(">BHH", 12, self.utf8(name), self.utf8(descriptor)),
+        )
+
+    def field_ref(self, owner: str, name: str, descriptor: str) -> int:
+        return self._add(
+            ("Fieldref", owner, name, descriptor),
+            struct.pack(">BHH", 9, self.class_ref(owner), self.name_and_type(name, descriptor)),
+        )
+
+    def method_ref(self, owner: str, name: str, descriptor: str) -> int:
+        return self._add(
+            ("Methodref", owner, name, descriptor),
+            struct.pack(">BHH", 10, self.class_ref(owner), self.name_and_type(name, descriptor)),
+        )
+
+    def to_bytes(self) -> bytes:
+        return struct.pack(">H", self.count) + b"".join(self.entries)
+
+
+class MethodBuilder:
+    """Bytecode, labels and limits of the method being assembled."""
+
+    def __init__(self, access: int, name: str, descriptor: str):
+        self.access = access
+        self.name = name
+        self.descriptor = descriptor
+        self.code = bytearray()
+        self.labels: Dict[str, int] = {}
+        # (instruction offset, operand offset, label, wide, source line)
+        self.fixups: List[Tuple[int, int, str, bool, int]] = []
+        # (index, name, descriptor, from label, to label)
+        self.variables: List[Tuple[int, str, str, Optional[str], Optional[str]]] = []
+        self.max_stack = 0
+        self.max_locals = 0
+
+
+class ClassWriter:
+    """
+    Assembler from Jasmin code to JVM class files.
+
+    The input is the text JasminCode produces, given either as one string or
+    as the fragments of an Emitter buffer. Constants are collected into the
+    constant pool, branch targets are resolved to offsets and the .limit
+    directives become the max_stack/max_locals of each Code attribute.
+    """
+
+    def __init__(self):
+        self.pool = ConstantPool()
+        self.source: Optional[str] = None
+        self.access = 0
+        self.class_name: Optional[str] = None
+        self.super_name = "java/lang/Object"
+        self.fields: List[bytes] = []
+        self.methods: List[bytes] = []
+        self.method: Optional[MethodBuilder] = None
+        self.line_no = 0
+
+    # ============================================================================
+    # Entry points
+    # ============================================================================
+
+    def assemble(self, source: Union[str, Iterable[str]]) -> Tuple[str, bytes]:
+        """
+        Assemble Jasmin code into a class file.
+
+        Args:
+            source: Jasmin code, as a string or an iterable of text fragments
+
+        Returns:
+            Tuple of (class name, class file bytes)
+
+        Raises:
+            AssemblyException: If the code cannot be assembled
+        """
+        fragments = [source] if isinstance(source, str) else source
+        for self.line_no, line in enumerate(self._lines(fragments), 1):
+            try:
+                self._assemble_line(line.strip())
+            except AssemblyException:
+                raise
+            except (ValueError, KeyError, IndexError, struct.error) as e:
+                raise AssemblyException(f"line {self.line_no}: {e}: {line.strip()}")
+        if self.method is not None:
+            raise AssemblyException(f"missing .end method for {self.method.name}")
+        if self.class_name is None:
+            raise AssemblyException("missing .class directive")
+        return self.class_name, self._class_bytes()
+
+    @staticmethod
+    def assemble_file(path: str, output_dir: Optional[str] = None) -> str:
+        """
+        Assemble a .j file into <class>.class, next to it or in output_dir.
+
+        Args:
+            path: Path of the Jasmin file
+            output_dir: Directory for the class file
+
+        Returns:
+            Path of the written class file
+
+        Raises:
+            AssemblyException: If the code cannot be assembled
+        """
+        with open(path) as f:
+            try:
+                name, data = ClassWriter().assemble(f)
+            except AssemblyException as e:
+                raise AssemblyException(f"{os.path.basename(path)}: {e.s}")
+        return ClassWriter.write(name, data, output_dir or os.path.dirname(path))
+
+    @staticmethod
+    def write(class_name: str, data: bytes, output_dir: str) -> str:
+        """Write class file bytes as output_dir/<class_name>.class."""
+        class_path = os.path.join(output_dir, class_name + ".class")
+        with open(class_path, "wb") as f:
+            f.write(data)
+        return class_path
+
+    @staticmethod
+    def _lines(fragments: Iterable[str]) -> Iterator[str]:
+        # Fragments normally end on a line break, but do not rely on it
+        pending = ""
+        for fragment in fragments:
+            lines = (pending + fragment).split("\n")
+            pending = lines.pop()
+            yield from lines
+        if pending:
+            yield pending
+
+    # ============================================================================
+    # Directives
+    # ============================================================================
+
+    def _assemble_line(self, line: str) -> None:
+        if not line or line.startswith(";"):
+            return
+        if line.startswith("."):
+            self._directive(line)
+        elif line.endswith(":") and " " not in line:
+            self._label(line[:-1])
+        else:
+            self._instruction(line)
+
+    def _directive(self, line: str) -> None:
+        parts = line.split()
+        name = parts[0]
+        if name == ".source":
+            self.source = line.split(None, 1)[1]
+        elif name == ".class":
+            self.access = self._flags(parts[1:-1]) | ACC_SUPER
+            self.class_name = parts[-1]
+        elif name == ".super":
+            self.super_name = parts[1]
+        elif name == ".field":
+            self._field(parts[1:])
+        elif name == ".method":
+            if self.method is not None:
+                raise AssemblyException(f"line {self.line_no}: nested .method")
+            signature = parts[-1]
+            paren = signature.index("(")
+            self.method = MethodBuilder(self._flags(parts[1:-1]), signature[:paren], signature[paren:])
+        elif name == ".limit":
+            method = self._current_method(line)
+            if parts[1] == "stack":
+                method.max_stack = int(parts[2])
+            elif parts[1] == "locals":
+                method.max_locals = int(parts[2])
+            else:
+                raise AssemblyException(f"line {self.line_no}: unknown limit {parts[1]}")
+        elif name == ".var":
+            # .var <index> is <name> <descriptor> [from <label> to <label>]
+            method = self._current_method(line)
+            start = parts[6] if len(parts) >= 9 else None
+            end = parts[8] if len(parts) >= 9 else None
+            method.variables.append((int(parts[1]), parts[3], parts[4], start, end))
+        elif name == ".end":
+            self._end_method(self._current_method(line))
+        else:
+            raise AssemblyException(f"line {self.line_no}: unknown directive {name}")
+
+    def _flags(self, words: List[str]) -> int:
+        flags = 0
+        for word in words:
+            if word not in ACCESS_FLAGS:
+                raise AssemblyException(f"line {self.line_no}: unknown access flag {word}")
+            flags |= ACCESS_FLAGS[word]
+        return flags
+
+    def _field(self, words: List[str]) -> None:
+        if "=" in words:
+            raise AssemblyException(f"line {self.line_no}: field initial values are not supported")
+        access = self._flags(words[:-2])
+        name, descriptor = words[-2], words[-1]
+        self.fields.append(
+            struct.pack(">HHHH", access, self.pool.utf8(name), self.pool.utf8(descriptor), 0)
+        )
+
+    def _current_method(self, line: str) -> MethodBuilder:
+        if self.method is None:
+            raise AssemblyException(f"line {self.line_no}: {line} outside of a method")
+        return self.method
+
+    def _label(self, name: str) -> None:
+        method = self._current_method(name + ":")
+        if name in method.labels:
+            raise AssemblyException(f"line {self.line_no}: duplicate label {name}")
+        method.labels[name] = len(method.code)
+
+    # ============================================================================
+    # Instructions
+    # ============================================================================
+
+    def _instruction(self, line: str) -> None:
+        method = self._current_method(line)
+        mnemonic, _, operand = line.partition(" ")
+        operand = operand.strip()
+        code = method.code
+        pool = self.pool
+
+        if mnemonic in SIMPLE_OPCODES:
+            code.append(SIMPLE_OPCODES[mnemonic])
+        elif mnemonic in LOCAL_OPCODES:
+            index = int(operand)
+            if index > 0xFF:
+                code += struct.pack(">BBH", WIDE, LOCAL_OPCODES[mnemonic], index)
+            else:
+                code += struct.pack(">BB", LOCAL_OPCODES[mnemonic], index)
+        elif mnemonic in BRANCH_OPCODES:
+            at = len(code)
+            code += struct.pack(">BH", BRANCH_OPCODES[mnemonic], 0)
+            method.fixups.append((at, at + 1, operand, False, self.line_no))
+        elif mnemonic == "goto_w":
+            at = len(code)
+            code += struct.pack(">Bi", 0xC8, 0)
+            method.fixups.append((at, at + 1, operand, True, self.line_no))
+        elif mnemonic in FIELD_OPCODES:
+            target, descriptor = operand.split()
+            owner, name = target.rsplit("/", 1)
+            code += struct.pack(">BH", FIELD_OPCODES[mnemonic], pool.field_ref(owner, name, descriptor))
+        elif mnemonic in METHOD_OPCODES:
+            paren = operand.index("(")
+            owner, name = operand[:paren].rsplit("/", 1)
+            index = pool.method_ref(owner, name, operand[paren:])
+            code += struct.pack(">BH", METHOD_OPCODES[mnemonic], index)
+        elif mnemonic in CLASS_OPCODES:
+            code += struct.pack(">BH", CLASS_OPCODES[mnemonic], pool.class_ref(operand))
+        elif mnemonic == "bipush":
+            code += struct.pack(">Bb", BIPUSH, int(operand))
+        elif mnemonic == "sipush":
+            code += struct.pack(">Bh", SIPUSH, int(operand))
+        elif mnemonic in ("ldc", "ldc_w"):
+            index = self._constant(operand)
+            if index > 0xFF or mnemonic == "ldc_w":
+                code += struct.pack(">BH", LDC_W, index)
+            else:
+                code += struct.pack(">BB", LDC, index)
+        elif mnemonic == "iinc":
+            index, delta = (int(x) for x in operand.split())
+            if index > 0xFF or not -128 <= delta <= 127:
+                code += struct.pack(">BBHh", WIDE, IINC, index, delta)
+            else:
+                code += struct.pack(">BBb", IINC, index, delta)
+        elif mnemonic == "newarray":
+            code += struct.pack(">BB", NEWARRAY, ARRAY_TYPES[operand])
+        elif mnemonic == "multianewarray":
+            descriptor, dimensions = operand.split()
+            code += struct.pack(">BHB", MULTIANEWARRAY, pool.class_ref(descriptor), int(dimensions))
+        else:
+            raise AssemblyException(f"line {self.line_no}: unknown instruction {mnemonic}")
+
+    def _constant(self, operand: str) -> int:
+        if operand.startswith('"'):
+            return self.pool.string(parse_string_literal(operand))
+        if any(c in operand for c in ".eE") or operand in ("NaN", "Infinity", "-Infinity"):
+            return self.pool.float32(float(operand))
+        value = int(operand)
+        if not -2 ** 31 <= value < 2 ** 31:
+            raise ValueError(f"integer constant out of range {operand}")
+        return self.pool.integer(value)
+
+    # ============================================================================
+    # Methods and class file layout
+    # ============================================================================
+
+    def _end_method(self, method: MethodBuilder) -> None:
+        code = method.code
+        if len(code) > MAX_CODE_LENGTH:
+            raise AssemblyException(f"method {method.name} is too large ({len(code)} bytes)")
+        for at, operand_at, label, wide, line_no in method.fixups:
+            if label not in method.labels:
+                raise AssemblyException(f"line {line_no}: undefined label {label}")
+            offset = method.labels[label] - at
+            if wide:
+                struct.pack_into(">i", code, operand_at, offset)
+            elif -32768 <= offset <= 32767:
+                struct.pack_into(">h", code, operand_at, offset)
+            else:
+                raise AssemblyException(f"line {line_no}: branch to {label} out of range")
+
+        attributes = []
+        if method.variables:
+            entries = []
+            for index, name, descriptor, start, end in method.variables:
+                start_pc = method.labels[start] if start else 0
+                end_pc = method.labels[end] if end else len(code)
+                entries.append(struct.pack(
+                    ">HHHHH", start_pc, end_pc - start_pc,
+                    self.pool.utf8(name), self.pool.utf8(descriptor), index,
+                ))
+            table = struct.pack(">H", len(entries)) + b"".join(entries)
+            attributes.append(self._attribute("LocalVariableTable", table))
+
+        body = (
+            struct.pack(">HHI", method.max_stack, method.max_locals, len(code))
+            + bytes(code)
+            + struct.pack(">HH", 0, len(attributes))
+            + b"".join(attributes)
+        )
+        self.methods.append(
+            struct.pack(
+                ">HHHH", method.access, self.pool.utf8(method.name),
+                self.pool.utf8(method.descriptor), 1,
+            )
+            + self._attribute("Code", body)
+        )
+        self.method = None
+
+    def _attribute(self, name: str, data: bytes) -> bytes:
+        return struct.pack(">HI", self.pool.utf8(name), len(data)) + data
+
+    def _class_bytes(self) -> bytes:
+        this_class = self.pool.class_ref(self.class_name)
+        super_class = self.pool.class_ref(self.super_name)
+        attributes = []
+        if self.source is not None:
+            attributes.append(self._attribute("SourceFile", struct.pack(">H", self.pool.utf8(self.source))))
+        # The constant pool is complete only once every other part is built
+        tail = (
+            struct.pack(">HHHH", self.access, this_class, super_class, 0)
+            + struct.pack(">H", len(self.fields)) + b"".join(self.fields)
+            + struct.pack(">H", len(self.methods)) + b"".join(self.methods)
+            + struct.pack(">H", len(attributes)) + b"".join(attributes)
+        )
+        return struct.pack(">IHH", MAGIC, MINOR_VERSION, MAJOR_VERSION) + self.pool.to_bytes() + tail
@@ -7,10 +7,14 @@ Java bytecode using the Emitter and Frame classes.
 from typing import Any, List, Optional, Union
 from ..utils.visitor import ASTVisitor
 from ..utils.nodes import *
+from ..utils.type_pool import (
+    class_type, array_type, INT_TYPE, FLOAT_TYPE, BOOL_TYPE, STRING_TYPE, VOID_TYPE
+)
 from .emitter import Emitter, is_void_type, is_int_type, is_string_type, is_bool_type, is_float_type
 from .frame import Frame
+from .peephole import PeepholeOptimizer
 from .error import IllegalOperandException, IllegalRuntimeException
-from .io import IO_SYMBOL_LIST
+from .io import IO_SYMBOL_LIST, IO_SYMBOLS, IO_CLASS_SYMBOL
 from .utils import *
 from functools import *
 
@@ -21,9 +25,29 @@ class CodeGenerator(ASTVisitor):
     Traverses AST and generates JVM bytecode.
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        class_files: bool = False,
+        output_dir: Optional[str] = None,
+        sink: Optional[dict] = None,
+        peephole: Union[bool, PeepholeOptimizer] = True,
+    ):
         self.current_class = None
         self.emit = None  # Will be initialized per class
+        # Also write .class files directly, without running jasmin.jar
+        self.class_files = class_files
+        # Where generated files go: output_dir (src/runtime by default), or
+        # the sink dict (file name -> contents) when one is given
+        self.output_dir = output_dir
+        self.sink = sink
+        # Names of the generated classes, and the first one with a static main
+        self.class_names: List[str] = []
+        self.main_class: Optional[str] = None
+        # Peephole optimizer shared by the classes of the program: True for
+        # one with the default rules, an instance for custom rules, False for none
+        if peephole is True:
+            peephole = PeepholeOptimizer()
+        self.peephole: Optional[PeepholeOptimizer] = peephole or None
 
     # ============================================================================
     # Program and Class Declarations
@@ -33,6 +57,8 @@ class CodeGenerator(ASTVisitor):
         """
         Visit program node - generate code for all classes.
         """
+        self.class_names = []
+        self.main_class = None
         # Process all class declarations
         for class_decl in node.class_decls:
             self.visit(class_decl, o)
@@ -42,8 +68,9 @@ class CodeGenerator(ASTVisitor):
         Visit class declaration - generate class structure.
         """
         self.current_class = node.name
+        self.class_names.append(node.name)
         class_file = node.name + ".j"
-        self.emit = Emitter(class_file)
+        self.emit = Emitter(class_file, self.output_dir, self.sink, self.peephole)
         
         # Determine superclass
         superclass = node.superclass if node.superclass else "java/lang/Object"
@@ -57,6 +84,8 @@ class CodeGenerator(ASTVisitor):
         
         # Emit class epilog
         self.emit.emit_epilog()
+        if self.class_files:
+            self.emit.emit_class_file()
 
     # ============================================================================
     # Attribute Declarations
@@ -113,14 +142,14 @@ class CodeGenerator(ASTVisitor):
         """
         Visit constructor declaration - generate constructor code.
         """
-        frame = Frame("<init>", PrimitiveType("void"))
+        frame = Frame("<init>", VOID_TYPE)
         self.generate_method(node, frame, False, is_constructor=True)
 
     def visit_destructor_decl(self, node: "DestructorDecl", o: Any = None):
         """
         Visit destructor declaration - generate destructor code.
         """
-        frame = Frame("~" + self.current_class, PrimitiveType("void"))
+        frame = Frame("~" + self.current_class, VOID_TYPE)
         self.generate_method(node, frame, False)
 
     def visit_parameter(self, node: "Parameter", o: Any = None):
@@ -149,14 +178,16 @@ class CodeGenerator(ASTVisitor):
         else:
             param_types = []
             
-        return_type = node.return_type if isinstance(node, MethodDecl) else PrimitiveType("void")
+        return_type = node.return_type if isinstance(node, MethodDecl) else VOID_TYPE
         
         # OPLang main method to Java main method mapping
         actual_method_name = method_name
         actual_func_type = FunctionType(param_types, return_type)
         if method_name == "main" and is_static:
             actual_method_name = "main"
-            actual_func_type = FunctionType([ArrayType(PrimitiveType("string"), 0)], PrimitiveType("void"))
+            actual_func_type = FunctionType([array_type(STRING_TYPE, 0)], VOID_TYPE)
+            if self.main_class is None:
+                self.main_class = class_name
         
         # Emit method directive
         self.emit.print_out(
@@ -166,12 +197,16 @@ class CodeGenerator(ASTVisitor):
                 is_static
             )
         )
+        self.emit.begin_method_body()
         
         frame.enter_scope(True)
         from_label = frame.get_start_label()
         to_label = frame.get_end_label()
         
-        sym_list = []
+        # The io receiver is declared outermost, as in the static checker,
+        # so parameters and locals called io shadow it
+        sym_table = SymbolTable([IO_CLASS_SYMBOL])
+        sym_table.push_scope()
         # Handle 'this' parameter for instance methods
         if not is_static:
             this_idx = frame.get_new_index()
@@ -179,13 +214,13 @@ class CodeGenerator(ASTVisitor):
                 self.emit.emit_var(
                     this_idx,
                     "this",
-                    ClassType(class_name),
+                    class_type(class_name),
                     from_label,
                     to_label
                 )
             )
-            # Add 'this' to symbol list
-            sym_list.append(Symbol("this", ClassType(class_name), Index(this_idx)))
+            # Add 'this' to symbol table
+            sym_table.add(Symbol("this", class_type(class_name), Index(this_idx)))
         elif method_name == "main":
             # Reserve index for String[] args
             frame.get_new_index()
@@ -203,20 +238,22 @@ class CodeGenerator(ASTVisitor):
                         to_label
                     )
                 )
-                sym_list.append(Symbol(param.name, param.param_type, Index(idx)))
+                sym_table.add(Symbol(param.name, param.param_type, Index(idx)))
         
-        # Add IO symbols
-        sym_list = IO_SYMBOL_LIST + sym_list
+        # Add IO symbols in an enclosing scope of their own; they shadow parameters
+        sym_table.push_scope()
+        for sym in IO_SYMBOL_LIST:
+            sym_table.add(sym)
         
         self.emit.print_out(self.emit.emit_label(from_label, frame))
         
         if is_constructor:
             # Call super constructor
-            self.emit.print_out(self.emit.emit_read_var("this", ClassType(class_name), 0, frame))
-            self.emit.print_out(self.emit.emit_invoke_special(frame, "java/lang/Object/<init>", FunctionType([], PrimitiveType("void"))))
+            self.emit.print_out(self.emit.emit_read_var("this", class_type(class_name), 0, frame))
+            self.emit.print_out(self.emit.emit_invoke_special(frame, "java/lang/Object/<init>", FunctionType([], VOID_TYPE)))
 
         # Generate code for method body
-        o = SubBody(frame, sym_list)
+        o = SubBody(frame, sym_table)
         self.visit(node.body, o)
         
         # Emit return if void
@@ -224,6 +261,7 @@ class CodeGenerator(ASTVisitor):
             self.emit.print_out(self.emit.emit_return(return_type, frame))
         
         self.emit.print_out(self.emit.emit_label(to_label, frame))
+        self.emit.end_method_body(frame)
         self.emit.print_out(self.emit.emit_end_method(frame))
         
         frame.exit_scope()
@@ -255,6 +293,8 @@ class CodeGenerator(ASTVisitor):
         if o is None:
             return
         
+        o.sym.push_scope()
+        
         # Process variable declarations
         for var_decl in node.var_decls:
             o = self.visit(var_decl, o)
@@ -262,6 +302,8 @@ class CodeGenerator(ASTVisitor):
         # Process statements
         for stmt in node.statements:
             self.visit(stmt, o)
+        
+        o.sym.pop_scope()
 
     def visit_variable_decl(self, node: "VariableDecl", o: SubBody = None):
         """
@@ -287,7 +329,7 @@ class CodeGenerator(ASTVisitor):
                 )
             )
             
-            # Add to symbol list
+            # Declared once the whole declaration is generated
             new_sym.append(Symbol(var.name, node.var_type, Index(idx)))
             
             # Handle initialization if present
@@ -295,11 +337,17 @@ class CodeGenerator(ASTVisitor):
                 # Generate code for initialization
                 code, typ = self.visit(var.init_value, Access(frame, o.sym))
                 self.emit.print_out(code)
+                # An int initializer of a float variable is widened
+                if is_float_type(node.var_type) and is_int_type(typ):
+                    self.emit.print_out(self.emit.emit_i2f(frame))
                 self.emit.print_out(
                     self.emit.emit_write_var(var.name, node.var_type, idx, frame)
                 )
         
-        return SubBody(frame, new_sym + o.sym)
+        # Earlier variables of the same declaration take precedence
+        for sym in reversed(new_sym):
+            o.sym.add(sym)
+        return o
 
     def visit_variable(self, node: "Variable", o: Any = None):
         pass
@@ -313,10 +361,13 @@ class CodeGenerator(ASTVisitor):
         
         # Generate code for RHS
         code, typ = self.visit(node.rhs, Access(o.frame, o.sym))
-        self.emit.print_out(code)
         
         # Generate code for LHS
         lhs_code, lhs_type = self.visit(node.lhs, Access(o.frame, o.sym, is_left=True))
+        # An int value assigned to a float is widened
+        if is_float_type(lhs_type) and is_int_type(typ):
+            code += self.emit.emit_i2f(o.frame)
+        self.emit.print_out(code)
         self.emit.print_out(lhs_code)
 
     def visit_if_statement(self, node: "IfStatement", o: SubBody = None):
@@ -326,20 +377,167 @@ class CodeGenerator(ASTVisitor):
         if o is None:
             return
         frame = o.frame
-        # condition
-        code, typ = self.visit(node.condition, Access(frame, o.sym))
-        self.emit.print_out(code)
-        
         false_label = frame.get_new_label()
-        exit_label = frame.get_new_label()
-        
-        self.emit.print_out(self.emit.emit_if_false(false_label, frame))
+        # condition: jump straight to the else part when it is false
+        self.emit.print_out(self.generate_condition(node.condition, Access(frame, o.sym), false_label, False))
+
         self.visit(node.then_stmt, o)
-        self.emit.print_out(self.emit.emit_goto(exit_label, frame))
-        self.emit.print_out(self.emit.emit_label(false_label, frame))
         if node.else_stmt:
+            exit_label = frame.get_new_label()
+            self.emit.print_out(self.emit.emit_goto(exit_label, frame))
+            self.emit.print_out(self.emit.emit_label(false_label, frame))
             self.visit(node.else_stmt, o)
-        self.emit.print_out(self.emit.emit_label(exit_label, frame))
+            self.emit.print_out(self.emit.emit_label(exit_label, frame))
+        else:
+            self.emit.print_out(self.emit.emit_label(false_label, frame))
+
+    def generate_condition(self, node: "Expr", o: Access, label: int, jump_if: bool) -> Code:
+        """
+        Generate jumping code for a boolean condition.
+
+        Control goes to label when the condition evaluates to jump_if and
+        falls through otherwise; no boolean value is left on the stack.
+        &&, || and ! are short-circuited into branches and comparisons
+        branch directly on their operands.
+
+        Args:
+            node: Condition expression
+            o: Access with the frame and symbol table
+            label: Target label
+            jump_if: Value of the condition for which to jump
+
+        Returns:
+            Generated code
+        """
+        frame = o.frame
+        while type(node) is ParenthesizedExpression:
+            node = node.expr
+
+        if type(node) is UnaryOp and node.operator == "!":
+            return self.generate_condition(node.operand, o, label, not jump_if)
+        if type(node) is BoolLiteral:
+            return Code(self.emit.emit_goto(label, frame)) if node.value == jump_if else Code()
+        if type(node) is BinaryOp and node.operator in ("&&", "||"):
+            # a && b jumps on true only if both hold, on false as soon as one fails;
+            # a || b is the mirror image
+            if (node.operator == "&&") == jump_if:
+                skip_label = frame.get_new_label()
+                code = self.generate_condition(node.left, o, skip_label, not jump_if)
+                code += self.generate_condition(node.right, o, label, jump_if)
+                code += self.emit.emit_label(skip_label, frame)
+                return code
+            code = self.generate_condition(node.left, o, label, jump_if)
+            code += self.generate_condition(node.right, o, label, jump_if)
+            return code
+        if type(node) is BinaryOp and node.operator in (">", ">=", "<", "<=", "==", "!="):
+            lc, lt = self.visit(node.left, o)
+            rc, rt = self.visit(node.right, o)
+            typ = FLOAT_TYPE if is_float_type(lt) or is_float_type(rt) else INT_TYPE
+            code = lc
+            if is_float_type(typ) and is_int_type(lt):
+                code += self.emit.emit_i2f(frame)
+            code += rc
+            if is_float_type(typ) and is_int_type(rt):
+                code += self.emit.emit_i2f(frame)
+            if jump_if:
+                code += self.emit.emit_rel_op(node.operator, typ, label, None, frame)
+            else:
+                code += self.emit.emit_rel_op(node.operator, typ, None, label, frame)
+            return code
+
+        code, typ = self.visit(node, o)
+        if jump_if:
+            code += self.emit.emit_if_true(label, frame)
+        else:
+            code += self.emit.emit_if_false(label, frame)
+        return code
+
+    def generate_bool_value(self, node: "Expr", o: Access) -> Code:
+        """
+        Generate code pushing the 0/1 value of a boolean expression.
+
+        The expression is compiled as a condition jumping to a push of 0,
+        so && and || short-circuit in value context too.
+
+        Args:
+            node: Boolean expression
+            o: Access with the frame and symbol table
+
+        Returns:
+            Generated code
+        """
+        frame = o.frame
+        false_label = frame.get_new_label()
+        exit_label = frame.get_new_label()
+        code = self.generate_condition(node, o, false_label, False)
+        code += self.emit.emit_push_iconst(1, frame)
+        code += self.emit.emit_goto(exit_label, frame)
+        code += self.emit.emit_label(false_label, frame)
+        # Only one of the two constants is on the stack at exit_label
+        frame.pop()
+        code += self.emit.emit_push_iconst(0, frame)
+        code += self.emit.emit_label(exit_label, frame)
+        return code
+
+    def concat_operands(self, node: "BinaryOp") -> List["Expr"]:
+        """
+        Return the operands of a chain of ^ from left to right.
+
+        Parenthesized chains are flattened too, since concatenation is
+        associative, and adjacent string literals are merged into one.
+
+        Args:
+            node: BinaryOp whose operator is ^
+
+        Returns:
+            List of operand expressions
+        """
+        operands = []
+        stack = [node]
+        while stack:
+            item = stack.pop()
+            inner = item
+            while type(inner) is ParenthesizedExpression:
+                inner = inner.expr
+            if type(inner) is BinaryOp and inner.operator == "^":
+                stack.append(inner.right)
+                stack.append(inner.left)
+            elif type(item) is StringLiteral and operands and type(operands[-1]) is StringLiteral:
+                operands[-1] = StringLiteral(operands[-1].value + item.value)
+            else:
+                operands.append(item)
+        return operands
+
+    def generate_concat(self, node: "BinaryOp", o: Access) -> Code:
+        """
+        Generate code for a whole chain a ^ b ^ c ^ ... with one
+        StringBuilder: one append per operand, using the int, float and
+        boolean overloads for those operands, and a single toString.
+
+        Args:
+            node: BinaryOp whose operator is ^
+            o: Access with the frame and symbol table
+
+        Returns:
+            Generated code
+        """
+        operands = [
+            operand for operand in self.concat_operands(node)
+            if type(operand) is not StringLiteral or operand.value
+        ]
+        if not operands:
+            return self.visit(StringLiteral(""), o)[0]
+        if len(operands) == 1 and type(operands[0]) is StringLiteral:
+            return self.visit(operands[0], o)[0]
+
+        frame = o.frame
+        code = Code(self.emit.emit_new_string_builder(frame))
+        for operand in operands:
+            operand_code, operand_type = self.visit(operand, o)
+            code += operand_code
+            code += self.emit.emit_append(operand_type, frame)
+        code += self.emit.emit_builder_to_string(frame)
+        return code
 
     def visit_for_statement(self, node: "ForStatement", o: SubBody = None):
         """
@@ -349,7 +547,7 @@ class CodeGenerator(ASTVisitor):
             return
         frame = o.frame
         # Find loop variable
-        sym = next(filter(lambda x: x.name == node.variable, o.sym), None)
+        sym = o.sym.lookup(node.variable)
         idx = sym.value.value
         
         # init: var := start_expr
@@ -357,37 +555,56 @@ class CodeGenerator(ASTVisitor):
         self.emit.print_out(code)
         self.emit.print_out(self.emit.emit_write_var(node.variable, typ, idx, frame))
         
+        # The spec evaluates end_expr once, before the first test. Literal
+        # bounds are pushed in place; any other bound goes to a hidden local.
+        bound_index = None
+        if not self.is_literal_bound(node.end_expr):
+            end_code, end_typ = self.visit(node.end_expr, Access(frame, o.sym))
+            bound_index = frame.get_new_index()
+            self.emit.print_out(end_code)
+            self.emit.print_out(self.emit.emit_write_var("", INT_TYPE, bound_index, frame))
+
         frame.enter_loop()
-        start_label = frame.get_continue_label()
+        start_label = frame.get_new_label()
+        continue_label = frame.get_continue_label()
         exit_label = frame.get_break_label()
         
         self.emit.print_out(self.emit.emit_label(start_label, frame))
         
         # condition: var <= end_expr (to) or var >= end_expr (downto)
         self.emit.print_out(self.emit.emit_read_var(node.variable, typ, idx, frame))
-        end_code, end_typ = self.visit(node.end_expr, Access(frame, o.sym))
-        self.emit.print_out(end_code)
+        if bound_index is None:
+            end_code, end_typ = self.visit(node.end_expr, Access(frame, o.sym))
+            self.emit.print_out(end_code)
+        else:
+            self.emit.print_out(self.emit.emit_read_var("", INT_TYPE, bound_index, frame))
         
         if node.direction == "to":
-            self.emit.print_out(self.emit.emit_rel_op("<=", typ, -1, exit_label, frame))
+            self.emit.print_out(self.emit.emit_rel_op("<=", typ, None, exit_label, frame))
         else:
-            self.emit.print_out(self.emit.emit_rel_op(">=", typ, -1, exit_label, frame))
+            self.emit.print_out(self.emit.emit_rel_op(">=", typ, None, exit_label, frame))
             
         self.visit(node.body, o)
         
-        # update: var := var + 1 or var - 1
-        self.emit.print_out(self.emit.emit_read_var(node.variable, typ, idx, frame))
-        self.emit.print_out(self.emit.emit_push_iconst(1, frame))
-        if node.direction == "to":
-            self.emit.print_out(self.emit.emit_add_op("+", PrimitiveType("int"), frame))
-        else:
-            self.emit.print_out(self.emit.emit_add_op("-", PrimitiveType("int"), frame))
-        self.emit.print_out(self.emit.emit_write_var(node.variable, typ, idx, frame))
+        # update: var := var + 1 or var - 1; continue jumps here
+        self.emit.print_out(self.emit.emit_label(continue_label, frame))
+        self.emit.print_out(self.emit.emit_iinc(idx, 1 if node.direction == "to" else -1, frame))
         
         self.emit.print_out(self.emit.emit_goto(start_label, frame))
         self.emit.print_out(self.emit.emit_label(exit_label, frame))
         frame.exit_loop()
 
+    def is_literal_bound(self, node) -> bool:
+        """
+        Return True if a for loop bound is an integer literal, possibly
+        negated or parenthesized, and can be pushed on every iteration.
+        """
+        while type(node) is ParenthesizedExpression or (
+            type(node) is UnaryOp and node.operator in ("-", "+")
+        ):
+            node = node.expr if type(node) is ParenthesizedExpression else node.operand
+        return type(node) is IntLiteral
+
     def visit_break_statement(self, node: "BreakStatement", o: SubBody = None):
         """
         Visit break statement.
@@ -440,17 +657,17 @@ class CodeGenerator(ASTVisitor):
         Visit identifier LHS - generate code to write to variable.
         """
         if o is None:
-            return "", None
+            return Code(), None
         
         # Find symbol
-        sym = next(filter(lambda x: x.name == node.name, o.sym), None)
+        sym = o.sym.lookup(node.name)
         if sym is None:
             raise IllegalOperandException(f"Undeclared variable: {node.name}")
         
         if type(sym.value) is Index:
-            code = self.emit.emit_write_var(
+            code = Code(self.emit.emit_write_var(
                 sym.name, sym.type, sym.value.value, o.frame
-            )
+            ))
             return code, sym.type
         else:
             raise IllegalOperandException(f"Cannot assign to: {node.name}")
@@ -460,7 +677,7 @@ class CodeGenerator(ASTVisitor):
         Visit postfix LHS (for member access, array access).
         """
         if o is None:
-            return "", None
+            return Code(), None
         
         # PostfixLHS is used for assignment targets like a[i] or a.b
         # We need to generate the receiver and index/member but not the final store
@@ -476,12 +693,20 @@ class CodeGenerator(ASTVisitor):
         Visit binary operation.
         """
         if o is None:
-            return "", None
+            return Code(), None
+        # Logical and relational operators are compiled as jumping code, so
+        # && and || only evaluate their right operand when needed
+        if node.operator in ("&&", "||", ">", ">=", "<", "<=", "==", "!="):
+            return self.generate_bool_value(node, o), BOOL_TYPE
+        if node.operator == "^":
+            return self.generate_concat(node, o), STRING_TYPE
+
         lc, lt = self.visit(node.left, o)
         rc, rt = self.visit(node.right, o)
         
-        # Simplified type promotion logic
-        res_type = PrimitiveType("float") if is_float_type(lt) or is_float_type(rt) else PrimitiveType("int")
+        # Simplified type promotion logic; / always divides floats
+        op = node.operator
+        res_type = FLOAT_TYPE if op == "/" or is_float_type(lt) or is_float_type(rt) else INT_TYPE
         
         code = lc
         if is_float_type(res_type) and is_int_type(lt):
@@ -489,26 +714,20 @@ class CodeGenerator(ASTVisitor):
         code += rc
         if is_float_type(res_type) and is_int_type(rt):
             code += self.emit.emit_i2f(o.frame)
-            
-        op = node.operator
+
         if op in ["+", "-"]:
             code += self.emit.emit_add_op(op, res_type, o.frame)
             return code, res_type
         elif op in ["*", "/"]:
             code += self.emit.emit_mul_op(op, res_type, o.frame)
             return code, res_type
+        elif op == "\\":
+            # Integer division of ints, truncating toward zero as idiv does
+            code += self.emit.emit_mul_op("/", res_type, o.frame) if is_float_type(res_type) else self.emit.emit_div(o.frame)
+            return code, res_type
         elif op == "%":
             code += self.emit.emit_mod(o.frame)
-            return code, PrimitiveType("int")
-        elif op == "&&":
-            code += self.emit.emit_and_op(o.frame)
-            return code, PrimitiveType("boolean")
-        elif op == "||":
-            code += self.emit.emit_or_op(o.frame)
-            return code, PrimitiveType("boolean")
-        elif op in [">", ">=", "<", "<=", "==", "!="]:
-            code += self.emit.emit_re_op(op, res_type, o.frame)
-            return code, PrimitiveType("boolean")
+            return code, INT_TYPE
         
         return code, res_type
 
@@ -517,12 +736,12 @@ class CodeGenerator(ASTVisitor):
         Visit unary operation.
         """
         if o is None:
-            return "", None
+            return Code(), None
+        if node.operator == "!":
+            return self.generate_bool_value(node, o), BOOL_TYPE
         code, typ = self.visit(node.operand, o)
         if node.operator == "-":
             code += self.emit.emit_neg_op(typ, o.frame)
-        elif node.operator == "!":
-            code += self.emit.emit_not(typ, o.frame)
         return code, typ
 
     def visit_postfix_expression(self, node: "PostfixExpression", o: Access = None):
@@ -530,7 +749,7 @@ class CodeGenerator(ASTVisitor):
         Visit postfix expression (method calls, member access, array access).
         """
         if o is None:
-            return "", None
+            return Code(), None
         
         code, typ = self.visit(node.primary, o)
         
@@ -573,18 +792,17 @@ class CodeGenerator(ASTVisitor):
         actual_name = io_mapping.get(method_name, method_name)
         
         # Look up symbol
-        m_sym = next(filter(lambda x: x.name == actual_name, sym_list), None)
+        m_sym = sym_list.lookup(actual_name)
         if m_sym is None:
-            from .io import IO_SYMBOL_LIST
-            m_sym = next(filter(lambda x: x.name == actual_name, IO_SYMBOL_LIST), None)
+            m_sym = IO_SYMBOLS.get(actual_name)
             
         if m_sym is None and actual_name == "valueOf":
              if method_name == "int2str":
-                 m_sym = Symbol("valueOf", FunctionType([PrimitiveType("int")], PrimitiveType("string")), CName("java/lang/String"))
+                 m_sym = Symbol("valueOf", FunctionType([INT_TYPE], STRING_TYPE), CName("java/lang/String"))
              elif method_name == "bool2str":
-                 m_sym = Symbol("valueOf", FunctionType([PrimitiveType("boolean")], PrimitiveType("string")), CName("java/lang/String"))
+                 m_sym = Symbol("valueOf", FunctionType([BOOL_TYPE], STRING_TYPE), CName("java/lang/String"))
         
-        arg_code = ""
+        arg_code = Code()
         for arg in node.args:
             ac, at = self.visit(arg, Access(frame, sym_list))
             arg_code += ac
@@ -598,7 +816,7 @@ class CodeGenerator(ASTVisitor):
             # Virtual call
             code += arg_code
             class_name = typ.class_name if isinstance(typ, ClassType) else self.current_class
-            m_type = m_sym.type if m_sym else FunctionType([], PrimitiveType("void"))
+            m_type = m_sym.type if m_sym else FunctionType([], VOID_TYPE)
             return code + self.emit.emit_invoke_virtual(f"{class_name}/{actual_name}", m_type, frame), m_type.return_type
 
     def visit_member_access(self, node: "MemberAccess", o: Any = None):
@@ -614,7 +832,7 @@ class CodeGenerator(ASTVisitor):
         class_name = typ.class_name if isinstance(typ, ClassType) else self.current_class
         # For simplicity, we assume field info is available or just emit GETFIELD
         # Real implementation would need symbol table for fields
-        field_type = PrimitiveType("int") # Placeholder
+        field_type = INT_TYPE # Placeholder
         
         if o.is_left:
             # For assignment, we just return the code to load receiver
@@ -635,7 +853,7 @@ class CodeGenerator(ASTVisitor):
         index_code, index_type = self.visit(node.index_expr, Access(frame, sym_list))
         code += index_code
         
-        elem_type = typ.element_type if isinstance(typ, ArrayType) else PrimitiveType("int")
+        elem_type = typ.element_type if isinstance(typ, ArrayType) else INT_TYPE
         
         if o.is_left:
             return code, elem_type
@@ -650,13 +868,13 @@ class CodeGenerator(ASTVisitor):
         frame = o.frame
         class_name = node.class_name
         
-        code = self.emit.jvm.emitNEW(class_name)
+        code = Code(self.emit.jvm.emitNEW(class_name))
         frame.push()
         code += self.emit.jvm.emitDUP()
         frame.push()
         
         # Load arguments for constructor
-        arg_code = ""
+        arg_code = Code()
         param_types = []
         for arg in node.args:
             ac, at = self.visit(arg, Access(frame, o.sym))
@@ -664,9 +882,9 @@ class CodeGenerator(ASTVisitor):
             param_types.append(at)
             
         code += arg_code
-        code += self.emit.emit_invoke_special(frame, f"{class_name}/<init>", FunctionType(param_types, PrimitiveType("void")))
+        code += self.emit.emit_invoke_special(frame, f"{class_name}/<init>", FunctionType(param_types, VOID_TYPE))
         
-        return code, ClassType(class_name)
+        return code, class_type(class_name)
 
     def visit_array_literal(self, node: "ArrayLiteral", o: Access = None):
         """
@@ -676,9 +894,9 @@ class CodeGenerator(ASTVisitor):
         size = len(node.elements)
         
         # Determine element type from first element or default to int
-        first_code, first_type = self.visit(node.elements[0], o) if size > 0 else ("", PrimitiveType("int"))
+        first_code, first_type = self.visit(node.elements[0], o) if size > 0 else (Code(), INT_TYPE)
         
-        code = self.emit.emit_push_iconst(size, frame)
+        code = Code(self.emit.emit_push_iconst(size, frame))
         if isinstance(first_type, (ClassType, ArrayType)) or is_string_type(first_type):
             code += self.emit.jvm.emitANEWARRAY(self.emit.get_full_type(first_type))
         else:
@@ -692,7 +910,7 @@ class CodeGenerator(ASTVisitor):
             code += ec
             code += self.emit.emit_astore(et, frame)
             
-        return code, ArrayType(first_type, size)
+        return code, array_type(first_type, size)
 
     def visit_member_access(self, node: "MemberAccess", o: Any = None):
         """
@@ -707,7 +925,7 @@ class CodeGenerator(ASTVisitor):
         class_name = typ.class_name if isinstance(typ, ClassType) else self.current_class
         # For simplicity, we assume field info is available or just emit GETFIELD
         # Real implementation would need symbol table for fields
-        field_type = PrimitiveType("int") # Placeholder
+        field_type = INT_TYPE # Placeholder
         
         if o.is_left:
             # For assignment, we just return the code to load receiver
@@ -715,7 +933,7 @@ class CodeGenerator(ASTVisitor):
         else:
             code += self.emit.emit_get_field(f"{class_name}/{node.member_name}", field_type, frame)
             return code, field_type
-            return code + self.emit.emit_get_field(field_name, PrimitiveType("int"), frame), PrimitiveType("int")
+            return code + self.emit.emit_get_field(field_name, INT_TYPE, frame), INT_TYPE
 
     def visit_array_access(self, node: "ArrayAccess", o: Any = None):
         """
@@ -728,7 +946,7 @@ class CodeGenerator(ASTVisitor):
         idx_code, idx_type = self.visit(node.index, Access(frame, o.sym))
         code += idx_code
         
-        elem_type = typ.element_type if isinstance(typ, ArrayType) else PrimitiveType("int")
+        elem_type = typ.element_type if isinstance(typ, ArrayType) else INT_TYPE
         
         if o.is_left:
             # The value to store will be pushed after this
@@ -741,10 +959,10 @@ class CodeGenerator(ASTVisitor):
         Visit object creation.
         """
         if o is None:
-            return "", None
+            return Code(), None
         frame = o.frame
         
-        code = self.emit.jvm.emitNEW(node.class_name)
+        code = Code(self.emit.jvm.emitNEW(node.class_name))
         frame.push()
         code += self.emit.jvm.emitDUP()
         frame.push()
@@ -753,15 +971,15 @@ class CodeGenerator(ASTVisitor):
             ac, at = self.visit(arg, o)
             code += ac
             
-        code += self.emit.emit_invoke_special(frame, f"{node.class_name}/<init>", FunctionType([], PrimitiveType("void")))
-        return code, ClassType(node.class_name)
+        code += self.emit.emit_invoke_special(frame, f"{node.class_name}/<init>", FunctionType([], VOID_TYPE))
+        return code, class_type(node.class_name)
 
     def visit_identifier(self, node: "Identifier", o: Access = None):
         """
         Visit identifier - generate code to read variable.
         """
         if o is None:
-            return "", None
+            return Code(), None
         
         # Mapping for common built-in or IO aliases
         io_mapping = {
@@ -777,50 +995,49 @@ class CodeGenerator(ASTVisitor):
         target_name = io_mapping.get(node.name, node.name)
         
         # Find symbol
-        sym = next(filter(lambda x: x.name == target_name, o.sym), None)
+        sym = o.sym.lookup(target_name)
         if sym is None:
             # Fallback for IO functions
-            from .io import IO_SYMBOL_LIST
-            io_sym = next(filter(lambda x: x.name == target_name, IO_SYMBOL_LIST), None)
+            io_sym = IO_SYMBOLS.get(target_name)
             if io_sym:
-                return "", io_sym.type
+                return Code(), io_sym.type
                 
             # Special case for int2str/bool2str if not in IO_SYMBOL_LIST
             if target_name == "valueOf":
                 if node.name == "int2str":
-                    return "", FunctionType([PrimitiveType("int")], PrimitiveType("string"))
+                    return Code(), FunctionType([INT_TYPE], STRING_TYPE)
                 if node.name == "bool2str":
-                    return "", FunctionType([PrimitiveType("boolean")], PrimitiveType("string"))
+                    return Code(), FunctionType([BOOL_TYPE], STRING_TYPE)
 
             raise IllegalOperandException(f"Undeclared identifier: {node.name}")
         
         if type(sym.value) is Index:
-            code = self.emit.emit_read_var(
+            code = Code(self.emit.emit_read_var(
                 sym.name, sym.type, sym.value.value, o.frame
-            )
+            ))
             return code, sym.type
         elif type(sym.value) is CName:
             # It's a class or static member
-            return "", sym.type
+            return Code(), sym.type
         else:
-            return "", sym.type
+            return Code(), sym.type
 
     def visit_this_expression(self, node: "ThisExpression", o: Access = None):
         """
         Visit this expression - load 'this' reference.
         """
         if o is None:
-            return "", None
+            return Code(), None
         
         # Find 'this' in symbol table (should be at index 0 for instance methods)
-        this_sym = next(filter(lambda x: x.name == "this", o.sym), None)
+        this_sym = o.sym.lookup("this")
         if this_sym is None:
             raise IllegalOperandException("'this' not available in static context")
         
         if type(this_sym.value) is Index:
-            code = self.emit.emit_read_var(
+            code = Code(self.emit.emit_read_var(
                 "this", this_sym.type, this_sym.value.value, o.frame
-            )
+            ))
             return code, this_sym.type
         else:
             raise IllegalOperandException("Invalid 'this' reference")
@@ -842,48 +1059,48 @@ class CodeGenerator(ASTVisitor):
         Visit integer literal - push integer constant.
         """
         if o is None:
-            return "", None
-        code = self.emit.emit_push_iconst(node.value, o.frame)
-        return code, PrimitiveType("int")
+            return Code(), None
+        code = Code(self.emit.emit_push_iconst(node.value, o.frame))
+        return code, INT_TYPE
 
     def visit_float_literal(self, node: "FloatLiteral", o: Access = None):
         """
         Visit float literal - push float constant.
         """
         if o is None:
-            return "", None
-        code = self.emit.emit_push_fconst(str(node.value), o.frame)
-        return code, PrimitiveType("float")
+            return Code(), None
+        code = Code(self.emit.emit_push_fconst(str(node.value), o.frame))
+        return code, FLOAT_TYPE
 
     def visit_bool_literal(self, node: "BoolLiteral", o: Access = None):
         """
         Visit boolean literal - push boolean constant.
         """
         if o is None:
-            return "", None
+            return Code(), None
         value_str = "1" if node.value else "0"
-        code = self.emit.emit_push_iconst(value_str, o.frame)
-        return code, PrimitiveType("boolean")
+        code = Code(self.emit.emit_push_iconst(value_str, o.frame))
+        return code, BOOL_TYPE
 
     def visit_string_literal(self, node: "StringLiteral", o: Access = None):
         """
         Visit string literal - push string constant.
         """
         if o is None:
-            return "", None
-        code = self.emit.emit_push_const('"' + node.value + '"', PrimitiveType("string"), o.frame)
-        return code, PrimitiveType("string")
+            return Code(), None
+        code = Code(self.emit.emit_push_const('"' + node.value + '"', STRING_TYPE, o.frame))
+        return code, STRING_TYPE
 
     def visit_array_literal(self, node: "ArrayLiteral", o: Access = None):
         """
         Visit array literal.
         """
         if o is None:
-            return "", None
+            return Code(), None
         frame = o.frame
         
         # For simplicity, assume int array
-        code = self.emit.emit_push_iconst(len(node.value), frame)
+        code = Code(self.emit.emit_push_iconst(len(node.value), frame))
         code += self.emit.jvm.emitNEWARRAY("int")
         # Stack: [array_ref]
         
@@ -893,9 +1110,9 @@ class CodeGenerator(ASTVisitor):
             code += self.emit.emit_push_iconst(i, frame)
             ec, et = self.visit(expr, o)
             code += ec
-            code += self.emit.emit_astore(PrimitiveType("int"), frame)
+            code += self.emit.emit_astore(INT_TYPE, frame)
             
-        return code, ArrayType(PrimitiveType("int"), len(node.value))
+        return code, array_type(INT_TYPE, len(node.value))
 
     def visit_method_invocation(self, node: "MethodCall", o: Any = None):
         """
@@ -910,9 +1127,9 @@ class CodeGenerator(ASTVisitor):
         frame = o.frame
         field_name = f"{node.class_name}/{node.member_name}"
         if o.is_left:
-            return self.emit.emit_put_static(field_name, PrimitiveType("int"), frame), PrimitiveType("int")
+            return Code(self.emit.emit_put_static(field_name, INT_TYPE, frame)), INT_TYPE
         else:
-            return self.emit.emit_get_static(field_name, PrimitiveType("int"), frame), PrimitiveType("int")
+            return Code(self.emit.emit_get_static(field_name, INT_TYPE, frame)), INT_TYPE
 
     def visit_static_method_invocation(self, node: "StaticMethodCall", o: Any = None):
         """
@@ -920,22 +1137,22 @@ class CodeGenerator(ASTVisitor):
         """
         frame = o.frame
         # Load arguments
-        arg_code = ""
+        arg_code = Code()
         for arg in node.args:
             ac, at = self.visit(arg, Access(frame, o.sym))
             arg_code += ac
             
         # We need the signature here. For now assume it's void or try to find it.
         # This is a placeholder since we don't have a full symbol table.
-        return arg_code + self.emit.emit_invoke_static(f"{node.class_name}/{node.method_name}", FunctionType([], PrimitiveType("void")), frame), PrimitiveType("void")
+        return arg_code + self.emit.emit_invoke_static(f"{node.class_name}/{node.method_name}", FunctionType([], VOID_TYPE), frame), VOID_TYPE
 
     def visit_nil_literal(self, node: "NilLiteral", o: Access = None):
         """
         Visit nil literal - push null reference.
         """
         if o is None:
-            return "", None
+            return Code(), None
         o.frame.push()
-        code = self.emit.jvm.emitPUSHNULL()
+        code = Code(self.emit.jvm.emitPUSHNULL())
         return code, None  # Type will be determined by context
 
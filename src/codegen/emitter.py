@@ -1,30 +1,84 @@
+import math
 import os
-from typing import List, Optional, Union
+import struct
+from typing import Dict, List, Optional, Union
 from .jasmin_code import JasminCode
+from .class_writer import ClassWriter
+from .peephole import PeepholeOptimizer
 from .error import IllegalOperandException
 from ..utils.nodes import *
+from ..utils.type_pool import (
+    intern_type, is_canonical, class_type,
+    INT_TYPE, FLOAT_TYPE, BOOL_TYPE, STRING_TYPE, VOID_TYPE
+)
 from .utils import *
 
+def _float32(value: float) -> float:
+    """Round a number to the nearest 32-bit float."""
+    return struct.unpack(">f", struct.pack(">f", value))[0]
+
+def _float_lexeme(value: float) -> str:
+    """
+    Return the shortest decimal that reads back as the 32-bit float value,
+    written with a '.' in its mantissa as Jasmin requires (1.0e-5, not 1e-05).
+    """
+    for digits in range(1, 10):
+        text = "{0:.{1}g}".format(value, digits)
+        try:
+            if _float32(float(text)) == value:
+                break
+        except OverflowError:
+            # Rounded up past the largest float; more digits are needed
+            continue
+    mantissa, _, exponent = text.partition("e")
+    if "." not in mantissa:
+        mantissa += ".0"
+    return mantissa + ("e" + str(int(exponent)) if exponent else "")
+
 # Helper functions for OPLang type checking
 def is_int_type(in_type):
     """Check if type is int primitive."""
-    return type(in_type) is PrimitiveType and in_type.type_name == "int"
+    return intern_type(in_type) is INT_TYPE
 
 def is_float_type(in_type):
     """Check if type is float primitive."""
-    return type(in_type) is PrimitiveType and in_type.type_name == "float"
+    return intern_type(in_type) is FLOAT_TYPE
 
 def is_string_type(in_type):
     """Check if type is string primitive."""
-    return type(in_type) is PrimitiveType and in_type.type_name == "string"
+    return intern_type(in_type) is STRING_TYPE
 
 def is_bool_type(in_type):
     """Check if type is boolean primitive."""
-    return type(in_type) is PrimitiveType and in_type.type_name == "boolean"
+    return intern_type(in_type) is BOOL_TYPE
 
 def is_void_type(in_type):
     """Check if type is void primitive."""
-    return type(in_type) is PrimitiveType and in_type.type_name == "void"
+    return intern_type(in_type) is VOID_TYPE
+
+
+# JVM descriptors of canonical types, shared by all emitters
+_jvm_type_cache = {}
+
+# Relational operator holding exactly when the given one does not
+NEGATED_REL_OPS = {">": "<=", ">=": "<", "<": ">=", "<=": ">", "==": "!=", "!=": "=="}
+# JasminCode methods of the branches taken when a comparison holds
+INT_BRANCHES = {
+    ">": "emitIFICMPGT", ">=": "emitIFICMPGE", "<": "emitIFICMPLT",
+    "<=": "emitIFICMPLE", "==": "emitIFICMPEQ", "!=": "emitIFICMPNE",
+}
+FLOAT_BRANCHES = {
+    ">": "emitIFGT", ">=": "emitIFGE", "<": "emitIFLT",
+    "<=": "emitIFLE", "==": "emitIFEQ", "!=": "emitIFNE",
+}
+
+# StringBuilder used to compile chains of the ^ operator
+STRING_BUILDER = "java/lang/StringBuilder"
+STRING_BUILDER_TYPE = class_type(STRING_BUILDER)
+OBJECT_TYPE = class_type("java/lang/Object")
+
+# Default output directory of generated files
+RUNTIME_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "runtime")
 
 
 class Emitter:
@@ -36,35 +90,60 @@ class Emitter:
 
     Attributes:
         filename (str): Name of the output file
-        buff (List[str]): Buffer to store generated code
+        filepath (str): Path of the output file inside output_dir
+        sink (dict): In-memory output, file name to contents; None to write files
+        optimizer (PeepholeOptimizer): Optimizer run over method bodies, or None
+        buff (Code): Buffer to store generated code
         jvm (JasminCode): JasminCode instance for JVM instruction generation
     """
 
-    def __init__(self, filename: str):
+    def __init__(
+        self,
+        filename: str,
+        output_dir: Optional[str] = None,
+        sink: Optional[Dict[str, Union[str, bytes]]] = None,
+        optimizer: Optional[PeepholeOptimizer] = None,
+    ):
         """
         Initialize Emitter.
 
         Args:
             filename: Name of the output file
+            output_dir: Directory of the output files, src/runtime by default
+            sink: Dict collecting the output in memory instead of writing files
+            optimizer: Peephole optimizer for method bodies, None to emit them as is
         """
 
         self.filename = filename
-        self.filepath = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)), "runtime", filename
-        )
-        self.buff: List[str] = []
+        self.filepath = os.path.join(output_dir or RUNTIME_DIR, filename)
+        self.sink = sink
+        self.optimizer = optimizer
+        self.buff = Code()
         self.jvm = JasminCode()
+        # Enclosing buffer while a method body is being collected
+        self.outer_buff: Optional[Code] = None
 
     def get_jvm_type(self, in_type) -> str:
         """
         Convert AST type to JVM type descriptor.
 
+        Descriptors of interned types are memoized per canonical instance.
+
         Args:
             in_type: AST type to convert
 
         Returns:
             JVM type descriptor string
         """
+        in_type = intern_type(in_type)
+        if is_canonical(in_type):
+            descriptor = _jvm_type_cache.get(in_type)
+            if descriptor is None:
+                descriptor = _jvm_type_cache[in_type] = self._jvm_type(in_type)
+            return descriptor
+        return self._jvm_type(in_type)
+
+    def _jvm_type(self, in_type) -> str:
         type_in = type(in_type)
         if is_int_type(in_type):
             return "I"
@@ -155,13 +234,12 @@ class Emitter:
         Returns:
             Generated JVM instruction string
         """
-        f = float(in_)
+        f = _float32(float(in_))
         frame.push()
-        rst = "{0:.4f}".format(f)
-        if rst == "0.0000" or rst == "1.0000" or rst == "2.0000":
-            return self.jvm.emitFCONST(rst[:3])
+        if f in (0.0, 1.0, 2.0) and math.copysign(1.0, f) > 0:
+            return self.jvm.emitFCONST(str(f))
         else:
-            return self.jvm.emitLDC(rst)
+            return self.jvm.emitLDC(_float_lexeme(f))
 
     def emit_push_const(self, in_: str, typ, frame) -> str:
         """
@@ -279,7 +357,7 @@ class Emitter:
             IllegalOperandException: If type is not supported
         """
         frame.push()
-        if is_int_type(in_type):
+        if is_int_type(in_type) or is_bool_type(in_type):
             return self.jvm.emitILOAD(index)
         elif is_float_type(in_type):
             return self.jvm.emitFLOAD(index)
@@ -327,7 +405,7 @@ class Emitter:
         """
         frame.pop()
 
-        if is_int_type(in_type):
+        if is_int_type(in_type) or is_bool_type(in_type):
             return self.jvm.emitISTORE(index)
         elif is_float_type(in_type):
             return self.jvm.emitFSTORE(index)
@@ -494,6 +572,55 @@ class Emitter:
             frame.push()
         return self.jvm.emitINVOKEVIRTUAL(lexeme, self.get_jvm_type(in_))
 
+    def emit_new_string_builder(self, frame) -> str:
+        """
+        Generate code to create an empty StringBuilder on the operand stack.
+
+        Args:
+            frame: Frame object for stack management
+
+        Returns:
+            Generated JVM instruction string
+        """
+        frame.push()
+        code = self.jvm.emitNEW(STRING_BUILDER) + self.emit_dup(frame)
+        return code + self.emit_invoke_special(
+            frame, STRING_BUILDER + "/<init>", FunctionType([], VOID_TYPE)
+        )
+
+    def emit_append(self, in_, frame) -> str:
+        """
+        Generate code to append the value on top of the stack to the
+        StringBuilder below it, leaving the StringBuilder on the stack.
+
+        Args:
+            in_: Type of the appended value; int, float, boolean and string
+                use their own append overloads, anything else append(Object)
+            frame: Frame object for stack management
+
+        Returns:
+            Generated JVM instruction string
+        """
+        if not (is_int_type(in_) or is_float_type(in_) or is_bool_type(in_) or is_string_type(in_)):
+            in_ = OBJECT_TYPE
+        return self.emit_invoke_virtual(
+            STRING_BUILDER + "/append", FunctionType([in_], STRING_BUILDER_TYPE), frame
+        )
+
+    def emit_builder_to_string(self, frame) -> str:
+        """
+        Generate code to replace the StringBuilder on top of the stack with its String.
+
+        Args:
+            frame: Frame object for stack management
+
+        Returns:
+            Generated JVM instruction string
+        """
+        return self.emit_invoke_virtual(
+            STRING_BUILDER + "/toString", FunctionType([], STRING_TYPE), frame
+        )
+
     def emit_neg_op(self, in_, frame) -> str:
         """
         Generate ineg, fneg.
@@ -525,10 +652,11 @@ class Emitter:
         label2 = frame.get_new_label()
         result = list()
         result.append(self.emit_if_true(label1, frame))
-        result.append(self.emit_push_const("1", PrimitiveType("int"), frame)) # Push true (1)
+        result.append(self.emit_push_const("1", INT_TYPE, frame)) # Push true (1)
         result.append(self.emit_goto(label2, frame))
         result.append(self.emit_label(label1, frame))
-        result.append(self.emit_push_const("0", PrimitiveType("int"), frame)) # Push false (0)
+        frame.pop()  # only one of the two constants is pushed at run time
+        result.append(self.emit_push_const("0", INT_TYPE, frame)) # Push false (0)
         result.append(self.emit_label(label2, frame))
         return "".join(result)
 
@@ -677,26 +805,30 @@ class Emitter:
                 result.append(self.jvm.emitIFEQ(label_f))
             else:
                 result.append(self.jvm.emitIFNE(label_f))
-        from ..utils.nodes import PrimitiveType
-        result.append(self.emit_push_const("1", PrimitiveType("int"), frame))
-        frame.push()
+        result.append(self.emit_push_const("1", INT_TYPE, frame))
         result.append(self.emit_goto(label_o, frame))
         result.append(self.emit_label(label_f, frame))
-        result.append(self.emit_push_const("0", PrimitiveType("int"), frame))
+        frame.pop()  # only one of the two constants is pushed at run time
+        result.append(self.emit_push_const("0", INT_TYPE, frame))
         result.append(self.emit_label(label_o, frame))
         return "".join(result)
 
     def emit_rel_op(
-        self, op: str, in_, true_label: int, false_label: int, frame
+        self, op: str, in_, true_label: Optional[int], false_label: Optional[int], frame
     ) -> str:
         """
-        Emit relational operation with labels.
+        Emit a comparison that jumps instead of pushing a boolean.
+
+        Control goes to true_label when the comparison holds and to
+        false_label otherwise. A label of None means that outcome falls
+        through to the next instruction, so the usual case costs a single
+        conditional branch.
 
         Args:
             op: Operator string
             in_: Type of operands
-            true_label: Label for true case
-            false_label: Label for false case
+            true_label: Label for true case, None to fall through
+            false_label: Label for false case, None to fall through
             frame: Frame object for stack management
 
         Returns:
@@ -706,20 +838,18 @@ class Emitter:
 
         frame.pop()
         frame.pop()
-        if op == ">":
-            result.append(self.jvm.emitIFICMPLE(false_label))
-            result.append(self.emit_goto(true_label))
-        elif op == ">=":
-            result.append(self.jvm.emitIFICMPLT(false_label))
-        elif op == "<":
-            result.append(self.jvm.emitIFICMPGE(false_label))
-        elif op == "<=":
-            result.append(self.jvm.emitIFICMPGT(false_label))
-        elif op == "!=":
-            result.append(self.jvm.emitIFICMPEQ(false_label))
-        elif op == "==":
-            result.append(self.jvm.emitIFICMPNE(false_label))
-        result.append(self.jvm.emitGOTO(true_label))
+        if true_label is not None:
+            branch_op, label = op, true_label
+        else:
+            branch_op, label = NEGATED_REL_OPS[op], false_label
+        if is_float_type(in_):
+            # fcmpg for < and <=, fcmpl otherwise: comparisons with NaN are false
+            result.append(self.jvm.emitFCMPG() if op in ("<", "<=") else self.jvm.emitFCMPL())
+            result.append(getattr(self.jvm, FLOAT_BRANCHES[branch_op])(label))
+        else:
+            result.append(getattr(self.jvm, INT_BRANCHES[branch_op])(label))
+        if true_label is not None and false_label is not None:
+            result.append(self.jvm.emitGOTO(false_label))
         return "".join(result)
 
     def emit_method(self, lexeme: str, in_type, is_static: bool) -> str:
@@ -736,6 +866,29 @@ class Emitter:
         """
         return self.jvm.emitMETHOD(lexeme, self.get_jvm_type(in_type), is_static)
 
+    def begin_method_body(self) -> None:
+        """
+        Collect the following code in a buffer of its own, until
+        end_method_body, so the method body can be optimized as a whole.
+        """
+        self.outer_buff, self.buff = self.buff, Code()
+
+    def end_method_body(self, frame) -> None:
+        """
+        Run the peephole optimizer over the collected method body and
+        append it to the enclosing buffer.
+
+        Args:
+            frame: Frame object of the method, whose stack limit grows if
+                a rewrite needs more operand stack
+        """
+        body, self.buff, self.outer_buff = self.buff, self.outer_buff, None
+        if self.optimizer is not None:
+            lines, extra_stack = self.optimizer.optimize(str(body).splitlines(True))
+            body = Code("".join(lines))
+            frame.max_op_stack_size += extra_stack
+        self.buff.append(body)
+
     def emit_end_method(self, frame) -> str:
         """
         Generate the end directive for a function.
@@ -762,9 +915,8 @@ class Emitter:
         Returns:
             Tuple of (value, type)
         """
-        from ..utils.nodes import PrimitiveType
         if type(ast) is IntLiteral:
-            return (str(ast.value), PrimitiveType("int"))
+            return (str(ast.value), INT_TYPE)
 
     def emit_if_true(self, label: int, frame) -> str:
         """
@@ -921,6 +1073,20 @@ class Emitter:
         """
         return self.jvm.emitGOTO(label)
 
+    def emit_iinc(self, index: int, amount: int, frame) -> str:
+        """
+        Generate code to add a constant to an int local variable in place.
+
+        Args:
+            index: Variable index
+            amount: Signed constant added to the variable
+            frame: Frame object for stack management
+
+        Returns:
+            Generated iinc instruction string
+        """
+        return self.jvm.emitIINC(index, amount)
+
     def emit_prolog(self, name: str, parent: str) -> str:
         """
         Generate some starting directives for a class.
@@ -967,18 +1133,39 @@ class Emitter:
     def emit_epilog(self) -> None:
         """
         Write generated code to file.
+
+        This is the only place where the code buffer is serialized. With a
+        sink the Jasmin source is stored under the file name instead.
         """
+        if self.sink is not None:
+            self.sink[self.filename] = str(self.buff)
+            return
         file = open(self.filepath, "w")
-        tmp = "".join(self.buff)
-        file.write(tmp)
+        file.writelines(self.buff.fragments())
         file.close()
 
-    def print_out(self, in_: str) -> None:
+    def emit_class_file(self) -> str:
+        """
+        Assemble the code buffer into a class file next to the Jasmin file.
+
+        Returns:
+            Path of the written class file, or its name in the sink
+
+        Raises:
+            AssemblyException: If the generated code cannot be assembled
+        """
+        class_name, data = ClassWriter().assemble(self.buff.fragments())
+        if self.sink is not None:
+            self.sink[class_name + ".class"] = data
+            return class_name + ".class"
+        return ClassWriter.write(class_name, data, os.path.dirname(self.filepath))
+
+    def print_out(self, in_: Union[str, Code]) -> None:
         """
         Print out the code to screen.
 
         Args:
-            in_: The code to be printed out
+            in_: The code to be printed out, an instruction string or a Code buffer
         """
         self.buff.append(in_)
 
@@ -986,4 +1173,4 @@ class Emitter:
         """
         Clear the code buffer.
         """
-        self.buff.clear()
+        self.buff = Code()
@@ -15,3 +15,12 @@ class IllegalRuntimeException(Exception):
     def __str__(self):
         return "Illegal Runtime: " + self.s + "\n"
 
+
+
+class AssemblyException(Exception):
+    def __init__(self, msg):
+        # msg:string
+        self.s = msg
+
+    def __str__(self):
+        return "Assembly Error: " + self.s + "\n"
@@ -1,4 +1,5 @@
 from ..utils.nodes import *
+from ..utils.type_pool import class_type, INT_TYPE, FLOAT_TYPE, BOOL_TYPE, STRING_TYPE, VOID_TYPE
 from .utils import *
 
 
@@ -6,23 +7,32 @@ LIB_NAME = "io"
 
 IO_SYMBOL_LIST = [
     # Integer I/O
-    Symbol("readInt", FunctionType([], PrimitiveType("int")), CName(LIB_NAME)),
-    Symbol("writeInt", FunctionType([PrimitiveType("int")], PrimitiveType("void")), CName(LIB_NAME)),
-    Symbol("writeIntLn", FunctionType([PrimitiveType("int")], PrimitiveType("void")), CName(LIB_NAME)),
+    Symbol("readInt", FunctionType([], INT_TYPE), CName(LIB_NAME)),
+    Symbol("writeInt", FunctionType([INT_TYPE], VOID_TYPE), CName(LIB_NAME)),
+    Symbol("writeIntLn", FunctionType([INT_TYPE], VOID_TYPE), CName(LIB_NAME)),
     
     # Float I/O
-    Symbol("readFloat", FunctionType([], PrimitiveType("float")), CName(LIB_NAME)),
-    Symbol("writeFloat", FunctionType([PrimitiveType("float")], PrimitiveType("void")), CName(LIB_NAME)),
-    Symbol("writeFloatLn", FunctionType([PrimitiveType("float")], PrimitiveType("void")), CName(LIB_NAME)),
+    Symbol("readFloat", FunctionType([], FLOAT_TYPE), CName(LIB_NAME)),
+    Symbol("writeFloat", FunctionType([FLOAT_TYPE], VOID_TYPE), CName(LIB_NAME)),
+    Symbol("writeFloatLn", FunctionType([FLOAT_TYPE], VOID_TYPE), CName(LIB_NAME)),
     
     # Boolean I/O
-    Symbol("readBool", FunctionType([], PrimitiveType("boolean")), CName(LIB_NAME)),
-    Symbol("writeBool", FunctionType([PrimitiveType("boolean")], PrimitiveType("void")), CName(LIB_NAME)),
-    Symbol("writeBoolLn", FunctionType([PrimitiveType("boolean")], PrimitiveType("void")), CName(LIB_NAME)),
+    Symbol("readBool", FunctionType([], BOOL_TYPE), CName(LIB_NAME)),
+    Symbol("writeBool", FunctionType([BOOL_TYPE], VOID_TYPE), CName(LIB_NAME)),
+    Symbol("writeBoolLn", FunctionType([BOOL_TYPE], VOID_TYPE), CName(LIB_NAME)),
     
     # String I/O
-    Symbol("readStr", FunctionType([], PrimitiveType("string")), CName(LIB_NAME)),
-    Symbol("writeStr", FunctionType([PrimitiveType("string")], PrimitiveType("void")), CName(LIB_NAME)),
-    Symbol("writeStrLn", FunctionType([PrimitiveType("string")], PrimitiveType("void")), CName(LIB_NAME)),
+    Symbol("readStr", FunctionType([], STRING_TYPE), CName(LIB_NAME)),
+    Symbol("writeStr", FunctionType([STRING_TYPE], VOID_TYPE), CName(LIB_NAME)),
+    Symbol("writeStrLn", FunctionType([STRING_TYPE], VOID_TYPE), CName(LIB_NAME)),
+
+    # Output is buffered; flushed at exit and before every read
+    Symbol("flush", FunctionType([], VOID_TYPE), CName(LIB_NAME)),
 ]
 
+# The io library itself, so that io.writeInt(...) resolves its receiver;
+# declared outside the parameters, which may shadow it
+IO_CLASS_SYMBOL = Symbol(LIB_NAME, class_type(LIB_NAME), CName(LIB_NAME))
+
+# IO functions by name, for lookups outside a method's symbol table
+IO_SYMBOLS = {sym.name: sym for sym in IO_SYMBOL_LIST}
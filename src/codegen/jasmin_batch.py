@@ -0,0 +1,93 @@
+"""
+Batch Jasmin assembly for OPLang programming language.
+This module assembles many .j files, possibly of many programs with their
+own output directories, in a single jasmin JVM (src/runtime/runner/
+JasminBatch) instead of starting `java -jar jasmin.jar` once per file.
+"""
+
+import os
+import subprocess
+from typing import Dict, List, Optional, Tuple
+
+RUNTIME_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "runtime")
+JASMIN_JAR = os.path.join(RUNTIME_DIR, "jasmin.jar")
+RUNNER_DIR = os.path.join(RUNTIME_DIR, "runner")
+BATCH_CLASS = "JasminBatch"
+MARKER = "#jasmin-batch "
+
+
+class JasminBatch:
+    """
+    Collects pending .j files and assembles them in one jasmin process.
+
+    Jasmin reports errors with the bare file name and always exits with
+    status 0, so the batch driver prints a marker line before the messages
+    of every file; assemble() splits the output on those markers and maps
+    each file to its own messages.
+    """
+
+    def __init__(self, java: str = "java"):
+        self.java = java
+        self.pending: List[Tuple[str, str]] = []
+
+    def __len__(self) -> int:
+        return len(self.pending)
+
+    def add(self, j_file: str, output_dir: Optional[str] = None) -> None:
+        """
+        Queue a .j file for assembly.
+
+        Args:
+            j_file: Path of the Jasmin source
+            output_dir: Directory for the class file, the .j file's own by default
+        """
+        self.pending.append((j_file, output_dir or os.path.dirname(os.path.abspath(j_file))))
+
+    def assemble(self, timeout: Optional[float] = None) -> Dict[str, Optional[str]]:
+        """
+        Assemble all pending files and clear the queue.
+
+        Args:
+            timeout: Seconds to wait for the whole batch, None to wait forever
+
+        Returns:
+            Dict from each queued .j path to None if its class file was
+            generated, or to jasmin's messages for it otherwise
+
+        Raises:
+            subprocess.TimeoutExpired: If the batch runs longer than timeout
+        """
+        pending, self.pending = self.pending, []
+        if not pending:
+            return {}
+        requests = "".join(
+            f"{os.path.abspath(output_dir)}\t{os.path.abspath(j_file)}\n"
+            for j_file, output_dir in pending
+        )
+        result = subprocess.run(
+            [self.java, "-cp", os.pathsep.join([RUNNER_DIR, JASMIN_JAR]), BATCH_CLASS],
+            input=requests,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+
+        messages: Dict[int, List[str]] = {}
+        current = None
+        for line in result.stdout.splitlines():
+            if line.startswith(MARKER):
+                index = line[len(MARKER):]
+                current = messages.setdefault(int(index), []) if index.isdigit() else None
+            elif current is not None:
+                current.append(line)
+
+        errors: Dict[str, Optional[str]] = {}
+        for index, (j_file, _) in enumerate(pending):
+            lines = messages.get(index)
+            if lines is None:
+                errors[j_file] = f"jasmin exited before assembling this file\n{result.stderr}"
+            elif any(line.startswith("Generated: ") for line in lines):
+                errors[j_file] = None
+            else:
+                errors[j_file] = "\n".join(lines) + "\n"
+        return errors
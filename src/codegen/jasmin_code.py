@@ -327,6 +327,16 @@ class MachineCode(ABC):
     def emitFCMPL(self):
         pass
 
+    @abstractmethod
+    def emitFCMPG(self):
+        pass
+
+    @abstractmethod
+    def emitIINC(self, index, amount):
+        # index: Int
+        # amount: Int
+        pass
+
     @abstractmethod
     def emitLIMITLOCAL(self, in_):
         # in_: String
@@ -705,6 +715,14 @@ class JasminCode(MachineCode):
     def emitFCMPL(self):
         return JasminCode.INDENT + "fcmpl" + JasminCode.END
 
+    def emitFCMPG(self):
+        return JasminCode.INDENT + "fcmpg" + JasminCode.END
+
+    def emitIINC(self, index, amount):
+        # index: Int
+        # amount: Int
+        return JasminCode.INDENT + "iinc " + str(index) + " " + str(amount) + JasminCode.END
+
     def emitLIMITLOCAL(self, in_):
         # in_: Int
         return ".limit locals " + str(in_) + JasminCode.END
@@ -0,0 +1,139 @@
+"""
+Persistent JVM runner for OPLang programming language.
+This module keeps one warm JVM running src/runtime/runner/OPLangRunner and
+sends it compiled programs to execute, instead of starting a new java
+process for every program. Each program gets a fresh class loader, so
+classes and static state (such as the io scanner) are never shared.
+"""
+
+import os
+import queue
+import subprocess
+import threading
+from typing import Optional
+
+RUNNER_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "runtime", "runner"
+)
+RUNNER_CLASS = "OPLangRunner"
+
+
+class JVMRunner:
+    """
+    Client of a long-lived OPLangRunner process.
+
+    run() mirrors subprocess.run for `java <main class>`: it returns a
+    CompletedProcess with the exit status and captured output, and raises
+    subprocess.TimeoutExpired when the program does not finish in time. A
+    program that times out (or kills the JVM) takes the runner down with
+    it; a new one is started for the next run.
+    """
+
+    def __init__(self, java: str = "java"):
+        self.java = java
+        self.process: Optional[subprocess.Popen] = None
+        self.responses: "queue.Queue" = queue.Queue()
+        self.lock = threading.Lock()
+
+    def __enter__(self) -> "JVMRunner":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def start(self) -> None:
+        """Start the runner JVM if it is not running."""
+        if self.process is not None and self.process.poll() is None:
+            return
+        self.process = subprocess.Popen(
+            [self.java, "-cp", RUNNER_DIR, RUNNER_CLASS],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        self.responses = queue.Queue()
+        threading.Thread(
+            target=self._read_responses,
+            args=(self.process, self.responses),
+            daemon=True,
+        ).start()
+
+    def close(self) -> None:
+        """Stop the runner JVM."""
+        process, self.process = self.process, None
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+            process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+
+    def run(
+        self,
+        class_dir: str,
+        main_class: str,
+        timeout: Optional[float] = None,
+        stdin_path: Optional[str] = None,
+    ) -> subprocess.CompletedProcess:
+        """
+        Run main_class from class_dir in the warm JVM.
+
+        Args:
+            class_dir: Directory holding the compiled classes and io.class
+            main_class: Name of the class whose main method is run
+            timeout: Seconds to wait for the program, None to wait forever
+            stdin_path: File to use as the program's standard input
+
+        Returns:
+            CompletedProcess with returncode, stdout and stderr as text
+
+        Raises:
+            subprocess.TimeoutExpired: If the program runs longer than timeout
+        """
+        args = [self.java, main_class]
+        request = f"{os.path.abspath(class_dir)}\t{main_class}\t{stdin_path or ''}\n"
+        with self.lock:
+            self.start()
+            process = self.process
+            try:
+                process.stdin.write(request.encode("utf-8"))
+                process.stdin.flush()
+            except OSError:
+                pass  # the runner died; reported below as a lost response
+            try:
+                response = self.responses.get(timeout=timeout)
+            except queue.Empty:
+                # The program may never return; only killing the JVM stops it
+                self.process = None
+                process.kill()
+                process.wait()
+                raise subprocess.TimeoutExpired(args, timeout)
+            if response is None:
+                self.process = None
+                returncode = process.wait()
+                return subprocess.CompletedProcess(
+                    args, returncode or 1, "", "Error: runner JVM exited unexpectedly\n"
+                )
+            returncode, stdout, stderr = response
+            return subprocess.CompletedProcess(
+                args,
+                returncode,
+                stdout.decode("utf-8", "replace"),
+                stderr.decode("utf-8", "replace"),
+            )
+
+    @staticmethod
+    def _read_responses(process: subprocess.Popen, responses: "queue.Queue") -> None:
+        # Responses are "<status> <stdout bytes> <stderr bytes>\n" plus the bytes
+        stream = process.stdout
+        while True:
+            header = stream.readline()
+            if not header:
+                responses.put(None)
+                return
+            status, out_len, err_len = (int(x) for x in header.split())
+            stdout = stream.read(out_len)
+            stderr = stream.read(err_len)
+            responses.put((status, stdout, stderr))
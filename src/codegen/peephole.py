@@ -0,0 +1,245 @@
+"""
+Peephole optimizer for OPLang programming language.
+This module contains the PeepholeOptimizer class that rewrites the Jasmin
+instructions of one method body through a table of local rules, until no
+rule applies, and counts how often each rule fired.
+"""
+
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+# A rule looks at the instruction at index i of a method body (stripped
+# lines) and returns how many lines it replaces and their replacement, or
+# None when it does not apply. labels maps label names to their line index.
+Match = Optional[Tuple[int, List[str]]]
+RuleFunction = Callable[[List[str], int, Dict[str, int]], Match]
+
+_RETURNS = frozenset(("return", "ireturn", "freturn", "areturn"))
+_UNCONDITIONAL = _RETURNS | {"goto", "athrow"}
+_BRANCHES = frozenset((
+    "goto", "ifeq", "ifne", "iflt", "ifle", "ifgt", "ifge", "ifnull", "ifnonnull",
+    "if_icmpeq", "if_icmpne", "if_icmplt", "if_icmple", "if_icmpgt", "if_icmpge",
+    "if_acmpeq", "if_acmpne",
+))
+# One-word pushes without side effects, which a following pop cancels
+_PURE_PUSHES = frozenset((
+    "dup", "aconst_null", "bipush", "sipush", "ldc",
+    "iconst_m1", "iconst_0", "iconst_1", "iconst_2", "iconst_3", "iconst_4", "iconst_5",
+    "fconst_0", "fconst_1", "fconst_2",
+    "iload", "fload", "aload",
+    "iload_0", "iload_1", "iload_2", "iload_3",
+    "fload_0", "fload_1", "fload_2", "fload_3",
+    "aload_0", "aload_1", "aload_2", "aload_3",
+))
+# Whether the branch of `iconst_<n>; if<cond> L` is taken
+_CONSTANT_BRANCHES = {
+    ("iconst_0", "ifeq"): True, ("iconst_0", "ifne"): False,
+    ("iconst_1", "ifeq"): False, ("iconst_1", "ifne"): True,
+}
+
+
+def is_label(line: str) -> bool:
+    return line.endswith(":")
+
+
+def is_instruction(line: str) -> bool:
+    return bool(line) and not line.startswith(".") and not line.endswith(":")
+
+
+def split(line: str) -> Tuple[str, str]:
+    """Return the opcode and the operand text of an instruction line."""
+    op, _, arg = line.partition(" ")
+    return op, arg.strip()
+
+
+def local_slot(op: str, arg: str) -> Optional[Tuple[str, str, str]]:
+    """Return (type prefix, load or store, slot) of a local variable access, else None."""
+    name, _, short = op.partition("_")
+    if name[:1] not in ("i", "f", "a") or name[1:] not in ("load", "store"):
+        return None
+    return name[0], name[1:], short or arg
+
+
+def next_instruction(code: List[str], index: int) -> int:
+    """Return the index of the first instruction at or after index, skipping labels and directives."""
+    while index < len(code) and not is_instruction(code[index]):
+        index += 1
+    return index
+
+
+class PeepholeRule:
+    """
+    A named entry of the rule table.
+
+    Attributes:
+        name (str): Key of the rule in the hit statistics
+        match (callable): Function (code, i, labels) -> (count, replacement) or None
+        extra_stack (int): Operand stack slots the replacement may need on top
+            of the replaced code
+    """
+
+    __slots__ = ("name", "match", "extra_stack")
+
+    def __init__(self, name: str, match: RuleFunction, extra_stack: int = 0):
+        self.name = name
+        self.match = match
+        self.extra_stack = extra_stack
+
+
+def goto_next_label(code: List[str], i: int, labels: Dict[str, int]) -> Match:
+    """goto L; L:  ->  L:"""
+    op, target = split(code[i])
+    if op != "goto":
+        return None
+    j = i + 1
+    while j < len(code) and is_label(code[j]):
+        if code[j][:-1] == target:
+            return 1, []
+        j += 1
+    return None
+
+
+def constant_branch(code: List[str], i: int, labels: Dict[str, int]) -> Match:
+    """iconst_1; ifeq L  ->  nothing, and iconst_1; ifne L  ->  goto L"""
+    if i + 1 >= len(code):
+        return None
+    op, target = split(code[i + 1])
+    taken = _CONSTANT_BRANCHES.get((code[i], op))
+    if taken is None:
+        return None
+    return 2, ["goto " + target] if taken else []
+
+
+def store_load(code: List[str], i: int, labels: Dict[str, int]) -> Match:
+    """istore x; iload x  ->  dup; istore x"""
+    if i + 1 >= len(code):
+        return None
+    store = local_slot(*split(code[i]))
+    load = local_slot(*split(code[i + 1]))
+    if store is None or load is None or store[1] != "store" or load[1] != "load":
+        return None
+    if store[0] != load[0] or store[2] != load[2]:
+        return None
+    if i + 2 < len(code) and code[i + 2] == "pop":
+        return None  # push-pop drops the load instead
+    return 2, ["dup", code[i]]
+
+
+def push_pop(code: List[str], i: int, labels: Dict[str, int]) -> Match:
+    """dup; pop  ->  nothing, and the same for loads and constants"""
+    if i + 1 >= len(code) or code[i + 1] != "pop":
+        return None
+    return (2, []) if split(code[i])[0] in _PURE_PUSHES else None
+
+
+def branch_chain(code: List[str], i: int, labels: Dict[str, int]) -> Match:
+    """
+    A branch to `L: goto M` branches to M instead, and goto L with
+    `L: return` returns directly.
+    """
+    op, target = split(code[i])
+    if op not in _BRANCHES or target not in labels:
+        return None
+    final = target
+    seen = {target}
+    while True:
+        j = next_instruction(code, labels[final] + 1)
+        if j >= len(code):
+            break
+        next_op, next_target = split(code[j])
+        if next_op == "goto" and next_target in labels and next_target not in seen:
+            final = next_target
+            seen.add(final)
+            continue
+        if next_op == "goto" and next_target in seen:
+            return None  # a loop made of gotos
+        if op == "goto" and next_op in _RETURNS:
+            return 1, [next_op]
+        break
+    return (1, [op + " " + final]) if final != target else None
+
+
+def unreachable(code: List[str], i: int, labels: Dict[str, int]) -> Match:
+    """Drop an instruction after goto, return or athrow that no label reaches."""
+    if split(code[i])[0] not in _UNCONDITIONAL:
+        return None
+    if i + 1 < len(code) and is_instruction(code[i + 1]):
+        return 2, [code[i]]
+    return None
+
+
+DEFAULT_RULES: Tuple[PeepholeRule, ...] = (
+    PeepholeRule("goto-next-label", goto_next_label),
+    PeepholeRule("constant-branch", constant_branch),
+    PeepholeRule("store-load", store_load, extra_stack=1),
+    PeepholeRule("push-pop", push_pop),
+    PeepholeRule("branch-chain", branch_chain),
+    PeepholeRule("unreachable", unreachable),
+)
+
+
+class PeepholeOptimizer:
+    """
+    Rewrites method bodies with a table of peephole rules.
+
+    Rules are tried in table order at every instruction; the first that
+    matches replaces its lines. Passes repeat until a whole pass changes
+    nothing, so rewrites can enable each other (a branch chain collapsed
+    to `goto L; L:` is then removed).
+
+    Attributes:
+        rules (tuple): PeepholeRule table
+        stats (dict): Rule name to the number of times it fired
+    """
+
+    def __init__(self, rules: Sequence[PeepholeRule] = DEFAULT_RULES):
+        self.rules = tuple(rules)
+        self.stats: Dict[str, int] = {rule.name: 0 for rule in self.rules}
+
+    def optimize(self, lines: List[str]) -> Tuple[List[str], int]:
+        """
+        Optimize the lines of one method body.
+
+        Args:
+            lines: Jasmin lines between the .method and .limit directives
+
+        Returns:
+            Tuple of the optimized lines and the number of operand stack
+            slots to add to the method's .limit stack
+        """
+        raw = [line.rstrip("\n") for line in lines]
+        code = [line.strip() for line in raw]
+        extra_stack = 0
+        changed = True
+        while changed:
+            changed = False
+            labels = {line[:-1]: k for k, line in enumerate(code) if is_label(line)}
+            out_code: List[str] = []
+            out_raw: List[str] = []
+            i = 0
+            while i < len(code):
+                if is_instruction(code[i]):
+                    for rule in self.rules:
+                        match = rule.match(code, i, labels)
+                        if match is not None:
+                            count, replacement = match
+                            self.stats[rule.name] += 1
+                            extra_stack = max(extra_stack, rule.extra_stack)
+                            out_code.extend(replacement)
+                            out_raw.extend("\t" + line for line in replacement)
+                            i += count
+                            changed = True
+                            break
+                    else:
+                        out_code.append(code[i])
+                        out_raw.append(raw[i])
+                        i += 1
+                else:
+                    out_code.append(code[i])
+                    out_raw.append(raw[i])
+                    i += 1
+            code, raw = out_code, out_raw
+        return [line + "\n" for line in raw], extra_stack
+
+    def hits(self) -> int:
+        """Return the total number of rewrites."""
+        return sum(self.stats.values())
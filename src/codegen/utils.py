@@ -1,4 +1,5 @@
-from ..utils.nodes import Type
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+from ..utils.nodes import Type, ClassType
 from .frame import Frame
 
 
@@ -14,17 +15,6 @@ class FunctionType(Type):
         return visitor.visit_function_type(self, o)
 
 
-class ClassType(Type):
-    """Class type node."""
-
-    def __init__(self, class_name):
-        super().__init__()
-        self.class_name = class_name
-
-    def accept(self, visitor, o=None):
-        return visitor.visit_class_type(self, o)
-
-
 class Value:
     pass
 
@@ -46,11 +36,49 @@ class Symbol:
         self.value = value
 
 
+class SymbolTable:
+    """
+    Scoped symbol table backed by chained hash maps.
+
+    Every name maps to a stack of symbols, innermost declaration last, and
+    every scope records the names it declared so it can be popped in time
+    proportional to its own size. Lookup, declaration, push and pop are O(1).
+    """
+
+    def __init__(self, symbols: Iterable["Symbol"] = ()):
+        self.table: Dict[str, List["Symbol"]] = {}
+        self.scopes: List[List[str]] = [[]]
+        for sym in symbols:
+            self.add(sym)
+
+    def push_scope(self) -> None:
+        """Open a new innermost scope."""
+        self.scopes.append([])
+
+    def pop_scope(self) -> None:
+        """Close the innermost scope and forget the symbols it declared."""
+        for name in reversed(self.scopes.pop()):
+            stack = self.table[name]
+            stack.pop()
+            if not stack:
+                del self.table[name]
+
+    def add(self, sym: "Symbol") -> None:
+        """Declare sym in the innermost scope, shadowing outer ones."""
+        self.table.setdefault(sym.name, []).append(sym)
+        self.scopes[-1].append(sym.name)
+
+    def lookup(self, name: str) -> Optional["Symbol"]:
+        """Return the innermost symbol called name, or None."""
+        stack = self.table.get(name)
+        return stack[-1] if stack else None
+
+
 class Access:
     def __init__(
         self,
         frame: Frame,
-        sym: list["Symbol"],
+        sym: SymbolTable,
         is_left: bool = False,
         is_first: bool = False,
     ):
@@ -61,7 +89,57 @@ class Access:
 
 
 class SubBody:
-    def __init__(self, frame: Frame, sym: list["Symbol"]):
+    def __init__(self, frame: Frame, sym: SymbolTable):
         self.frame = frame
         self.sym = sym
 
+
+# Buffers with at most this many parts are inlined when appended
+_INLINE_PARTS = 8
+
+
+class Code:
+    """
+    Buffer of generated Jasmin code.
+
+    Parts are instruction strings or nested Code buffers, so joining the
+    code of a whole subexpression is O(1) and nothing is copied until the
+    buffer is serialized, once, by Emitter.emit_epilog. `code + x` and
+    `code += x` return a new buffer and leave code unchanged, so a buffer
+    can be shared; only its owner, such as the Emitter, appends to it.
+    """
+
+    __slots__ = ("parts",)
+
+    def __init__(self, *parts: Union[str, "Code"]):
+        self.parts: List[Union[str, "Code"]] = list(parts)
+
+    def append(self, part: Union[str, "Code"]) -> "Code":
+        """Append an instruction string or another buffer and return self."""
+        if type(part) is Code and len(part.parts) <= _INLINE_PARTS:
+            # Copying a few references is cheaper than keeping a tiny node
+            self.parts.extend(part.parts)
+        else:
+            self.parts.append(part)
+        return self
+
+    def __add__(self, other: Union[str, "Code"]) -> "Code":
+        return Code().append(self).append(other)
+
+    def __radd__(self, other: str) -> "Code":
+        return Code(other).append(self)
+
+    def fragments(self) -> Iterator[str]:
+        """Yield the instruction strings in order, without recursion."""
+        stack = [iter(self.parts)]
+        while stack:
+            for part in stack[-1]:
+                if type(part) is Code:
+                    stack.append(iter(part.parts))
+                    break
+                yield part
+            else:
+                stack.pop()
+
+    def __str__(self) -> str:
+        return "".join(self.fragments())
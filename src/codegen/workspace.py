@@ -0,0 +1,134 @@
+"""
+Compilation workspaces for OPLang programming language.
+This module contains the Workspace class, the private temporary directory
+a program is compiled and run in. It holds the steps shared by the test
+harness and the instrumented pipeline: assembling the program's .j files,
+copying the io runtime next to its classes and running its main class in
+a warm JVMRunner or in a new java process.
+"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+from typing import Dict, Iterable, Optional
+
+from src.codegen.class_writer import ClassWriter
+from src.codegen.error import AssemblyException
+from src.codegen.jasmin_batch import JasminBatch
+from src.codegen.jvm_runner import JVMRunner
+
+RUNTIME_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "runtime")
+IO_CLASS = os.path.join(RUNTIME_DIR, "io.class")
+
+
+class Workspace:
+    """
+    Temporary directory holding one program's .j and .class files and a
+    copy of io.class, so a program never picks up classes of another one
+    and several programs can be compiled and run at once.
+
+    Used as a context manager, the directory is removed on exit.
+    """
+
+    def __init__(self, prefix: str = "oplang-"):
+        self.path = tempfile.mkdtemp(prefix=prefix)
+
+    def __enter__(self) -> "Workspace":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.remove()
+
+    def remove(self) -> None:
+        """Delete the directory and everything in it."""
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def j_file(self, class_name: str) -> str:
+        """Return the path of a class's Jasmin file."""
+        return os.path.join(self.path, class_name + ".j")
+
+    def class_file(self, class_name: str) -> str:
+        """Return the path of a class's class file."""
+        return os.path.join(self.path, class_name + ".class")
+
+    def install_runtime(self) -> None:
+        """Copy io.class next to the program's classes."""
+        shutil.copy(IO_CLASS, self.path)
+
+    def queue(self, class_names: Iterable[str], batch: JasminBatch) -> None:
+        """Add the .j files of class_names to a batch assembled by the caller."""
+        for class_name in class_names:
+            batch.add(self.j_file(class_name))
+
+    def assemble(
+        self,
+        class_names: Iterable[str],
+        assembler: str = "python",
+        timeout: Optional[float] = None,
+    ) -> Dict[str, int]:
+        """
+        Assemble the .j files of class_names into class files.
+
+        Args:
+            class_names: Classes whose .j files are in the workspace
+            assembler: "python" for the built-in class writer, "jasmin" for jasmin.jar
+            timeout: Seconds to wait for jasmin, None to wait forever
+
+        Returns:
+            Dict from each class name to the size of its class file
+
+        Raises:
+            AssemblyException: If a file cannot be assembled
+            subprocess.TimeoutExpired: If jasmin runs longer than timeout
+        """
+        class_names = list(class_names)
+        if assembler == "jasmin":
+            batch = JasminBatch()
+            self.queue(class_names, batch)
+            for j_file, error in batch.assemble(timeout=timeout).items():
+                if error:
+                    raise AssemblyException(f"{os.path.basename(j_file)}: {error}")
+        else:
+            for class_name in class_names:
+                ClassWriter.assemble_file(self.j_file(class_name))
+        return {class_name: os.path.getsize(self.class_file(class_name)) for class_name in class_names}
+
+    def run(
+        self,
+        main_class: str,
+        runner: Optional[JVMRunner] = None,
+        timeout: Optional[float] = None,
+        stdin_path: Optional[str] = None,
+    ) -> subprocess.CompletedProcess:
+        """
+        Run main_class with the workspace as its class path.
+
+        Args:
+            main_class: Name of the class whose main method is run
+            runner: Warm JVM to run the program in; None starts `java`
+            timeout: Seconds to wait for the program, None to wait forever
+            stdin_path: File to use as the program's standard input
+
+        Returns:
+            CompletedProcess with returncode, stdout and stderr as text
+
+        Raises:
+            subprocess.TimeoutExpired: If the program runs longer than timeout
+            FileNotFoundError: If java cannot be started
+        """
+        if runner is not None:
+            return runner.run(self.path, main_class, timeout=timeout, stdin_path=stdin_path)
+        stdin = open(stdin_path) if stdin_path else subprocess.DEVNULL
+        try:
+            return subprocess.run(
+                ["java", main_class],
+                cwd=self.path,
+                stdin=stdin,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+            )
+        finally:
+            if stdin_path:
+                stdin.close()
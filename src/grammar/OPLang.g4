@@ -144,7 +144,7 @@ COMMENT: ('/*' .*? ('*/' | EOF) | '#' ~[\r\n]* ('\n' | EOF)) -> skip;
 //Statement:
     //Block statement:
     blockstm: LB var_decl_stm stmlist RB;
-    stmlist: stm stmlist| ; //Note: Added stmlist to have recursive
+    stmlist: stm*; //Note: Added stmlist to have a flat statement loop
     stm: assingstm | ifstm | forstm | breakstm | continuestm | returnstm | invocationstm | blockstm;
 
         //Assign statement
@@ -164,7 +164,7 @@ COMMENT: ('/*' .*? ('*/' | EOF) | '#' ~[\r\n]* ('\n' | EOF)) -> skip;
 
         //Invocation statement
         invocationstm: invocationstm_frame SEMI;
-        invocationstm_frame: expr dotting; //(in_attribute_access | sta_attribute_access | in_method | sta_method);//Copy from expression
+        invocationstm_frame: expr9; //Postfix expression, ASTGeneration checks it ends in a dotting (call for invocationstm) //(in_attribute_access | sta_attribute_access | in_method | sta_method);//Copy from expression
         // in_attribute_access: expr DOT ID;
         // sta_attribute_access: ID DOT ID;
         // in_method: expr DOT callfuncstm;
@@ -173,13 +173,13 @@ COMMENT: ('/*' .*? ('*/' | EOF) | '#' ~[\r\n]* ('\n' | EOF)) -> skip;
         //Call function statement:
         callfuncstm: ID LRB input_func_param_list RRB;
         input_func_param_list: input_func_param_prime | ; //nullable 4, YES sep SEMI
-        input_func_param_prime: input_func_param COMMA input_func_param_prime | input_func_param;
+        input_func_param_prime: input_func_param (COMMA input_func_param)*;
         input_func_param: INTLIT | FLOATLIT | STRINGLIT | ID | expr;
 
 //Declare:
-    decl : (attr_decl|func_decl) decl| ;
+    decl : (attr_decl|func_decl)*;
 //Class Declaration:
-class_decl_list: class_decl class_decl_list| class_decl; // non-nullable 1 class
+class_decl_list: class_decl+; // non-nullable 1 class
     class_decl: CLASS ID LB class_member RB //Replaced ID -> class_type
                 | CLASS ID EXTEND ID LB class_member RB; //
     //NOT in this Project: Check duplicate
@@ -224,12 +224,13 @@ func_decl: normal_func | constructor | destructor;
         // RETYPE: TYPE | VOID;
 
     func_param_list: func_param_prime | ; //nullable 4, YES sep SEMI
-    func_param_prime: (type | referencetype) func_param SEMI func_param_prime | (type | referencetype) func_param;
+    func_param_prime: func_param_group (SEMI func_param_group)*;
+    func_param_group: (type | referencetype) func_param;
     func_param: var_name COMMA func_param | var_name;
     
         
 //Variable/Attribute Declaration:
-var_decl_stm: var_decl_no_stafin var_decl_stm | ;
+var_decl_stm: var_decl_no_stafin*;
 
 var_decl_no_stafin: (FIN | ) type var_decl_list SEMI | (FIN | ) referencetype var_decl_list_ref SEMI; 
 
@@ -254,7 +255,7 @@ var_decl: stafin type var_decl_list SEMI | stafin referencetype var_decl_list_re
     expr6: NOT expr6 | expr7;
     expr7: (ADD|SUB) expr7 | expr8;
     expr8: expr8 LSB expr RSB | expr9;
-    dotting: DOT (ID | callfuncstm | ID LSB expr RSB) dotting | DOT (ID | callfuncstm| ID LSB expr RSB);
+    dotting: DOT (ID | callfuncstm | ID LSB expr RSB); //One step; expr9 repeats it
     expr9: expr9 dotting | expr10;
     expr10: NEW expr10 | expr11;
     expr11: INTLIT | FLOATLIT | STRINGLIT | BOOLLIT | ID | callfuncstm | array | THIS | NIL | LRB expr RRB;
@@ -0,0 +1,161 @@
+"""
+Instrumented compiler pipeline for OPLang programming language.
+This module runs one source program through every compiler stage (lexer,
+parser, AST generation, static checking, constant folding, code generation,
+assembly and the JVM run) under an Instrumentation, so the time, memory and
+work of each stage can be reported.
+
+The generated ANTLR lexer and parser are imported from build/, which has
+to be on sys.path as for the test suite (run `python run.py build` first).
+"""
+
+import subprocess
+from typing import List, Optional
+
+from antlr4 import CommonTokenStream, InputStream
+from build.OPLangLexer import OPLangLexer
+from build.OPLangParser import OPLangParser
+
+from src.astgen.ast_generation import ASTGeneration
+from src.codegen.codegen import CodeGenerator
+from src.codegen.jvm_runner import JVMRunner
+from src.codegen.peephole import is_instruction
+from src.codegen.workspace import Workspace
+from src.semantics.constant_folder import ConstantFolder
+from src.semantics.static_checker import StaticChecker
+from src.utils.error_listener import NewErrorListener
+from src.utils.instrumentation import Instrumentation
+from src.utils.nodes import ASTNode, Program
+from src.utils.parsing import parse_two_stage
+
+STAGES = ("lex", "parse", "ast", "check", "fold", "codegen", "assemble", "run")
+
+
+def count_nodes(ast: ASTNode) -> int:
+    """Return the number of AST nodes under ast, itself included (types too)."""
+    count = 0
+    stack = [ast]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, ASTNode):
+            count += 1
+            for cls in type(item).__mro__:
+                for name in cls.__dict__.get("__slots__", ()):
+                    stack.append(getattr(item, name, None))
+        elif type(item) is list or type(item) is tuple:
+            stack.extend(item)
+    return count
+
+
+def count_instructions(source: str) -> int:
+    """Return the number of instructions in Jasmin source, labels and directives excluded."""
+    return sum(1 for line in source.splitlines() if is_instruction(line.strip()))
+
+
+class PipelineResult:
+    """
+    Outcome of run_pipeline.
+
+    Attributes:
+        instrumentation (Instrumentation): Measurements of the stages that ran
+        ast (Program): Checked and folded AST
+        class_names (list): Generated classes, in declaration order
+        main_class (str or None): Class holding the static main method
+        output (CompletedProcess or None): Result of the JVM run, None if
+            the program was not run
+    """
+
+    def __init__(self, instrumentation: Instrumentation):
+        self.instrumentation = instrumentation
+        self.ast: Optional[Program] = None
+        self.class_names: List[str] = []
+        self.main_class: Optional[str] = None
+        self.output: Optional[subprocess.CompletedProcess] = None
+
+
+def run_pipeline(
+    source: str,
+    instrumentation: Optional[Instrumentation] = None,
+    assembler: str = "python",
+    runner: Optional[JVMRunner] = None,
+    execute: bool = True,
+    stdin_path: Optional[str] = None,
+    timeout: Optional[float] = None,
+) -> PipelineResult:
+    """
+    Compile source stage by stage and optionally run it.
+
+    Each stage records its counts: tokens (lex, parse), nodes (ast, check,
+    fold), folded (fold), classes and instructions (codegen), class_files and
+    bytes (assemble), output_bytes (run). Errors of any stage propagate
+    after its measurements are recorded.
+
+    Args:
+        source: OPLang program text
+        instrumentation: Where to record the stages, a new one by default
+        assembler: "python" for the built-in class writer, "jasmin" for jasmin.jar
+        runner: Warm JVM to run the program in; None starts `java` for the run
+        execute: Whether to run the compiled program
+        stdin_path: File to use as the program's standard input
+        timeout: Seconds to wait for the program
+
+    Returns:
+        PipelineResult with the instrumentation, the AST and the run output
+    """
+    instrumentation = instrumentation if instrumentation is not None else Instrumentation()
+    instrumentation.meta.setdefault("source_bytes", len(source.encode("utf-8")))
+    instrumentation.meta.setdefault("assembler", assembler)
+    result = PipelineResult(instrumentation)
+    stage = instrumentation.stage
+
+    with stage("lex") as report:
+        token_stream = CommonTokenStream(OPLangLexer(InputStream(source)))
+        token_stream.fill()
+    report.counts["tokens"] = tokens = len(token_stream.tokens) - 1  # EOF
+
+    with stage("parse") as report:
+        parser = OPLangParser(token_stream)
+        parser.removeErrorListeners()
+        parser.addErrorListener(NewErrorListener.INSTANCE)
+        parse_tree = parse_two_stage(parser, "program")
+    report.counts["tokens"] = tokens
+
+    with stage("ast") as report:
+        ast = result.ast = ASTGeneration().visit(parse_tree)
+    report.counts["nodes"] = nodes = count_nodes(ast)
+
+    with stage("check") as report:
+        StaticChecker().check_program(ast)
+    report.counts["nodes"] = nodes
+
+    with stage("fold") as report:
+        folder = ConstantFolder()
+        folder.fold_program(ast)
+    report.counts["nodes"] = nodes
+    report.counts["folded"] = folder.folded
+
+    with Workspace(prefix="oplang-pipeline-") as workspace:
+        with stage("codegen") as report:
+            codegen = CodeGenerator(output_dir=workspace.path)
+            codegen.visit(ast)
+        result.class_names = codegen.class_names
+        result.main_class = codegen.main_class
+        instructions = 0
+        for class_name in codegen.class_names:
+            with open(workspace.j_file(class_name)) as f:
+                instructions += count_instructions(f.read())
+        report.counts["classes"] = len(codegen.class_names)
+        report.counts["instructions"] = instructions
+
+        with stage("assemble") as report:
+            sizes = workspace.assemble(codegen.class_names, assembler, timeout=timeout)
+        report.counts["class_files"] = len(sizes)
+        report.counts["bytes"] = sum(sizes.values())
+
+        if execute and codegen.main_class:
+            workspace.install_runtime()
+            with stage("run") as report:
+                output = workspace.run(codegen.main_class, runner, timeout=timeout, stdin_path=stdin_path)
+            result.output = output
+            report.counts["output_bytes"] = len(output.stdout.encode("utf-8"))
+    return result
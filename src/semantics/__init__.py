@@ -7,9 +7,11 @@ programming language including type checking, scope management, and error detect
 
 from .static_error import *
 from .static_checker import StaticChecker
+from .constant_folder import ConstantFolder
 
 __all__ = [
     'StaticChecker',
+    'ConstantFolder',
     'StaticError',
     'Redeclared',
     'UndeclaredIdentifier', 
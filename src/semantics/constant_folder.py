@@ -0,0 +1,387 @@
+"""
+Constant folding for OPLang programming language.
+This module contains the ConstantFolder pass that runs between
+StaticChecker.check_program and code generation. It evaluates constant
+subexpressions, replaces uses of final locals and final attributes that
+have constant initializers with their values, and rewrites the AST in
+place so code generation sees literals instead of runtime arithmetic,
+field loads and local loads.
+"""
+
+import struct
+from typing import Any, Dict, Optional, Tuple
+
+from ..utils.nodes import (
+    Program, ClassDecl, AttributeDecl, Attribute, MethodDecl, ConstructorDecl,
+    DestructorDecl, VariableDecl, AssignmentStatement, IfStatement,
+    ForStatement, ReturnStatement, MethodInvocationStatement, BlockStatement,
+    PrimitiveType, PostfixLHS, BinaryOp, UnaryOp, PostfixExpression,
+    MethodCall, MemberAccess, ArrayAccess, ObjectCreation, Identifier,
+    ThisExpression, ParenthesizedExpression, IntLiteral, FloatLiteral,
+    BoolLiteral, StringLiteral, ArrayLiteral
+)
+from ..utils.type_pool import class_type
+from .static_checker import StaticChecker
+
+_SCALAR_LITERALS = (IntLiteral, FloatLiteral, BoolLiteral, StringLiteral)
+_NUMERIC_LITERALS = (IntLiteral, FloatLiteral)
+
+
+def _wrap_int(value: int) -> int:
+    """Truncate an int to 32-bit two's complement, like JVM int arithmetic."""
+    return (value + 0x80000000) % 0x100000000 - 0x80000000
+
+
+def _to_float(value) -> float:
+    """
+    Round a number to the nearest 32-bit float.
+
+    Raises:
+        OverflowError: If the value is out of the float range
+    """
+    return struct.unpack(">f", struct.pack(">f", value))[0]
+
+
+def _int_div(left: int, right: int) -> int:
+    """Integer division rounding toward zero, like idiv."""
+    quotient = abs(left) // abs(right)
+    return quotient if (left < 0) == (right < 0) else -quotient
+
+
+def _literal(value) -> Any:
+    """Return a new literal node holding a Python value."""
+    if type(value) is bool:
+        return BoolLiteral(value)
+    if type(value) is int:
+        return IntLiteral(_wrap_int(value))
+    if type(value) is float:
+        return FloatLiteral(value)
+    return StringLiteral(value)
+
+
+def _copy(literal) -> Any:
+    """Return a fresh node for a scalar literal substituted at a use site."""
+    return type(literal)(literal.value)
+
+
+class ConstantFolder(StaticChecker):
+    """
+    Folds constant expressions of a checked program.
+
+    The pass reuses the checker's class table, scopes and constant-ness
+    rules (_is_constant_expr for final locals, _is_constant_expr_for_attr
+    for final attributes). A final with a constant initializer that folds
+    to a scalar literal is propagated to its uses, converted to the
+    declared type, so `final float f := 1;` is used as 1.0. Arithmetic
+    follows the JVM: int results wrap to 32 bits, float results are
+    rounded to single precision, `/` always divides floats and `\\` and
+    `%` round toward zero. Divisions by zero and float overflows are left
+    for run time.
+
+    Attributes:
+        folded (int): Number of expressions replaced by a literal
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.folded = 0
+        # id of an attribute's class table entry -> (class name, Attribute node)
+        self._attr_decls: Dict[int, Tuple[str, Attribute]] = {}
+        # id of an attribute's class table entry -> folded value or None
+        self._attr_values: Dict[int, Any] = {}
+
+    def fold_program(self, ast: Program) -> Program:
+        """
+        Fold the constants of a program in place.
+
+        Args:
+            ast: Program that passed check_program
+
+        Returns:
+            The same Program node
+        """
+        self._build_class_table(ast)
+        self._add_io_class()
+        for cls in ast.class_decls or []:
+            attributes = self.class_table[cls.name]["attributes"]
+            for member in cls.members or []:
+                if type(member) is AttributeDecl:
+                    for attr in member.attributes or []:
+                        self._attr_decls[id(attributes[attr.name])] = (cls.name, attr)
+
+        self.enter_scope()
+        self.scopes[-1]["io"] = {"type": class_type("IO"), "isFinal": True}
+        for cls in ast.class_decls or []:
+            self._fold_class(cls)
+        self.exit_scope()
+        return ast
+
+    # Declarations
+
+    def _fold_class(self, ast: ClassDecl):
+        self.current_class = ast.name
+        self.enter_scope()
+        self.scopes[-1]["this"] = {"type": class_type(ast.name), "isFinal": True}
+        for member in ast.members or []:
+            member_type = type(member)
+            if member_type is AttributeDecl:
+                self._fold_attribute_decl(member)
+            elif member_type in (MethodDecl, ConstructorDecl, DestructorDecl):
+                self.enter_scope()
+                for param in getattr(member, "params", None) or []:
+                    self.scopes[-1][param.name] = {"type": param.param_type, "isFinal": False}
+                if member.body:
+                    self._fold_block_content(member.body)
+                self.exit_scope()
+        self.exit_scope()
+        self.current_class = None
+
+    def _fold_attribute_decl(self, ast: AttributeDecl):
+        attributes = self.class_table[self.current_class]["attributes"]
+        for attr in ast.attributes or []:
+            if attr.init_value is None:
+                continue
+            if ast.is_final:
+                self._attr_value(attributes[attr.name])
+            else:
+                attr.init_value = self._fold(attr.init_value)
+
+    def _attr_value(self, info: Dict[str, Any]):
+        """Return the folded literal of a final attribute, or None if it is not constant."""
+        key = id(info)
+        if key in self._attr_values:
+            return self._attr_values[key]
+        self._attr_values[key] = None  # stops initializers that refer to each other
+        if key not in self._attr_decls or not info.get("isFinal"):
+            return None
+        owner, attr = self._attr_decls[key]
+        if attr.init_value is None:
+            return None
+
+        # Initializers are folded in their own class, outside any method
+        saved = self.current_class, self.scopes
+        class_scope = {"this": {"type": class_type(owner), "isFinal": True}}
+        self.current_class, self.scopes = owner, self.scopes[:1] + [class_scope]
+        try:
+            constant = self._is_constant_expr_for_attr(attr.init_value, info["type"])
+            attr.init_value = self._fold(attr.init_value)
+        finally:
+            self.current_class, self.scopes = saved
+        value = self._as_declared(attr.init_value, info["type"]) if constant else None
+        attr.init_value = value or attr.init_value
+        self._attr_values[key] = value
+        return value
+
+    def _as_declared(self, literal, declared_type):
+        """Return a scalar literal converted to a declared primitive type, or None."""
+        if type(literal) not in _SCALAR_LITERALS or type(declared_type) is not PrimitiveType:
+            return None
+        if declared_type.type_name == "float" and type(literal) is IntLiteral:
+            return FloatLiteral(_to_float(literal.value))
+        if declared_type.type_name == "int" and type(literal) is not IntLiteral:
+            return None
+        return literal
+
+    def _fold_block_content(self, ast: BlockStatement):
+        for decl in ast.var_decls or []:
+            self._fold_variable_decl(decl)
+        for stmt in ast.statements or []:
+            self._fold_statement(stmt)
+
+    def _fold_variable_decl(self, ast: VariableDecl):
+        for var in ast.variables or []:
+            value = None
+            if var.init_value is not None:
+                constant = ast.is_final and self._is_constant_expr(var.init_value)
+                var.init_value = self._fold(var.init_value)
+                if constant:
+                    value = self._as_declared(var.init_value, ast.var_type)
+                    var.init_value = value or var.init_value
+            entry = {"type": ast.var_type, "isFinal": ast.is_final}
+            if value is not None:
+                entry["value"] = value
+            self.scopes[-1][var.name] = entry
+
+    # Statements
+
+    def _fold_statement(self, ast):
+        stmt_type = type(ast)
+        if stmt_type is BlockStatement:
+            self.enter_scope()
+            self._fold_block_content(ast)
+            self.exit_scope()
+        elif stmt_type is AssignmentStatement:
+            if type(ast.lhs) is PostfixLHS:
+                self._fold_postfix_ops(ast.lhs.postfix_expr)
+            ast.rhs = self._fold(ast.rhs)
+        elif stmt_type is IfStatement:
+            ast.condition = self._fold(ast.condition)
+            self._fold_statement(ast.then_stmt)
+            self._fold_statement(ast.else_stmt)
+        elif stmt_type is ForStatement:
+            ast.start_expr = self._fold(ast.start_expr)
+            ast.end_expr = self._fold(ast.end_expr)
+            self._fold_statement(ast.body)
+        elif stmt_type is ReturnStatement:
+            ast.value = self._fold(ast.value)
+        elif stmt_type is MethodInvocationStatement:
+            ast.method_call = self._fold(ast.method_call)
+
+    # Expressions
+
+    def _fold(self, expr):
+        """Return the folded form of an expression, rewriting its children in place."""
+        expr_type = type(expr)
+        if expr_type is BinaryOp:
+            return self._fold_binary_op(expr)
+        if expr_type is UnaryOp:
+            return self._fold_unary_op(expr)
+        if expr_type is ParenthesizedExpression:
+            expr.expr = self._fold(expr.expr)
+            return self._replaced(expr.expr) if type(expr.expr) in _SCALAR_LITERALS else expr
+        if expr_type is Identifier:
+            return self._fold_identifier(expr)
+        if expr_type is PostfixExpression:
+            return self._fold_postfix_expression(expr)
+        if expr_type is ObjectCreation:
+            expr.args = [self._fold(arg) for arg in expr.args or []]
+        elif expr_type is ArrayLiteral:
+            expr.value = [self._fold(element) for element in expr.value or []]
+        return expr
+
+    def _replaced(self, literal):
+        self.folded += 1
+        return literal
+
+    def _fold_identifier(self, expr: Identifier):
+        info = self.lookup(expr.name)
+        if info is not None:
+            value = info.get("value")
+        elif self.current_class:
+            attr = self.lookup_in_class_attrs(self.current_class, expr.name)
+            value = self._attr_value(attr) if attr and attr.get("isFinal") else None
+        else:
+            value = None
+        return self._replaced(_copy(value)) if value is not None else expr
+
+    def _fold_postfix_ops(self, expr: PostfixExpression):
+        for op in expr.postfix_ops or []:
+            if type(op) is MethodCall:
+                op.args = [self._fold(arg) for arg in op.args or []]
+            elif type(op) is ArrayAccess:
+                op.index = self._fold(op.index)
+
+    def _fold_postfix_expression(self, expr: PostfixExpression):
+        self._fold_postfix_ops(expr)
+        ops = expr.postfix_ops or []
+        if len(ops) != 1 or type(ops[0]) is not MemberAccess:
+            expr.primary = self._fold(expr.primary)
+            return expr
+
+        # this.x and ClassName.x of final attributes with constant initializers
+        primary = expr.primary
+        owner = None
+        if type(primary) is Identifier:
+            if self.lookup(primary.name) is None and primary.name in self.class_table:
+                owner = primary.name
+        elif type(primary) is ThisExpression:
+            owner = self.current_class
+        if owner is not None:
+            attr = self.lookup_in_class_attrs(owner, ops[0].member_name)
+            value = self._attr_value(attr) if attr and attr.get("isFinal") else None
+            if value is not None:
+                return self._replaced(_copy(value))
+        expr.primary = self._fold(primary)
+        return expr
+
+    def _fold_unary_op(self, expr: UnaryOp):
+        expr.operand = operand = self._fold(expr.operand)
+        operand_type = type(operand)
+        op = expr.operator
+        if op == "+" and operand_type in _NUMERIC_LITERALS:
+            return self._replaced(operand)
+        if op == "-" and operand_type is IntLiteral:
+            return self._replaced(IntLiteral(_wrap_int(-operand.value)))
+        if op == "-" and operand_type is FloatLiteral:
+            return self._replaced(FloatLiteral(-operand.value))
+        if op == "!" and operand_type is BoolLiteral:
+            return self._replaced(BoolLiteral(not operand.value))
+        return expr
+
+    def _fold_binary_op(self, expr: BinaryOp):
+        expr.left = left = self._fold(expr.left)
+        op = expr.operator
+        # A decided left operand of && or || is all short-circuit evaluation looks at
+        if op in ("&&", "||") and type(left) is BoolLiteral:
+            if left.value == (op == "||"):
+                return self._replaced(left)
+            return self._replaced(self._fold(expr.right))
+        expr.right = right = self._fold(expr.right)
+        if type(left) not in _SCALAR_LITERALS or type(right) not in _SCALAR_LITERALS:
+            return expr
+        try:
+            value = self._evaluate(op, left, right)
+        except (OverflowError, ZeroDivisionError):
+            value = None
+        return self._replaced(_literal(value)) if value is not None else expr
+
+    def _evaluate(self, op: str, left, right) -> Optional[Any]:
+        """Return the value of `left op right` on two literals, or None if it cannot be folded."""
+        left_type, right_type = type(left), type(right)
+        lv, rv = left.value, right.value
+        if left_type in _NUMERIC_LITERALS and right_type in _NUMERIC_LITERALS:
+            if left_type is IntLiteral and right_type is IntLiteral:
+                if op == "+":
+                    return _wrap_int(lv + rv)
+                if op == "-":
+                    return _wrap_int(lv - rv)
+                if op == "*":
+                    return _wrap_int(lv * rv)
+                if op == "\\":
+                    return _wrap_int(_int_div(lv, rv))
+                if op == "%":
+                    return lv - rv * _int_div(lv, rv)
+                if op == "==":
+                    return lv == rv
+                if op == "!=":
+                    return lv != rv
+                if op == "<":
+                    return lv < rv
+                if op == "<=":
+                    return lv <= rv
+                if op == ">":
+                    return lv > rv
+                if op == ">=":
+                    return lv >= rv
+            # int operands are promoted to float before float arithmetic
+            lf, rf = _to_float(lv), _to_float(rv)
+            if op == "+":
+                return _to_float(lf + rf)
+            if op == "-":
+                return _to_float(lf - rf)
+            if op == "*":
+                return _to_float(lf * rf)
+            if op == "/":
+                return _to_float(lf / rf)
+            if op == "<":
+                return lf < rf
+            if op == "<=":
+                return lf <= rf
+            if op == ">":
+                return lf > rf
+            if op == ">=":
+                return lf >= rf
+            return None
+        if left_type is BoolLiteral and right_type is BoolLiteral:
+            if op == "&&":
+                return lv and rv
+            if op == "||":
+                return lv or rv
+            if op == "==":
+                return lv == rv
+            if op == "!=":
+                return lv != rv
+            return None
+        if left_type is StringLiteral and right_type is StringLiteral and op == "^":
+            return lv + rv
+        return None
@@ -22,6 +22,10 @@ from .static_error import (
     MustInLoop, IllegalConstantExpression, IllegalArrayLiteral,
     IllegalMemberAccess, NoEntryPoint
 )
+from ..utils.type_pool import (
+    intern_type, primitive_type, class_type, array_type,
+    INT_TYPE, FLOAT_TYPE, BOOL_TYPE, STRING_TYPE, VOID_TYPE
+)
 
 
 class ErrorType:
@@ -29,6 +33,7 @@ class ErrorType:
         return "<ErrorType>"
 
 ERROR = ErrorType()
+BOOL_ALIAS_TYPE = primitive_type("bool")
 
 
 class StaticChecker(ASTVisitor):
@@ -44,6 +49,10 @@ class StaticChecker(ASTVisitor):
         self.has_main: bool = False
         self.in_constructor: bool = False
         self.currently_initializing_attr: Optional[str] = None
+        # Flattened views of class_table: visible members and ancestors per class
+        self.flat_attributes: Dict[str, Dict[str, Any]] = {}
+        self.flat_methods: Dict[str, Dict[str, Any]] = {}
+        self.ancestors: Dict[str, frozenset] = {}
 
     def check_program(self, ast: Program, require_main: bool = True):
         self._build_class_table(ast)
@@ -58,19 +67,20 @@ class StaticChecker(ASTVisitor):
                 "parent": None,
                 "attributes": {},
                 "methods": {
-                    "writeInt": {"returnType": PrimitiveType("void"), "params": [Parameter(PrimitiveType("int"), "x")], "isStatic": True},
-                    "writeFloat": {"returnType": PrimitiveType("void"), "params": [Parameter(PrimitiveType("float"), "x")], "isStatic": True},
-                    "writeString": {"returnType": PrimitiveType("void"), "params": [Parameter(PrimitiveType("string"), "x")], "isStatic": True},
-                    "writeBool": {"returnType": PrimitiveType("void"), "params": [Parameter(PrimitiveType("boolean"), "x")], "isStatic": True},
-                    "writeIntLn": {"returnType": PrimitiveType("void"), "params": [Parameter(PrimitiveType("int"), "x")], "isStatic": True},
-                    "writeFloatLn": {"returnType": PrimitiveType("void"), "params": [Parameter(PrimitiveType("float"), "x")], "isStatic": True},
-                    "writeStringLn": {"returnType": PrimitiveType("void"), "params": [Parameter(PrimitiveType("string"), "x")], "isStatic": True},
-                    "writeBoolLn": {"returnType": PrimitiveType("void"), "params": [Parameter(PrimitiveType("boolean"), "x")], "isStatic": True},
-                    "writeStrLn": {"returnType": PrimitiveType("void"), "params": [Parameter(PrimitiveType("string"), "x")], "isStatic": True},
-                    "readInt": {"returnType": PrimitiveType("int"), "params": [], "isStatic": True},
-                    "readFloat": {"returnType": PrimitiveType("float"), "params": [], "isStatic": True},
-                    "readString": {"returnType": PrimitiveType("void"), "params": [], "isStatic": True},
-                    "readBool": {"returnType": PrimitiveType("boolean"), "params": [], "isStatic": True},
+                    "writeInt": {"returnType": VOID_TYPE, "params": [Parameter(INT_TYPE, "x")], "isStatic": True},
+                    "writeFloat": {"returnType": VOID_TYPE, "params": [Parameter(FLOAT_TYPE, "x")], "isStatic": True},
+                    "writeString": {"returnType": VOID_TYPE, "params": [Parameter(STRING_TYPE, "x")], "isStatic": True},
+                    "writeBool": {"returnType": VOID_TYPE, "params": [Parameter(BOOL_TYPE, "x")], "isStatic": True},
+                    "writeIntLn": {"returnType": VOID_TYPE, "params": [Parameter(INT_TYPE, "x")], "isStatic": True},
+                    "writeFloatLn": {"returnType": VOID_TYPE, "params": [Parameter(FLOAT_TYPE, "x")], "isStatic": True},
+                    "writeStringLn": {"returnType": VOID_TYPE, "params": [Parameter(STRING_TYPE, "x")], "isStatic": True},
+                    "writeBoolLn": {"returnType": VOID_TYPE, "params": [Parameter(BOOL_TYPE, "x")], "isStatic": True},
+                    "writeStrLn": {"returnType": VOID_TYPE, "params": [Parameter(STRING_TYPE, "x")], "isStatic": True},
+                    "readInt": {"returnType": INT_TYPE, "params": [], "isStatic": True},
+                    "readFloat": {"returnType": FLOAT_TYPE, "params": [], "isStatic": True},
+                    "readString": {"returnType": VOID_TYPE, "params": [], "isStatic": True},
+                    "readBool": {"returnType": BOOL_TYPE, "params": [], "isStatic": True},
+                    "flush": {"returnType": VOID_TYPE, "params": [], "isStatic": True},
                 },
                 "constructors": {},
                 "destructor": None
@@ -141,7 +151,7 @@ class StaticChecker(ASTVisitor):
                                 raise Redeclared("Attribute", aname)
                         declared_names.add(aname)
                         info["attributes"][aname] = {
-                            "type": m.attr_type,
+                            "type": intern_type(m.attr_type),
                             "isFinal": m.is_final,
                             "isStatic": m.is_static,
                             "init": a.init_value,
@@ -154,7 +164,7 @@ class StaticChecker(ASTVisitor):
                         raise Redeclared("Method", mname)
                     declared_names.add(mname)
                     info["methods"][mname] = {
-                        "returnType": m.return_type,
+                        "returnType": intern_type(m.return_type),
                         "params": m.params or [],
                         "isStatic": m.is_static,
                     }
@@ -178,7 +188,7 @@ class StaticChecker(ASTVisitor):
                         has_class_name_constructor = True
                     
                     info["constructors"][sig] = {
-                        "returnType": ClassType(cname),
+                        "returnType": class_type(cname),
                         "params": m.params or [],
                         "isStatic": False
                     }
@@ -201,6 +211,76 @@ class StaticChecker(ASTVisitor):
                         "isStatic": False
                     }
 
+        self._flatten_class_table()
+
+    def _flatten_class_table(self):
+        self.flat_attributes = {}
+        self.flat_methods = {}
+        self.ancestors = {}
+        for name in self.class_table:
+            if name not in self.ancestors:
+                self._flatten_class(name)
+
+    def _flatten_class(self, name: str):
+        # Walk up to the first class that is already flattened
+        chain = []
+        seen = set()
+        cur = name
+        while cur and cur not in self.ancestors and cur not in seen:
+            seen.add(cur)
+            chain.append(cur)
+            clsinfo = self.class_table.get(cur)
+            cur = clsinfo["parent"] if clsinfo else None
+
+        if cur in seen:
+            # Inheritance cycle: the parent walk of each class on it stops at
+            # a different place, so only the class asked for is stored
+            ancestors, attributes, methods = frozenset(), {}, {}
+            for c in reversed(self._parent_walk(name)):
+                ancestors, attributes, methods = self._extend_flat(c, ancestors, attributes, methods)
+            self._store_flat(name, ancestors, attributes, methods)
+            return
+
+        if cur:
+            ancestors = self.ancestors[cur]
+            attributes = self.flat_attributes[cur]
+            methods = self.flat_methods[cur]
+        else:
+            ancestors, attributes, methods = frozenset(), {}, {}
+        for c in reversed(chain):
+            ancestors, attributes, methods = self._extend_flat(c, ancestors, attributes, methods)
+            self._store_flat(c, ancestors, attributes, methods)
+
+    def _parent_walk(self, name: str) -> List[str]:
+        walk = []
+        cur = name
+        while cur and cur not in walk:
+            walk.append(cur)
+            clsinfo = self.class_table.get(cur)
+            cur = clsinfo["parent"] if clsinfo else None
+        return walk
+
+    def _extend_flat(self, name: str, ancestors, attributes, methods):
+        clsinfo = self.class_table.get(name)
+        if clsinfo:
+            # Members of the subclass hide inherited ones with the same name
+            attributes = {**attributes, **clsinfo["attributes"]}
+            methods = {**methods, **clsinfo["methods"]}
+        return ancestors | {name}, attributes, methods
+
+    def _store_flat(self, name: str, ancestors, attributes, methods):
+        if name in self.class_table:
+            self.ancestors[name] = ancestors
+            self.flat_attributes[name] = attributes
+            self.flat_methods[name] = methods
+
+    def _flat_entry(self, table: Dict[str, Dict[str, Any]], class_name: str):
+        entry = table.get(class_name)
+        if entry is None and class_name in self.class_table:
+            self._flatten_class(class_name)
+            entry = table.get(class_name)
+        return entry
+
     def enter_scope(self):
         self.scopes.append({})
 
@@ -217,14 +297,14 @@ class StaticChecker(ASTVisitor):
                 raise Redeclared("Constant", name)
             else:
                 raise Redeclared("Variable", name)
-        cur[name] = {"type": typeNode, "isFinal": isFinal, "initialized": initialized}
+        cur[name] = {"type": intern_type(typeNode), "isFinal": isFinal, "initialized": initialized}
 
     def declare_param(self, name: str, typeNode: Any):
         if not self.scopes:
             self.enter_scope()
         if name in self.scopes[-1]:
             raise Redeclared("Parameter", name)
-        self.scopes[-1][name] = {"type": typeNode, "isFinal": False, "initialized": True}
+        self.scopes[-1][name] = {"type": intern_type(typeNode), "isFinal": False, "initialized": True}
 
     def lookup(self, name: str):
         for scope in reversed(self.scopes):
@@ -240,26 +320,12 @@ class StaticChecker(ASTVisitor):
     def lookup_in_class_attrs(self, class_name: str, attr: str):
         if self.currently_initializing_attr == attr and class_name == self.current_class:
             return None
-        cur = class_name
-        visited = set()
-        while cur and cur not in visited:
-            visited.add(cur)
-            clsinfo = self.class_table.get(cur)
-            if clsinfo and attr in clsinfo["attributes"]:
-                return clsinfo["attributes"][attr]
-            cur = clsinfo["parent"] if clsinfo else None
-        return None
+        attributes = self._flat_entry(self.flat_attributes, class_name)
+        return attributes.get(attr) if attributes else None
 
     def lookup_method(self, class_name: str, method_name: str):
-        cur = class_name
-        visited = set()
-        while cur and cur not in visited:
-            visited.add(cur)
-            clsinfo = self.class_table.get(cur)
-            if clsinfo and method_name in clsinfo["methods"]:
-                return clsinfo["methods"][method_name]
-            cur = clsinfo["parent"] if clsinfo else None
-        return None
+        methods = self._flat_entry(self.flat_methods, class_name)
+        return methods.get(method_name) if methods else None
     
     def lookup_constructor(self, class_name: str, arg_types: List):
         clsinfo = self.class_table.get(class_name)
@@ -282,16 +348,17 @@ class StaticChecker(ASTVisitor):
         return str(t)
 
     def is_int_type(self, t: Any) -> bool:
-        return isinstance(t, PrimitiveType) and t.type_name.lower() == "int"
+        return intern_type(t) is INT_TYPE
 
     def is_float_type(self, t: Any) -> bool:
-        return isinstance(t, PrimitiveType) and t.type_name.lower() == "float"
+        return intern_type(t) is FLOAT_TYPE
 
     def is_bool_type(self, t: Any) -> bool:
-        return isinstance(t, PrimitiveType) and t.type_name.lower() in ("boolean", "bool")
+        t = intern_type(t)
+        return t is BOOL_TYPE or t is BOOL_ALIAS_TYPE
 
     def is_string_type(self, t: Any) -> bool:
-        return isinstance(t, PrimitiveType) and t.type_name.lower() == "string"
+        return intern_type(t) is STRING_TYPE
 
     def is_array_type(self, t: Any) -> bool:
         return isinstance(t, ArrayType)
@@ -316,31 +383,17 @@ class StaticChecker(ASTVisitor):
     def same_type(self, a: Any, b: Any) -> bool:
         if a is ERROR or b is ERROR:
             return False
-        if a is None and b is None:
-            return True
-        if type(a) != type(b):
-            return False
-        if isinstance(a, PrimitiveType):
-            return a.type_name.lower() == b.type_name.lower()
-        if isinstance(a, ClassType):
-            return a.class_name == b.class_name
-        if isinstance(a, ArrayType):
-            return self.same_type(a.element_type, b.element_type) and a.size == b.size
-        return str(a) == str(b)
+        # Canonical types are unique, so structural equality is identity
+        return intern_type(a) is intern_type(b)
 
     def is_subtype(self, sub: Any, sup: Any) -> bool:
         if isinstance(sub, ClassType) and isinstance(sup, ClassType):
             sub_name = sub.class_name
             sup_name = sup.class_name
-            cur = sub_name
-            visited = set()
-            while cur and cur not in visited:
-                if cur == sup_name:
-                    return True
-                visited.add(cur)
-                clsinfo = self.class_table.get(cur)
-                cur = clsinfo["parent"] if clsinfo else None
-            return False
+            if sub_name == sup_name:
+                return True
+            ancestors = self._flat_entry(self.ancestors, sub_name)
+            return bool(ancestors) and sup_name in ancestors
         return False
 
     def compatible(self, expected: Any, actual: Any) -> bool:
@@ -461,19 +514,24 @@ class StaticChecker(ASTVisitor):
             return False
         return False
 
+    @classmethod
+    def handler_name(cls, node_cls: type) -> str:
+        return f'visit{node_cls.__name__}'
+
     def visit(self, node):
         if node is None:
             return None
-        method_name = f'visit{node.__class__.__name__}'
-        visitor = getattr(self, method_name, None)
-        if visitor:
-            return visitor(node)
-        return None
+        visitor = self._dispatch_table.get(node.__class__)
+        if visitor is None:
+            visitor = self.dispatch(node.__class__)
+            if visitor is None:
+                return None
+        return visitor(self, node)
 
     def visitProgram(self, ast: Program):
         self.visited_classes = set()
         self.enter_scope()
-        self.scopes[-1]["io"] = {"type": ClassType("IO"), "isFinal": True, "initialized": True}
+        self.scopes[-1]["io"] = {"type": class_type("IO"), "isFinal": True, "initialized": True}
         for cls in ast.class_decls or []:
             if cls:
                 self.visitClassDecl(cls)
@@ -482,7 +540,7 @@ class StaticChecker(ASTVisitor):
     def visitClassDecl(self, ast: ClassDecl):
         self.current_class = ast.name
         self.enter_scope()
-        self.scopes[-1]["this"] = {"type": ClassType(ast.name), "isFinal": True}
+        self.scopes[-1]["this"] = {"type": class_type(ast.name), "isFinal": True}
         for mem in ast.members or []:
             if mem:
                 self.visit(mem)
@@ -537,7 +595,7 @@ class StaticChecker(ASTVisitor):
             raise TypeMismatchInStatement(ast)
         
         self.current_method = ast.name
-        self.current_method_return_type = ClassType(self.current_class) if self.current_class else None
+        self.current_method_return_type = class_type(self.current_class) if self.current_class else None
         self.in_constructor = True
         self.enter_scope()
         
@@ -779,43 +837,43 @@ class StaticChecker(ASTVisitor):
         
         if op in ['+', '-', '*', '\\', '%']:
             if self.is_int_type(left_t) and self.is_int_type(right_t):
-                return PrimitiveType("int")
+                return INT_TYPE
             if ((self.is_int_type(left_t) or self.is_float_type(left_t)) and
                 (self.is_int_type(right_t) or self.is_float_type(right_t))):
-                return PrimitiveType("float")
+                return FLOAT_TYPE
             raise TypeMismatchInExpression(ast)
         
         if op == '/':
             if ((self.is_int_type(left_t) or self.is_float_type(left_t)) and
                 (self.is_int_type(right_t) or self.is_float_type(right_t))):
-                return PrimitiveType("float")
+                return FLOAT_TYPE
             raise TypeMismatchInExpression(ast)
         
         if op in ['<', '>', '<=', '>=']:
             if ((self.is_int_type(left_t) or self.is_float_type(left_t)) and
                 (self.is_int_type(right_t) or self.is_float_type(right_t))):
-                return PrimitiveType("boolean")
+                return BOOL_TYPE
             raise TypeMismatchInExpression(ast)
         
         if op in ['==', '!=']:
             if self.is_int_type(left_t) and self.is_int_type(right_t):
-                return PrimitiveType("boolean")
+                return BOOL_TYPE
             if self.is_bool_type(left_t) and self.is_bool_type(right_t):
-                return PrimitiveType("boolean")
+                return BOOL_TYPE
             if isinstance(ast.left, NilLiteral) or isinstance(ast.right, NilLiteral):
                 if (self.is_class_type(left_t) or self.is_array_type(left_t) or 
                     self.is_class_type(right_t) or self.is_array_type(right_t)):
-                    return PrimitiveType("boolean")
+                    return BOOL_TYPE
             raise TypeMismatchInExpression(ast)
         
         if op in ['&&', '||']:
             if self.is_bool_type(left_t) and self.is_bool_type(right_t):
-                return PrimitiveType("boolean")
+                return BOOL_TYPE
             raise TypeMismatchInExpression(ast)
         
         if op == '^':
             if self.is_string_type(left_t) and self.is_string_type(right_t):
-                return PrimitiveType("string")
+                return STRING_TYPE
             raise TypeMismatchInExpression(ast)
         
         raise TypeMismatchInExpression(ast)
@@ -831,7 +889,7 @@ class StaticChecker(ASTVisitor):
             raise TypeMismatchInExpression(ast)
         if op == '!':
             if self.is_bool_type(operand_t):
-                return PrimitiveType("boolean")
+                return BOOL_TYPE
             raise TypeMismatchInExpression(ast)
         raise TypeMismatchInExpression(ast)
 
@@ -935,7 +993,7 @@ class StaticChecker(ASTVisitor):
     def visitIdentifier(self, ast: Identifier):
         name = ast.name
         if name in self.class_table:
-            return ClassType(name)
+            return class_type(name)
         info = self.lookup(name)
         if info:
             var_type = info["type"]
@@ -957,7 +1015,7 @@ class StaticChecker(ASTVisitor):
         if self.current_method_is_static:
             raise IllegalMemberAccess(ast)
         if self.current_class:
-            return ClassType(self.current_class)
+            return class_type(self.current_class)
         return ERROR
 
     def visitObjectCreation(self, ast: ObjectCreation):
@@ -987,30 +1045,30 @@ class StaticChecker(ASTVisitor):
                             break
                 if not found and constructors:
                     raise TypeMismatchInExpression(ast)
-        return ClassType(class_name)
+        return class_type(class_name)
 
     def visitParenthesizedExpression(self, ast: ParenthesizedExpression):
         return self.visit(ast.expr)
 
     def visitIntLiteral(self, ast: IntLiteral):
-        return PrimitiveType("int")
+        return INT_TYPE
 
     def visitFloatLiteral(self, ast: FloatLiteral):
-        return PrimitiveType("float")
+        return FLOAT_TYPE
 
     def visitBoolLiteral(self, ast: BoolLiteral):
-        return PrimitiveType("boolean")
+        return BOOL_TYPE
 
     def visitStringLiteral(self, ast: StringLiteral):
-        return PrimitiveType("string")
+        return STRING_TYPE
 
     def visitNilLiteral(self, ast: NilLiteral):
-        return ClassType("nil")
+        return class_type("nil")
 
     def visitArrayLiteral(self, ast: ArrayLiteral):
         elements = ast.value or []
         if not elements:
-            return ArrayType(PrimitiveType("void"), 0)
+            return array_type(VOID_TYPE, 0)
         
         first_type = self.visit(elements[0])
         if first_type is ERROR:
@@ -1023,7 +1081,7 @@ class StaticChecker(ASTVisitor):
             if not self.same_type(first_type, elem_type):
                 raise IllegalArrayLiteral(ast)
         
-        return ArrayType(first_type, len(elements))
+        return array_type(first_type, len(elements))
 
     def visitMemberAccess(self, ast: MemberAccess):
         return None
@@ -6,6 +6,19 @@ visitor patterns, and other common functionality.
 
 from .nodes import *
 from .visitor import ASTVisitor
+from .type_pool import (
+    intern_type,
+    is_canonical,
+    primitive_type,
+    class_type,
+    array_type,
+    reference_type,
+    INT_TYPE,
+    FLOAT_TYPE,
+    BOOL_TYPE,
+    STRING_TYPE,
+    VOID_TYPE,
+)
 
 __all__ = [
     # Base classes
@@ -70,4 +83,16 @@ __all__ = [
     "NilLiteral",
     # Visitor
     "ASTVisitor",
+    # Canonical types
+    "intern_type",
+    "is_canonical",
+    "primitive_type",
+    "class_type",
+    "array_type",
+    "reference_type",
+    "INT_TYPE",
+    "FLOAT_TYPE",
+    "BOOL_TYPE",
+    "STRING_TYPE",
+    "VOID_TYPE",
 ]
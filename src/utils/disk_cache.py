@@ -0,0 +1,113 @@
+"""
+On-disk cache for OPLang programming language.
+This module contains a small content-addressed file cache with
+size-bounded least-recently-used eviction, shared by the compiler caches.
+"""
+
+import os
+import tempfile
+from typing import Optional
+
+
+class DiskCache:
+    """
+    Content-addressed byte store kept in a single directory.
+
+    Each entry is one file named after its key. Reading an entry refreshes
+    its modification time, and writing an entry evicts the least recently
+    used files until the directory fits in max_bytes.
+
+    Attributes:
+        directory (str): Directory holding the cache entries
+        max_bytes (int): Upper bound for the total size of all entries
+        suffix (str): File name suffix of the entries
+    """
+
+    def __init__(self, directory: str, max_bytes: int, suffix: str = ".bin"):
+        """
+        Initialize DiskCache.
+
+        Args:
+            directory: Directory holding the cache entries, created if missing
+            max_bytes: Upper bound for the total size of all entries
+            suffix: File name suffix of the entries
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + self.suffix)
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Return the bytes stored under key, or None on a miss.
+
+        Args:
+            key: Hex digest identifying the entry
+
+        Returns:
+            Stored bytes or None
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)
+        except OSError:
+            return None
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """
+        Store bytes under key and evict old entries if over the size bound.
+
+        Entries larger than the whole cache are not stored.
+
+        Args:
+            key: Hex digest identifying the entry
+            data: Bytes to store
+        """
+        if len(data) > self.max_bytes:
+            return
+        # Write to a temporary file first so readers never see partial data
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove least recently used entries until the size bound holds."""
+        entries = []
+        total = 0
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(self.suffix):
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total += stat.st_size
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+    def clear(self) -> None:
+        """Remove every entry of the cache."""
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(self.suffix):
+                os.remove(entry.path)
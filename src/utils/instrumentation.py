@@ -0,0 +1,155 @@
+"""
+Compiler instrumentation for OPLang programming language.
+This module contains the Instrumentation class that measures the stages of
+a compilation (wall time, CPU time, peak Python memory and item counts),
+reports them as JSON, and can dump a cProfile profile of every stage.
+"""
+
+import cProfile
+import json
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+
+class StageReport:
+    """
+    Measurements of one stage.
+
+    Attributes:
+        name (str): Stage name, e.g. "lex" or "codegen"
+        wall (float): Elapsed wall clock seconds
+        cpu (float): CPU seconds of this process (a JVM stage runs in
+            another process and shows up in wall only)
+        peak_memory (int or None): Peak bytes allocated by Python during the
+            stage on top of what was allocated before it, None if memory was
+            not traced
+        counts (dict): Items the stage handled, e.g. {"tokens": 1200}
+        profile (str or None): Path of the stage's cProfile dump
+    """
+
+    __slots__ = ("name", "wall", "cpu", "peak_memory", "counts", "profile")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.peak_memory: Optional[int] = None
+        self.counts: Dict[str, int] = {}
+        self.profile: Optional[str] = None
+
+    def rate(self, count: str) -> Optional[float]:
+        """Return counts[count] per wall second, None if unknown."""
+        value = self.counts.get(count)
+        if value is None or self.wall <= 0:
+            return None
+        return value / self.wall
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "wall": self.wall,
+            "cpu": self.cpu,
+            "peak_memory": self.peak_memory,
+            "counts": dict(self.counts),
+            "profile": self.profile,
+        }
+
+
+class Instrumentation:
+    """
+    Records a StageReport for every stage run under stage().
+
+    Tracing memory makes Python code noticeably slower, so a run meant to
+    compare times should pass trace_memory=False. Stages are not meant to
+    be nested.
+
+    Attributes:
+        stages (list): StageReport of every finished stage, in order
+        meta (dict): Free-form run information included in the report
+        trace_memory (bool): Measure peak memory with tracemalloc
+        profile_dir (str or None): Directory for cProfile dumps, named
+            <index>-<stage>.prof, or None for no profiling
+    """
+
+    def __init__(self, trace_memory: bool = True, profile_dir: Optional[str] = None):
+        self.stages: List[StageReport] = []
+        self.meta: Dict[str, Any] = {}
+        self.trace_memory = trace_memory
+        self.profile_dir = profile_dir
+        if profile_dir:
+            os.makedirs(profile_dir, exist_ok=True)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageReport]:
+        """
+        Measure the body of a with block as stage name.
+
+        The yielded StageReport can be given counts inside or after the
+        block. It is recorded even if the block raises.
+        """
+        report = StageReport(name)
+        started_tracing = False
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracing = True
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+        profiler = cProfile.Profile() if self.profile_dir else None
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        if profiler is not None:
+            profiler.enable()
+        try:
+            yield report
+        finally:
+            if profiler is not None:
+                profiler.disable()
+            report.wall = time.perf_counter() - wall_start
+            report.cpu = time.process_time() - cpu_start
+            if self.trace_memory:
+                report.peak_memory = max(0, tracemalloc.get_traced_memory()[1] - baseline)
+                if started_tracing:
+                    tracemalloc.stop()
+            if profiler is not None:
+                report.profile = os.path.join(self.profile_dir, f"{len(self.stages)}-{name}.prof")
+                profiler.dump_stats(report.profile)
+            self.stages.append(report)
+
+    def __getitem__(self, name: str) -> StageReport:
+        """Return the last StageReport named name."""
+        for report in reversed(self.stages):
+            if report.name == name:
+                return report
+        raise KeyError(name)
+
+    def report(self) -> Dict[str, Any]:
+        """Return all measurements as a JSON-serializable dict."""
+        return {
+            "meta": dict(self.meta),
+            "stages": [report.to_dict() for report in self.stages],
+            "total": {
+                "wall": sum(report.wall for report in self.stages),
+                "cpu": sum(report.cpu for report in self.stages),
+            },
+        }
+
+    def to_json(self, path: Optional[str] = None, indent: int = 2) -> str:
+        """Return the report as JSON, also writing it to path if one is given."""
+        text = json.dumps(self.report(), indent=indent)
+        if path is not None:
+            with open(path, "w") as f:
+                f.write(text + "\n")
+        return text
+
+    def table(self) -> str:
+        """Return the measurements as a plain text table."""
+        lines = [f"{'stage':<10}{'wall (s)':>10}{'cpu (s)':>10}{'peak KiB':>10}  counts"]
+        for report in self.stages:
+            peak = "-" if report.peak_memory is None else f"{report.peak_memory / 1024:.0f}"
+            counts = ", ".join(f"{key}={value}" for key, value in report.counts.items())
+            lines.append(f"{report.name:<10}{report.wall:>10.4f}{report.cpu:>10.4f}{peak:>10}  {counts}")
+        return "\n".join(lines)
@@ -0,0 +1,56 @@
+"""
+Parsing front end for OPLang programming language.
+This module drives the generated ANTLR parser with the two-stage
+SLL-then-LL strategy recommended by the ANTLR runtime.
+"""
+
+from antlr4 import CommonTokenStream
+from antlr4.atn.PredictionMode import PredictionMode
+from antlr4.error.ErrorStrategy import BailErrorStrategy
+from antlr4.error.Errors import ParseCancellationException
+
+
+def parse_two_stage(parser, rule: str = "program"):
+    """
+    Parse the parser's input starting from the given rule.
+
+    The first attempt uses SLL prediction with a bail-out error strategy and
+    no error listeners, which is much cheaper than full LL prediction. If
+    that attempt fails for any reason, the input is parsed again from the
+    start with the parser's original prediction mode, error strategy and
+    error listeners, so errors are reported exactly as a plain LL parse
+    would report them.
+
+    Args:
+        parser: Generated ANTLR parser bound to a token stream
+        rule: Name of the entry rule to invoke
+
+    Returns:
+        The parse tree produced by the entry rule
+    """
+    interp = parser._interp
+    prediction_mode = interp.predictionMode
+    error_handler = parser._errHandler
+    listeners = list(parser._listeners)
+
+    interp.predictionMode = PredictionMode.SLL
+    parser._errHandler = BailErrorStrategy()
+    parser.removeErrorListeners()
+    try:
+        return getattr(parser, rule)()
+    except ParseCancellationException:
+        # Tokens fetched so far are buffered and can simply be replayed
+        parser.reset()
+    except Exception:
+        # Lexer errors leave the lexer past the offending token, so the
+        # token stream has to be rebuilt from the beginning of the input
+        lexer = parser.getTokenStream().tokenSource
+        lexer.reset()
+        parser.setTokenStream(CommonTokenStream(lexer))
+    finally:
+        interp.predictionMode = prediction_mode
+        parser._errHandler = error_handler
+        for listener in listeners:
+            parser.addErrorListener(listener)
+
+    return getattr(parser, rule)()
@@ -0,0 +1,603 @@
+"""
+Synthetic program generator for OPLang programming language.
+This module contains the ProgramGenerator class that builds random but
+well-typed OPLang programs of a chosen size, for scaling benchmarks of the
+lexer, parser, static checker and code generator, and the SourcePrinter
+that turns an AST back into OPLang source.
+
+The generator builds the AST first and prints it, so the source and the AST
+always agree: parsing the source gives back the same AST. Every compound
+operand is parenthesized, which keeps the printed program independent of
+operator precedence.
+"""
+
+import random
+from typing import Dict, List, Optional, Tuple
+
+from .nodes import *
+from .visitor import BaseVisitor
+
+PRIMITIVES = ("int", "float", "boolean", "string")
+
+WRITE_METHODS = {
+    "int": "writeIntLn",
+    "float": "writeFloatLn",
+    "boolean": "writeBoolLn",
+    "string": "writeStrLn",
+}
+
+WORDS = ("alpha", "beta", "gamma", "delta", "omega", "sigma", "kappa", "zeta")
+
+
+class SourcePrinter(BaseVisitor):
+    """
+    Prints an AST as OPLang source, one statement or member per line.
+
+    Expressions are printed exactly as they are nested, without adding or
+    dropping parentheses, so the AST has to keep ParenthesizedExpression
+    nodes where the precedence requires them (as the parser produces it).
+    """
+
+    INDENT = "    "
+
+    def __init__(self):
+        self.lines: List[str] = []
+        self.depth = 0
+
+    def print_program(self, node: ASTNode) -> str:
+        """Return the source of a Program, class member or statement."""
+        self.lines = []
+        self.depth = 0
+        self.visit(node)
+        return "\n".join(self.lines) + "\n"
+
+    def line(self, text: str):
+        self.lines.append(self.INDENT * self.depth + text)
+
+    def expr(self, node: Expr) -> str:
+        return self.visit(node)
+
+    def args(self, args: List[Expr]) -> str:
+        return ", ".join(self.visit(arg) for arg in args)
+
+    def visit_program(self, node: "Program", o=None):
+        for index, class_decl in enumerate(node.class_decls):
+            if index:
+                self.lines.append("")
+            self.visit(class_decl)
+
+    def visit_class_decl(self, node: "ClassDecl", o=None):
+        extends = f" extends {node.superclass}" if node.superclass else ""
+        self.line(f"class {node.name}{extends} {{")
+        self.depth += 1
+        for member in node.members:
+            self.visit(member)
+        self.depth -= 1
+        self.line("}")
+
+    def visit_attribute_decl(self, node: "AttributeDecl", o=None):
+        modifiers = ("static " if node.is_static else "") + ("final " if node.is_final else "")
+        attributes = ", ".join(self.visit(attr) for attr in node.attributes)
+        self.line(f"{modifiers}{self.visit(node.attr_type)} {attributes};")
+
+    def visit_attribute(self, node: "Attribute", o=None):
+        if node.init_value is None:
+            return node.name
+        return f"{node.name} := {self.expr(node.init_value)}"
+
+    def params(self, params: List["Parameter"]) -> str:
+        return "; ".join(self.visit(param) for param in params)
+
+    def body(self, header: str, body: "BlockStatement"):
+        self.line(header + " {")
+        self.block_contents(body)
+        self.line("}")
+
+    def visit_method_decl(self, node: "MethodDecl", o=None):
+        static = "static " if node.is_static else ""
+        self.body(f"{static}{self.visit(node.return_type)} {node.name}({self.params(node.params)})", node.body)
+
+    def visit_constructor_decl(self, node: "ConstructorDecl", o=None):
+        self.body(f"{node.name}({self.params(node.params)})", node.body)
+
+    def visit_destructor_decl(self, node: "DestructorDecl", o=None):
+        self.body(f"~{node.name}()", node.body)
+
+    def visit_parameter(self, node: "Parameter", o=None):
+        return f"{self.visit(node.param_type)} {node.name}"
+
+    def visit_primitive_type(self, node: "PrimitiveType", o=None):
+        return node.type_name
+
+    def visit_array_type(self, node: "ArrayType", o=None):
+        return f"{self.visit(node.element_type)}[{node.size}]"
+
+    def visit_class_type(self, node: "ClassType", o=None):
+        return node.class_name
+
+    def visit_reference_type(self, node: "ReferenceType", o=None):
+        return f"{self.visit(node.referenced_type)} &"
+
+    def block_contents(self, node: "BlockStatement"):
+        self.depth += 1
+        for var_decl in node.var_decls:
+            self.visit(var_decl)
+        for stmt in node.statements:
+            self.visit(stmt)
+        self.depth -= 1
+
+    def visit_block_statement(self, node: "BlockStatement", o=None):
+        self.line("{")
+        self.block_contents(node)
+        self.line("}")
+
+    def visit_variable_decl(self, node: "VariableDecl", o=None):
+        final = "final " if node.is_final else ""
+        variables = ", ".join(self.visit(var) for var in node.variables)
+        self.line(f"{final}{self.visit(node.var_type)} {variables};")
+
+    def visit_variable(self, node: "Variable", o=None):
+        if node.init_value is None:
+            return node.name
+        return f"{node.name} := {self.expr(node.init_value)}"
+
+    def nested(self, header: str, stmt: "Statement"):
+        """Print header followed by stmt, a block opening on the same line."""
+        if type(stmt) is BlockStatement:
+            self.body(header, stmt)
+        else:
+            self.line(header)
+            self.depth += 1
+            self.visit(stmt)
+            self.depth -= 1
+
+    def visit_assignment_statement(self, node: "AssignmentStatement", o=None):
+        self.line(f"{self.visit(node.lhs)} := {self.expr(node.rhs)};")
+
+    def visit_if_statement(self, node: "IfStatement", o=None):
+        self.nested(f"if {self.expr(node.condition)} then", node.then_stmt)
+        if node.else_stmt is not None:
+            self.nested("else", node.else_stmt)
+
+    def visit_for_statement(self, node: "ForStatement", o=None):
+        header = (
+            f"for {node.variable} := {self.expr(node.start_expr)} {node.direction} "
+            f"{self.expr(node.end_expr)} do"
+        )
+        self.nested(header, node.body)
+
+    def visit_break_statement(self, node: "BreakStatement", o=None):
+        self.line("break;")
+
+    def visit_continue_statement(self, node: "ContinueStatement", o=None):
+        self.line("continue;")
+
+    def visit_return_statement(self, node: "ReturnStatement", o=None):
+        self.line(f"return {self.expr(node.value)};")
+
+    def visit_method_invocation_statement(self, node: "MethodInvocationStatement", o=None):
+        self.line(f"{self.expr(node.method_call)};")
+
+    def visit_id_lhs(self, node: "IdLHS", o=None):
+        return node.name
+
+    def visit_postfix_lhs(self, node: "PostfixLHS", o=None):
+        return self.expr(node.postfix_expr)
+
+    def visit_binary_op(self, node: "BinaryOp", o=None):
+        return f"{self.expr(node.left)} {node.operator} {self.expr(node.right)}"
+
+    def visit_unary_op(self, node: "UnaryOp", o=None):
+        return f"{node.operator}{self.expr(node.operand)}"
+
+    def visit_postfix_expression(self, node: "PostfixExpression", o=None):
+        return self.expr(node.primary) + "".join(self.visit(op) for op in node.postfix_ops)
+
+    def visit_method_call(self, node: "MethodCall", o=None):
+        return f".{node.method_name}({self.args(node.args)})"
+
+    def visit_member_access(self, node: "MemberAccess", o=None):
+        return f".{node.member_name}"
+
+    def visit_array_access(self, node: "ArrayAccess", o=None):
+        return f"[{self.expr(node.index)}]"
+
+    def visit_object_creation(self, node: "ObjectCreation", o=None):
+        return f"new {node.class_name}({self.args(node.args)})"
+
+    def visit_identifier(self, node: "Identifier", o=None):
+        return node.name
+
+    def visit_this_expression(self, node: "ThisExpression", o=None):
+        return "this"
+
+    def visit_parenthesized_expression(self, node: "ParenthesizedExpression", o=None):
+        return f"({self.expr(node.expr)})"
+
+    def visit_int_literal(self, node: "IntLiteral", o=None):
+        return str(node.value)
+
+    def visit_float_literal(self, node: "FloatLiteral", o=None):
+        return repr(float(node.value))
+
+    def visit_bool_literal(self, node: "BoolLiteral", o=None):
+        return "true" if node.value else "false"
+
+    def visit_string_literal(self, node: "StringLiteral", o=None):
+        # The value keeps its escape sequences, as the lexer produces it
+        return f'"{node.value}"'
+
+    def visit_array_literal(self, node: "ArrayLiteral", o=None):
+        return "{" + self.args(node.value) + "}"
+
+    def visit_nil_literal(self, node: "NilLiteral", o=None):
+        return "nil"
+
+
+def to_source(node: ASTNode) -> str:
+    """Return node printed as OPLang source."""
+    return SourcePrinter().print_program(node)
+
+
+class _ClassInfo:
+    """Members of a generated class, its inherited ones included."""
+
+    def __init__(self, name: str, parent: Optional["_ClassInfo"]):
+        self.name = name
+        self.parent = parent
+        # type name -> attribute names
+        self.fields: Dict[str, List[str]] = {t: list(parent.fields[t]) if parent else [] for t in PRIMITIVES}
+        # (name, param types, return type) of callable methods, in declaration order
+        self.methods: List[Tuple[str, List[str], str]] = list(parent.methods) if parent else []
+
+
+class _Scope:
+    """Names visible in the method being generated."""
+
+    def __init__(self, info: Optional[_ClassInfo], objects: List[Tuple[str, _ClassInfo]]):
+        self.info = info  # None in the static main
+        self.objects = objects  # (local name, class) of object locals
+        self.readable: Dict[str, List[str]] = {t: [] for t in PRIMITIVES}
+        self.assignable: Dict[str, List[str]] = {t: [] for t in PRIMITIVES}
+        self.arrays: List[Tuple[str, int]] = []
+        self.loop_vars: List[str] = []  # declared loop variables
+        self.active_loops: List[str] = []  # loop variables of the enclosing loops
+        self.bound: Optional[str] = None  # final int holding the last loop index
+        self.call_made = False
+
+
+class ProgramGenerator:
+    """
+    Generates random, type-correct OPLang programs.
+
+    Classes are C0, C1, ... declared parents first; consecutive classes form
+    inheritance chains of inheritance_depth extends links. Every class gets
+    two attributes (int and float) and methods_per_class instance methods
+    with up to two primitive parameters and a random return type. A last
+    class Main holds the static main, which creates an object of every class
+    and calls all of its methods.
+
+    Method bodies declare one local of each primitive type, an int array
+    literal of array_size elements, loop variables and an object, followed
+    by statements_per_method statements (nested ones included): assignments,
+    array and attribute stores, io writes, if/else, for loops with break and
+    continue, and calls. A method calls at most one earlier method, never
+    from inside a loop, so there is no recursion and every call chain is
+    short. Calls are statements only and their results unused. Strings are
+    only assigned values built from literals, so loops cannot grow them.
+
+    The same parameters and seed always give the same program.
+
+    Attributes:
+        classes (int): Number of classes besides Main
+        inheritance_depth (int): Length of the extends chains, 0 for none
+        methods_per_class (int): Methods declared by each class
+        statements_per_method (int): Statements in each method body
+        expression_depth (int): Maximum operator nesting of an expression
+        array_size (int): Elements of the array literals, 0 for no arrays
+        seed (int): Random seed
+    """
+
+    def __init__(
+        self,
+        classes: int = 4,
+        inheritance_depth: int = 2,
+        methods_per_class: int = 4,
+        statements_per_method: int = 8,
+        expression_depth: int = 3,
+        array_size: int = 4,
+        seed: int = 0,
+    ):
+        self.classes = classes
+        self.inheritance_depth = inheritance_depth
+        self.methods_per_class = methods_per_class
+        self.statements_per_method = statements_per_method
+        self.expression_depth = expression_depth
+        self.array_size = array_size
+        self.seed = seed
+        self.rng = random.Random(seed)
+        # Last index of the loops, those over arrays cover all their elements
+        self.last = max(array_size, 4) - 1
+
+    def generate(self) -> Tuple[str, Program]:
+        """
+        Build a program.
+
+        Returns:
+            (source, ast): the program text and its Program AST
+        """
+        ast = self.program()
+        return to_source(ast), ast
+
+    def program(self) -> Program:
+        """Build a program and return its AST."""
+        self.rng = random.Random(self.seed)
+        infos: List[_ClassInfo] = []
+        class_decls = []
+        for index in range(self.classes):
+            linked = self.inheritance_depth > 0 and index % (self.inheritance_depth + 1) != 0
+            info = _ClassInfo(f"C{index}", infos[-1] if linked else None)
+            class_decls.append(self.class_decl(info, infos))
+            infos.append(info)
+        class_decls.append(self.main_class(infos))
+        return Program(class_decls)
+
+    # ========================================================================
+    # Declarations
+    # ========================================================================
+
+    def class_decl(self, info: _ClassInfo, earlier: List[_ClassInfo]) -> ClassDecl:
+        prefix = info.name.lower()
+        members: List[ClassMember] = [
+            AttributeDecl(False, False, PrimitiveType("int"), [Attribute(f"{prefix}_count", self.int_literal())]),
+            AttributeDecl(False, False, PrimitiveType("float"), [Attribute(f"{prefix}_scale", self.float_literal())]),
+        ]
+        info.fields["int"].append(f"{prefix}_count")
+        info.fields["float"].append(f"{prefix}_scale")
+        for index in range(self.methods_per_class):
+            return_type = self.rng.choice(PRIMITIVES + ("void",))
+            param_types = [self.rng.choice(PRIMITIVES) for _ in range(self.rng.randint(0, 2))]
+            name = f"{prefix}_m{index}"
+            # Objects of the class itself or of one declared before it
+            target = self.rng.choice(earlier + [info])
+            scope = _Scope(info, [("other", target)])
+            params = [Parameter(PrimitiveType(t), f"p{k}") for k, t in enumerate(param_types)]
+            for param in params:
+                scope.readable[param.param_type.type_name].append(param.name)
+            body = self.method_body(scope, return_type, [VariableDecl(
+                False, ClassType(target.name), [Variable("other", ObjectCreation(target.name, []))]
+            )])
+            members.append(MethodDecl(False, PrimitiveType(return_type), name, params, body))
+            info.methods.append((name, param_types, return_type))
+        return ClassDecl(info.name, info.parent.name if info.parent else None, members)
+
+    def main_class(self, infos: List[_ClassInfo]) -> ClassDecl:
+        objects = [(f"o{index}", info) for index, info in enumerate(infos)]
+        scope = _Scope(None, objects)
+        object_decls = [
+            VariableDecl(False, ClassType(info.name), [Variable(name, ObjectCreation(info.name, []))])
+            for name, info in objects
+        ]
+        body = self.method_body(scope, "void", object_decls)
+        for name, info in objects:
+            for method, param_types, _ in info.methods:
+                body.statements.append(self.call(Identifier(name), method, param_types, scope))
+        main = MethodDecl(True, PrimitiveType("void"), "main", [], body)
+        return ClassDecl("Main", None, [main])
+
+    def method_body(self, scope: _Scope, return_type: str, extra_decls: List[VariableDecl]) -> BlockStatement:
+        size = self.array_size
+        var_decls = [
+            VariableDecl(True, PrimitiveType("int"), [Variable("last", IntLiteral(self.last))]),
+            VariableDecl(False, PrimitiveType("int"), [
+                Variable("x0", self.int_literal()), Variable("x1", self.int_literal())
+            ]),
+            VariableDecl(False, PrimitiveType("float"), [Variable("y0", self.float_literal())]),
+            VariableDecl(False, PrimitiveType("boolean"), [Variable("b0", BoolLiteral(self.rng.random() < 0.5))]),
+            VariableDecl(False, PrimitiveType("string"), [Variable("s0", self.string_literal())]),
+        ]
+        scope.bound = "last"
+        scope.readable["int"].append("last")
+        for t, names in (("int", ["x0", "x1"]), ("float", ["y0"]), ("boolean", ["b0"]), ("string", ["s0"])):
+            scope.readable[t].extend(names)
+            scope.assignable[t].extend(names)
+        if size > 0:
+            elements = [self.int_literal() for _ in range(size)]
+            var_decls.append(VariableDecl(False, ArrayType(PrimitiveType("int"), size), [
+                Variable("a0", ArrayLiteral(elements))
+            ]))
+            scope.arrays.append(("a0", size))
+        scope.loop_vars = ["i0", "i1"]
+        var_decls.append(VariableDecl(False, PrimitiveType("int"), [Variable(name) for name in scope.loop_vars]))
+        var_decls.extend(extra_decls)
+
+        statements = self.statements(scope, self.statements_per_method, 0)
+        if return_type != "void":
+            statements.append(ReturnStatement(self.expression(return_type, scope, self.expression_depth)))
+        return BlockStatement(var_decls, statements)
+
+    # ========================================================================
+    # Statements
+    # ========================================================================
+
+    def statements(self, scope: _Scope, budget: int, nesting: int) -> List[Statement]:
+        """Return statements totalling budget, nested ones included."""
+        statements = []
+        while budget > 0:
+            stmt, used = self.statement(scope, budget, nesting)
+            statements.append(stmt)
+            budget -= used
+        return statements
+
+    def statement(self, scope: _Scope, budget: int, nesting: int) -> Tuple[Statement, int]:
+        """Return a statement and the number of statements it holds."""
+        kinds = ["assign", "assign", "write", "write"]
+        if scope.arrays:
+            kinds.append("store")
+        if scope.info is not None:
+            kinds.append("field")
+        if budget >= 2 and nesting < 2:
+            kinds += ["if", "if"]
+            if len(scope.active_loops) < len(scope.loop_vars):
+                kinds += ["for", "for"]
+        if scope.active_loops:
+            kinds.append("jump")
+        elif not scope.call_made and (scope.objects or scope.info is not None and scope.info.methods):
+            kinds.append("call")
+        kind = self.rng.choice(kinds)
+        depth = self.expression_depth
+
+        if kind == "assign":
+            t = self.rng.choice([t for t in PRIMITIVES if scope.assignable[t]])
+            name = self.rng.choice(scope.assignable[t])
+            if t == "string":
+                return AssignmentStatement(IdLHS(name), self.expression(t, _Scope(None, []), depth)), 1
+            return AssignmentStatement(IdLHS(name), self.expression(t, scope, depth)), 1
+        if kind == "store":
+            name, size = self.rng.choice(scope.arrays)
+            lhs = PostfixLHS(PostfixExpression(Identifier(name), [ArrayAccess(self.index(scope, size))]))
+            return AssignmentStatement(lhs, self.expression("int", scope, depth)), 1
+        if kind == "field":
+            t = self.rng.choice([t for t in PRIMITIVES if scope.info.fields[t]])
+            name = self.rng.choice(scope.info.fields[t])
+            lhs = PostfixLHS(PostfixExpression(ThisExpression(), [MemberAccess(name)]))
+            return AssignmentStatement(lhs, self.expression(t, scope, depth)), 1
+        if kind == "write":
+            t = self.rng.choice(PRIMITIVES)
+            call = MethodCall(WRITE_METHODS[t], [self.expression(t, scope, depth)])
+            return MethodInvocationStatement(PostfixExpression(Identifier("io"), [call])), 1
+        if kind == "jump":
+            jump = BreakStatement() if self.rng.random() < 0.5 else ContinueStatement()
+            return IfStatement(self.condition(scope), jump), 2
+        if kind == "call":
+            scope.call_made = True
+            if scope.info is not None and scope.info.methods and (not scope.objects or self.rng.random() < 0.5):
+                method, param_types, _ = self.rng.choice(scope.info.methods)
+                return self.call(ThisExpression(), method, param_types, scope), 1
+            name, info = self.rng.choice(scope.objects)
+            if not info.methods:
+                return self.statement(scope, budget, nesting)
+            method, param_types, _ = self.rng.choice(info.methods)
+            return self.call(Identifier(name), method, param_types, scope), 1
+        if kind == "if":
+            inner = budget - 1
+            then_size = inner if inner < 2 or self.rng.random() < 0.5 else self.rng.randint(1, inner - 1)
+            then_stmt = self.block(scope, then_size, nesting + 1)
+            else_stmt = self.block(scope, inner - then_size, nesting + 1) if inner > then_size else None
+            return IfStatement(self.condition(scope), then_stmt, else_stmt), 1 + inner
+        # for
+        inner = self.rng.randint(1, min(budget - 1, 4))
+        var = scope.loop_vars[len(scope.active_loops)]
+        scope.active_loops.append(var)
+        body = self.block(scope, inner, nesting + 1)
+        scope.active_loops.pop()
+        if self.rng.random() < 0.5:
+            loop = ForStatement(var, IntLiteral(0), "to", Identifier(scope.bound), body)
+        else:
+            loop = ForStatement(var, Identifier(scope.bound), "downto", IntLiteral(0), body)
+        return loop, 1 + inner
+
+    def block(self, scope: _Scope, budget: int, nesting: int) -> BlockStatement:
+        return BlockStatement([], self.statements(scope, budget, nesting))
+
+    def call(self, receiver: Expr, method: str, param_types: List[str], scope: _Scope) -> MethodInvocationStatement:
+        depth = max(self.expression_depth - 1, 0)
+        args = [self.expression(t, scope, depth) for t in param_types]
+        return MethodInvocationStatement(PostfixExpression(receiver, [MethodCall(method, args)]))
+
+    def index(self, scope: _Scope, size: int) -> Expr:
+        """Return an index within an array of size elements."""
+        # Loop variables run from 0 to last
+        if scope.active_loops and size > self.last and self.rng.random() < 0.7:
+            return Identifier(self.rng.choice(scope.active_loops))
+        return IntLiteral(self.rng.randrange(size))
+
+    # ========================================================================
+    # Expressions
+    # ========================================================================
+
+    def condition(self, scope: _Scope) -> Expr:
+        """Return a boolean expression that is not parenthesized as a whole."""
+        return self.expression("boolean", scope, max(self.expression_depth, 1))
+
+    def expression(self, t: str, scope: _Scope, depth: int) -> Expr:
+        """Return an expression of type t nesting at most depth operators."""
+        if depth <= 0 or self.rng.random() < 0.2:
+            return self.leaf(t, scope)
+        return getattr(self, f"{t}_operation")(scope, depth - 1)
+
+    def operand(self, t: str, scope: _Scope, depth: int) -> Expr:
+        expr = self.expression(t, scope, depth)
+        if isinstance(expr, (BinaryOp, UnaryOp)):
+            return ParenthesizedExpression(expr)
+        return expr
+
+    def int_operation(self, scope: _Scope, depth: int) -> Expr:
+        roll = self.rng.random()
+        if roll < 0.1:
+            return UnaryOp("-", self.operand("int", scope, depth))
+        if roll < 0.25:
+            # Divisor known to be non-zero
+            return BinaryOp(self.operand("int", scope, depth), "%", IntLiteral(self.rng.randint(1, 9)))
+        operator = self.rng.choice(("+", "-", "*"))
+        return BinaryOp(self.operand("int", scope, depth), operator, self.operand("int", scope, depth))
+
+    def float_operation(self, scope: _Scope, depth: int) -> Expr:
+        roll = self.rng.random()
+        if roll < 0.1:
+            return UnaryOp("-", self.operand("float", scope, depth))
+        if roll < 0.25:
+            return BinaryOp(self.operand("float", scope, depth), "/", FloatLiteral(self.rng.randint(1, 16) / 4))
+        left = self.operand("float", scope, depth)
+        right = self.operand("int" if self.rng.random() < 0.3 else "float", scope, depth)
+        if self.rng.random() < 0.5:
+            left, right = right, left
+        return BinaryOp(left, self.rng.choice(("+", "-", "*")), right)
+
+    def boolean_operation(self, scope: _Scope, depth: int) -> Expr:
+        roll = self.rng.random()
+        if roll < 0.1:
+            return UnaryOp("!", self.operand("boolean", scope, depth))
+        if roll < 0.4:
+            operator = self.rng.choice(("&&", "||"))
+            return BinaryOp(self.operand("boolean", scope, depth), operator, self.operand("boolean", scope, depth))
+        if roll < 0.55:
+            t = self.rng.choice(("int", "boolean"))
+            operator = self.rng.choice(("==", "!="))
+            return BinaryOp(self.operand(t, scope, depth), operator, self.operand(t, scope, depth))
+        t = self.rng.choice(("int", "float"))
+        operator = self.rng.choice(("<", "<=", ">", ">="))
+        return BinaryOp(self.operand(t, scope, depth), operator, self.operand(t, scope, depth))
+
+    def string_operation(self, scope: _Scope, depth: int) -> Expr:
+        return BinaryOp(self.operand("string", scope, depth), "^", self.operand("string", scope, depth))
+
+    def leaf(self, t: str, scope: _Scope) -> Expr:
+        choices = [None] * 2  # a literal
+        choices += [Identifier(name) for name in scope.readable[t]]
+        choices += [Identifier(name) for name in scope.active_loops if t == "int"]
+        if scope.info is not None:
+            choices += [
+                PostfixExpression(ThisExpression(), [MemberAccess(name)]) for name in scope.info.fields[t]
+            ]
+        if t == "int":
+            choices += [
+                PostfixExpression(Identifier(name), [ArrayAccess(self.index(scope, size))])
+                for name, size in scope.arrays
+            ]
+        leaf = self.rng.choice(choices)
+        if leaf is None:
+            return getattr(self, f"{t}_literal")()
+        return leaf
+
+    def int_literal(self) -> IntLiteral:
+        return IntLiteral(self.rng.randint(0, 99))
+
+    def float_literal(self) -> FloatLiteral:
+        return FloatLiteral(self.rng.randint(0, 400) / 4)
+
+    def boolean_literal(self) -> BoolLiteral:
+        return BoolLiteral(self.rng.random() < 0.5)
+
+    def string_literal(self) -> StringLiteral:
+        return StringLiteral(self.rng.choice(WORDS))
@@ -0,0 +1,98 @@
+"""
+Canonical type objects for OPLang programming language.
+This module interns type nodes so that every distinct type has exactly one
+shared instance, which lets the checker and the code generator compare
+types by identity.
+"""
+
+from typing import Any, Dict, Set, Tuple
+
+from .nodes import ArrayType, ClassType, PrimitiveType, ReferenceType, Type
+
+_primitives: Dict[str, PrimitiveType] = {}
+_classes: Dict[str, ClassType] = {}
+_arrays: Dict[Tuple[Type, Any], ArrayType] = {}
+_references: Dict[Type, ReferenceType] = {}
+# ids of canonical instances; they are never freed, so ids stay valid
+_canonical: Set[int] = set()
+
+
+def _register(t: Type) -> Type:
+    _canonical.add(id(t))
+    return t
+
+
+def primitive_type(name: str) -> PrimitiveType:
+    """Return the canonical primitive type with the given (case-insensitive) name."""
+    name = name.lower()
+    t = _primitives.get(name)
+    if t is None:
+        t = _primitives[name] = _register(PrimitiveType(name))
+    return t
+
+
+def class_type(name: str) -> ClassType:
+    """Return the canonical class type with the given name."""
+    t = _classes.get(name)
+    if t is None:
+        t = _classes[name] = _register(ClassType(name))
+    return t
+
+
+def array_type(element_type: Type, size: Any) -> ArrayType:
+    """Return the canonical array type of size elements of element_type."""
+    element_type = intern_type(element_type)
+    key = (element_type, size)
+    t = _arrays.get(key)
+    if t is None:
+        t = _arrays[key] = _register(ArrayType(element_type, size))
+    return t
+
+
+def reference_type(referenced_type: Type) -> ReferenceType:
+    """Return the canonical reference type to referenced_type."""
+    referenced_type = intern_type(referenced_type)
+    t = _references.get(referenced_type)
+    if t is None:
+        t = _references[referenced_type] = _register(ReferenceType(referenced_type))
+    return t
+
+
+def is_canonical(t: Any) -> bool:
+    """Check if t is a canonical type instance."""
+    return id(t) in _canonical
+
+
+def intern_type(t: Any) -> Any:
+    """
+    Return the canonical instance equal to the type t.
+
+    Canonical instances are returned unchanged. Values that are not type
+    nodes of a known kind (None, error markers, function types) are
+    returned as they are.
+
+    Args:
+        t: Type node to intern
+
+    Returns:
+        Canonical type instance
+    """
+    if id(t) in _canonical:
+        return t
+    cls = type(t)
+    if cls is PrimitiveType:
+        return primitive_type(t.type_name)
+    if cls is ClassType:
+        return class_type(t.class_name)
+    if cls is ArrayType:
+        return array_type(t.element_type, t.size)
+    if cls is ReferenceType:
+        return reference_type(t.referenced_type)
+    return t
+
+
+INT_TYPE = primitive_type("int")
+FLOAT_TYPE = primitive_type("float")
+BOOL_TYPE = primitive_type("boolean")
+STRING_TYPE = primitive_type("string")
+VOID_TYPE = primitive_type("void")
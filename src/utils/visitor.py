@@ -4,19 +4,80 @@ This module defines the abstract visitor pattern interface for traversing
 and processing AST nodes.
 """
 
+import re
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
 
 if TYPE_CHECKING:
     from .nodes import *
 
 
+# Word boundaries of a CamelCase class name, keeping acronyms such as LHS whole
+_WORD_BOUNDARY = re.compile(r"(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])")
+
+
+def snake_case(name: str) -> str:
+    """
+    Return a CamelCase name in snake_case.
+
+    Args:
+        name: Class name such as "BinaryOp" or "IdLHS"
+
+    Returns:
+        Name such as "binary_op" or "id_lhs"
+    """
+    return _WORD_BOUNDARY.sub("_", name).lower()
+
+
 class ASTVisitor(ABC):
-    """Abstract base class for AST visitors."""
+    """
+    Abstract base class for AST visitors.
+
+    Each visitor class keeps a dispatch table from node class to handler
+    function, filled the first time a node class is visited, so visiting a
+    node costs a single dictionary lookup instead of a double dispatch
+    through accept(). The handler of a node class is the method named
+    visit_<snake_case(class name)>, the one its accept() calls.
+    """
+
+    _dispatch_table: Dict[type, Optional[Callable]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._dispatch_table = {}
+
+    @classmethod
+    def handler_name(cls, node_cls: type) -> str:
+        """Return the name of the method handling node_cls."""
+        return f"visit_{snake_case(node_cls.__name__)}"
+
+    @classmethod
+    def dispatch(cls, node_cls: type) -> Optional[Callable]:
+        """
+        Return the handler function for node_cls, or None if there is none.
+
+        Args:
+            node_cls: AST node class
+
+        Returns:
+            Unbound handler function taken from the visitor class
+        """
+        table = cls._dispatch_table
+        if node_cls in table:
+            return table[node_cls]
+        name = cls.handler_name(node_cls)
+        handler = getattr(cls, name, None) if name else None
+        table[node_cls] = handler
+        return handler
 
     def visit(self, node: "ASTNode", o: Any = None):
         """Visit a node using the visitor pattern."""
-        return node.accept(self, o)
+        handler = self._dispatch_table.get(node.__class__)
+        if handler is None:
+            handler = self.dispatch(node.__class__)
+            if handler is None:
+                return node.accept(self, o)
+        return handler(self, node, o)
 
     # Program and class declarations
     @abstractmethod
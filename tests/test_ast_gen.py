@@ -1,4 +1,7 @@
+import tempfile
+
 from tests.utils import ASTGenerator
+from src.astgen.ast_cache import ASTCache
 
 
 def test_001():
@@ -126,3 +129,29 @@ def test_011():
     }"""
     expected = "Program([ClassDecl(TestClass, [DestructorDecl(~TestClass(), BlockStatement(vars=[VariableDecl(PrimitiveType(int), [Variable(x = IntLiteral(0))])], stmts=[]))])])"
     assert str(ASTGenerator(source).generate()) == expected
+
+
+def test_012():
+    """Test AST cache hit returns the same AST without lexing or parsing"""
+    source = """class TestClass {
+        static final int N := 2 * 3;
+        int sum(int a, b; float & c) {
+            int i, s := 0;
+            for i := 1 to N do s := s + i;
+            return s;
+        }
+    }"""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cold = ASTGenerator(source, cache=ASTCache(cache_dir)).generate()
+        warm_gen = ASTGenerator(source, cache=ASTCache(cache_dir))
+        warm = warm_gen.generate()
+        assert warm_gen.token_stream.tokens == []
+        assert str(warm) == str(cold) == str(ASTGenerator(source).generate())
+
+
+def test_013():
+    """Test a statement that does not end in a method call is a syntax error"""
+    for stmt, expected in (("a.b;", "Error on line 1 col 37: ;"), ("foo(1);", "Error on line 1 col 40: ;"),
+                           ("(x) := 1;", "Error on line 1 col 38: :=")):
+        source = "class Main { static void main() { %s } }" % stmt
+        assert str(ASTGenerator(source).generate()) == "AST Generation Error: " + expected
@@ -88,3 +88,63 @@ class Test {
 """
     expected = "IllegalArrayLiteral(ArrayLiteral({BoolLiteral(True), IntLiteral(42)}))"
     assert Checker(source).check_from_source() == expected
+
+def test_008():
+    """Test array and class types compare structurally across declarations"""
+    source = """
+class Shape {
+    int[3] sizes := {1, 2, 3};
+}
+class Test {
+    static void main() {
+        int[3] a := {4, 5, 6};
+        int[3] b;
+        Shape s := new Shape();
+        Shape t;
+        b := a;
+        t := s;
+        a := s.sizes;
+    }
+}
+"""
+    expected = "Static checking passed"
+    assert Checker(source).check_from_source() == expected
+
+def test_009():
+    """Test array size mismatch is still a type mismatch"""
+    source = """
+class Test {
+    static void main() {
+        int[3] a := {4, 5, 6};
+        int[2] b;
+        b := a;
+    }
+}
+"""
+    expected = "TypeMismatchInStatement(AssignmentStatement(IdLHS(b) := Identifier(a)))"
+    assert Checker(source).check_from_source() == expected
+
+def test_010():
+    """Test inherited members resolve through several levels and subclasses assign to ancestors"""
+    source = """
+class A {
+    int base := 1;
+    int get(int k) { return k + this.base; }
+}
+class B extends A { float scale := 2.0; }
+class C extends B {
+    int get(int k) { return k; }
+}
+class Test {
+    static void main() {
+        C c := new C();
+        A a;
+        int r;
+        a := c;
+        r := c.get(3) + c.base;
+        r := a.get(r);
+    }
+}
+"""
+    expected = "Static checking passed"
+    assert Checker(source).check_from_source() == expected
@@ -0,0 +1,46 @@
+"""
+Test cases for the class file cache of the OPLang code generator.
+"""
+
+import tempfile
+
+from src.codegen.class_cache import ClassCache
+from src.utils.nodes import *
+from utils import CodeGenerator
+
+
+def program(value):
+    """Return a program printing value"""
+    return Program([
+        ClassDecl("Main", None, [
+            MethodDecl(True, PrimitiveType("void"), "main", [], BlockStatement([], [
+                MethodInvocationStatement(PostfixExpression(Identifier("io"), [
+                    MethodCall("writeInt", [IntLiteral(value)])
+                ]))
+            ]))
+        ])
+    ])
+
+
+def test_001():
+    """Test class cache hit skips code generation and runs the cached classes"""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = ClassCache(cache_dir)
+        assert CodeGenerator(cache=cache).generate_and_run(program(7)) == "7"
+        warm = program(7)
+        warm.class_decls[0].line = 42  # positions are not part of the key
+        assert CodeGenerator(cache=cache).generate_and_run(warm) == "7"
+        assert CodeGenerator(cache=cache).generate_and_run(program(8)) == "8"
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"]) == (1, 2)
+        assert stats["bytes_saved"] > 0
+
+
+def test_002():
+    """Test programs compiled with and without folding are cached apart"""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = ClassCache(cache_dir)
+        assert CodeGenerator(cache=cache, fold=False).generate_and_run(program(7)) == "7"
+        assert CodeGenerator(cache=cache, fold=True).generate_and_run(program(7)) == "7"
+        assert cache.stats()["hits"] == 0
+        assert cache.key(program(7), {"fold": False}) != cache.key(program(7), {"fold": True})
@@ -0,0 +1,30 @@
+"""
+Test cases for the Code buffer of the OPLang code generator.
+"""
+
+from src.codegen.utils import Code
+
+
+def test_001():
+    """Test += leaves other names for the buffer unchanged"""
+    left = Code("iload_1\n", "iload_2\n")
+    code = left
+    code += "iadd\n"
+    assert str(left) == "iload_1\niload_2\n"
+    assert str(code) == "iload_1\niload_2\niadd\n"
+
+
+def test_002():
+    """Test a large buffer joined by reference is not changed by a later +="""
+    part = Code(*[f"iconst_{i % 6}\n" for i in range(20)])
+    whole = Code("aload_0\n") + part
+    part += "pop\n"
+    assert str(whole) == "aload_0\n" + "".join(f"iconst_{i % 6}\n" for i in range(20))
+    assert str(part).endswith("iconst_1\npop\n")
+
+
+def test_003():
+    """Test strings and buffers join in order, with str on either side"""
+    code = "a\n" + Code("b\n") + Code("c\n", Code("d\n")) + "e\n"
+    assert str(code) == "a\nb\nc\nd\ne\n"
+    assert list(code.fragments()) == ["a\n", "b\n", "c\n", "d\n", "e\n"]
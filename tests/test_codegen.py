@@ -4,8 +4,12 @@ This file contains test cases for the code generator.
 Students should add more test cases here.
 """
 
+import os
+
+from src.codegen.codegen import CodeGenerator as CodeGen
+from src.codegen.workspace import Workspace
 from src.utils.nodes import *
-from utils import CodeGenerator, ASTGenerator
+from utils import CodeGenerator, ASTGenerator, shared_jvm_runner
 
 
 def test_001():
@@ -8174,3 +8178,406 @@ def test_229():
     assert result == expected
 
 
+
+
+def test_248():
+    """Test constants that need the constant pool: large ints, floats and escaped strings"""
+    ast = Program([
+        ClassDecl("Main", None, [
+            MethodDecl(True, PrimitiveType("void"), "main", [], BlockStatement([], [
+                MethodInvocationStatement(PostfixExpression(Identifier("io"), [
+                    MethodCall("writeInt", [BinaryOp(IntLiteral(100000), "+", IntLiteral(-40000))])
+                ])),
+                MethodInvocationStatement(PostfixExpression(Identifier("io"), [
+                    MethodCall("writeStr", [StringLiteral(" \\\"ok\\\"\\t")])
+                ])),
+                MethodInvocationStatement(PostfixExpression(Identifier("io"), [
+                    MethodCall("writeFloat", [FloatLiteral(2.5)])
+                ]))
+            ]))
+        ])
+    ])
+    expected = '60000 "ok"\t2.5'
+    result = CodeGenerator().generate_and_run(ast)
+    assert result == expected
+
+
+def test_252():
+    """Test if conditions with &&, || and ! compiled to jumping code"""
+    def write(value):
+        return MethodInvocationStatement(PostfixExpression(Identifier("io"), [
+            MethodCall("writeInt", [IntLiteral(value)])
+        ]))
+
+    # (i < 3 && !(i == 1)) || i > 4
+    condition = BinaryOp(
+        BinaryOp(
+            BinaryOp(Identifier("i"), "<", IntLiteral(3)),
+            "&&",
+            UnaryOp("!", ParenthesizedExpression(BinaryOp(Identifier("i"), "==", IntLiteral(1))))
+        ),
+        "||",
+        BinaryOp(Identifier("i"), ">", IntLiteral(4))
+    )
+    ast = Program([
+        ClassDecl("Main", None, [
+            MethodDecl(True, PrimitiveType("void"), "main", [], BlockStatement(
+                [VariableDecl(False, PrimitiveType("int"), [Variable("i", None)])],
+                [
+                    ForStatement("i", IntLiteral(0), "to", IntLiteral(6), BlockStatement([], [
+                        IfStatement(condition, write(1), write(0))
+                    ]))
+                ]
+            ))
+        ])
+    ])
+    expected = "1010011"
+    result = CodeGenerator().generate_and_run(ast)
+    assert result == expected
+
+
+def test_253():
+    """Test && and || in value context skip the right operand when the left decides"""
+    def guard(operator, compare):
+        # d != 0 && 10 / d > 1, or d == 0 || 10 / d > 1: dividing would throw
+        return BinaryOp(
+            BinaryOp(Identifier("d"), compare, IntLiteral(0)),
+            operator,
+            BinaryOp(BinaryOp(IntLiteral(10), "/", Identifier("d")), ">", IntLiteral(1))
+        )
+
+    def write(value):
+        return MethodInvocationStatement(PostfixExpression(Identifier("io"), [
+            MethodCall("writeBool", [value])
+        ]))
+
+    ast = Program([
+        ClassDecl("Main", None, [
+            MethodDecl(True, PrimitiveType("void"), "main", [], BlockStatement(
+                [
+                    VariableDecl(False, PrimitiveType("int"), [Variable("d", IntLiteral(0))]),
+                    VariableDecl(False, PrimitiveType("boolean"), [Variable("b", guard("&&", "!="))])
+                ],
+                [
+                    write(Identifier("b")),
+                    write(guard("||", "==")),
+                    write(UnaryOp("!", guard("&&", "!=")))
+                ]
+            ))
+        ])
+    ])
+    expected = "falsetruetrue"
+    result = CodeGenerator().generate_and_run(ast)
+    assert result == expected
+
+def test_254():
+    """Test for loops evaluate a computed end bound once, in nested and downto loops"""
+    def write(value):
+        return MethodInvocationStatement(PostfixExpression(Identifier("io"), [
+            MethodCall("writeInt", [value])
+        ]))
+
+    ast = Program([
+        ClassDecl("Main", None, [
+            MethodDecl(True, PrimitiveType("void"), "main", [], BlockStatement(
+                [
+                    VariableDecl(False, PrimitiveType("int"), [Variable("i"), Variable("j")]),
+                    VariableDecl(False, PrimitiveType("int"), [Variable("n", IntLiteral(2))])
+                ],
+                [
+                    ForStatement("i", IntLiteral(1), "to", BinaryOp(Identifier("n"), "+", IntLiteral(1)), BlockStatement([], [
+                        ForStatement("j", BinaryOp(Identifier("n"), "-", IntLiteral(1)), "downto", UnaryOp("-", IntLiteral(1)), BlockStatement([], [
+                            write(Identifier("j"))
+                        ])),
+                        AssignmentStatement(IdLHS("n"), BinaryOp(Identifier("n"), "+", IntLiteral(1))),
+                        write(Identifier("i"))
+                    ])),
+                    write(Identifier("n"))
+                ]
+            ))
+        ])
+    ])
+    expected = "10-11210-123210-135"
+    result = CodeGenerator().generate_and_run(ast)
+    assert result == expected
+
+def test_255():
+    """Test folded constants print the same values as the run-time computation"""
+    def write(method, value):
+        return MethodInvocationStatement(PostfixExpression(Identifier("io"), [
+            MethodCall(method, [value])
+        ]))
+
+    ast = Program([
+        ClassDecl("Main", None, [
+            MethodDecl(True, PrimitiveType("void"), "main", [], BlockStatement(
+                [
+                    VariableDecl(True, PrimitiveType("int"), [
+                        Variable("day", BinaryOp(BinaryOp(IntLiteral(60), "*", IntLiteral(60)), "*", IntLiteral(24)))
+                    ]),
+                    VariableDecl(True, PrimitiveType("float"), [Variable("f", IntLiteral(1))]),
+                    VariableDecl(True, PrimitiveType("string"), [Variable("s", BinaryOp(StringLiteral("a"), "^", StringLiteral("b")))]),
+                    VariableDecl(False, PrimitiveType("int"), [Variable("x", IntLiteral(-3))])
+                ],
+                [
+                    write("writeInt", Identifier("day")),
+                    write("writeFloat", BinaryOp(Identifier("f"), "/", IntLiteral(4))),
+                    write("writeStrLn", Identifier("s")),
+                    write("writeInt", BinaryOp(UnaryOp("-", ParenthesizedExpression(IntLiteral(3))), "*", IntLiteral(2147483647))),
+                    write("writeInt", BinaryOp(Identifier("x"), "*", IntLiteral(2147483647))),
+                    write("writeInt", BinaryOp(UnaryOp("-", IntLiteral(7)), "%", IntLiteral(3))),
+                    write("writeInt", BinaryOp(Identifier("x"), "%", IntLiteral(2))),
+                    write("writeBool", BinaryOp(BinaryOp(Identifier("f"), ">", IntLiteral(0)), "&&", BinaryOp(Identifier("x"), "<", IntLiteral(0))))
+                ]
+            ))
+        ])
+    ])
+    expected = "864000.25ab\n-2147483645-2147483645-1-1true"
+    assert CodeGenerator(fold=False).generate_and_run(ast) == expected
+    assert CodeGenerator(fold=True).generate_and_run(ast) == expected
+
+
+def test_257():
+    """Test ^ chains append string, int, boolean and float operands to one builder"""
+    piece = BinaryOp(
+        BinaryOp(
+            BinaryOp(BinaryOp(Identifier("s"), "^", Identifier("i")), "^", StringLiteral(":")),
+            "^",
+            ParenthesizedExpression(BinaryOp(Identifier("i"), ">", IntLiteral(1)))
+        ),
+        "^",
+        StringLiteral(";")
+    )
+    tail = BinaryOp(
+        BinaryOp(Identifier("s"), "^", ParenthesizedExpression(BinaryOp(StringLiteral("<"), "^", Identifier("t")))),
+        "^",
+        FloatLiteral(0.5)
+    )
+    ast = Program([
+        ClassDecl("Main", None, [
+            MethodDecl(True, PrimitiveType("void"), "main", [], BlockStatement(
+                [
+                    VariableDecl(False, PrimitiveType("int"), [Variable("i")]),
+                    VariableDecl(False, PrimitiveType("string"), [Variable("s", StringLiteral("")), Variable("t", StringLiteral("x"))])
+                ],
+                [
+                    ForStatement("i", IntLiteral(1), "to", IntLiteral(3), AssignmentStatement(IdLHS("s"), piece)),
+                    MethodInvocationStatement(PostfixExpression(Identifier("io"), [
+                        MethodCall("writeStr", [tail])
+                    ]))
+                ]
+            ))
+        ])
+    ])
+    expected = "1:false;2:true;3:true;<x0.5"
+    result = CodeGenerator().generate_and_run(ast)
+    assert result == expected
+
+
+def test_259():
+    """Test buffered io output is flushed when main ends with an uncaught exception"""
+    def call(name, *args):
+        return MethodInvocationStatement(PostfixExpression(Identifier("io"), [MethodCall(name, list(args))]))
+
+    ast = Program([
+        ClassDecl("Main", None, [
+            MethodDecl(True, PrimitiveType("void"), "main", [], BlockStatement(
+                [VariableDecl(False, PrimitiveType("int"), [Variable("x", IntLiteral(0))])],
+                [
+                    call("writeIntLn", IntLiteral(1)),
+                    call("flush"),
+                    call("writeStr", StringLiteral("before")),
+                    AssignmentStatement(IdLHS("x"), BinaryOp(IntLiteral(1), "\\", Identifier("x"))),
+                    call("writeStr", StringLiteral("after")),
+                ]
+            ))
+        ])
+    ])
+    with Workspace() as workspace:
+        CodeGen(class_files=True, output_dir=workspace.path).visit(ast)
+        workspace.install_runtime()
+        warm = workspace.run("Main", shared_jvm_runner(), timeout=10)
+        cold = workspace.run("Main", timeout=10)
+    for result in (warm, cold):
+        assert result.returncode != 0
+        assert "ArithmeticException" in result.stderr
+        assert result.stdout == "1\nbefore"
+
+
+def test_260():
+    """Test io.read* tokenize stdin with Scanner's parsing rules"""
+    def echo(read, write):
+        return MethodInvocationStatement(PostfixExpression(Identifier("io"), [
+            MethodCall(write, [PostfixExpression(Identifier("io"), [MethodCall(read, [])])])
+        ]))
+
+    reads = [
+        ("readInt", "writeIntLn"), ("readInt", "writeIntLn"), ("readInt", "writeIntLn"), ("readInt", "writeIntLn"),
+        ("readFloat", "writeFloatLn"), ("readFloat", "writeFloatLn"), ("readFloat", "writeFloatLn"),
+        ("readBool", "writeBoolLn"), ("readBool", "writeBoolLn"), ("readBool", "writeBoolLn"),
+        ("readStr", "writeStrLn"), ("readInt", "writeIntLn"),
+    ]
+    ast = Program([
+        ClassDecl("Main", None, [
+            MethodDecl(True, PrimitiveType("void"), "main", [], BlockStatement(
+                [], [echo(read, write) for read, write in reads]
+            ))
+        ])
+    ])
+    with Workspace() as workspace:
+        CodeGen(class_files=True, output_dir=workspace.path).visit(ast)
+        workspace.install_runtime()
+        stdin_path = os.path.join(workspace.path, "input.txt")
+        with open(stdin_path, "w") as f:
+            f.write("  0012 -2147483648\t+7\n1,000\n-.5 2.50 1e3\r\nTRUE 1 yes\n\nhéllo 12abc")
+        result = workspace.run("Main", shared_jvm_runner(), timeout=10, stdin_path=stdin_path)
+    assert result.stdout == "12\n-2147483648\n7\n1000\n-0.5\n2.5\n1000.0\ntrue\ntrue\nfalse\nhéllo\n"
+    assert "java.util.InputMismatchException" in result.stderr
+
+
+
+def test_263():
+    """Test / divides floats and \\ and % truncate, on literals and on variables"""
+    def write(method, value):
+        return MethodInvocationStatement(PostfixExpression(Identifier("io"), [
+            MethodCall(method, [value])
+        ]))
+
+    ast = Program([
+        ClassDecl("Main", None, [
+            MethodDecl(True, PrimitiveType("void"), "main", [], BlockStatement(
+                [
+                    VariableDecl(False, PrimitiveType("int"), [
+                        Variable("a", IntLiteral(7)), Variable("b", IntLiteral(2)), Variable("n", UnaryOp("-", IntLiteral(7)))
+                    ]),
+                    VariableDecl(False, PrimitiveType("float"), [Variable("f", BinaryOp(Identifier("a"), "/", Identifier("b")))])
+                ],
+                [
+                    write("writeFloatLn", BinaryOp(IntLiteral(7), "/", IntLiteral(2))),
+                    write("writeFloatLn", BinaryOp(Identifier("a"), "/", Identifier("b"))),
+                    write("writeFloatLn", Identifier("f")),
+                    write("writeIntLn", BinaryOp(IntLiteral(7), "\\", IntLiteral(2))),
+                    write("writeIntLn", BinaryOp(Identifier("a"), "\\", Identifier("b"))),
+                    write("writeIntLn", BinaryOp(UnaryOp("-", IntLiteral(7)), "\\", IntLiteral(2))),
+                    write("writeIntLn", BinaryOp(Identifier("n"), "\\", Identifier("b"))),
+                    write("writeIntLn", BinaryOp(UnaryOp("-", IntLiteral(7)), "%", IntLiteral(2))),
+                    write("writeIntLn", BinaryOp(Identifier("n"), "%", Identifier("b")))
+                ]
+            ))
+        ])
+    ])
+    expected = "3.5\n3.5\n3.5\n3\n3\n-3\n-3\n-1\n-1"
+    assert CodeGenerator(fold=False).generate_and_run(ast) == expected
+    assert CodeGenerator(fold=True).generate_and_run(ast) == expected
+
+
+def test_264():
+    """Test io.read* split tokens at Unicode whitespace like Scanner"""
+    def echo(read, write):
+        return MethodInvocationStatement(PostfixExpression(Identifier("io"), [
+            MethodCall(write, [PostfixExpression(Identifier("io"), [MethodCall(read, [])])])
+        ]))
+
+    reads = [("readInt", "writeIntLn")] * 3 + [("readStr", "writeStrLn")] * 4
+    ast = Program([
+        ClassDecl("Main", None, [
+            MethodDecl(True, PrimitiveType("void"), "main", [], BlockStatement(
+                [], [echo(read, write) for read, write in reads]
+            ))
+        ])
+    ])
+    with Workspace() as workspace:
+        CodeGen(class_files=True, output_dir=workspace.path).visit(ast)
+        workspace.install_runtime()
+        stdin_path = os.path.join(workspace.path, "input.txt")
+        # em space, ideographic space and line separator split tokens, no-break spaces do not
+        with open(stdin_path, "w", encoding="utf-8") as f:
+            f.write("1\u20032\u3000 3\u2028a\u00a0b\u2007c x\u2192y\u205fz\u1680\u2029end\u2003")
+        result = workspace.run("Main", shared_jvm_runner(), timeout=10, stdin_path=stdin_path)
+    assert result.stdout == "1\n2\n3\na\u00a0b\u2007c\nx\u2192y\nz\nend\n"
+
+
+def test_265():
+    """Test the io receiver resolves in every scope and parameters and locals called io shadow it"""
+    def write(value):
+        return MethodInvocationStatement(PostfixExpression(Identifier("io"), [MethodCall("writeIntLn", [value])]))
+
+    ast = Program([
+        ClassDecl("Main", None, [
+            MethodDecl(True, PrimitiveType("int"), "twice", [Parameter(PrimitiveType("int"), "io")], BlockStatement(
+                [], [ReturnStatement(BinaryOp(Identifier("io"), "+", Identifier("io")))]
+            )),
+            MethodDecl(True, PrimitiveType("void"), "main", [], BlockStatement(
+                [VariableDecl(False, PrimitiveType("int"), [Variable("x", IntLiteral(1))])],
+                [
+                    write(Identifier("x")),
+                    BlockStatement(
+                        [VariableDecl(False, PrimitiveType("int"), [Variable("io", IntLiteral(2))])],
+                        [AssignmentStatement(IdLHS("x"), Identifier("io"))]
+                    ),
+                    write(Identifier("x")),
+                    BlockStatement([], [write(IntLiteral(3))])
+                ]
+            ))
+        ])
+    ])
+    sink = {}
+    CodeGen(sink=sink).visit(ast)
+    twice = sink["Main.j"].split(".method public static twice(I)I")[1].split(".end method")[0]
+    assert "\tiload_0\n\tiload_0\n\tiadd\n" in twice
+    assert CodeGenerator().generate_and_run(ast) == "1\n2\n3"
+
+
+def test_266():
+    """Test float constants keep full float precision, folded or not"""
+    def write(value):
+        return MethodInvocationStatement(PostfixExpression(Identifier("io"), [
+            MethodCall("writeFloatLn", [value])
+        ]))
+
+    ast = Program([
+        ClassDecl("Main", None, [
+            MethodDecl(True, PrimitiveType("void"), "main", [], BlockStatement(
+                [],
+                [
+                    write(BinaryOp(IntLiteral(1), "/", IntLiteral(3))),
+                    write(BinaryOp(IntLiteral(1), "/", IntLiteral(100000))),
+                    write(BinaryOp(FloatLiteral(2.0), "/", FloatLiteral(3.0))),
+                    write(FloatLiteral(3.14159)),
+                    write(UnaryOp("-", FloatLiteral(0.1)))
+                ]
+            ))
+        ])
+    ])
+    expected = "0.33333334\n1.0E-5\n0.6666667\n3.14159\n-0.1"
+    assert CodeGenerator(fold=False).generate_and_run(ast) == expected
+    assert CodeGenerator(fold=True).generate_and_run(ast) == expected
+
+
+def test_267():
+    """Test locals declared in a for loop with a computed bound keep their own slots"""
+    def write(value):
+        return MethodInvocationStatement(PostfixExpression(Identifier("io"), [MethodCall("writeInt", [value])]))
+
+    ast = Program([
+        ClassDecl("Main", None, [
+            MethodDecl(True, PrimitiveType("void"), "main", [], BlockStatement(
+                [VariableDecl(False, PrimitiveType("int"), [Variable("i"), Variable("n", IntLiteral(2))])],
+                [
+                    ForStatement("i", IntLiteral(1), "to", BinaryOp(Identifier("n"), "+", IntLiteral(1)), BlockStatement(
+                        [VariableDecl(False, PrimitiveType("int"), [Variable("k", BinaryOp(Identifier("i"), "*", IntLiteral(10)))])],
+                        [write(Identifier("k"))]
+                    )),
+                    BlockStatement(
+                        [VariableDecl(False, PrimitiveType("int"), [Variable("m", IntLiteral(7)), Variable("p", IntLiteral(8))])],
+                        [write(Identifier("m")), write(Identifier("p"))]
+                    )
+                ]
+            ))
+        ])
+    ])
+    sink = {}
+    CodeGen(sink=sink).visit(ast)
+    slots = [line.split()[1] for line in sink["Main.j"].splitlines() if line.startswith(".var")]
+    assert len(slots) == len(set(slots))
+    assert CodeGenerator().generate_and_run(ast) == "10203078"
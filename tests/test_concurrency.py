@@ -0,0 +1,30 @@
+"""
+Test cases for compiling and running OPLang programs concurrently.
+Every compilation has its own workspace, so programs with the same class
+names can be compiled and run at the same time.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from src.utils.nodes import *
+from utils import CodeGenerator
+
+
+def test_001():
+    """Test programs with the same class names compiled and run concurrently"""
+    def program(value):
+        return Program([
+            ClassDecl("Helper", None, []),
+            ClassDecl("Main", None, [
+                MethodDecl(True, PrimitiveType("void"), "main", [], BlockStatement([], [
+                    MethodInvocationStatement(PostfixExpression(Identifier("io"), [
+                        MethodCall("writeInt", [IntLiteral(value)])
+                    ]))
+                ]))
+            ])
+        ])
+
+    values = list(range(8))
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda v: CodeGenerator().generate_and_run(program(v)), values))
+    assert results == [str(v) for v in values]
@@ -0,0 +1,52 @@
+"""
+Test cases for constant folding in OPLang programming language.
+"""
+
+from src.semantics.constant_folder import ConstantFolder
+from src.utils.nodes import *
+
+
+def test_001():
+    """Test constant folding rewrites final uses and constant operators into literals"""
+    main = MethodDecl(True, PrimitiveType("void"), "main", [], BlockStatement(
+        [
+            VariableDecl(True, PrimitiveType("float"), [Variable("f", IntLiteral(3))]),
+            VariableDecl(False, PrimitiveType("int"), [Variable("n", IntLiteral(1))])
+        ],
+        [
+            AssignmentStatement(IdLHS("n"), BinaryOp(IntLiteral(7), "\\", UnaryOp("-", IntLiteral(2)))),
+            AssignmentStatement(IdLHS("n"), PostfixExpression(Identifier("Main"), [MemberAccess("DAY")])),
+            ReturnStatement(BinaryOp(Identifier("f"), "*", ParenthesizedExpression(BinaryOp(Identifier("n"), "+", IntLiteral(1)))))
+        ]
+    ))
+    ConstantFolder().fold_program(Program([ClassDecl("Main", None, [
+        AttributeDecl(True, True, PrimitiveType("int"), [
+            Attribute("DAY", BinaryOp(BinaryOp(IntLiteral(60), "*", IntLiteral(60)), "*", IntLiteral(24)))
+        ]),
+        main
+    ])]))
+    divide, day, ret = main.body.statements
+    assert str(divide.rhs) == "IntLiteral(-3)"
+    assert str(day.rhs) == "IntLiteral(86400)"
+    assert str(ret.value.left) == "FloatLiteral(3.0)"
+    assert type(ret.value.right) is ParenthesizedExpression
+
+
+def test_002():
+    """Test / folds to a float quotient and \\ and % to truncated int results"""
+    statements = [
+        AssignmentStatement(IdLHS("f"), BinaryOp(IntLiteral(7), "/", IntLiteral(2))),
+        AssignmentStatement(IdLHS("n"), BinaryOp(UnaryOp("-", IntLiteral(7)), "\\", IntLiteral(2))),
+        AssignmentStatement(IdLHS("n"), BinaryOp(UnaryOp("-", IntLiteral(7)), "%", IntLiteral(2))),
+        AssignmentStatement(IdLHS("n"), BinaryOp(IntLiteral(1), "\\", IntLiteral(0))),
+    ]
+    ConstantFolder().fold_program(Program([ClassDecl("Main", None, [
+        MethodDecl(True, PrimitiveType("void"), "main", [], BlockStatement([
+            VariableDecl(False, PrimitiveType("float"), [Variable("f", None)]),
+            VariableDecl(False, PrimitiveType("int"), [Variable("n", None)])
+        ], statements))
+    ])]))
+    assert [str(statement.rhs) for statement in statements[:3]] == [
+        "FloatLiteral(3.5)", "IntLiteral(-3)", "IntLiteral(-1)"
+    ]
+    assert type(statements[3].rhs) is BinaryOp
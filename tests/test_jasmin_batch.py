@@ -0,0 +1,64 @@
+"""
+Test cases for assembling Jasmin files in batches.
+"""
+
+import os
+import tempfile
+
+from src.codegen.jasmin_batch import JasminBatch
+from src.utils.nodes import *
+from utils import CodeGenerator
+
+
+def write_class(directory, name, body):
+    """Write a Jasmin class with a static main() holding body, return its path"""
+    path = os.path.join(directory, name + ".j")
+    with open(path, "w") as f:
+        f.write(
+            f".class public {name}\n.super java/lang/Object\n"
+            f".method public static main([Ljava/lang/String;)V\n{body}\treturn\n"
+            ".limit stack 1\n.limit locals 1\n.end method\n"
+        )
+    return path
+
+
+def test_001():
+    """Test one batch assembles the files of several directories, errors kept per file"""
+    with tempfile.TemporaryDirectory() as first, tempfile.TemporaryDirectory() as second:
+        good = write_class(first, "Main", "")
+        other = write_class(second, "Main", "\ticonst_1\n\tpop\n")
+        broken = write_class(second, "Broken", "\tnot_an_instruction\n")
+        batch = JasminBatch()
+        for path in (good, other, broken):
+            batch.add(path)
+        assert len(batch) == 3
+        errors = batch.assemble(timeout=30)
+        assert len(batch) == 0
+        assert errors[good] is None and errors[other] is None
+        assert "Syntax error" in errors[broken]
+        assert os.path.exists(os.path.join(first, "Main.class"))
+        assert os.path.exists(os.path.join(second, "Main.class"))
+        assert not os.path.exists(os.path.join(second, "Broken.class"))
+
+
+def test_002():
+    """Test several programs generated and run together, errors kept per program"""
+    def program(argument):
+        return Program([
+            ClassDecl("Main", None, [
+                MethodDecl(True, PrimitiveType("void"), "main", [], BlockStatement([], [
+                    MethodInvocationStatement(PostfixExpression(Identifier("io"), [
+                        MethodCall("writeInt", [argument])
+                    ]))
+                ]))
+            ])
+        ])
+
+    results = CodeGenerator().generate_and_run_all([
+        program(IntLiteral(1)),
+        program(Identifier("missing")),
+        program(IntLiteral(3))
+    ])
+    assert results[0] == "1"
+    assert results[1].startswith("Code generation error")
+    assert results[2] == "3"
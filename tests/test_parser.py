@@ -1,3 +1,6 @@
+from antlr4.atn.PredictionMode import PredictionMode
+from antlr4.error.ErrorStrategy import BailErrorStrategy
+
 from utils import Parser
 
 
@@ -112,3 +115,75 @@ def test_011():
     source = """class Test { int x := 1; """  # Thiếu dấu }
     expected = "Error on line 1 col 25: <EOF>"
     assert Parser(source).parse() == expected
+
+
+def test_012():
+    """Test parser error reported after SLL fallback: missing semicolon"""
+    source = """class Test { static void main() { int x := 1 x := 2; } }"""
+    expected = "Error on line 1 col 45: x"
+    assert Parser(source).parse() == expected
+
+
+def test_013():
+    """Test lexer error surfaces unchanged through the two-stage parser"""
+    source = """class Test { static void main() { string s := "abc; } }"""
+    expected = 'Unclosed String: abc; } }'
+    assert Parser(source).parse() == expected
+
+
+def test_014():
+    """Test parser error: stray semicolon inside an else block"""
+    source = """class Test {
+        static void main() {
+            int x;
+            if (x > 0) then {
+                x := 1;
+            } else { x := 2;; }
+        }
+    }"""
+    expected = "Error on line 6 col 14: else"
+    assert Parser(source).parse() == expected
+
+
+def test_015():
+    """Test parser error: missing semicolon before the closing brace of an else block"""
+    source = """class Test {
+        static void main() {
+            int x;
+            if (x > 0) then {
+                x := 1;
+            } else { x := 2 }
+        }
+    }"""
+    expected = "Error on line 6 col 14: else"
+    assert Parser(source).parse() == expected
+
+
+def test_016():
+    """Test parser error reported before a later lexer error: stray character in :="""
+    source = """class Test {
+        static void main() {
+            int i;
+            for i :;= 1 to 10 do { }
+        }
+    }"""
+    expected = "Error on line 4 col 18: :"
+    assert Parser(source).parse() == expected
+
+
+def test_017():
+    """Test SLL prediction alone parses method invocation and member assignment statements"""
+    source = """class Test {
+        static void main() {
+            io.writeIntLn(obj.data[1] + r);
+            obj.compute(10, r);
+            a.b().c(1.5);
+            (new A()).f();
+            this.x.y := a.get();
+        }
+    }"""
+    parser = Parser(source).parser
+    parser._interp.predictionMode = PredictionMode.SLL
+    parser._errHandler = BailErrorStrategy()
+    parser.program()
+    assert parser.getNumberOfSyntaxErrors() == 0
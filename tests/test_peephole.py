@@ -0,0 +1,42 @@
+"""
+Test cases for the peephole optimizer of the OPLang code generator.
+"""
+
+from src.codegen.peephole import PeepholeOptimizer
+
+
+def test_001():
+    """Test the peephole rules rewrite a method body and count their hits"""
+    body = [
+        "Label0:\n",
+        "\ticonst_1\n", "\tifne Label2\n",
+        "\tiload_1\n",
+        "Label2:\n",
+        "\tistore_2\n", "\tiload_2\n", "\tgoto Label3\n",
+        "Label3:\n",
+        "\tgoto Label4\n",
+        "Label5:\n",
+        "\tdup\n", "\tpop\n",
+        "Label4:\n",
+        "\tgoto Label6\n",
+        "Label6:\n",
+        "\treturn\n",
+    ]
+    optimizer = PeepholeOptimizer()
+    lines, extra_stack = optimizer.optimize(body)
+    assert "".join(lines) == (
+        "Label0:\n"
+        "Label2:\n"
+        "\tdup\n\tistore_2\n"
+        "Label3:\n"
+        "\treturn\n"
+        "Label5:\n"
+        "Label4:\n"
+        "Label6:\n"
+        "\treturn\n"
+    )
+    assert extra_stack == 1
+    assert optimizer.stats == {
+        "goto-next-label": 3, "constant-branch": 1, "store-load": 1,
+        "push-pop": 1, "branch-chain": 1, "unreachable": 1,
+    }
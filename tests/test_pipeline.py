@@ -0,0 +1,49 @@
+"""
+Test cases for the instrumented compiler pipeline of OPLang programming language.
+"""
+
+import json
+import os
+import tempfile
+
+from utils import shared_jvm_runner  # puts build/ on sys.path for the generated parser
+from src.pipeline import STAGES, count_nodes, run_pipeline
+from src.utils.instrumentation import Instrumentation
+from src.utils.nodes import *
+
+
+def test_001():
+    """Test the instrumented pipeline records every stage with its counts"""
+    source = """
+class Main {
+    static void main() {
+        int i, s := 0;
+        for i := 1 to 2 * 5 do
+            s := s + i;
+        io.writeIntLn(s);
+    }
+}
+"""
+    with tempfile.TemporaryDirectory() as profile_dir:
+        instrumentation = Instrumentation(profile_dir=profile_dir)
+        result = run_pipeline(source, instrumentation, runner=shared_jvm_runner(), timeout=10)
+        report = json.loads(instrumentation.to_json())
+        assert [stage["name"] for stage in report["stages"]] == list(STAGES)
+        assert all(os.path.exists(stage["profile"]) for stage in report["stages"])
+    assert result.output.stdout == "55\n"
+    assert instrumentation["lex"].counts["tokens"] == 40
+    assert instrumentation["ast"].counts["nodes"] == instrumentation["check"].counts["nodes"] > 0
+    assert instrumentation["fold"].counts["nodes"] == instrumentation["ast"].counts["nodes"]
+    assert instrumentation["fold"].counts["folded"] == 1
+    assert instrumentation["codegen"].counts["classes"] == 1
+    assert instrumentation["codegen"].counts["instructions"] > 0
+    assert instrumentation["assemble"].counts["class_files"] == 1
+    assert all(stage["wall"] > 0 and stage["peak_memory"] is not None for stage in report["stages"])
+
+
+def test_002():
+    """Test count_nodes counts every node of an AST, types included"""
+    ast = Program([ClassDecl("Main", None, [
+        AttributeDecl(False, False, PrimitiveType("int"), [Attribute("x", BinaryOp(IntLiteral(1), "+", IntLiteral(2)))])
+    ])])
+    assert count_nodes(ast) == 8
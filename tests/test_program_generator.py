@@ -0,0 +1,34 @@
+"""
+Test cases for the synthetic program generator of OPLang programming language.
+"""
+
+from utils import ASTGenerator, CodeGenerator
+from src.codegen.codegen import CodeGenerator as CodeGen
+from src.semantics.static_checker import StaticChecker
+from src.utils.program_generator import ProgramGenerator, to_source
+
+
+def test_001():
+    """Test generated programs parse back to their AST, pass the checker and compile"""
+    generator = ProgramGenerator(
+        classes=3, inheritance_depth=2, methods_per_class=2,
+        statements_per_method=6, expression_depth=2, array_size=3, seed=7,
+    )
+    source, ast = generator.generate()
+    assert generator.generate()[0] == source
+    assert "class C1 extends C0" in source and "class C2 extends C1" in source
+    assert str(ASTGenerator(source).generate()) == str(ast)
+    StaticChecker().check_program(ast)
+    sink = {}
+    CodeGen(sink=sink).visit(ast)
+    assert sorted(sink) == ["C0.j", "C1.j", "C2.j", "Main.j"]
+
+
+def test_002():
+    """Test a program of main alone prints back to its source and runs"""
+    source, ast = ProgramGenerator(classes=0, statements_per_method=5, expression_depth=1, array_size=0, seed=1).generate()
+    assert source.startswith("class Main")
+    assert to_source(ast) == source
+    StaticChecker().check_program(ast)
+    output = CodeGenerator().generate_and_run(ast)
+    assert not output.startswith(("Runtime error", "Code generation error", "Assembly error")), output
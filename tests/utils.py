@@ -1,9 +1,9 @@
 import sys
 import os
 import subprocess
-import tempfile
-import shutil
-import glob
+import copy
+import atexit
+import threading
 
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "build"))
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "src"))
@@ -12,8 +12,14 @@ from antlr4 import *
 from build.OPLangLexer import OPLangLexer
 from build.OPLangParser import OPLangParser
 from src.utils.error_listener import NewErrorListener
+from src.utils.parsing import parse_two_stage
 from src.astgen.ast_generation import ASTGeneration
+from src.astgen.ast_cache import ASTCache
+from src.codegen.class_cache import ClassCache, CompiledProgram
+from src.codegen.jasmin_batch import JasminBatch
+from src.codegen.workspace import Workspace
 from src.semantics.static_checker import StaticChecker
+from src.semantics.constant_folder import ConstantFolder
 from src.utils.nodes import *
 
 
@@ -62,7 +68,7 @@ class Parser:
 
     def parse(self):
         try:
-            self.parser.program()  # Assuming 'program' is the entry point of your grammar
+            parse_two_stage(self.parser, "program")
             return "success"
         except Exception as e:
             return str(e)
@@ -71,22 +77,32 @@ class Parser:
 class ASTGenerator:
     """Class to generate AST from OPLang source code."""
 
-    def __init__(self, input_string):
+    def __init__(self, input_string, cache=None):
         self.input_string = input_string
         self.input_stream = InputStream(input_string)
         self.lexer = OPLangLexer(self.input_stream)
         self.token_stream = CommonTokenStream(self.lexer)
         self.parser = OPLangParser(self.token_stream)
         self.ast_generator = ASTGeneration()
+        # Opt-in AST cache, either passed in or taken from $OPLANG_AST_CACHE
+        self.cache = cache if cache is not None else ASTCache.from_env()
 
     def generate(self):
         """Generate AST from the input string."""
         try:
+            if self.cache is not None:
+                ast = self.cache.get(self.input_string)
+                if ast is not None:
+                    return ast
+
             # Parse the program starting from the entry point
-            parse_tree = self.parser.program()
+            parse_tree = parse_two_stage(self.parser, "program")
 
             # Generate AST using the visitor
             ast = self.ast_generator.visit(parse_tree)
+            # Recovered parses report errors as they go, so only clean ones are cached
+            if self.cache is not None and self.parser.getNumberOfSyntaxErrors() == 0:
+                self.cache.put(self.input_string, ast)
             return ast
         except Exception as e:
             return f"AST Generation Error: {str(e)}"
@@ -121,89 +137,140 @@ class Checker:
             return str(e)
 
 
+# Warm JVMs of a test session, one per thread so programs can run in parallel
+_jvm_runners = threading.local()
+
+
+def shared_jvm_runner():
+    """Return the calling thread's JVMRunner, starting it on first use."""
+    runner = getattr(_jvm_runners, "runner", None)
+    if runner is None:
+        from src.codegen.jvm_runner import JVMRunner
+        runner = _jvm_runners.runner = JVMRunner()
+        atexit.register(runner.close)
+    return runner
+
+
 class CodeGenerator:
-    """Class to generate and run code from AST."""
+    """
+    Class to generate and run code from AST.
 
-    def __init__(self):
-        from src.codegen.codegen import CodeGenerator as CodeGen
-        self.codegen = CodeGen()
-        self.runtime_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src", "runtime")
+    Every compilation gets a private Workspace for its .j and .class files
+    and a copy of io.class, so a program never picks up classes of another
+    one and several programs can be compiled and run at once.
+    """
+
+    def __init__(self, cache=None, fold=None):
+        # OPLANG_ASSEMBLER=jasmin assembles with jasmin.jar instead of the built-in class writer
+        self.assembler = os.environ.get("OPLANG_ASSEMBLER", "python")
+        # OPLANG_RUNNER=java starts a new java process per program instead of the warm runner
+        self.runner = os.environ.get("OPLANG_RUNNER", "warm")
+        # Opt-in constant folding, either passed in or turned on by OPLANG_FOLD=1
+        self.fold = fold if fold is not None else os.environ.get("OPLANG_FOLD") == "1"
+        # Opt-in class file cache, either passed in or taken from $OPLANG_CLASS_CACHE
+        self.cache = cache if cache is not None else ClassCache.from_env()
 
     def generate_and_run(self, ast):
         """Generate code from AST and run it, return output"""
+        return self.generate_and_run_all([ast])[0]
+
+    def generate_and_run_all(self, asts):
+        """
+        Generate code from several ASTs and run them, return their outputs.
+
+        With OPLANG_ASSEMBLER=jasmin the .j files of all programs are
+        assembled together in one jasmin process; assembly errors are still
+        reported for the program they belong to. Programs found in the class
+        cache skip code generation and assembly.
+        """
+        workspaces = [Workspace() for _ in asts]
         try:
-            # Change to runtime directory and generate code from AST
-            original_dir = os.getcwd()
-            os.chdir(self.runtime_dir)
-            try:
-                self.codegen.visit(ast)
-            finally:
-                os.chdir(original_dir)
-            
-            # Find all generated .j files
-            j_files = glob.glob(os.path.join(self.runtime_dir, "*.j"))
-            
-            if not j_files:
-                return "Error: No .j files generated"
-            
-            # Assemble all .j files to .class
+            batch = JasminBatch()
+            keys = [
+                self.cache.key(ast, {"assembler": self.assembler, "fold": self.fold}) if self.cache is not None else None
+                for ast in asts
+            ]
+            programs = [self.generate(ast, workspace, batch, key) for ast, workspace, key in zip(asts, workspaces, keys)]
             try:
-                for j_file in j_files:
-                    result = subprocess.run(
-                        ["java", "-jar", "jasmin.jar", os.path.basename(j_file)],
-                        cwd=self.runtime_dir,
-                        capture_output=True,
-                        text=True,
-                        timeout=10
-                    )
-                    
-                    if result.returncode != 0:
-                        return f"Assembly error for {os.path.basename(j_file)}: {result.stderr}"
-                
-                # Find the class with main method
-                # In OPLang, any class can have a static main() method
-                class_files = glob.glob(os.path.join(self.runtime_dir, "*.class"))
-                main_class = None
-                
-                # Try to find a class with main method
-                # For now, try running the first class found, or look for a specific pattern
-                # This is a simplified approach - in practice, you might need to check which class has main
-                if class_files:
-                    # Try to find main class by checking class files
-                    # For simplicity, we'll try the first class file
-                    # In a real implementation, you might need to inspect the class files
-                    # or maintain a list of classes with main methods
-                    
-                    # Get class name from .class file (remove .class extension)
-                    for class_file in class_files:
-                        class_name = os.path.basename(class_file).replace(".class", "")
-                        # Skip io.class
-                        if class_name == "io":
-                            continue
-                        main_class = class_name
-                        break
-                
-                if not main_class:
-                    return "Error: No main class found"
-                
-                # Run program
-                result = subprocess.run(
-                    ["java", main_class],
-                    cwd=self.runtime_dir,
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
-                
-                if result.returncode != 0:
-                    return f"Runtime error: {result.stderr}"
-                
-                return result.stdout.strip()
-                
+                errors = batch.assemble(timeout=10 + len(batch))
             except subprocess.TimeoutExpired:
-                return "Timeout"
+                return ["Timeout"] * len(asts)
             except FileNotFoundError:
-                return "Java not found"
-                
+                return ["Java not found"] * len(asts)
+            return [
+                program if isinstance(program, str) else self.run(program, workspace, errors, key)
+                for program, workspace, key in zip(programs, workspaces, keys)
+            ]
+        finally:
+            for workspace in workspaces:
+                workspace.remove()
+
+    def generate(self, ast, workspace, batch, key=None):
+        """Generate code from AST into workspace, return the compiled program or an error message"""
+        from src.codegen.codegen import CodeGenerator as CodeGen
+        from src.codegen.error import AssemblyException
+        try:
+            cached = self.cache.get(key) if key is not None else None
+            if cached is not None:
+                cached.write(workspace.path)
+                workspace.install_runtime()
+                return cached
+
+            if self.fold:
+                # The folder rewrites a checked AST in place, so fold a checked copy
+                ast = copy.deepcopy(ast)
+                try:
+                    StaticChecker().check_program(ast)
+                except Exception as e:
+                    return f"Static check error: {str(e)}"
+                ConstantFolder().fold_program(ast)
+            codegen = CodeGen(class_files=self.assembler != "jasmin", output_dir=workspace.path)
+            try:
+                codegen.visit(ast)
+            except AssemblyException as e:
+                return f"Assembly error: {e}"
+
+            if not codegen.class_names:
+                return "Error: No .j files generated"
+            workspace.install_runtime()
+
+            # Without the built-in class writer, the .j files are assembled with jasmin.jar
+            if self.assembler == "jasmin":
+                workspace.queue(codegen.class_names, batch)
+            return codegen
+
         except Exception as e:
             return f"Code generation error: {str(e)}"
+
+    def run(self, codegen, workspace, errors, key=None):
+        """Run a generated program in its workspace, return output"""
+        for class_name in codegen.class_names:
+            error = errors.get(workspace.j_file(class_name))
+            if error:
+                return f"Assembly error for {class_name}.j: {error}"
+
+        if key is not None and not isinstance(codegen, CompiledProgram):
+            classes = {}
+            for class_name in codegen.class_names:
+                with open(workspace.class_file(class_name), "rb") as f:
+                    classes[class_name] = f.read()
+            self.cache.put(key, CompiledProgram(codegen.main_class, classes))
+
+        # In OPLang, any class can have a static main() method
+        main_class = codegen.main_class
+        if not main_class:
+            return "Error: No main class found"
+
+        try:
+            runner = None if self.runner == "java" else shared_jvm_runner()
+            result = workspace.run(main_class, runner, timeout=10)
+
+            if result.returncode != 0:
+                return f"Runtime error: {result.stderr}"
+
+            return result.stdout.strip()
+
+        except subprocess.TimeoutExpired:
+            return "Timeout"
+        except FileNotFoundError:
+            return "Java not found"